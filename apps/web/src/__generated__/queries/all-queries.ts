@@ -564,6 +564,18 @@ export const UPDATENODESTATE_MUTATION = gql`
   }
 `;
 
+export const UPDATENODESTATES_MUTATION = gql`
+  mutation UpdateNodeStates(
+    $input: UpdateNodeStatesInput!
+  ) {
+    updateNodeStates(input: $input) {
+      success
+      message
+      error
+    }
+  }
+`;
+
 export const UPLOADFILE_MUTATION = gql`
   mutation UploadFile(
     $file: Upload!,
@@ -791,6 +803,7 @@ export const mutations = {
   ControlExecution: CONTROLEXECUTION_MUTATION,
   SendInteractiveResponse: SENDINTERACTIVERESPONSE_MUTATION,
   UpdateNodeState: UPDATENODESTATE_MUTATION,
+  UpdateNodeStates: UPDATENODESTATES_MUTATION,
   UploadFile: UPLOADFILE_MUTATION,
   UploadDiagram: UPLOADDIAGRAM_MUTATION,
   ValidateDiagram: VALIDATEDIAGRAM_MUTATION,
@@ -9,9 +9,10 @@ command-line interface for diagram operations, execution, and
 management tasks.
 """
 
+from dipeo.infrastructure.diagram.drivers import DiagramLoader
+
 from .claude_code_manager import ClaudeCodeCommandManager
 from .cli_runner import CLIRunner
-from .diagram_loader import DiagramLoader
 from .event_forwarder import EventForwarder
 from .integration_manager import IntegrationCommandManager
 from .interactive_handler import cli_interactive_handler
@@ -58,15 +58,28 @@ class ClaudeCodeCommandManager:
                     if not sessions:
                         print("No sessions found")
                         return False
-                    results = []
-                    for session in sessions:
-                        result = manager.convert_session(
-                            session.id,
+                    if len(sessions) == 1:
+                        return manager.convert_session(
+                            sessions[0].id,
                             kwargs.get("output_dir"),
                             kwargs.get("format", "light"),
                         )
-                        results.append(result)
-                    return all(results)
+
+                    report = manager.convert_sessions(
+                        [session.id for session in sessions],
+                        kwargs.get("output_dir"),
+                        kwargs.get("format", "light"),
+                        max_workers=kwargs.get("jobs"),
+                        force=kwargs.get("force", False),
+                        on_result=lambda session_id, status: print(f"  {status}: {session_id}"),
+                    )
+                    print(
+                        f"✅ {len(report.converted)} converted, {len(report.skipped)} skipped, "
+                        f"{len(report.failed)} failed in {report.duration_seconds:.2f}s "
+                        f"({report.sessions_per_second:.2f} sessions/s, "
+                        f"{report.megabytes_per_second:.2f} MB/s)"
+                    )
+                    return report.success
                 elif session_id:
                     return manager.convert_session(
                         session_id,
@@ -82,6 +95,7 @@ class ClaudeCodeCommandManager:
                     kwargs.get("interval", 30),
                     kwargs.get("output_dir"),
                     kwargs.get("format", "light"),
+                    follow=kwargs.get("follow", False),
                 )
 
             elif action == "stats":
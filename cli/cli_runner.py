@@ -3,13 +3,13 @@
 from typing import Any
 
 from dipeo.application.bootstrap import Container
+from dipeo.infrastructure.diagram.drivers import DiagramLoader
 
 from .claude_code_manager import ClaudeCodeCommandManager
 from .commands.compilation import DiagramCompiler
 from .commands.conversion import DiagramConverter
 from .commands.execution import DiagramExecutor
 from .commands.query import DiagramQuery
-from .diagram_loader import DiagramLoader
 from .display import MetricsManager
 from .integration_manager import IntegrationCommandManager
 
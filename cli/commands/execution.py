@@ -12,8 +12,8 @@ from dipeo.application.registry.keys import DIAGRAM_PORT, MESSAGE_ROUTER, STATE_
 from dipeo.config.base_logger import get_module_logger
 from dipeo.diagram_generated.domain_models import ExecutionID
 from dipeo.diagram_generated.enums import Status
+from dipeo.infrastructure.diagram.drivers import DiagramLoader
 
-from ..diagram_loader import DiagramLoader
 from ..display import DisplayManager
 from ..interactive_handler import cli_interactive_handler
 from ..session_manager import SessionManager
@@ -80,6 +80,10 @@ class DiagramExecutor:
                 "diagram_source_path": diagram,
             }
 
+            # Optional top-level `llm_cache: {mode, ttl_s}` block in the diagram file
+            if isinstance(diagram_data, dict) and diagram_data.get("llm_cache"):
+                options["llm_cache"] = diagram_data["llm_cache"]
+
             if execution_id:
                 import re
 
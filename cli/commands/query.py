@@ -79,7 +79,10 @@ class DiagramQuery:
                 try:
                     message_store = MessageStore(STATE_DB_PATH)
                     await message_store.initialize()
-                    messages = await message_store.get_execution_messages(session_id)
+                    try:
+                        messages = await message_store.get_execution_messages(session_id)
+                    finally:
+                        await message_store.close()
                     if messages:
                         response["conversation"] = self._format_conversation(messages)
                 except Exception as e:
@@ -106,7 +109,10 @@ class DiagramQuery:
                 try:
                     message_store = MessageStore(STATE_DB_PATH)
                     await message_store.initialize()
-                    messages = await message_store.get_execution_messages(session_id)
+                    try:
+                        messages = await message_store.get_execution_messages(session_id)
+                    finally:
+                        await message_store.close()
                     if messages:
                         response["messages_count"] = len(messages)
                         last_msg = messages[-1]
@@ -280,8 +280,11 @@ def _get_dipeocc_kwargs(args: argparse.Namespace, action: str) -> dict:
         kwargs["latest"] = getattr(args, "latest", False)
         kwargs["output_dir"] = getattr(args, "output_dir", None)
         kwargs["format"] = getattr(args, "format", "light")
+        kwargs["jobs"] = getattr(args, "jobs", None)
+        kwargs["force"] = getattr(args, "force", False)
     elif action == "watch":
         kwargs["interval"] = getattr(args, "interval", 30)
+        kwargs["follow"] = getattr(args, "follow", False)
     elif action == "stats":
         kwargs["session_id"] = args.session_id
 
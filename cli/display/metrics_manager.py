@@ -191,7 +191,7 @@ class MetricsManager:
             True if stats displayed successfully, False otherwise
         """
         try:
-            from ..diagram_loader import DiagramLoader
+            from dipeo.infrastructure.diagram.drivers import DiagramLoader
 
             loader = DiagramLoader()
             diagram_data, _ = await loader.load_diagram(diagram_path, None)
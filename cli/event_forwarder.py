@@ -2,34 +2,59 @@
 
 import asyncio
 import contextlib
+import time
+from typing import Any
 
 import httpx
 
 from dipeo.config.base_logger import get_module_logger
-from dipeo.diagram_generated.graphql.inputs import ExecutionControlInput, UpdateNodeStateInput
+from dipeo.diagram_generated.graphql.inputs import ExecutionControlInput
 from dipeo.diagram_generated.graphql.operations import (
     ControlExecutionOperation,
-    UpdateNodeStateOperation,
+    UpdateNodeStatesOperation,
 )
 from dipeo.domain.events import DomainEvent, EventType
 
 logger = get_module_logger(__name__)
 
+NODE_STATUS_MAP = {
+    EventType.NODE_STARTED: "RUNNING",
+    EventType.NODE_COMPLETED: "COMPLETED",
+    EventType.NODE_ERROR: "FAILED",
+}
+EXECUTION_EVENT_TYPES = (EventType.EXECUTION_COMPLETED, EventType.EXECUTION_ERROR)
 
-class EventForwarder:
-    """Forwards execution events from CLI to background server via GraphQL."""
 
-    def __init__(self, execution_id: str, server_url: str = "http://localhost:8000"):
+class EventForwarder:
+    """Forwards execution events from CLI to background server via GraphQL.
+
+    Node events are drained from the queue into batches of up to ``batch_size``
+    events, waiting at most ``flush_interval`` seconds for a batch to fill, and each
+    batch is sent as one UpdateNodeStates mutation over a persistent HTTP client.
+    Execution-level events are sent after the node events queued before them.
+    """
+
+    def __init__(
+        self,
+        execution_id: str,
+        server_url: str = "http://localhost:8000",
+        batch_size: int = 200,
+        flush_interval: float = 0.05,
+    ):
         self.execution_id = execution_id
         self.server_url = server_url
         self.graphql_endpoint = f"{server_url}/graphql"
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
         self._running = False
         self._event_queue: asyncio.Queue[DomainEvent] = asyncio.Queue()
         self._forward_task: asyncio.Task | None = None
+        self._client: httpx.AsyncClient | None = None
 
     async def start(self) -> None:
         """Start the event forwarder."""
         self._running = True
+        self._client = httpx.AsyncClient(timeout=2.0)
         self._forward_task = asyncio.create_task(self._process_event_queue())
 
     async def stop(self) -> None:
@@ -41,6 +66,9 @@ class EventForwarder:
             self._forward_task.cancel()
             with contextlib.suppress(asyncio.CancelledError):
                 await self._forward_task
+        if self._client:
+            await self._client.aclose()
+            self._client = None
 
     async def handle(self, event: DomainEvent) -> None:
         """Handle an event from the event bus (callback for EventBus subscription)."""
@@ -52,104 +80,93 @@ class EventForwarder:
             return
 
         # Forward node-level AND execution-level events
-        if event.type in [
-            EventType.NODE_STARTED,
-            EventType.NODE_COMPLETED,
-            EventType.NODE_ERROR,
-            EventType.EXECUTION_COMPLETED,
-            EventType.EXECUTION_ERROR,
-        ]:
+        if event.type in NODE_STATUS_MAP or event.type in EXECUTION_EVENT_TYPES:
             await self._event_queue.put(event)
 
     async def _process_event_queue(self) -> None:
-        """Process events from the queue and forward to server."""
-        while self._running or not self._event_queue.empty():
+        """Drain the queue into batches and forward them to the server."""
+        while True:
+            batch = await self._next_batch()
             try:
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=0.1)
-                await self._forward_event(event)
-                self._event_queue.task_done()
-            except TimeoutError:
-                continue
+                await self._forward_batch(batch)
             except Exception as e:
                 logger.error(f"Error processing event queue: {e}")
+            finally:
+                for _ in batch:
+                    self._event_queue.task_done()
 
-    async def _forward_event(self, event: DomainEvent) -> None:
-        """Forward a single event to the background server via GraphQL."""
-        try:
-            # Handle execution-level events differently
-            if event.type in [EventType.EXECUTION_COMPLETED, EventType.EXECUTION_ERROR]:
+    async def _next_batch(self) -> list[DomainEvent]:
+        """Wait for an event, then collect more until the batch is full or the interval ends."""
+        batch = [await self._event_queue.get()]
+        deadline = time.monotonic() + self.flush_interval
+
+        while len(batch) < self.batch_size:
+            try:
+                batch.append(self._event_queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+
+            # Execution events end a run; send without waiting for more
+            remaining = deadline - time.monotonic()
+            if batch[-1].type in EXECUTION_EVENT_TYPES or remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._event_queue.get(), timeout=remaining))
+            except TimeoutError:
+                break
+
+        return batch
+
+    async def _forward_batch(self, batch: list[DomainEvent]) -> None:
+        """Forward events in order, grouping consecutive node events into one mutation."""
+        updates: list[dict[str, Any]] = []
+        for event in batch:
+            if event.type in EXECUTION_EVENT_TYPES:
+                await self._forward_node_updates(updates)
+                updates = []
                 await self._forward_execution_event(event)
-                return
-
-            # Handle node-level events
-            # Extract node_id from scope (not payload!)
-            node_id = event.scope.node_id
-            if not node_id:
-                logger.warning(f"Event {event.type} missing node_id in scope, skipping forward")
-                return
-
-            # Map event type to status
-            status_map = {
-                EventType.NODE_STARTED: "RUNNING",
-                EventType.NODE_COMPLETED: "COMPLETED",
-                EventType.NODE_ERROR: "FAILED",
-            }
-            status = status_map.get(event.type)
-            if not status:
-                logger.warning(f"Unknown event type {event.type}, skipping forward")
-                return
-
-            # Extract error from payload
-            error = getattr(event.payload, "error_message", None) if event.payload else None
-
-            # Build mutation input
-            input_data = UpdateNodeStateInput(
-                execution_id=self.execution_id,
-                node_id=node_id,
-                status=status,
-                output=None,
-                error=error,
-            )
+                continue
 
-            variables = UpdateNodeStateOperation.get_variables_dict(input=input_data)
-            query = UpdateNodeStateOperation.get_query()
-
-            # Forward to server with retry logic
-            max_retries = 3
-            retry_delay = 0.1
-
-            for attempt in range(max_retries):
-                try:
-                    async with httpx.AsyncClient(timeout=2.0) as client:
-                        response = await client.post(
-                            self.graphql_endpoint,
-                            json={"query": query, "variables": variables},
-                        )
-                        result = response.json()
-                        if response.status_code == 200:
-                            if result.get("errors"):
-                                logger.error(
-                                    f"GraphQL errors forwarding event {event.type} for node {node_id}: {result['errors']}"
-                                )
-                            return
-                        else:
-                            logger.warning(
-                                f"Server returned {response.status_code} when forwarding event {event.type} for node {node_id}"
-                            )
-
-                except (httpx.ConnectError, httpx.TimeoutException) as e:
-                    if attempt < max_retries - 1:
-                        logger.debug(
-                            f"Failed to forward event (attempt {attempt + 1}/{max_retries}), retrying..."
-                        )
-                        await asyncio.sleep(retry_delay)
-                        retry_delay = min(retry_delay * 2, 1.0)
-                    else:
-                        logger.warning(f"Could not forward event after {max_retries} attempts: {e}")
-                        return
+            update = self._node_update(event)
+            if update is not None:
+                updates.append(update)
 
-        except Exception as e:
-            logger.error(f"Error forwarding event {event.type}: {e}")
+        await self._forward_node_updates(updates)
+
+    def _node_update(self, event: DomainEvent) -> dict[str, Any] | None:
+        """Build the UpdateNodeStates entry for a node event."""
+        # Extract node_id from scope (not payload!)
+        node_id = event.scope.node_id
+        if not node_id:
+            logger.warning(f"Event {event.type} missing node_id in scope, skipping forward")
+            return None
+
+        status = NODE_STATUS_MAP.get(event.type)
+        if not status:
+            logger.warning(f"Unknown event type {event.type}, skipping forward")
+            return None
+
+        # Extract error from payload
+        error = getattr(event.payload, "error_message", None) if event.payload else None
+
+        return {"node_id": node_id, "status": status, "output": None, "error": error}
+
+    async def _forward_node_updates(self, updates: list[dict[str, Any]]) -> None:
+        """Send node state updates to the server in a single UpdateNodeStates mutation."""
+        if not updates:
+            return
+
+        variables = UpdateNodeStatesOperation.get_variables_dict(
+            input={"execution_id": self.execution_id, "updates": updates}
+        )
+        result = await self._post(
+            UpdateNodeStatesOperation.get_query(), variables, f"{len(updates)} node updates"
+        )
+        if result is not None and not result.get("errors"):
+            payload = (result.get("data") or {}).get("updateNodeStates") or {}
+            if payload.get("success") is False:
+                logger.error(f"Server rejected node updates: {payload.get('error')}")
 
     async def _forward_execution_event(self, event: DomainEvent) -> None:
         """Forward execution-level events (COMPLETED/ERROR) to server via ControlExecution mutation."""
@@ -178,46 +195,59 @@ class EventForwarder:
             )
 
             variables = ControlExecutionOperation.get_variables_dict(input=input_data)
-            query = ControlExecutionOperation.get_query()
-
-            # Send the mutation with retry logic
-            max_retries = 3
-            retry_delay = 0.1
-
-            for attempt in range(max_retries):
-                try:
-                    async with httpx.AsyncClient(timeout=2.0) as client:
-                        response = await client.post(
-                            self.graphql_endpoint,
-                            json={"query": query, "variables": variables},
-                        )
-                        result = response.json()
-
-                        if response.status_code == 200:
-                            if result.get("errors"):
-                                logger.error(
-                                    f"GraphQL errors forwarding execution {action}: {result['errors']}"
-                                )
-                            else:
-                                logger.debug(f"Forwarded execution {action} to server (SUCCESS)")
-                            return
-                        else:
-                            logger.warning(
-                                f"Server returned {response.status_code} when forwarding execution {action}"
-                            )
-
-                except (httpx.ConnectError, httpx.TimeoutException) as e:
-                    if attempt < max_retries - 1:
-                        logger.debug(
-                            f"Failed to forward execution event (attempt {attempt + 1}/{max_retries}), retrying..."
-                        )
-                        await asyncio.sleep(retry_delay)
-                        retry_delay = min(retry_delay * 2, 1.0)
-                    else:
-                        logger.warning(
-                            f"Could not forward execution event after {max_retries} attempts: {e}"
-                        )
-                        return
+            result = await self._post(
+                ControlExecutionOperation.get_query(), variables, f"execution {action}"
+            )
+            if result is not None and not result.get("errors"):
+                logger.debug(f"Forwarded execution {action} to server (SUCCESS)")
 
         except Exception as e:
             logger.error(f"Error forwarding execution event {event.type}: {e}")
+
+    async def _post(
+        self, query: str, variables: dict[str, Any], description: str
+    ) -> dict[str, Any] | None:
+        """Send a GraphQL request with retries on connection errors and timeouts.
+
+        Args:
+            query: GraphQL query string
+            variables: Query variables
+            description: What is being forwarded, for log messages
+
+        Returns:
+            Decoded response body, or None if the server could not be reached
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(timeout=2.0)
+
+        max_retries = 3
+        retry_delay = 0.1
+
+        for attempt in range(max_retries):
+            try:
+                response = await self._client.post(
+                    self.graphql_endpoint,
+                    json={"query": query, "variables": variables},
+                )
+                result = response.json()
+                if response.status_code != 200:
+                    logger.warning(
+                        f"Server returned {response.status_code} when forwarding {description}"
+                    )
+                elif result.get("errors"):
+                    logger.error(f"GraphQL errors forwarding {description}: {result['errors']}")
+                return result
+
+            except (httpx.ConnectError, httpx.TimeoutException) as e:
+                if attempt < max_retries - 1:
+                    logger.debug(
+                        f"Failed to forward {description} "
+                        f"(attempt {attempt + 1}/{max_retries}), retrying..."
+                    )
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = min(retry_delay * 2, 1.0)
+                else:
+                    logger.warning(
+                        f"Could not forward {description} after {max_retries} attempts: {e}"
+                    )
+        return None
@@ -228,11 +228,27 @@ def _add_dipeocc_command(subparsers):
     convert_parser.add_argument(
         "--format", type=str, choices=["light", "native", "readable"], default="light"
     )
+    convert_parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        help="Worker processes for --latest batch conversion (default: CPU count)",
+    )
+    convert_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Re-convert sessions even if their source is unchanged",
+    )
 
     watch_parser = dipeocc_subparsers.add_parser(
         "watch", help="Watch for new sessions and convert automatically"
     )
     watch_parser.add_argument("--interval", type=int, default=30, help="Check interval in seconds")
+    watch_parser.add_argument(
+        "--follow",
+        action="store_true",
+        help="Follow growing sessions and regenerate diagrams from appended events",
+    )
 
     stats_cc_parser = dipeocc_subparsers.add_parser(
         "stats", help="Show detailed session statistics"
@@ -189,15 +189,10 @@ class TypedExecutionContext(ExecutionContextProtocol):
         endpoint_nodes = self.diagram.get_nodes_by_type(NodeType.ENDPOINT)
 
         if not endpoint_nodes:
-            all_states = self._state_tracker.get_all_node_states()
-            if not all_states:
+            if not self._state_tracker.count_nodes():
                 return False
 
-            for _node_id, state in all_states.items():
-                if state.status in (Status.PENDING, Status.RUNNING):
-                    return False
-
-            return True
+            return self._state_tracker.count_nodes(Status.PENDING, Status.RUNNING) == 0
 
         for endpoint in endpoint_nodes:
             state = self._state_tracker.get_node_state(endpoint.id)
@@ -19,8 +19,7 @@ def get_execution_summary(context: "TypedExecutionContext") -> dict[str, Any]:
 
 def _count_by_status(context: "TypedExecutionContext", status_filter: list[Status]) -> int:
     """Count nodes matching any of the given statuses."""
-    node_states = context.state.get_all_node_states()
-    return sum(1 for state in node_states.values() if state.status in status_filter)
+    return context.state.count_nodes(*status_filter)
 
 
 def count_nodes_by_status(context: "TypedExecutionContext", statuses: list[str]) -> int:
@@ -30,8 +29,7 @@ def count_nodes_by_status(context: "TypedExecutionContext", statuses: list[str])
 
 def calculate_progress(context: "TypedExecutionContext") -> dict[str, Any]:
     """Calculate execution progress with total_nodes, completed_nodes, and percentage."""
-    node_states = context.state.get_all_node_states()
-    total = len(node_states)
+    total = context.state.count_nodes()
     completed = _count_by_status(context, [Status.COMPLETED, Status.MAXITER_REACHED])
     return {
         "total_nodes": total,
@@ -52,11 +50,9 @@ def get_failed_node_count(context: "TypedExecutionContext") -> int:
 
 def get_execution_metrics(context: "TypedExecutionContext") -> dict[str, Any]:
     """Get comprehensive execution metrics: progress, status_counts, tracker_summary, execution_id, diagram_id."""
-    node_states = context.state.get_all_node_states()
-    status_counts = {}
-    for state in node_states.values():
-        status_name = state.status.name
-        status_counts[status_name] = status_counts.get(status_name, 0) + 1
+    status_counts = {
+        status.name: count for status, count in context.state.get_status_counts().items()
+    }
     return {
         "progress": calculate_progress(context),
         "status_counts": status_counts,
@@ -2,6 +2,7 @@
 
 import asyncio
 import logging
+import weakref
 from collections.abc import AsyncIterator
 from typing import TYPE_CHECKING, Any, Optional
 
@@ -9,6 +10,7 @@ from dipeo.application.execution.engine.context import TypedExecutionContext
 from dipeo.application.execution.engine.node_executor import execute_single_node
 from dipeo.application.execution.engine.scheduler import NodeScheduler
 from dipeo.application.execution.events import EventPipeline
+from dipeo.application.registry.keys import EXECUTION_HISTORY_SPILL_FACTORY
 from dipeo.config import get_settings
 from dipeo.config.base_logger import get_module_logger
 from dipeo.diagram_generated import ExecutionState, NodeID
@@ -54,21 +56,36 @@ class TypedExecutionEngine:
             )
             from dipeo.diagram_generated import Status
 
+            # Per-execution bindings (DIAGRAM, EXECUTION_CONTEXT) live in a scope so
+            # concurrent runs neither contend on nor overwrite the shared registry
+            service_registry = self.service_registry.create_scope()
+
             context = TypedExecutionContext(
                 execution_id=str(execution_state.id),
                 diagram_id=str(execution_state.diagram_id),
                 diagram=diagram,
-                service_registry=self.service_registry,
+                service_registry=service_registry,
                 event_bus=self.event_bus,
                 container=container,
             )
 
+            max_history = self._settings.execution.history_max_records_per_node
+            if max_history > 0:
+                history_spill = None
+                # Without a spill factory, records evicted from memory are dropped
+                if self.service_registry.has(EXECUTION_HISTORY_SPILL_FACTORY):
+                    history_spill = self.service_registry.resolve(EXECUTION_HISTORY_SPILL_FACTORY)()
+                    # Spilled records stay readable after the run, for as long as the
+                    # tracker is referenced
+                    weakref.finalize(context.state, history_spill.close)
+                context.state.configure_history(max_history, history_spill)
+
             node_states = {}
             tracker = context.get_tracker()
             ExecutionStatePersistence.load_from_state(execution_state, node_states, tracker)
 
             if node_states:
-                context._state_tracker._node_states = node_states
+                context._state_tracker.load_states(node_states)
 
             existing_states = context.state.get_all_node_states()
             for node in diagram.get_nodes_by_type(None) or diagram.nodes:
@@ -113,8 +130,8 @@ class TypedExecutionEngine:
 
             from dipeo.application.registry.keys import DIAGRAM, EXECUTION_CONTEXT
 
-            self.service_registry.register(DIAGRAM, diagram)
-            self.service_registry.register(
+            service_registry.register(DIAGRAM, diagram)
+            service_registry.register(
                 EXECUTION_CONTEXT, {"interactive_handler": interactive_handler}
             )
 
@@ -206,7 +223,7 @@ class TypedExecutionEngine:
         if len(nodes) == 1:
             node = nodes[0]
             result = await execute_single_node(
-                node, context, event_pipeline, self._scheduler, self.service_registry
+                node, context, event_pipeline, self._scheduler, context.service_registry
             )
             return {str(node.id): result}
 
@@ -215,7 +232,7 @@ class TypedExecutionEngine:
         async def execute_with_semaphore(node: ExecutableNode) -> tuple[str, dict[str, Any]]:
             async with semaphore:
                 result = await execute_single_node(
-                    node, context, event_pipeline, self._scheduler, self.service_registry
+                    node, context, event_pipeline, self._scheduler, context.service_registry
                 )
                 return str(node.id), result
 
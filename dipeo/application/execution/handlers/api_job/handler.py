@@ -1,4 +1,5 @@
 import json
+from pathlib import Path
 from typing import Any
 
 from pydantic import BaseModel
@@ -14,6 +15,7 @@ from dipeo.application.execution.handlers.core.base import TypedNodeHandler
 from dipeo.application.execution.handlers.core.decorators import requires_services
 from dipeo.application.execution.handlers.core.factory import register_handler
 from dipeo.application.registry import API_INVOKER
+from dipeo.application.registry.keys import FILESYSTEM_ADAPTER
 from dipeo.diagram_generated.enums import HttpMethod
 from dipeo.diagram_generated.unified_nodes.api_job_node import ApiJobNode, NodeType
 from dipeo.domain.execution.messaging.envelope import Envelope, EnvelopeFactory
@@ -152,17 +154,33 @@ class ApiJobNodeHandler(TypedNodeHandler[ApiJobNode]):
 
         max_retries = getattr(node, "max_retries", 3)
 
-        response_data = await api_service.execute_with_retry(
-            url=url,
-            method=method_value,
-            data=request_data,
-            headers=headers,
-            max_retries=max_retries,
-            retry_delay=1.0,
-            timeout=timeout,
-            auth=auth,
-            expected_status_codes=list(range(200, 300)),
-        )
+        pagination = (node.metadata or {}).get("pagination")
+        if pagination:
+            response_data = await self._stream_pages(
+                request,
+                pagination,
+                url=url,
+                method=method_value,
+                # Params go in the query string unless they are already the request body
+                params=params if request_data is not params else None,
+                data=request_data,
+                headers=headers,
+                max_retries=max_retries,
+                timeout=timeout,
+                auth=auth,
+            )
+        else:
+            response_data = await api_service.execute_with_retry(
+                url=url,
+                method=method_value,
+                data=request_data,
+                headers=headers,
+                max_retries=max_retries,
+                retry_delay=1.0,
+                timeout=timeout,
+                auth=auth,
+                expected_status_codes=list(range(200, 300)),
+            )
 
         if hasattr(api_service, "last_response"):
             request.set_handler_state("last_response", api_service.last_response)
@@ -183,6 +201,49 @@ class ApiJobNodeHandler(TypedNodeHandler[ApiJobNode]):
 
         return response_dict
 
+    async def _stream_pages(
+        self,
+        request: ExecutionRequest[ApiJobNode],
+        pagination: dict[str, Any],
+        **request_args: Any,
+    ) -> dict[str, Any]:
+        """Consume a paginated collection page by page.
+
+        Driven by the node's ``metadata``: ``pagination`` (provider manifest format),
+        optional ``max_items``, and optional ``output_file``. With ``output_file`` each
+        page is appended to that JSONL file as it arrives, so the collection is never
+        held in memory; otherwise the items are returned as a list.
+        """
+        metadata = request.node.metadata or {}
+        output_file = metadata.get("output_file")
+        pages = self._api_service.iter_pages(
+            pagination=pagination, max_items=metadata.get("max_items"), **request_args
+        )
+
+        page_count = 0
+        if not output_file:
+            items: list[Any] = []
+            async for page in pages:
+                items.extend(page)
+                page_count += 1
+            return {"items": items, "count": len(items), "pages": page_count}
+
+        filesystem = request.get_optional_service(FILESYSTEM_ADAPTER)
+        if filesystem is None:
+            raise ValueError("Filesystem adapter is required when output_file is set")
+
+        file_path = Path(output_file)
+        if file_path.parent != Path() and not filesystem.exists(file_path.parent):
+            filesystem.mkdir(file_path.parent, parents=True)
+        count = 0
+        with filesystem.open(file_path, "wb") as f:
+            async for page in pages:
+                lines = "".join(json.dumps(item, default=str) + "\n" for item in page)
+                f.write(lines.encode("utf-8"))
+                count += len(page)
+                page_count += 1
+        return {"output_file": output_file, "count": count, "pages": page_count}
+
     def serialize_output(self, result: Any, request: ExecutionRequest[ApiJobNode]) -> Envelope:
         node = request.node
         trace_id = request.execution_id or ""
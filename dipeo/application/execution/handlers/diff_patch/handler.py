@@ -13,9 +13,10 @@ from dipeo.application.execution.handlers.diff_patch.diff_processor import (
 )
 from dipeo.application.execution.handlers.diff_patch.patch_applier import (
     apply_diff,
-    calculate_file_hash,
+    calculate_lines_hash,
     create_backup,
     save_rejected_hunks,
+    write_patched_lines,
 )
 from dipeo.config.base_logger import get_module_logger
 from dipeo.diagram_generated.enums import NodeType
@@ -140,13 +141,11 @@ class DiffPatchHandler(TypedNodeHandler[DiffPatchNode]):
                     shutil.copy2(backup_path, target_path)
                 return result
 
-        patched_content = "".join(patched_lines)
         if apply_mode != "dry_run":
-            target_path.write_text(patched_content)
+            write_patched_lines(target_path, patched_lines)
             logger.info(f"Successfully patched {target_path}")
 
-        file_hash = calculate_file_hash(patched_content)
-        result["file_hash"] = file_hash
+        result["file_hash"] = calculate_lines_hash(patched_lines)
         result["status"] = "success" if not rejected_hunks else "partial"
 
         return result
@@ -1,6 +1,7 @@
 import hashlib
 import os
 import shutil
+from collections.abc import Iterable, Sequence
 from pathlib import Path
 from typing import Any
 
@@ -22,24 +23,60 @@ def create_backup(target_path: Path, backup_dir: Path | None) -> Path:
 
 
 def apply_diff(
-    original_lines: list[str],
+    original_lines: Sequence[str],
     diff_content: str,
     format_type: str,
     strip_level: int,
     fuzz_factor: int,
     ignore_whitespace: bool,
 ) -> tuple[list[str], list[dict[str, Any]]]:
+    """Apply unified diff hunks to a file's lines in one forward pass.
+
+    Each hunk is tried at its header position (shifted by the line delta of the
+    hunks applied before it), then up to ``fuzz_factor`` lines before and after.
+    Unchanged spans are copied once, so patching is linear in file size plus
+    hunk size rather than rebuilding the line list for every hunk.
+
+    Args:
+        original_lines: Lines of the target file
+        diff_content: Unified diff text
+        format_type: Diff format; anything but unified/git is treated as unified
+        strip_level: Path components to strip (unused; the target is given directly)
+        fuzz_factor: Maximum lines a hunk may be displaced from its header position
+        ignore_whitespace: Compare context lines ignoring leading/trailing whitespace
+
+    Returns:
+        Tuple of (patched lines, rejected hunks)
+    """
     if format_type not in ["unified", "git"]:
         logger.warning(f"Format {format_type} not fully supported, treating as unified")
 
     hunks = parse_hunks(diff_content)
-    patched_lines = original_lines.copy()
     rejected_hunks = []
     offset = 0
 
+    # The patched file is ``output`` followed by ``original_lines[consumed:]``;
+    # hunks are spliced in at the boundary as the pass moves forward.
+    output: list[str] = []
+    consumed = 0
+    total = len(original_lines)
+
+    def line_at(position: int) -> str:
+        if position < len(output):
+            return output[position]
+        return original_lines[consumed + position - len(output)]
+
+    def matches(start: int, expected: list[str]) -> bool:
+        if start + len(expected) > len(output) + total - consumed:
+            return False
+        for i, line in enumerate(expected):
+            actual = line_at(start + i)
+            if (actual.strip() if ignore_whitespace else actual) != line:
+                return False
+        return True
+
     for hunk in hunks:
         old_start = hunk["old_start"] - 1 + offset
-        old_lines = hunk["old_lines"]
         new_lines = []
         old_content = []
 
@@ -52,34 +89,46 @@ def apply_diff(
                 old_content.append(line[1:])
                 new_lines.append(line[1:])
 
-        applied = False
+        expected = [line.strip() for line in old_content] if ignore_whitespace else old_content
+        length = len(output) + total - consumed
+
+        match_start = None
         for fuzz in range(fuzz_factor + 1):
             for direction in [0, -1, 1]:
                 test_start = old_start + direction * fuzz
-                if test_start < 0 or test_start >= len(patched_lines):
-                    continue
-
-                if _match_content(
-                    patched_lines[test_start : test_start + len(old_content)],
-                    old_content,
-                    ignore_whitespace,
-                ):
-                    patched_lines = (
-                        patched_lines[:test_start]
-                        + new_lines
-                        + patched_lines[test_start + len(old_content) :]
-                    )
-                    offset += len(new_lines) - len(old_content)
-                    applied = True
+                if 0 <= test_start < length and matches(test_start, expected):
+                    match_start = test_start
                     break
-
-            if applied:
+            if match_start is not None:
                 break
 
-        if not applied:
+        if match_start is None:
             rejected_hunks.append(hunk)
+            continue
 
-    return patched_lines, rejected_hunks
+        match_end = match_start + len(old_content)
+        if match_end <= len(output):
+            # Fuzz moved the hunk back into lines already written
+            output[match_start:match_end] = new_lines
+        elif match_start >= len(output):
+            copy_end = consumed + match_start - len(output)
+            output.extend(original_lines[consumed:copy_end])
+            output.extend(new_lines)
+            consumed = copy_end + len(old_content)
+        else:
+            consumed += match_end - len(output)
+            del output[match_start:]
+            output.extend(new_lines)
+        offset += len(new_lines) - len(old_content)
+
+    output.extend(original_lines[consumed:])
+    return output, rejected_hunks
+
+
+def write_patched_lines(target_path: Path, lines: Iterable[str]) -> None:
+    """Write patched lines without joining them into one string."""
+    with target_path.open("w") as f:
+        f.writelines(lines)
 
 
 def save_rejected_hunks(reject_file: Path, rejected_hunks: list[dict[str, Any]]) -> None:
@@ -102,17 +151,9 @@ def calculate_file_hash(content: str) -> str:
     return hashlib.sha256(content.encode()).hexdigest()
 
 
-def _match_content(
-    actual_lines: list[str], expected_lines: list[str], ignore_whitespace: bool
-) -> bool:
-    if len(actual_lines) != len(expected_lines):
-        return False
-
-    for actual, expected in zip(actual_lines, expected_lines, strict=True):
-        if ignore_whitespace:
-            if actual.strip() != expected.strip():
-                return False
-        elif actual != expected:
-            return False
-
-    return True
+def calculate_lines_hash(lines: Iterable[str]) -> str:
+    """Hash lines as calculate_file_hash would hash their concatenation."""
+    digest = hashlib.sha256()
+    for line in lines:
+        digest.update(line.encode())
+    return digest.hexdigest()
@@ -209,6 +209,15 @@ class SingleExecutor:
         if pydantic_model:
             complete_kwargs["text_format"] = pydantic_model
 
+        # Per-diagram response cache policy: the run entry points copy the diagram file's
+        # top-level `llm_cache: {mode, ttl_s}` block into executable metadata
+        diagram_metadata = getattr(self._diagram, "metadata", None) or {}
+        llm_cache = diagram_metadata.get("llm_cache")
+        if isinstance(llm_cache, str):
+            llm_cache = {"mode": llm_cache}
+        if llm_cache:
+            complete_kwargs["llm_cache"] = llm_cache
+
         return complete_kwargs
 
     def _build_task_preview(
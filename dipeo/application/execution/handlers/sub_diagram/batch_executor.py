@@ -465,14 +465,7 @@ class BatchSubDiagramExecutor(BaseSubDiagramExecutor):
     def _create_isolated_registry(self, parent_registry):
         """Create an isolated service registry for batch item execution.
 
-        Copies parent registry to prevent state contamination between parallel executions.
+        Returns a copy-on-write scope over the parent registry: bindings made by the
+        batch item stay local, and parent services are read from a shared snapshot.
         """
-        from dipeo.application.registry import ServiceRegistry
-
-        isolated_registry = ServiceRegistry()
-
-        if hasattr(parent_registry, "_services"):
-            for key_str, service in parent_registry._services.items():
-                isolated_registry._services[key_str] = service
-
-        return isolated_registry
+        return parent_registry.create_scope()
@@ -372,41 +372,10 @@ class LightweightSubDiagramExecutor(BaseSubDiagramExecutor):
     def _create_isolated_registry(self, parent_registry):
         """Create an isolated service registry for sub-diagram execution.
 
-        Copies the parent registry to prevent state contamination between parallel executions.
+        Returns a copy-on-write scope over the parent registry: bindings made by the
+        sub-diagram stay local, and parent services are read from a shared snapshot.
         """
-        from dipeo.application.registry import ServiceRegistry
-
-        isolated_registry = ServiceRegistry()
-
-        if hasattr(parent_registry, "_services"):
-            for key_str, service in parent_registry._services.items():
-                isolated_registry._services[key_str] = service
-
-        # Ensure critical services for person_job are available
-        if hasattr(parent_registry, "resolve"):
-            from dipeo.application.registry.keys import (
-                EXECUTION_ORCHESTRATOR,
-                FILESYSTEM_ADAPTER,
-                LLM_SERVICE,
-                PROMPT_BUILDER,
-            )
-
-            critical_services = [
-                (FILESYSTEM_ADAPTER, "filesystem_adapter"),
-                (LLM_SERVICE, "llm_service"),
-                (EXECUTION_ORCHESTRATOR, "execution_orchestrator"),
-                (PROMPT_BUILDER, "prompt_builder"),
-            ]
-
-            for service_key, key_str in critical_services:
-                try:
-                    service = parent_registry.resolve(service_key)
-                    if service and key_str not in isolated_registry._services:
-                        isolated_registry._services[key_str] = service
-                except Exception:
-                    pass
-
-        return isolated_registry
+        return parent_registry.create_scope()
 
     async def _register_diagram_persons(
         self, diagram: "ExecutableDiagram", service_registry
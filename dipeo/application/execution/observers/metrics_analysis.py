@@ -1,14 +1,158 @@
 """Metrics analysis and optimization logic."""
 
+import heapq
+from dataclasses import dataclass, field
 from typing import Any
 
-from dipeo.application.execution.observers.metrics_types import ExecutionMetrics
+from dipeo.application.execution.observers.metrics_types import ExecutionMetrics, NodeMetrics
 from dipeo.config.base_logger import get_module_logger
 from dipeo.domain.events import DomainEvent, EventBus, EventScope, EventType, ExecutionLogPayload
 
 logger = get_module_logger(__name__)
 
 
+@dataclass
+class ExecutionDag:
+    """Executed node instances with their measured durations and dependency edges.
+
+    Instances are keyed like ``ExecutionMetrics.node_metrics`` (loop iterations are
+    separate instances). ``order`` is a topological order of the instances.
+    """
+
+    durations: dict[str, float]
+    predecessors: dict[str, set[str]]
+    successors: dict[str, set[str]] = field(default_factory=dict)
+    order: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_metrics(
+        cls, metrics: ExecutionMetrics, dependencies: dict[str, set[str]] | None
+    ) -> "ExecutionDag":
+        """Build the DAG of an execution.
+
+        An instance depends on the latest instance of each dependency node that
+        finished before it started. Without dependency information, an instance
+        depends on every instance that finished before it started. Either way edges
+        follow time, so the graph is acyclic even for diagrams with loops.
+
+        Args:
+            metrics: Collected execution metrics
+            dependencies: Node id to the node ids it depends on
+
+        Returns:
+            Execution DAG
+        """
+        instances = sorted(
+            metrics.node_metrics.items(), key=lambda item: (item[1].start_time, _end(item[1]))
+        )
+        durations = {key: _duration_ms(node) for key, node in instances}
+        predecessors: dict[str, set[str]] = {key: set() for key, _ in instances}
+
+        if dependencies:
+            by_node: dict[str, list[tuple[str, NodeMetrics]]] = {}
+            for key, node in instances:
+                by_node.setdefault(node.node_id, []).append((key, node))
+            for key, node in instances:
+                for dependency in dependencies.get(node.node_id, ()):
+                    finished = [
+                        (_end(other), other_key)
+                        for other_key, other in by_node.get(dependency, ())
+                        if other_key != key and _end(other) <= node.start_time
+                    ]
+                    if finished:
+                        predecessors[key].add(max(finished)[1])
+        else:
+            for index, (key, node) in enumerate(instances):
+                predecessors[key] = {
+                    other_key
+                    for other_key, other in instances[:index]
+                    if _end(other) <= node.start_time
+                }
+
+        dag = cls(durations=durations, predecessors=predecessors)
+        dag.successors = {key: set() for key in durations}
+        for key, preds in predecessors.items():
+            for pred in preds:
+                dag.successors[pred].add(key)
+        dag.order = dag._topological_order([key for key, _ in instances])
+        return dag
+
+    def _topological_order(self, start_order: list[str]) -> list[str]:
+        # Kahn's algorithm, preferring earlier-started instances among the ready ones
+        rank = {key: index for index, key in enumerate(start_order)}
+        remaining = {key: len(preds) for key, preds in self.predecessors.items()}
+        ready = [(rank[key], key) for key, count in remaining.items() if count == 0]
+        heapq.heapify(ready)
+        order = []
+        while ready:
+            _, key = heapq.heappop(ready)
+            order.append(key)
+            for successor in self.successors[key]:
+                remaining[successor] -= 1
+                if remaining[successor] == 0:
+                    heapq.heappush(ready, (rank[successor], successor))
+        return order
+
+    def schedule(self) -> tuple[dict[str, float], dict[str, float]]:
+        """Compute earliest and latest start times with unlimited parallelism.
+
+        Returns:
+            Tuple of (earliest start, latest start) per instance, in milliseconds
+        """
+        earliest: dict[str, float] = {}
+        for key in self.order:
+            earliest[key] = max(
+                (earliest[pred] + self.durations[pred] for pred in self.predecessors[key]),
+                default=0.0,
+            )
+        makespan = max((earliest[key] + self.durations[key] for key in self.order), default=0.0)
+
+        latest: dict[str, float] = {}
+        for key in reversed(self.order):
+            latest_finish = min((latest[succ] for succ in self.successors[key]), default=makespan)
+            latest[key] = latest_finish - self.durations[key]
+        return earliest, latest
+
+    def critical_path(self, earliest: dict[str, float]) -> list[str]:
+        """Longest duration-weighted path through the DAG, from source to sink."""
+        if not self.order:
+            return []
+        key = max(self.order, key=lambda k: earliest[k] + self.durations[k])
+        path = [key]
+        while self.predecessors[key]:
+            # The predecessor that finishes last is the one that gated this instance
+            key = max(self.predecessors[key], key=lambda k: earliest[k] + self.durations[k])
+            path.append(key)
+        path.reverse()
+        return path
+
+    def antichain_levels(self) -> list[list[str]]:
+        """Group instances by longest hop count from a source.
+
+        No instance can reach another instance of the same level, so each level is
+        an antichain: its members have no dependency between them.
+        """
+        level: dict[str, int] = {}
+        for key in self.order:
+            level[key] = max((level[pred] + 1 for pred in self.predecessors[key]), default=0)
+        groups: dict[int, list[str]] = {}
+        for key in self.order:
+            groups.setdefault(level[key], []).append(key)
+        return [groups[index] for index in sorted(groups)]
+
+
+def _end(node: NodeMetrics) -> float:
+    if node.end_time is not None:
+        return node.end_time
+    return node.start_time + (node.duration_ms or 0.0) / 1000
+
+
+def _duration_ms(node: NodeMetrics) -> float:
+    if node.duration_ms is not None:
+        return node.duration_ms
+    return max(0.0, (_end(node) - node.start_time) * 1000)
+
+
 class MetricsAnalyzer:
     """Analyzes execution metrics and provides optimization suggestions."""
 
@@ -34,8 +178,10 @@ class MetricsAnalyzer:
         """Analyze completed execution and emit optimization suggestions."""
         bottlenecks = self._identify_bottlenecks(metrics)
         metrics.bottlenecks = [b["node_id"] for b in bottlenecks[:5]]
-        metrics.critical_path = self._calculate_critical_path(metrics)
-        metrics.parallelizable_groups = self._find_parallelizable_nodes(metrics)
+
+        dag = ExecutionDag.from_metrics(metrics, self._node_dependencies.get(metrics.execution_id))
+        metrics.critical_path = self._calculate_critical_path(metrics, dag)
+        metrics.parallelizable_groups = self._find_parallelizable_nodes(metrics, dag)
 
         if self.event_bus:
             await self._emit_metrics_event(metrics, scope, bottlenecks)
@@ -69,6 +215,8 @@ class MetricsAnalyzer:
             "total_token_usage": total_token_usage,
             "bottlenecks": bottlenecks[:5],
             "critical_path_length": len(metrics.critical_path),
+            "critical_path": metrics.critical_path,
+            "critical_path_ms": metrics.critical_path_ms,
             "parallelizable_groups": len(metrics.parallelizable_groups),
             "node_breakdown": node_breakdown,
         }
@@ -126,57 +274,46 @@ class MetricsAnalyzer:
         bottlenecks.sort(key=lambda x: x["duration_ms"], reverse=True)
         return bottlenecks
 
-    def _calculate_critical_path(self, metrics: ExecutionMetrics) -> list[str]:
-        """Calculate the critical execution path based on start times."""
-        sorted_nodes = sorted(metrics.node_metrics.items(), key=lambda x: x[1].start_time)
-        return [node_id for node_id, _ in sorted_nodes]
+    def _calculate_critical_path(self, metrics: ExecutionMetrics, dag: ExecutionDag) -> list[str]:
+        """Find the longest duration-weighted dependency chain and each node's slack.
 
-    def _find_parallelizable_nodes(self, metrics: ExecutionMetrics) -> list[list[str]]:
-        """Find groups of nodes that could be executed in parallel."""
-        groups = []
-        exec_id = metrics.execution_id
-
-        if exec_id not in self._node_dependencies:
-            return groups
-
-        dependencies = self._node_dependencies[exec_id]
-        potential_group = []
-
-        for node_id in metrics.node_metrics:
-            node_deps = dependencies.get(node_id, set())
-            can_parallel = True
+        Also sets ``metrics.critical_path_ms`` and ``metrics.node_slack_ms``; a node's
+        slack is how long it could be delayed without lengthening the execution.
+        """
+        earliest, latest = dag.schedule()
+        path = dag.critical_path(earliest)
+        metrics.critical_path_ms = sum(dag.durations[key] for key in path)
+        metrics.node_slack_ms = {key: max(0.0, latest[key] - earliest[key]) for key in dag.order}
+        return path
 
-            for other_id in potential_group:
-                other_deps = dependencies.get(other_id, set())
-                if node_id in other_deps or other_id in node_deps:
-                    can_parallel = False
-                    break
-
-            if can_parallel:
-                potential_group.append(node_id)
-            elif len(potential_group) > 1:
-                groups.append(potential_group)
-                potential_group = [node_id]
-
-        if len(potential_group) > 1:
-            groups.append(potential_group)
+    def _find_parallelizable_nodes(
+        self, metrics: ExecutionMetrics, dag: ExecutionDag
+    ) -> list[list[str]]:
+        """Find groups of independent nodes that did not fully run in parallel.
 
+        Groups are antichains of the execution DAG. A group is reported when the
+        wall time its members spanned exceeds its longest member, the time they
+        would take running concurrently.
+        """
+        groups = []
+        for group in dag.antichain_levels():
+            if len(group) < 2:
+                continue
+            nodes = [metrics.node_metrics[key] for key in group]
+            span_ms = (max(_end(n) for n in nodes) - min(n.start_time for n in nodes)) * 1000
+            if span_ms > max(dag.durations[key] for key in group) + 1e-6:
+                groups.append(group)
         return groups
 
     def _estimate_parallel_savings(self, metrics: ExecutionMetrics) -> float:
-        """Estimate time savings from parallelization."""
-        total_savings = 0.0
-
-        for group in metrics.parallelizable_groups:
-            durations = []
-            for node_id in group:
-                if node_id in metrics.node_metrics:
-                    duration = metrics.node_metrics[node_id].duration_ms
-                    if duration:
-                        durations.append(duration)
-
-            if durations:
-                savings = sum(durations) - max(durations)
-                total_savings += savings
-
-        return total_savings
+        """Estimate time savings from parallelization.
+
+        With every independent node running concurrently the execution would take
+        as long as its critical path; the savings are the observed node wall time
+        beyond that.
+        """
+        if not metrics.node_metrics or metrics.critical_path_ms is None:
+            return 0.0
+        nodes = metrics.node_metrics.values()
+        observed_ms = (max(_end(n) for n in nodes) - min(n.start_time for n in nodes)) * 1000
+        return round(max(0.0, observed_ms - metrics.critical_path_ms), 1)
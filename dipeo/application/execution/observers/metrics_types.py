@@ -31,6 +31,8 @@ class ExecutionMetrics:
     total_duration_ms: float | None = None
     node_metrics: dict[str, NodeMetrics] = field(default_factory=dict)
     critical_path: list[str] = field(default_factory=list)
+    critical_path_ms: float | None = None
+    node_slack_ms: dict[str, float] = field(default_factory=dict)
     parallelizable_groups: list[list[str]] = field(default_factory=list)
     bottlenecks: list[str] = field(default_factory=list)
 
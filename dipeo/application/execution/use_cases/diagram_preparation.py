@@ -45,6 +45,10 @@ async def prepare_and_compile_diagram(
         # Fallback to inline implementation if service not available
         executable_diagram = await _fallback_prepare_and_compile(service_registry, diagram, options)
 
+    # Per-diagram LLM response cache policy ({"mode": ..., "ttl_s": ...}) for PersonJob calls
+    if options.get("llm_cache"):
+        executable_diagram.metadata["llm_cache"] = options["llm_cache"]
+
     await register_person_configs(service_registry, executable_diagram)
 
     return executable_diagram
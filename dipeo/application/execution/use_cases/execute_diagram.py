@@ -168,10 +168,13 @@ class ExecuteDiagramUseCase(LoggingMixin, InitializationMixin):
                             "status": state.status.value,
                             "error": state.error if state.error else ("Failed" if is_error else None),
                         }
-                except Exception:
-                    execution_task.cancel()
-                    with contextlib.suppress(asyncio.CancelledError):
-                        await execution_task
+                except BaseException:
+                    # Also on cancellation of the consumer, so a cancelled run stops the engine
+                    for task in (execution_task, poll_task):
+                        task.cancel()
+                    for task in (execution_task, poll_task):
+                        with contextlib.suppress(asyncio.CancelledError, Exception):
+                            await task
                     raise
         except Exception:
             raise
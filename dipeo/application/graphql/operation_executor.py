@@ -133,6 +133,7 @@ class OperationExecutor:
             "ControlExecution": "ExecutionResult",
             "SendInteractiveResponse": "ExecutionResult",
             "UpdateNodeState": "ExecutionResult",
+            "UpdateNodeStates": "ExecutionResult",
             "UploadFile": "FileOperationResult",
             "ConvertDiagramFormat": "FileOperationResult",
         }
@@ -18,6 +18,7 @@ from dipeo.diagram_generated.graphql.inputs import (
     ExecutionControlInput,
     InteractiveResponseInput,
     UpdateNodeStateInput,
+    UpdateNodeStatesInput,
 )
 from dipeo.diagram_generated.graphql.results import ExecutionResult
 from dipeo.infrastructure.diagram.adapters import UnifiedSerializerAdapter
@@ -85,6 +86,10 @@ async def execute_diagram(registry: ServiceRegistry, input: ExecuteDiagramInput)
         if diagram_source_path:
             options["diagram_source_path"] = diagram_source_path
 
+        # Optional top-level `llm_cache: {mode, ttl_s}` block in inline diagram data
+        if isinstance(input.diagram_data, dict) and input.diagram_data.get("llm_cache"):
+            options["llm_cache"] = input.diagram_data["llm_cache"]
+
         execution_id = ExecutionID(f"exec_{uuid.uuid4().hex}")
 
         async def run_execution():
@@ -117,6 +122,53 @@ async def execute_diagram(registry: ServiceRegistry, input: ExecuteDiagramInput)
         return ExecutionResult.error_result(error=f"Failed to execute diagram: {e!s}")
 
 
+async def _apply_node_state(
+    state_store,
+    message_router,
+    execution_id: str,
+    node_id: str,
+    status: str,
+    output=None,
+    error: str | None = None,
+) -> None:
+    """Store one node status update and broadcast it to the execution's subscribers."""
+    # Convert string status to Status enum
+    status_map = {
+        "RUNNING": Status.RUNNING,
+        "COMPLETED": Status.COMPLETED,
+        "FAILED": Status.FAILED,
+    }
+    status_enum = status_map.get(status.upper(), Status.RUNNING)
+
+    # Update node status (execution should already exist from register_cli_session)
+    await state_store.update_node_status(
+        execution_id=execution_id,
+        node_id=node_id,
+        status=status_enum,
+        error=error,
+    )
+
+    # Determine event type based on status (case-insensitive)
+    status_upper = status.upper()
+    if status_upper == "COMPLETED":
+        event_type = EventType.NODE_COMPLETED
+    elif status_upper == "FAILED" or error:
+        event_type = EventType.NODE_ERROR
+    else:  # RUNNING or other
+        event_type = EventType.NODE_STARTED
+
+    await message_router.broadcast_to_execution(
+        execution_id=execution_id,
+        message={
+            "type": event_type,
+            "node_id": node_id,
+            "status": status,
+            "output": output,
+            "error": error,
+        },
+    )
+
+
 async def update_node_state(
     registry: ServiceRegistry, input: UpdateNodeStateInput
 ) -> ExecutionResult:
@@ -128,42 +180,16 @@ async def update_node_state(
         state_store = registry.resolve(STATE_STORE)
         message_router = registry.resolve(MESSAGE_ROUTER)
 
-        # Convert string status to Status enum
-        status_map = {
-            "RUNNING": Status.RUNNING,
-            "COMPLETED": Status.COMPLETED,
-            "FAILED": Status.FAILED,
-        }
-        status_enum = status_map.get(input.status.upper(), Status.RUNNING)
-
-        # Update node status (execution should already exist from register_cli_session)
-        await state_store.update_node_status(
+        await _apply_node_state(
+            state_store,
+            message_router,
             execution_id=input.execution_id,
             node_id=input.node_id,
-            status=status_enum,
+            status=input.status,
+            output=input.output,
             error=input.error,
         )
 
-        # Determine event type based on status (case-insensitive)
-        status_upper = input.status.upper()
-        if status_upper == "COMPLETED":
-            event_type = EventType.NODE_COMPLETED
-        elif status_upper == "FAILED" or input.error:
-            event_type = EventType.NODE_ERROR
-        else:  # RUNNING or other
-            event_type = EventType.NODE_STARTED
-
-        await message_router.broadcast_to_execution(
-            execution_id=input.execution_id,
-            message={
-                "type": event_type,
-                "node_id": input.node_id,
-                "status": input.status,
-                "output": input.output,
-                "error": input.error,
-            },
-        )
-
         execution = await state_store.get_state(input.execution_id)
         result = ExecutionResult.success_result(
             data=ExecutionStateType.from_pydantic(execution),
@@ -177,6 +203,39 @@ async def update_node_state(
         return ExecutionResult.error_result(error=f"Failed to update node state: {e!s}")
 
 
+async def update_node_states(
+    registry: ServiceRegistry, input: UpdateNodeStatesInput
+) -> ExecutionResult:
+    """
+    Resolver for UpdateNodeStates operation.
+    Applies a batch of node state updates in order; used by CLI event forwarding.
+    """
+    applied = 0
+    try:
+        state_store = registry.resolve(STATE_STORE)
+        message_router = registry.resolve(MESSAGE_ROUTER)
+
+        for update in input.updates:
+            await _apply_node_state(
+                state_store,
+                message_router,
+                execution_id=input.execution_id,
+                node_id=update.node_id,
+                status=update.status,
+                output=update.output,
+                error=update.error,
+            )
+            applied += 1
+
+        return ExecutionResult.success_result(message=f"Applied {applied} node state updates")
+
+    except Exception as e:
+        logger.error(f"Failed to update node states after {applied} updates: {e}")
+        return ExecutionResult.error_result(
+            error=f"Failed to update node states after {applied} updates: {e!s}"
+        )
+
+
 async def control_execution(
     registry: ServiceRegistry, input: ExecutionControlInput
 ) -> ExecutionResult:
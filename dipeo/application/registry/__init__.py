@@ -2,6 +2,8 @@
 
 from .enhanced_service_registry import (
     ChildServiceRegistry,
+    RegistrySnapshot,
+    ScopedServiceRegistry,
 )
 from .enhanced_service_registry import (
     EnhancedServiceKey as ServiceKey,
@@ -15,6 +17,8 @@ __all__ = [
     "ServiceRegistry",
     "ServiceKey",
     "ChildServiceRegistry",
+    "RegistrySnapshot",
+    "ScopedServiceRegistry",
 ] + [
     item
     for item in dir()
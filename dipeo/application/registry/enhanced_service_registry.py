@@ -9,6 +9,7 @@ from contextlib import contextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from types import MappingProxyType
 from typing import Any, TypeVar, cast
 
 T = TypeVar("T")
@@ -67,6 +68,15 @@ class EnhancedServiceKey[T]:
         return f"EnhancedServiceKey[{self.name}]{qualifier_str}"
 
 
+@dataclass(frozen=True, slots=True)
+class RegistrySnapshot:
+    """Immutable view of a registry's bindings at a point in time."""
+
+    services: MappingProxyType[str, object]
+    factories: MappingProxyType[str, Callable[[], object]]
+    keys: MappingProxyType[str, EnhancedServiceKey]
+
+
 class EnhancedServiceRegistry:
     """Thread-safe service registry with enhanced safety rails and audit capabilities."""
 
@@ -81,6 +91,9 @@ class EnhancedServiceRegistry:
         # Thread safety
         self._lock = threading.RLock()
 
+        # Copy-on-write snapshot shared by scoped registries; dropped on any mutation
+        self._snapshot: RegistrySnapshot | None = None
+
         # Metrics and auditing
         self._resolve_hits: dict[str, int] = {}
         self._audit_trail: list[RegistrationRecord] = []
@@ -143,6 +156,7 @@ class EnhancedServiceRegistry:
 
             # Store the key metadata
             self._service_keys[key.name] = key
+            self._snapshot = None
 
             if callable(service) and not hasattr(service, "__self__"):
                 self._factories[key.name] = service
@@ -172,6 +186,7 @@ class EnhancedServiceRegistry:
                 try:
                     service = self._factories[key.name]()
                     self._services[key.name] = service
+                    self._snapshot = None
                     self._resolve_hits[key.name] = self._resolve_hits.get(key.name, 0) + 1
                     return cast(T, service)
                 except Exception as e:
@@ -254,6 +269,7 @@ class EnhancedServiceRegistry:
             self._service_keys.pop(key.name, None)
             self._immutable_services.discard(key.name)
             self._frozen_services.discard(key.name)
+            self._snapshot = None
 
             self._record_action(key.name, "unregister", caller_info, True)
 
@@ -299,6 +315,7 @@ class EnhancedServiceRegistry:
             self._service_keys.clear()
             self._immutable_services.clear()
             self._frozen_services.clear()
+            self._snapshot = None
 
             self._record_action("*", "clear", caller_info, True)
 
@@ -386,6 +403,7 @@ class EnhancedServiceRegistry:
                 else:
                     self._services[key.name] = value
                     self._factories.pop(key.name, None)
+                self._snapshot = None
 
                 self._record_action(
                     key.name,
@@ -411,6 +429,7 @@ class EnhancedServiceRegistry:
                         else:
                             self._factories[key.name] = value
                             self._services.pop(key.name, None)
+                    self._snapshot = None
 
                     self._record_action(
                         key.name,
@@ -466,6 +485,36 @@ class EnhancedServiceRegistry:
     def create_child(self, **services: object) -> ChildServiceRegistry:
         return ChildServiceRegistry(parent=self, **services)
 
+    def snapshot(self) -> RegistrySnapshot:
+        """Get an immutable snapshot of the current bindings.
+
+        The snapshot is built once and reused until the next mutation, so taking
+        one per execution costs nothing while the registry is unchanged.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = RegistrySnapshot(
+                    services=MappingProxyType(dict(self._services)),
+                    factories=MappingProxyType(dict(self._factories)),
+                    keys=MappingProxyType(dict(self._service_keys)),
+                )
+            return self._snapshot
+
+    def create_scope(self, **services: object) -> ScopedServiceRegistry:
+        """Create a lock-free per-execution overlay on top of this registry.
+
+        Args:
+            **services: Initial scope-local services keyed by service name
+
+        Returns:
+            ScopedServiceRegistry reading through to a snapshot of this registry
+        """
+        return ScopedServiceRegistry(self, **services)
+
     def _check_registration_constraints(
         self,
         key: EnhancedServiceKey[T],
@@ -630,6 +679,154 @@ class ChildServiceRegistry(EnhancedServiceRegistry):
         return parent_info
 
 
+class ScopedServiceRegistry:
+    """Copy-on-write, per-execution overlay over a registry snapshot.
+
+    Registrations stay local to the scope and shadow the parent. Lookups check the
+    local bindings first and then the parent's immutable snapshot, so no lock is
+    taken and nothing is copied when a scope is created. Only unresolved parent
+    factories are delegated to the parent, which materializes them once.
+
+    A scope is owned by a single execution; it is not meant to be written to from
+    several threads at once.
+    """
+
+    def __init__(
+        self, parent: EnhancedServiceRegistry | ScopedServiceRegistry, **services: object
+    ) -> None:
+        self._parent = parent
+        self._base = parent.snapshot() if isinstance(parent, EnhancedServiceRegistry) else None
+        self._local: dict[str, object] = {}
+        self._local_factories: dict[str, Callable[[], object]] = {}
+        self._local_keys: dict[str, EnhancedServiceKey] = {}
+
+        for name, service in services.items():
+            self._local[name] = service
+
+    def register(
+        self,
+        key: EnhancedServiceKey[T],
+        service: T | Callable[[], T],
+        *,
+        override: bool = False,
+        override_reason: str | None = None,
+    ) -> None:
+        """Bind a service in this scope only.
+
+        Raises:
+            RuntimeError: If the key is final or immutable in the parent registry
+        """
+        parent_key = self._parent_key(key.name)
+        if parent_key is not None and (parent_key.final or parent_key.immutable):
+            raise RuntimeError(f"Cannot shadow final or immutable service '{key.name}' in a scope")
+
+        self._local_keys[key.name] = key
+        if callable(service) and not hasattr(service, "__self__"):
+            self._local_factories[key.name] = service
+            self._local.pop(key.name, None)
+        else:
+            self._local[key.name] = service
+            self._local_factories.pop(key.name, None)
+
+    def override(
+        self, key: EnhancedServiceKey[T], service: T | Callable[[], T], *, reason: str = ""
+    ) -> None:
+        self.register(key, service, override=True, override_reason=reason)
+
+    def resolve(self, key: EnhancedServiceKey[T]) -> T:
+        name = key.name
+        if name in self._local:
+            return cast(T, self._local[name])
+        if name in self._local_factories:
+            try:
+                service = self._local_factories[name]()
+            except Exception as e:
+                raise RuntimeError(f"Failed to create service '{name}': {e}") from e
+            self._local[name] = service
+            return cast(T, service)
+
+        if self._base is None:
+            return cast(ScopedServiceRegistry, self._parent).resolve(key)
+
+        if name in self._base.services:
+            return cast(T, self._base.services[name])
+        if name in self._base.factories:
+            # Let the parent materialize the factory once, under its lock
+            return cast(EnhancedServiceRegistry, self._parent).resolve(key)
+
+        raise KeyError(f"Service not found: {name}")
+
+    def get(self, key: EnhancedServiceKey[T], default: T | None = None) -> T | None:
+        try:
+            return self.resolve(key)
+        except KeyError:
+            return default
+
+    def has(self, key: EnhancedServiceKey[T]) -> bool:
+        if self.has_local(key):
+            return True
+        if self._base is None:
+            return self._parent.has(key)
+        return key.name in self._base.services or key.name in self._base.factories
+
+    def has_local(self, key: EnhancedServiceKey[T]) -> bool:
+        return key.name in self._local or key.name in self._local_factories
+
+    def unregister(self, key: EnhancedServiceKey[T], *, force: bool = False) -> None:
+        """Remove a scope-local binding; parent bindings are never affected."""
+        self._local.pop(key.name, None)
+        self._local_factories.pop(key.name, None)
+        self._local_keys.pop(key.name, None)
+
+    def list_services(self) -> list[str]:
+        local = set(self._local) | set(self._local_factories)
+        if self._base is None:
+            return list(local | set(self._parent.list_services()))
+        return list(local | set(self._base.services) | set(self._base.factories))
+
+    def snapshot(self) -> RegistrySnapshot:
+        raise TypeError("Scoped registries are mutable overlays and cannot be snapshotted")
+
+    def create_scope(self, **services: object) -> ScopedServiceRegistry:
+        return ScopedServiceRegistry(self, **services)
+
+    def create_child(self, **services: object) -> ScopedServiceRegistry:
+        return self.create_scope(**services)
+
+    def is_frozen(self, service: str | None = None) -> bool:
+        return self.root.is_frozen(service)
+
+    def get_service_info(self, service: str) -> dict[str, Any] | None:
+        if service in self._local or service in self._local_factories:
+            key = self._local_keys.get(service)
+            return {
+                "name": service,
+                "type": "factory" if service in self._local_factories else "instance",
+                "service_type": key.service_type.value if key else "unknown",
+                "description": key.description if key else "",
+                "source": "local",
+            }
+
+        info = self._parent.get_service_info(service)
+        if info is not None:
+            info.setdefault("source", "parent")
+        return info
+
+    @property
+    def root(self) -> EnhancedServiceRegistry:
+        """The process-wide registry this scope ultimately reads from."""
+        parent = self._parent
+        while isinstance(parent, ScopedServiceRegistry):
+            parent = parent._parent
+        return parent
+
+    def _parent_key(self, name: str) -> EnhancedServiceKey | None:
+        if self._base is not None:
+            return self._base.keys.get(name)
+        parent = cast(ScopedServiceRegistry, self._parent)
+        return parent._local_keys.get(name) or parent._parent_key(name)
+
+
 def final_service(name: str, **kwargs) -> EnhancedServiceKey[Any]:
     return EnhancedServiceKey[Any](name=name, final=True, **kwargs)
 
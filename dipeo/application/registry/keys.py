@@ -87,6 +87,12 @@ STATE_CACHE = ServiceKey["ExecutionCachePort"](
     "state.cache", service_type=ServiceType.CORE, description="Cache layer for execution state"
 )
 
+EXECUTION_HISTORY_SPILL_FACTORY = ServiceKey["Callable[[], ExecutionHistorySpill]"](
+    "state.history_spill_factory",
+    service_type=ServiceType.FACTORY,
+    description="Creates the store for execution records evicted from tracker memory",
+)
+
 # =============================================================================
 # EXECUTION & ORCHESTRATION SERVICES
 # =============================================================================
@@ -404,6 +410,7 @@ __all__ = [
     "EVENT_BUS",
     "EXECUTE_DIAGRAM_USE_CASE",
     "EXECUTION_CONTEXT",
+    "EXECUTION_HISTORY_SPILL_FACTORY",
     # Execution & Orchestration
     "EXECUTION_ORCHESTRATOR",
     "EXECUTION_REPOSITORY",
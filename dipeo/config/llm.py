@@ -45,3 +45,21 @@ GOOGLE_MAX_OUTPUT_TOKENS = 128000
 # Ollama (defaults - varies by model)
 OLLAMA_MAX_CONTEXT_LENGTH = 128000
 OLLAMA_MAX_OUTPUT_TOKENS = 4096
+
+# Batch chat concurrency (requests in flight per provider, shared by all clients)
+BATCH_DEFAULT_MAX_CONCURRENCY = 4
+BATCH_MAX_CONCURRENCY = {
+    "openai": 8,
+    "anthropic": 4,
+    "google": 8,
+    "ollama": 2,
+    "claude_code": 2,
+    "claude_code_custom": 2,
+}
+BATCH_OVERLOAD_RETRIES = 4  # Retries per item after 429/overload responses
+
+# Claude Code SDK session pool (pre-connected CLI sessions per phase and options)
+CLAUDE_SESSION_POOL_SIZE = 1  # Warm sessions kept per (phase, options); 0 disables pooling
+CLAUDE_SESSION_POOL_MAX_SESSIONS = 8  # Idle sessions kept across all keys
+CLAUDE_SESSION_POOL_MAX_USES = 1  # Queries per session; sessions keep conversation context
+CLAUDE_SESSION_POOL_IDLE_TIMEOUT = 300.0  # Seconds before an idle session is closed
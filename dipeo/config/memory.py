@@ -29,7 +29,7 @@ MEMORY_CONTENT_SNIPPET_LENGTH = 250  # Maximum characters for message snippet in
 MEMORY_CONTENT_KEY_LENGTH = 400  # Maximum characters for content key in deduplication
 
 # Deduplication settings
-MEMORY_WORD_OVERLAP_THRESHOLD = 0.9  # 80% word overlap threshold for deduplication
+MEMORY_WORD_OVERLAP_THRESHOLD = 0.9  # 90% word overlap threshold for deduplication
 
 # Scoring weights for message ranking
 MEMORY_SCORING_WEIGHTS = {
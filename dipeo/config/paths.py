@@ -45,6 +45,9 @@ DIPEO_DIR: Path = BASE_DIR / ".dipeo"
 DATA_DIR: Path = DIPEO_DIR / "data"
 STATE_DB_PATH: Path = DATA_DIR / "dipeo_state.db"
 EVENTS_DB_PATH: Path = DATA_DIR / "dipeo_events.db"
+LLM_CACHE_DB_PATH: Path = DATA_DIR / "llm_responses.db"
+RATE_LIMIT_DB_PATH: Path = DATA_DIR / "rate_limits.db"
+WEBHOOK_INBOX_DB_PATH: Path = DATA_DIR / "webhook_inbox.db"
 
 # Cache directory for temporary cached data
 CACHE_DIR: Path = DIPEO_DIR / "cache"
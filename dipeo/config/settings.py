@@ -6,6 +6,7 @@ and environment variable overrides.
 """
 
 from pathlib import Path
+from typing import Literal
 
 from pydantic import Field
 from pydantic_settings import BaseSettings
@@ -45,6 +46,21 @@ class LLMSettings(BaseSettings):
         env="DIPEO_PERSON_JOB_MAX_TOKENS",
         description="Max tokens for PersonJob node LLM calls",
     )
+    cache_mode: Literal["off", "read_write", "record", "replay"] = Field(
+        default="off",
+        env="DIPEO_LLM_CACHE_MODE",
+        description="Response cache mode; a diagram's top-level llm_cache block overrides it",
+    )
+    cache_ttl_s: int = Field(
+        default=0,
+        env="DIPEO_LLM_CACHE_TTL_S",
+        description="Default lifetime of cached LLM responses in seconds (0 = no expiry)",
+    )
+    cache_memory_entries: int = Field(
+        default=512,
+        env="DIPEO_LLM_CACHE_MEMORY_ENTRIES",
+        description="Responses kept in the in-memory tier of the LLM response cache",
+    )
 
     class Config:
         env_prefix = "DIPEO_LLM_"
@@ -71,6 +87,13 @@ class ExecutionSettings(BaseSettings):
     max_iterations: int = Field(
         default=150, env="DIPEO_MAX_ITERATIONS", description="Maximum iterations for loop nodes"
     )
+    history_max_records_per_node: int = Field(
+        default=100,
+        env="DIPEO_EXECUTION_HISTORY_MAX_RECORDS_PER_NODE",
+        description=(
+            "Execution records kept in memory per node; older ones spill to disk (0 = unbounded)"
+        ),
+    )
 
     class Config:
         env_prefix = "DIPEO_EXECUTION_"
@@ -164,6 +187,12 @@ class StorageSettings(BaseSettings):
         env="DIPEO_DIAGRAMS_DIR",
         description="Diagrams directory (relative to base_dir)",
     )
+    state_db_convert_vacuum: bool = Field(
+        default=False,
+        env="DIPEO_STATE_DB_CONVERT_VACUUM",
+        description="Rebuild a state database created without incremental auto-vacuum "
+        "with a one-time full VACUUM (blocks state writes while it runs)",
+    )
 
     class Config:
         env_prefix = "DIPEO_"
@@ -851,6 +851,26 @@ class Mutation:
         return await executor.execute("UpdateNodeState", variables=variables)
 
 
+    @strawberry.field(name="updateNodeStates")
+    async def update_node_states(
+        self,
+        info: Info,
+        input: UpdateNodeStatesInput
+    ) -> ExecutionResult:
+        """
+        
+        Operation: UpdateNodeStatesOperation
+        """
+        from dipeo.application.graphql.operation_executor import OperationExecutor
+        executor = OperationExecutor(info.context.service_registry)
+
+        # Build variables dict from typed parameters
+        variables = {}
+        variables["input"] = input
+
+        return await executor.execute("UpdateNodeStates", variables=variables)
+
+
     @strawberry.field(name="uploadFile")
     async def upload_file(
         self,
@@ -126,6 +126,20 @@ class UpdateNodeStateInput:
     status: Status
 
 
+@strawberry.input
+class NodeStateUpdateInput:
+    error: Optional[String] = None
+    node_id: ID
+    output: Optional[JSON] = None
+    status: Status
+
+
+@strawberry.input
+class UpdateNodeStatesInput:
+    execution_id: ID
+    updates: List[NodeStateUpdateInput]
+
+
 @strawberry.input
 class InteractiveResponseInput:
     execution_id: ID
@@ -181,6 +195,8 @@ __all__ = [
     'ExecutionControlInput',
     'ExecutionFilterInput',
     'UpdateNodeStateInput',
+    'NodeStateUpdateInput',
+    'UpdateNodeStatesInput',
     'InteractiveResponseInput',
     'RegisterCliSessionInput',
     'UnregisterCliSessionInput',
@@ -15,7 +15,7 @@ from strawberry.file_uploads import Upload
 
 # Import custom domain types from inputs if needed
 
-from .inputs import CreateApiKeyInput, CreateDiagramInput, CreateNodeInput, CreatePersonInput, DiagramFilterInput, DiagramFormatGraphQL, ExecuteDiagramInput, ExecuteIntegrationInput, ExecutionControlInput, ExecutionFilterInput, InteractiveResponseInput, RegisterCliSessionInput, TestIntegrationInput, UnregisterCliSessionInput, UpdateNodeInput, UpdateNodeStateInput, UpdatePersonInput
+from .inputs import CreateApiKeyInput, CreateDiagramInput, CreateNodeInput, CreatePersonInput, DiagramFilterInput, DiagramFormatGraphQL, ExecuteDiagramInput, ExecuteIntegrationInput, ExecutionControlInput, ExecutionFilterInput, InteractiveResponseInput, RegisterCliSessionInput, TestIntegrationInput, UnregisterCliSessionInput, UpdateNodeInput, UpdateNodeStateInput, UpdateNodeStatesInput, UpdatePersonInput
 
 
 # Helper functions for Strawberry object conversion
@@ -583,6 +583,16 @@ UPDATE_NODE_STATE_MUTATION = """mutation UpdateNodeState($input: UpdateNodeState
 
 
 
+UPDATE_NODE_STATES_MUTATION = """mutation UpdateNodeStates($input: UpdateNodeStatesInput!) {
+  updateNodeStates(input: $input) {
+    success
+    message
+    error
+  }
+}"""
+
+
+
 UPLOAD_FILE_MUTATION = """mutation UploadFile($file: Upload!, $path: String) {
   uploadFile(file: $file, path: $path) {
     id
@@ -1984,6 +1994,40 @@ class UpdateNodeStateOperation(BaseGraphQLOperation):
         )
 
 
+class UpdateNodeStatesOperation(BaseGraphQLOperation):
+    """
+    Mutation operation for Execution.
+    GraphQL mutation: UpdateNodeStates
+    """
+
+    query = UPDATE_NODE_STATES_MUTATION
+    operation_type = "mutation"
+    operation_name = "UpdateNodeStates"
+
+    
+    class Variables(TypedDict):
+        """Variable types for UpdateNodeStates mutation."""
+        
+        input: UpdateNodeStatesInput
+        
+    
+
+    @classmethod
+    def get_variables_dict(cls, input: UpdateNodeStatesInput) -> dict[str, Any]:
+        """
+        Build variables dictionary for the operation.
+
+        Args:
+            input: UpdateNodeStatesInput - Required (accepts dict or Strawberry input object)
+
+        Returns:
+            Dictionary of variables for GraphQL execution
+        """
+        return cls._build_variables(
+            input=input
+        )
+
+
 class UploadFileOperation(BaseGraphQLOperation):
     """
     Mutation operation for File.
@@ -2541,6 +2585,7 @@ MUTATIONS = {
     "ControlExecution": ControlExecutionOperation,
     "SendInteractiveResponse": SendInteractiveResponseOperation,
     "UpdateNodeState": UpdateNodeStateOperation,
+    "UpdateNodeStates": UpdateNodeStatesOperation,
     "UploadFile": UploadFileOperation,
     "UploadDiagram": UploadDiagramOperation,
     "ValidateDiagram": ValidateDiagramOperation,
@@ -2657,6 +2702,8 @@ __all__ = [
     
     "UPDATE_NODE_STATE_MUTATION",
     
+    "UPDATE_NODE_STATES_MUTATION",
+    
     "UPLOAD_FILE_MUTATION",
     
     "UPLOAD_DIAGRAM_MUTATION",
@@ -2759,6 +2806,8 @@ __all__ = [
     
     "UpdateNodeStateOperation",
     
+    "UpdateNodeStatesOperation",
+    
     "UploadFileOperation",
     
     "UploadDiagramOperation",
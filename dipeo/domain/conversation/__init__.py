@@ -2,11 +2,13 @@
 
 from .conversation import Conversation
 from .memory_strategies import IntelligentMemoryStrategy, MemoryConfig
+from .message_deduplicator import MessageDeduplicator
 from .person import Person
 
 __all__ = [
     "Conversation",
     "IntelligentMemoryStrategy",
     "MemoryConfig",
+    "MessageDeduplicator",
     "Person",
 ]
@@ -11,13 +11,13 @@ from datetime import datetime
 from typing import TYPE_CHECKING, Any, Optional
 
 from dipeo.config.memory import (
-    MEMORY_CONTENT_KEY_LENGTH,
     MEMORY_DECAY_FACTOR,
     MEMORY_HARD_CAP,
     MEMORY_SCORING_WEIGHTS,
     MEMORY_WORD_OVERLAP_THRESHOLD,
 )
 from dipeo.diagram_generated.domain_models import Message, PersonID
+from dipeo.domain.conversation.message_deduplicator import MessageDeduplicator
 from dipeo.infrastructure.timing.context import atime_phase, time_phase
 
 if TYPE_CHECKING:
@@ -46,6 +46,8 @@ class IntelligentMemoryStrategy:
         self.config = config or MemoryConfig()
         self.llm_service = llm_service
         self.person_repository = person_repository
+        # Dedup indexes per ignore_person filter, extended as the conversation grows
+        self._deduplicators: dict[str | None, MessageDeduplicator] = {}
 
     async def select_memories(
         self,
@@ -79,7 +81,9 @@ class IntelligentMemoryStrategy:
 
         # Phase 2: Deduplication
         with time_phase(exec_id, node_id, "deduplication"):
-            unique_messages, frequencies = self._deduplicate_messages(filtered_candidates)
+            unique_messages, frequencies = self._deduplicate_messages(
+                filtered_candidates, ignore_person
+            )
 
         # Phase 3: Scoring
         with time_phase(exec_id, node_id, "scoring"):
@@ -164,43 +168,19 @@ class IntelligentMemoryStrategy:
         return filtered
 
     def _deduplicate_messages(
-        self, messages: Sequence[Message]
+        self, messages: Sequence[Message], ignore_person: str | None = None
     ) -> tuple[list[Message], dict[str, int]]:
-        unique_messages = []
-        frequencies = {}
-        seen_contents = []
-
-        for message in messages:
-            if not getattr(message, "id", None):
-                continue
-
-            content_key = (message.content or "")[:MEMORY_CONTENT_KEY_LENGTH].strip()
-
-            is_duplicate = False
-            for seen_content, seen_msg in seen_contents:
-                if self._calculate_word_overlap(content_key, seen_content):
-                    frequencies[seen_msg.id] = frequencies.get(seen_msg.id, 1) + 1
-                    is_duplicate = True
-                    break
-
-            if not is_duplicate:
-                unique_messages.append(message)
-                frequencies[message.id] = 1
-                seen_contents.append((content_key, message))
-
-        return unique_messages, frequencies
-
-    def _calculate_word_overlap(self, text1: str, text2: str) -> bool:
-        words1 = set(text1.lower().split())
-        words2 = set(text2.lower().split())
-
-        if not words1 or not words2:
-            return text1 == text2
-
-        intersection = len(words1 & words2)
-        smaller_set = min(len(words1), len(words2))
-
-        return (intersection / smaller_set) >= self.config.word_overlap_threshold
+        deduplicator = self._deduplicators.get(ignore_person)
+        if (
+            deduplicator is None
+            or deduplicator.threshold != self.config.word_overlap_threshold
+            or not deduplicator.extends(messages)
+        ):
+            deduplicator = MessageDeduplicator(self.config.word_overlap_threshold)
+            self._deduplicators[ignore_person] = deduplicator
+
+        deduplicator.extend(messages[deduplicator.seen_count :])
+        return list(deduplicator.unique_messages), dict(deduplicator.frequencies)
 
     def _score_and_rank_messages(
         self,
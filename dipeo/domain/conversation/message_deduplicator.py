@@ -0,0 +1,165 @@
+"""Incremental near-duplicate index for conversation messages.
+
+Two messages are duplicates when the words of their content keys overlap by at
+least ``threshold`` of the smaller word set (the overlap coefficient), and each
+message folds into the earliest unique message it duplicates.
+
+Instead of comparing every message with every earlier unique message, the index
+uses prefix filtering: with all word sets sorted in one fixed order, two sets
+sharing at least ``c`` words must share a word within the first ``len - c + 1``
+words of either set. Each unique message therefore only registers its prefix
+words in one inverted index and all its words in another, and a new message only
+has to verify the few candidates those indexes return. Results are identical to
+the pairwise comparison.
+"""
+
+from collections.abc import Sequence
+
+from dipeo.config.memory import MEMORY_CONTENT_KEY_LENGTH, MEMORY_WORD_OVERLAP_THRESHOLD
+from dipeo.diagram_generated.domain_models import Message
+
+
+def _same_message(a: Message, b: Message) -> bool:
+    # Conversation stores may hand out fresh Message objects for the same history
+    return a is b or (a.id is not None and a.id == b.id)
+
+
+def _word_order(word: str) -> tuple[int, str]:
+    # Long words first: they are rarer, which keeps the prefix postings short
+    return (-len(word), word)
+
+
+class MessageDeduplicator:
+    """Append-only dedup index over an ordered message sequence."""
+
+    def __init__(self, threshold: float = MEMORY_WORD_OVERLAP_THRESHOLD):
+        """Initialize an empty index.
+
+        Args:
+            threshold: Minimum word overlap (0.0-1.0) of the smaller message for two
+                messages to count as duplicates
+        """
+        self.threshold = threshold
+        self.unique_messages: list[Message] = []
+        self.frequencies: dict[str, int] = {}
+        self._unique_ids: list[str] = []
+        self._word_sets: list[frozenset[str]] = []
+        self._prefix_index: dict[str, list[int]] = {}
+        self._full_index: dict[str, list[int]] = {}
+        self._first_empty: int | None = None
+        self._first_non_empty: int | None = None
+        self._required_overlap: dict[int, int] = {}
+        self._seen: list[Message] = []
+
+    @property
+    def seen_count(self) -> int:
+        return len(self._seen)
+
+    def extends(self, messages: Sequence[Message]) -> bool:
+        """Check whether ``messages`` continues the sequence already indexed.
+
+        Args:
+            messages: Full message sequence
+
+        Returns:
+            True if the indexed messages are a prefix of ``messages``
+        """
+        count = len(self._seen)
+        if count == 0:
+            return True
+        if len(messages) < count:
+            return False
+        return _same_message(messages[0], self._seen[0]) and _same_message(
+            messages[count - 1], self._seen[-1]
+        )
+
+    def extend(self, messages: Sequence[Message]) -> None:
+        """Index messages appended after the ones already seen.
+
+        Args:
+            messages: New messages, in conversation order
+        """
+        for message in messages:
+            self._seen.append(message)
+            self.add(message)
+
+    def add(self, message: Message) -> str | None:
+        """Index one message.
+
+        Args:
+            message: Message to deduplicate; messages without an id are ignored
+
+        Returns:
+            Id of the unique message it duplicates, or None if it is new
+        """
+        message_id = message.id
+        if not message_id:
+            return None
+
+        content_key = (message.content or "")[:MEMORY_CONTENT_KEY_LENGTH].strip()
+        words = frozenset(content_key.lower().split())
+
+        match = self._find_match(words)
+        if match is not None:
+            original_id = self._unique_ids[match]
+            self.frequencies[original_id] = self.frequencies.get(original_id, 1) + 1
+            return original_id
+
+        index = len(self.unique_messages)
+        self.unique_messages.append(message)
+        self._unique_ids.append(message_id)
+        self.frequencies[message_id] = 1
+        self._word_sets.append(words)
+
+        if not words:
+            if self._first_empty is None:
+                self._first_empty = index
+            return None
+
+        if self._first_non_empty is None:
+            self._first_non_empty = index
+        ordered = sorted(words, key=_word_order)
+        prefix_length = len(ordered) - self._overlap_needed(len(ordered)) + 1
+        for position, word in enumerate(ordered):
+            self._full_index.setdefault(word, []).append(index)
+            if position < prefix_length:
+                self._prefix_index.setdefault(word, []).append(index)
+        return None
+
+    def _find_match(self, words: frozenset[str]) -> int | None:
+        if not words:
+            # An empty key only equals another empty key
+            return self._first_empty
+        if self.threshold <= 0:
+            return self._first_non_empty
+
+        ordered = sorted(words, key=_word_order)
+        prefix_length = len(ordered) - self._overlap_needed(len(ordered)) + 1
+
+        # Smaller-or-equal earlier sets: one of their prefix words is in this set.
+        # Larger earlier sets: one of this set's prefix words is in theirs.
+        candidates: set[int] = set()
+        for position, word in enumerate(ordered):
+            postings = self._prefix_index.get(word)
+            if postings:
+                candidates.update(postings)
+            if position < prefix_length:
+                postings = self._full_index.get(word)
+                if postings:
+                    candidates.update(postings)
+
+        for index in sorted(candidates):
+            other = self._word_sets[index]
+            if len(words & other) / min(len(words), len(other)) >= self.threshold:
+                return index
+        return None
+
+    def _overlap_needed(self, size: int) -> int:
+        """Smallest shared word count that reaches the threshold against ``size`` words."""
+        needed = self._required_overlap.get(size)
+        if needed is None:
+            needed = 1
+            while needed <= size and needed / size < self.threshold:
+                needed += 1
+            self._required_overlap[size] = needed
+        return needed
@@ -7,6 +7,7 @@ import yaml
 
 from dipeo.diagram_generated import DiagramFormat, DomainDiagram, HandleLabel
 from dipeo.domain.base.exceptions import ValidationError
+from dipeo.domain.diagram.utils.conversion import load_yaml
 
 
 class DiagramFormatDetector:
@@ -17,30 +18,35 @@ class DiagramFormatDetector:
 
         if content.startswith("{"):
             try:
-                data = json.loads(content)
-                if "nodes" in data and isinstance(data["nodes"], dict):
-                    return DiagramFormat.NATIVE
+                json.loads(content)
                 return DiagramFormat.NATIVE
             except json.JSONDecodeError:
                 pass
 
         try:
-            data = yaml.safe_load(content)
-            if isinstance(data, dict):
-                if data.get("version") == "light" or (
-                    isinstance(data.get("nodes"), list)
-                    and "connections" in data
-                    and "persons" in data
-                ):
-                    return DiagramFormat.LIGHT
-                if data.get("format") == "readable":
-                    return DiagramFormat.READABLE
-                return DiagramFormat.LIGHT
+            data = load_yaml(content)
         except yaml.YAMLError:
-            pass
+            data = None
+
+        if isinstance(data, dict):
+            return self.detect_format_from_data(data)
 
         raise ValueError("Unable to detect diagram format")
 
+    def detect_format_from_data(self, data: dict[str, Any]) -> DiagramFormat:
+        """Detect the format of an already-parsed YAML diagram document.
+
+        Only an explicit ``format: readable`` selects READABLE; every other YAML
+        document is treated as LIGHT.
+        """
+        if data.get("version") == "light" or (
+            isinstance(data.get("nodes"), list) and "connections" in data and "persons" in data
+        ):
+            return DiagramFormat.LIGHT
+        if data.get("format") == "readable":
+            return DiagramFormat.READABLE
+        return DiagramFormat.LIGHT
+
     def detect_format_from_filename(self, filename: str) -> DiagramFormat | None:
         if filename.endswith(".native.json"):
             return DiagramFormat.NATIVE
@@ -26,6 +26,16 @@ class BaseConversionStrategy(FormatStrategy, ABC):
         """Deserialize string content to a DomainDiagram."""
         pass
 
+    def deserialize_data_to_domain(
+        self, data: Any, diagram_path: str | None = None
+    ) -> DomainDiagram:
+        """Deserialize already-parsed content to a DomainDiagram.
+
+        Strategies that parse into plain data override this so callers that have
+        parsed the content for format detection do not parse it again.
+        """
+        return self.deserialize_to_domain(self.format(data), diagram_path)
+
     @abstractmethod
     def parse(self, content: str) -> Any:
         """Parse string content to intermediate format."""
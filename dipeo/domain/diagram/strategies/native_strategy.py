@@ -26,7 +26,11 @@ class NativeJsonStrategy(_JsonMixin, BaseConversionStrategy):
     }
 
     def deserialize_to_domain(self, content: str, diagram_path: str | None = None) -> DomainDiagram:
-        data = self.parse(content)
+        return self.deserialize_data_to_domain(self.parse(content), diagram_path)
+
+    def deserialize_data_to_domain(
+        self, data: Any, diagram_path: str | None = None
+    ) -> DomainDiagram:
         data = self._clean_graphql_fields(data)
         if "nodes" in data and isinstance(data["nodes"], dict):
             nodes_list = []
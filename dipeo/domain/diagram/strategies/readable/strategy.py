@@ -41,8 +41,12 @@ class ReadableYamlStrategy(_YamlMixin, BaseConversionStrategy):
 
     def deserialize_to_domain(self, content: str, diagram_path: str | None = None) -> DomainDiagram:
         """Deserialize readable YAML content to DomainDiagram."""
-        # Parse YAML content
-        data = self.parse(content)
+        return self.deserialize_data_to_domain(self.parse(content), diagram_path)
+
+    def deserialize_data_to_domain(
+        self, data: Any, diagram_path: str | None = None
+    ) -> DomainDiagram:
+        """Deserialize parsed readable YAML data to DomainDiagram."""
         data = self._clean_graphql_fields(data)
 
         # Parse to intermediate ReadableDiagram
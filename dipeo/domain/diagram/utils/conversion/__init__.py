@@ -6,6 +6,8 @@ from .format_converters import (
     _node_id_map,
     _YamlMixin,
     diagram_maps_to_arrays,
+    load_yaml,
+    parse_diagram_content,
 )
 
 __all__ = [
@@ -16,4 +18,6 @@ __all__ = [
     "_YamlMixin",
     "_node_id_map",
     "diagram_maps_to_arrays",
+    "load_yaml",
+    "parse_diagram_content",
 ]
@@ -9,6 +9,32 @@ from dipeo.diagram_generated import DomainDiagram
 
 DomainDiagram.model_rebuild()
 
+# libyaml-backed loader when PyYAML was built with it; ~10x faster than pure Python
+YamlSafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def load_yaml(content: str) -> Any:
+    """Parse YAML with the fastest available safe loader."""
+    return yaml.load(content, Loader=YamlSafeLoader)
+
+
+def parse_diagram_content(content: str) -> Any:
+    """Parse diagram content once, as JSON when it looks like JSON, otherwise YAML.
+
+    Raises:
+        ValueError: If the content is neither valid JSON nor valid YAML
+    """
+    stripped = content.lstrip()
+    if stripped.startswith("{"):
+        try:
+            return json.loads(stripped)
+        except json.JSONDecodeError:
+            pass
+    try:
+        return load_yaml(content)
+    except yaml.YAMLError as e:
+        raise ValueError(f"Invalid diagram content: {e}") from e
+
 
 class _JsonMixin:
     def parse(self, content: str) -> dict[str, Any]:  # type: ignore[override]
@@ -26,7 +52,7 @@ class _JsonMixin:
 
 class _YamlMixin:
     def parse(self, content: str) -> dict[str, Any]:  # type: ignore[override]
-        return yaml.safe_load(content) or {}
+        return load_yaml(content) or {}
 
     def format(self, data: dict[str, Any]) -> str:  # type: ignore[override]
         class CustomDumper(yaml.SafeDumper):
@@ -2,6 +2,7 @@
 
 from .ports import (
     ExecutionCachePort,
+    ExecutionHistorySpill,
     ExecutionStateRepository,
     ExecutionStateService,
 )
@@ -21,6 +22,7 @@ ExecutionTracker = UnifiedStateTracker
 
 __all__ = [
     "ExecutionCachePort",
+    "ExecutionHistorySpill",
     "ExecutionStateRepository",
     "ExecutionStateService",
     "ExecutionTracker",
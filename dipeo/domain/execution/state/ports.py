@@ -10,6 +10,7 @@ if TYPE_CHECKING:
         Status,
         TokenUsage,
     )
+    from dipeo.domain.execution.state.unified_state_tracker import NodeExecutionRecord
 
 
 @runtime_checkable
@@ -143,3 +144,35 @@ class ExecutionCachePort(Protocol):
     async def persist_final_state(self, state: "ExecutionState") -> None:
         """Persist final state from cache to database."""
         ...
+
+
+@runtime_checkable
+class ExecutionHistorySpill(Protocol):
+    """Append-only store for execution records evicted from tracker memory."""
+
+    def append(self, records: list["NodeExecutionRecord"]) -> bool:
+        """Buffer evicted records.
+
+        Cheap enough to call under the tracker lock; the records are encoded and
+        written by ``flush()``.
+
+        Returns:
+            True when enough records are buffered that ``flush()`` should be called
+        """
+        ...
+
+    def flush(self) -> None:
+        """Encode and write buffered records."""
+        ...
+
+    def load(self, node_id: str) -> list["NodeExecutionRecord"]:
+        """Load a node's spilled records, ordered by execution number."""
+        ...
+
+    def clear(self) -> None:
+        """Remove all spilled records."""
+        ...
+
+    def close(self) -> None:
+        """Release the underlying storage."""
+        ...
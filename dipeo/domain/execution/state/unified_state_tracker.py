@@ -7,7 +7,8 @@ Key Features:
 - Single source of truth for all execution state
 - Thread-safe operations
 - Clear internal separation of concerns
-- Comprehensive execution history
+- Comprehensive execution history, optionally bounded per node with older
+  records spilled to an ExecutionHistorySpill
 - Iteration limit enforcement
 - Node metadata management
 """
@@ -19,6 +20,7 @@ import threading
 from collections import defaultdict
 from dataclasses import dataclass, field
 from datetime import datetime
+from itertools import takewhile
 from typing import TYPE_CHECKING, Any
 
 from dipeo.config.base_logger import get_module_logger
@@ -27,6 +29,7 @@ from dipeo.diagram_generated.enums import CompletionStatus, Status
 if TYPE_CHECKING:
     from dipeo.diagram_generated import NodeID
     from dipeo.domain.execution.messaging.envelope import Envelope
+    from dipeo.domain.execution.state.ports import ExecutionHistorySpill
 
 logger = get_module_logger(__name__)
 
@@ -94,14 +97,38 @@ class UnifiedStateTracker:
     to eliminate redundancy and prevent state divergence.
     """
 
-    def __init__(self):
+    def __init__(
+        self,
+        max_records_per_node: int | None = None,
+        history_spill: ExecutionHistorySpill | None = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            max_records_per_node: Completed records kept in memory per node;
+                unbounded when None
+            history_spill: Store receiving records evicted from memory; evicted
+                records are dropped when None
+        """
         self._node_states: dict[NodeID, NodeState] = {}
+        # Per-status node sets (insertion-ordered dicts), kept in step with _node_states
+        self._nodes_by_status: dict[Status, dict[NodeID, None]] = defaultdict(dict)
 
         self._execution_records: dict[NodeID, list[NodeExecutionRecord]] = {}
         self._execution_counts: dict[NodeID, int] = {}
         self._last_outputs: dict[NodeID, Envelope] = {}
         self._execution_order: list[NodeID] = []
 
+        self._max_records_per_node = max_records_per_node
+        self._history_spill = history_spill
+        # Set under the lock when the spill buffer is full; flushed after releasing it
+        self._spill_flush_due = False
+        # Running totals so summaries do not depend on records still in memory
+        self._successful_executions = 0
+        self._failed_executions = 0
+        self._total_duration = 0.0
+        self._total_tokens = {"input": 0, "output": 0, "cached": 0}
+
         self._node_iterations_per_epoch: dict[tuple[NodeID, int], int] = defaultdict(int)
         self._max_iterations_per_epoch: int = 100
 
@@ -109,6 +136,26 @@ class UnifiedStateTracker:
 
         self._lock = threading.Lock()
 
+    def configure_history(
+        self,
+        max_records_per_node: int | None,
+        history_spill: ExecutionHistorySpill | None = None,
+    ) -> None:
+        """Set the in-memory retention policy for execution records.
+
+        Args:
+            max_records_per_node: Completed records kept in memory per node;
+                unbounded when None
+            history_spill: Store receiving records evicted from memory; evicted
+                records are dropped when None
+        """
+        with self._lock:
+            self._max_records_per_node = max_records_per_node
+            self._history_spill = history_spill
+            for node_id in list(self._execution_records):
+                self._enforce_retention(node_id)
+        self._flush_history_spill()
+
     # ========================================================================
     # State Transition Methods
     # ========================================================================
@@ -121,7 +168,7 @@ class UnifiedStateTracker:
         """
         with self._lock:
             if node_id not in self._node_states:
-                self._node_states[node_id] = NodeState(status=Status.PENDING)
+                self._set_state(node_id, NodeState(status=Status.PENDING))
 
     def transition_to_running(self, node_id: NodeID, epoch: int) -> int:
         """Transition a node to RUNNING state and start execution tracking.
@@ -134,7 +181,7 @@ class UnifiedStateTracker:
             The execution count for this node (1-indexed)
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.RUNNING)
+            self._set_state(node_id, NodeState(status=Status.RUNNING))
 
             current_count = self._execution_counts.get(node_id, 0)
             new_count = current_count + 1
@@ -175,10 +222,11 @@ class UnifiedStateTracker:
             token_usage: Token usage statistics
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.COMPLETED)
+            self._set_state(node_id, NodeState(status=Status.COMPLETED))
             self._complete_execution_record(
                 node_id, CompletionStatus.SUCCESS, output=output, token_usage=token_usage
             )
+        self._flush_history_spill()
 
     def transition_to_failed(self, node_id: NodeID, error: str) -> None:
         """Transition a node to FAILED state.
@@ -188,9 +236,10 @@ class UnifiedStateTracker:
             error: Error message describing the failure
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.FAILED, error=error)
+            self._set_state(node_id, NodeState(status=Status.FAILED, error=error))
             self._complete_execution_record(node_id, CompletionStatus.FAILED, error=error)
             logger.debug(f"Node {node_id} transitioned to FAILED: {error}")
+        self._flush_history_spill()
 
     def transition_to_maxiter(self, node_id: NodeID, output: Envelope | None = None) -> None:
         """Transition a node to MAXITER_REACHED state.
@@ -200,8 +249,9 @@ class UnifiedStateTracker:
             output: The node's last output envelope
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.MAXITER_REACHED)
+            self._set_state(node_id, NodeState(status=Status.MAXITER_REACHED))
             self._complete_execution_record(node_id, CompletionStatus.MAX_ITER, output=output)
+        self._flush_history_spill()
 
     def transition_to_skipped(self, node_id: NodeID) -> None:
         """Transition a node to SKIPPED state (conditional branch not taken).
@@ -210,9 +260,10 @@ class UnifiedStateTracker:
             node_id: The node to transition
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.SKIPPED)
+            self._set_state(node_id, NodeState(status=Status.SKIPPED))
             self._complete_execution_record(node_id, CompletionStatus.SKIPPED)
             logger.debug(f"Node {node_id} transitioned to SKIPPED")
+        self._flush_history_spill()
 
     def reset_node(self, node_id: NodeID) -> None:
         """Reset a node to PENDING state (for next iteration).
@@ -223,7 +274,7 @@ class UnifiedStateTracker:
             node_id: The node to reset
         """
         with self._lock:
-            self._node_states[node_id] = NodeState(status=Status.PENDING)
+            self._set_state(node_id, NodeState(status=Status.PENDING))
             logger.debug(
                 f"Reset node {node_id} to PENDING, "
                 f"execution_count remains {self._execution_counts.get(node_id, 0)}"
@@ -260,12 +311,7 @@ class UnifiedStateTracker:
         Returns:
             List of node IDs
         """
-        with self._lock:
-            return [
-                node_id
-                for node_id, state in self._node_states.items()
-                if state.status == Status.COMPLETED
-            ]
+        return self.get_nodes_by_status(Status.COMPLETED)
 
     def get_running_nodes(self) -> list[NodeID]:
         """Get all nodes in RUNNING state.
@@ -273,12 +319,7 @@ class UnifiedStateTracker:
         Returns:
             List of node IDs
         """
-        with self._lock:
-            return [
-                node_id
-                for node_id, state in self._node_states.items()
-                if state.status == Status.RUNNING
-            ]
+        return self.get_nodes_by_status(Status.RUNNING)
 
     def get_failed_nodes(self) -> list[NodeID]:
         """Get all nodes in FAILED state.
@@ -286,12 +327,19 @@ class UnifiedStateTracker:
         Returns:
             List of node IDs
         """
+        return self.get_nodes_by_status(Status.FAILED)
+
+    def get_nodes_by_status(self, status: Status) -> list[NodeID]:
+        """Get all nodes currently in the given state.
+
+        Args:
+            status: The status to query
+
+        Returns:
+            List of node IDs, in the order they entered the status
+        """
         with self._lock:
-            return [
-                node_id
-                for node_id, state in self._node_states.items()
-                if state.status == Status.FAILED
-            ]
+            return list(self._nodes_by_status.get(status, ()))
 
     def has_running_nodes(self) -> bool:
         """Check if any nodes are currently running.
@@ -300,7 +348,30 @@ class UnifiedStateTracker:
             True if at least one node is in RUNNING state
         """
         with self._lock:
-            return any(state.status == Status.RUNNING for state in self._node_states.values())
+            return bool(self._nodes_by_status.get(Status.RUNNING))
+
+    def count_nodes(self, *statuses: Status) -> int:
+        """Count tracked nodes, optionally restricted to the given statuses.
+
+        Args:
+            *statuses: Statuses to count; counts all nodes when omitted
+
+        Returns:
+            Number of matching nodes
+        """
+        with self._lock:
+            if not statuses:
+                return len(self._node_states)
+            return sum(len(self._nodes_by_status.get(status, ())) for status in statuses)
+
+    def get_status_counts(self) -> dict[Status, int]:
+        """Get the number of nodes in each status.
+
+        Returns:
+            Dictionary mapping statuses with at least one node to their counts
+        """
+        with self._lock:
+            return {status: len(nodes) for status, nodes in self._nodes_by_status.items() if nodes}
 
     # ========================================================================
     # Execution History Methods
@@ -328,8 +399,7 @@ class UnifiedStateTracker:
             True if the node has executed at least once
         """
         with self._lock:
-            records = self._execution_records.get(node_id, [])
-            return len(records) > 0
+            return self._execution_counts.get(node_id, 0) > 0
 
     def get_last_output(self, node_id: NodeID) -> Envelope | None:
         """Get the last output envelope from a node.
@@ -364,6 +434,8 @@ class UnifiedStateTracker:
     def get_node_execution_history(self, node_id: NodeID) -> list[NodeExecutionRecord]:
         """Get all execution records for a node.
 
+        Records evicted from memory are loaded back from the history spill.
+
         Args:
             node_id: The node to query
 
@@ -371,7 +443,10 @@ class UnifiedStateTracker:
             List of execution records (ordered by execution number)
         """
         with self._lock:
-            return self._execution_records.get(node_id, []).copy()
+            records = self._execution_records.get(node_id, []).copy()
+            if self._history_spill is None:
+                return records
+            return self._history_spill.load(node_id) + records
 
     def get_execution_summary(self) -> dict[str, Any]:
         """Get a summary of all executions.
@@ -389,24 +464,8 @@ class UnifiedStateTracker:
         """
         with self._lock:
             total_executions = sum(self._execution_counts.values())
-            successful_executions = 0
-            failed_executions = 0
-            total_duration = 0.0
-            total_tokens = {"input": 0, "output": 0, "cached": 0}
-
-            for records in self._execution_records.values():
-                for record in records:
-                    if record.is_complete():
-                        total_duration += record.duration
-                        if record.was_successful():
-                            successful_executions += 1
-                        else:
-                            failed_executions += 1
-
-                        if record.token_usage:
-                            total_tokens["input"] += record.token_usage.get("input", 0)
-                            total_tokens["output"] += record.token_usage.get("output", 0)
-                            total_tokens["cached"] += record.token_usage.get("cached", 0)
+            successful_executions = self._successful_executions
+            failed_executions = self._failed_executions
 
             return {
                 "total_executions": total_executions,
@@ -415,8 +474,8 @@ class UnifiedStateTracker:
                 "success_rate": (
                     successful_executions / total_executions if total_executions > 0 else 0
                 ),
-                "total_duration": total_duration,
-                "total_tokens": total_tokens,
+                "total_duration": self._total_duration,
+                "total_tokens": dict(self._total_tokens),
                 "nodes_executed": len(self._execution_counts),
                 "execution_order": self._execution_order.copy(),
             }
@@ -519,25 +578,40 @@ class UnifiedStateTracker:
         """
         with self._lock:
             self._node_states = node_states.copy()
+            self._nodes_by_status = defaultdict(dict)
+            for node_id, state in self._node_states.items():
+                self._nodes_by_status[state.status][node_id] = None
             if execution_records is not None:
                 self._execution_records = {k: list(v) for k, v in execution_records.items()}
+                self._reset_totals()
+                for records in self._execution_records.values():
+                    for record in records:
+                        if record.is_complete():
+                            self._add_to_totals(record)
+                for node_id in list(self._execution_records):
+                    self._enforce_retention(node_id)
             if execution_counts is not None:
                 self._execution_counts = execution_counts.copy()
             if last_outputs is not None:
                 self._last_outputs = last_outputs.copy()
 
             logger.debug(f"Loaded states for {len(node_states)} nodes")
+        self._flush_history_spill()
 
     def clear_history(self) -> None:
         """Clear all execution history (for testing)."""
         with self._lock:
             self._execution_records.clear()
             self._node_states.clear()
+            self._nodes_by_status.clear()
             self._execution_counts.clear()
             self._last_outputs.clear()
             self._execution_order.clear()
             self._node_iterations_per_epoch.clear()
             self._node_metadata.clear()
+            self._reset_totals()
+            if self._history_spill is not None:
+                self._history_spill.clear()
 
             logger.debug("Cleared all execution history")
 
@@ -579,6 +653,17 @@ class UnifiedStateTracker:
     # Private Helper Methods
     # ========================================================================
 
+    def _set_state(self, node_id: NodeID, state: NodeState) -> None:
+        """Replace a node's state and move it between status sets.
+
+        Assumes lock is already held.
+        """
+        previous = self._node_states.get(node_id)
+        if previous is not None:
+            self._nodes_by_status[previous.status].pop(node_id, None)
+        self._node_states[node_id] = state
+        self._nodes_by_status[state.status][node_id] = None
+
     def _complete_execution_record(
         self,
         node_id: NodeID,
@@ -619,3 +704,60 @@ class UnifiedStateTracker:
 
         if output:
             self._last_outputs[node_id] = output
+
+        self._add_to_totals(current_record)
+        self._enforce_retention(node_id)
+
+    def _add_to_totals(self, record: NodeExecutionRecord) -> None:
+        """Fold a completed record into the running summary totals.
+
+        Assumes lock is already held.
+        """
+        self._total_duration += record.duration
+        if record.was_successful():
+            self._successful_executions += 1
+        else:
+            self._failed_executions += 1
+
+        if record.token_usage:
+            for key in self._total_tokens:
+                self._total_tokens[key] += record.token_usage.get(key, 0)
+
+    def _reset_totals(self) -> None:
+        self._successful_executions = 0
+        self._failed_executions = 0
+        self._total_duration = 0.0
+        self._total_tokens = {"input": 0, "output": 0, "cached": 0}
+
+    def _enforce_retention(self, node_id: NodeID) -> None:
+        """Evict the oldest completed records beyond the per-node limit.
+
+        Assumes lock is already held. An in-flight record is never evicted.
+        """
+        if self._max_records_per_node is None:
+            return
+
+        records = self._execution_records.get(node_id)
+        if not records or len(records) <= self._max_records_per_node:
+            return
+
+        excess = len(records) - self._max_records_per_node
+        evicted = list(takewhile(NodeExecutionRecord.is_complete, records[:excess]))
+        if not evicted:
+            return
+
+        del records[: len(evicted)]
+        if self._history_spill is not None and self._history_spill.append(evicted):
+            self._spill_flush_due = True
+
+    def _flush_history_spill(self) -> None:
+        """Write the spill's buffered records once it asks for a flush.
+
+        Called without the lock held: encoding the records serializes their
+        outputs, which must not block other state transitions.
+        """
+        spill = self._history_spill
+        if not self._spill_flush_due or spill is None:
+            return
+        self._spill_flush_due = False
+        spill.flush()
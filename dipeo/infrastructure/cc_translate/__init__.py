@@ -1,7 +1,9 @@
 """Infrastructure adapters for Claude Code translation."""
 
 from .adapters import SessionAdapter
-from .manager import ClaudeCodeManager, SessionInfo
+from .manager import BatchConversionReport, ClaudeCodeManager, SessionInfo, compute_source_hash
+from .session_follower import FollowedSession, SessionFollower
+from .session_index import SessionIndex, SessionIndexEntry
 from .session_parser import (
     ClaudeCodeSession,
     ConversationTurn,
@@ -15,14 +17,20 @@ from .session_parser import (
 from .session_serializer import SessionSerializer
 
 __all__ = [
+    "BatchConversionReport",
     "ClaudeCodeManager",
     "ClaudeCodeSession",
     "ConversationTurn",
+    "FollowedSession",
     "SessionAdapter",
     "SessionEvent",
+    "SessionFollower",
+    "SessionIndex",
+    "SessionIndexEntry",
     "SessionInfo",
     "SessionMetadata",
     "SessionSerializer",
+    "compute_source_hash",
     "extract_session_timestamp",
     "find_session_files",
     "format_timestamp_for_directory",
@@ -57,6 +57,29 @@ class SessionAdapter:
 
         return self._domain_session
 
+    def extend(self, new_events: list) -> DomainSession:
+        """Convert newly appended session events into the cached domain session.
+
+        Only the new events are converted; metadata is refreshed from the
+        underlying session, which tracks its counters incrementally.
+        """
+        if self._domain_session is None:
+            return self.to_domain_session()
+
+        for event in new_events:
+            domain_event = self._convert_event(event)
+            if domain_event:
+                self._domain_session.events.append(domain_event)
+
+        metadata = self._domain_session.metadata
+        metadata.start_time = self._session.metadata.start_time
+        metadata.end_time = self._session.metadata.end_time
+        metadata.event_count = len(self._session.events)
+        metadata.tool_usage_count = dict(self._session.metadata.tool_usage_count)
+        metadata.file_operations = self._session.metadata.file_operations
+
+        return self._domain_session
+
     def _convert_event(self, infra_event) -> DomainEvent | None:
         event_type = self._get_event_type(infra_event)
 
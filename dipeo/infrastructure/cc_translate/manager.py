@@ -5,20 +5,27 @@ including listing, converting, watching, and analyzing sessions.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
+import os
 import re
-from dataclasses import dataclass
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
 from dipeo.domain.cc_translate import PhaseCoordinator
+from dipeo.domain.cc_translate.models.session import DomainSession
 from dipeo.domain.diagram.strategies.light.strategy import LightYamlStrategy
 from dipeo.infrastructure.cc_translate.adapters import SessionAdapter
+from dipeo.infrastructure.cc_translate.session_follower import HAS_WATCHFILES, SessionFollower
+from dipeo.infrastructure.cc_translate.session_index import SessionIndex
 from dipeo.infrastructure.cc_translate.session_parser import (
     ClaudeCodeSession,
-    extract_session_timestamp,
     find_session_files,
     format_timestamp_for_directory,
     parse_session_file,
@@ -27,6 +34,8 @@ from dipeo.infrastructure.cc_translate.session_serializer import SessionSerializ
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_OUTPUT_ROOT = Path("projects/claude_code/sessions")
+
 
 @dataclass
 class SessionInfo:
@@ -39,6 +48,49 @@ class SessionInfo:
     event_count: int = 0
 
 
+@dataclass
+class BatchConversionReport:
+    """Outcome and throughput of a batch conversion."""
+
+    converted: list[str] = field(default_factory=list)
+    skipped: list[str] = field(default_factory=list)
+    failed: list[str] = field(default_factory=list)
+    bytes_processed: int = 0
+    duration_seconds: float = 0.0
+
+    @property
+    def success(self) -> bool:
+        return not self.failed
+
+    @property
+    def sessions_per_second(self) -> float:
+        if self.duration_seconds <= 0:
+            return 0.0
+        return len(self.converted) / self.duration_seconds
+
+    @property
+    def megabytes_per_second(self) -> float:
+        if self.duration_seconds <= 0:
+            return 0.0
+        return self.bytes_processed / (1024 * 1024) / self.duration_seconds
+
+
+def compute_source_hash(file_path: Path) -> str:
+    """Hash the contents of a session file.
+
+    Args:
+        file_path: Path to the session JSONL file
+
+    Returns:
+        Hex digest of the file contents
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
 class ClaudeCodeManager:
     """Manages Claude Code session conversion and analysis.
 
@@ -46,14 +98,17 @@ class ClaudeCodeManager:
     including discovery, conversion to DiPeO diagrams, and session monitoring.
     """
 
-    def __init__(self, session_dir: Path | None = None):
+    def __init__(self, session_dir: Path | None = None, session_index: SessionIndex | None = None):
         """Initialize the ClaudeCodeManager.
 
         Args:
             session_dir: Directory containing Claude Code session files.
                         Defaults to ~/.claude/projects/
+            session_index: Metadata index used for listings and stats.
+                          Defaults to the index in the DiPeO cache directory.
         """
         self.session_dir = session_dir or self._discover_session_dir()
+        self.session_index = session_index or SessionIndex()
         self.coordinator = PhaseCoordinator()
         self.serializer = SessionSerializer()
         self.light_strategy = LightYamlStrategy()
@@ -125,24 +180,16 @@ class ClaudeCodeManager:
 
         for file_path in session_files:
             try:
-                # Parse basic info without full processing
-                session_id = file_path.stem
-                timestamp = extract_session_timestamp(file_path)
-
-                # Quick parse to get event count
-                event_count = 0
-                with open(file_path, encoding="utf-8") as f:
-                    for line in f:
-                        if line.strip():
-                            event_count += 1
-
+                # Metadata comes from the index; only new or grown files are read
+                entry = self.session_index.get(file_path)
                 sessions.append(
                     SessionInfo(
-                        id=session_id,
+                        id=file_path.stem,
                         name=file_path.name,
-                        created_at=timestamp or datetime.fromtimestamp(file_path.stat().st_mtime),
+                        created_at=entry.first_timestamp
+                        or datetime.fromtimestamp(entry.mtime_ns / 1e9),
                         file_path=file_path,
-                        event_count=event_count,
+                        event_count=entry.event_count,
                     )
                 )
             except Exception as e:
@@ -190,6 +237,9 @@ class ClaudeCodeManager:
                 logger.error(f"Session file not found: {session_file}")
                 return False
 
+            # Hash before parsing so the recorded hash never covers unconverted events
+            source_hash = compute_source_hash(session_file)
+
             # Parse session
             logger.info(f"Parsing session: {session_id}")
             session = parse_session_file(session_file)
@@ -198,104 +248,274 @@ class ClaudeCodeManager:
             adapter = SessionAdapter(session)
             domain_session = adapter.to_domain_session()
 
-            # Get preprocessed session for saving
-            preprocessed_session = self.coordinator.preprocess_only(domain_session)
-
-            # Run translation pipeline
-            logger.info("Running translation pipeline...")
-            diagram, metrics = self.coordinator.translate(
+            return self._translate_and_save(
+                session_id,
+                session_file,
                 domain_session,
-                post_process=True,  # Enable post-processing for optimization
+                output_dir,
+                format_type,
+                source_hash=source_hash,
             )
 
-            if not metrics.success:
-                logger.error(f"Translation failed: {', '.join(metrics.errors)}")
-                return False
+        except Exception as e:
+            logger.error(f"Conversion failed: {e}", exc_info=True)
+            return False
 
-            # Determine output path
-            if output_dir:
-                output_base = Path(output_dir)
-            else:
-                # Default to projects/claude_code/sessions/{timestamp}_{session_id}/
-                timestamp = extract_session_timestamp(session_file)
-                if timestamp:
-                    dir_name = format_timestamp_for_directory(timestamp)
-                else:
-                    dir_name = session_id
+    def convert_sessions(
+        self,
+        session_ids: Iterable[str],
+        output_dir: str | None = None,
+        format_type: str = "light",
+        max_workers: int | None = None,
+        force: bool = False,
+        on_result: Callable[[str, str], None] | None = None,
+    ) -> BatchConversionReport:
+        """Convert many sessions in parallel across a process pool.
 
-                output_base = Path("projects/claude_code/sessions") / dir_name
+        Each session is written to its own ``{timestamp}_{session_id}`` directory under
+        ``output_dir`` as soon as its conversion finishes. Sessions whose source
+        hash matches the one recorded in an existing conversion are skipped.
 
-            output_base.mkdir(parents=True, exist_ok=True)
+        Args:
+            session_ids: IDs of the sessions to convert
+            output_dir: Root directory for per-session outputs
+                        (defaults to projects/claude_code/sessions/)
+            format_type: Output format type
+            max_workers: Number of worker processes (defaults to CPU count)
+            force: Convert even if the source hash is unchanged
+            on_result: Optional callback invoked with (session_id, status) as each
+                       session finishes; status is converted, skipped or failed
 
-            # Copy original session JSONL
-            import shutil
+        Returns:
+            BatchConversionReport with per-session outcomes and throughput
+        """
+        report = BatchConversionReport()
+        output_root = Path(output_dir) if output_dir else DEFAULT_OUTPUT_ROOT
+        tasks = []
+        for session_id in dict.fromkeys(session_ids):
+            session_file = self.session_dir / f"{session_id}.jsonl"
+            if not self._is_valid_session_id(session_id) or not session_file.exists():
+                logger.error(f"Invalid or missing session: {session_id}")
+                report.failed.append(session_id)
+                continue
+            output_base = output_root / self._output_dir_name(
+                session_id, session_file, with_session_id=True
+            )
+            tasks.append((session_id, str(output_base), format_type, force))
+
+        def record(session_id: str, status: str, size: int) -> None:
+            getattr(report, status).append(session_id)
+            if status == "converted":
+                report.bytes_processed += size
+            if on_result:
+                on_result(session_id, status)
+
+        start = time.perf_counter()
+        workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+        if workers <= 1:
+            for task in tasks:
+                record(task[0], *self._convert_to(*task))
+        else:
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_conversion_worker,
+                initargs=(self.session_dir,),
+            ) as executor:
+                futures = {executor.submit(_convert_in_worker, *task): task[0] for task in tasks}
+                for future in as_completed(futures):
+                    session_id = futures[future]
+                    try:
+                        status, size = future.result()
+                    except Exception as e:
+                        logger.error(f"Worker failed converting {session_id}: {e}")
+                        status, size = "failed", 0
+                    record(session_id, status, size)
+        report.duration_seconds = time.perf_counter() - start
+
+        logger.info(
+            f"Batch conversion: {len(report.converted)} converted, "
+            f"{len(report.skipped)} skipped, {len(report.failed)} failed in "
+            f"{report.duration_seconds:.2f}s ({report.sessions_per_second:.2f} sessions/s, "
+            f"{report.megabytes_per_second:.2f} MB/s)"
+        )
+        return report
+
+    def _convert_to(
+        self, session_id: str, output_base: str, format_type: str, force: bool
+    ) -> tuple[str, int]:
+        """Convert a single session into a resolved output directory.
 
-            original_session_copy = output_base / "session.jsonl"
-            shutil.copy2(session_file, original_session_copy)
+        Returns:
+            Tuple of (status, source size in bytes)
+        """
+        session_file = self.session_dir / f"{session_id}.jsonl"
+        try:
+            size = session_file.stat().st_size
+            source_hash = compute_source_hash(session_file)
+            if not force and self._is_up_to_date(Path(output_base), source_hash, format_type):
+                return "skipped", size
 
-            # Save domain session as JSON
-            domain_session_file = output_base / "domain_session.json"
-            self.serializer.to_jsonl_file(domain_session, output_base / "domain_session.jsonl")
+            session = parse_session_file(session_file)
+            domain_session = SessionAdapter(session).to_domain_session()
+            converted = self._translate_and_save(
+                session_id,
+                session_file,
+                domain_session,
+                output_base,
+                format_type,
+                source_hash=source_hash,
+            )
+            return ("converted" if converted else "failed"), size
+        except Exception as e:
+            logger.error(f"Conversion of {session_id} failed: {e}", exc_info=True)
+            return "failed", 0
 
-            # Save preprocessed session data
-            preprocessed_file = output_base / "preprocessed.json"
-            preprocessed_dict = preprocessed_session.to_dict()
-            with open(preprocessed_file, "w", encoding="utf-8") as f:
-                json.dump(preprocessed_dict, f, indent=2, default=str)
+    def _is_up_to_date(self, output_base: Path, source_hash: str, format_type: str) -> bool:
+        metadata_file = output_base / "conversion_metadata.json"
+        try:
+            with open(metadata_file, encoding="utf-8") as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return False
+        return (
+            metadata.get("source_hash") == source_hash
+            and metadata.get("output_format") == format_type
+            and metadata.get("metrics", {}).get("success", False)
+        )
+
+    def _output_dir_name(
+        self, session_id: str, session_file: Path, with_session_id: bool = False
+    ) -> str:
+        """Name of a session's default output directory.
+
+        Single conversions keep the ``{timestamp}`` name they always had. Batch and
+        follow mode convert many sessions at once, and sessions started in the same
+        second must not share a directory, so they use ``{timestamp}_{session_id}``;
+        the id keeps the name stable across runs so unchanged sessions are skipped.
+        """
+        timestamp = self.session_index.get(session_file).first_timestamp
+        if not timestamp:
+            return session_id
+        dir_name = format_timestamp_for_directory(timestamp)
+        return f"{dir_name}_{session_id}" if with_session_id else dir_name
 
-            # Save preprocessed session as JSONL
-            preprocessed_jsonl = output_base / "preprocessed.jsonl"
-            self.serializer.to_jsonl_file(preprocessed_session.session, preprocessed_jsonl)
+    def _translate_and_save(
+        self,
+        session_id: str,
+        session_file: Path,
+        domain_session: DomainSession,
+        output_dir: str | None,
+        format_type: str,
+        source_hash: str | None = None,
+        with_session_id: bool = False,
+    ) -> bool:
+        """Translate a parsed domain session and write all conversion outputs.
 
-            # Save diagram
-            output_file = output_base / "diagram.light.yaml"
-            logger.info(f"Saving diagram to: {output_file}")
+        Args:
+            session_id: ID of the session
+            session_file: Path to the source session JSONL
+            domain_session: Parsed domain session
+            output_dir: Optional output directory
+            format_type: Output format type
+            source_hash: Hash of the converted source, recorded so unchanged
+                         sessions can be skipped by batch conversion
+            with_session_id: Add the session id to the default directory name
 
-            # Diagram is already in light format dict, just serialize to YAML
-            import yaml
+        Returns:
+            True if translation succeeded, False otherwise
+        """
+        # Get preprocessed session for saving
+        preprocessed_session = self.coordinator.preprocess_only(domain_session)
+
+        # Run translation pipeline
+        logger.info("Running translation pipeline...")
+        diagram, metrics = self.coordinator.translate(
+            domain_session,
+            post_process=True,  # Enable post-processing for optimization
+        )
+
+        if not metrics.success:
+            logger.error(f"Translation failed: {', '.join(metrics.errors)}")
+            return False
 
-            yaml_content = yaml.dump(diagram, default_flow_style=False, sort_keys=False)
-            output_file.write_text(yaml_content, encoding="utf-8")
+        # Determine output path
+        if output_dir:
+            output_base = Path(output_dir)
+        else:
+            # Default to projects/claude_code/sessions/{timestamp}[_{session_id}]/
+            output_base = DEFAULT_OUTPUT_ROOT / self._output_dir_name(
+                session_id, session_file, with_session_id
+            )
 
-            # Save metadata
-            metadata_file = output_base / "conversion_metadata.json"
-            metadata = {
-                "session_id": session_id,
-                "converted_at": datetime.now().isoformat(),
-                "output_format": format_type,
-                "metrics": {
-                    "total_duration_ms": metrics.total_duration_ms,
-                    "phase_durations": {
-                        phase.value: duration for phase, duration in metrics.phase_durations.items()
-                    },
-                    "success": metrics.success,
-                    "errors": metrics.errors,
+        output_base.mkdir(parents=True, exist_ok=True)
+
+        # Copy original session JSONL
+        import shutil
+
+        original_session_copy = output_base / "session.jsonl"
+        shutil.copy2(session_file, original_session_copy)
+
+        # Save domain session as JSON
+        domain_session_file = output_base / "domain_session.json"
+        self.serializer.to_jsonl_file(domain_session, output_base / "domain_session.jsonl")
+
+        # Save preprocessed session data
+        preprocessed_file = output_base / "preprocessed.json"
+        preprocessed_dict = preprocessed_session.to_dict()
+        with open(preprocessed_file, "w", encoding="utf-8") as f:
+            json.dump(preprocessed_dict, f, indent=2, default=str)
+
+        # Save preprocessed session as JSONL
+        preprocessed_jsonl = output_base / "preprocessed.jsonl"
+        self.serializer.to_jsonl_file(preprocessed_session.session, preprocessed_jsonl)
+
+        # Save diagram
+        output_file = output_base / "diagram.light.yaml"
+        logger.info(f"Saving diagram to: {output_file}")
+
+        # Diagram is already in light format dict, just serialize to YAML
+        import yaml
+
+        yaml_content = yaml.dump(diagram, default_flow_style=False, sort_keys=False)
+        output_file.write_text(yaml_content, encoding="utf-8")
+
+        # Save metadata
+        metadata_file = output_base / "conversion_metadata.json"
+        metadata = {
+            "session_id": session_id,
+            "converted_at": datetime.now().isoformat(),
+            "output_format": format_type,
+            "source_hash": source_hash,
+            "metrics": {
+                "total_duration_ms": metrics.total_duration_ms,
+                "phase_durations": {
+                    phase.value: duration for phase, duration in metrics.phase_durations.items()
                 },
-                "diagram_stats": {
-                    "node_count": len(diagram.get("nodes", [])),
-                    "connection_count": len(diagram.get("connections", [])),
-                },
-            }
-
-            with open(metadata_file, "w", encoding="utf-8") as f:
-                json.dump(metadata, f, indent=2, default=str)
-
-            logger.info("✅ Conversion completed successfully")
-            logger.info(f"   Duration: {metrics.total_duration_ms:.2f}ms")
-            logger.info(f"   Nodes: {len(diagram.get('nodes', []))}")
-            logger.info(f"   Output: {output_file}")
-
-            return True
+                "success": metrics.success,
+                "errors": metrics.errors,
+            },
+            "diagram_stats": {
+                "node_count": len(diagram.get("nodes", [])),
+                "connection_count": len(diagram.get("connections", [])),
+            },
+        }
+
+        with open(metadata_file, "w", encoding="utf-8") as f:
+            json.dump(metadata, f, indent=2, default=str)
+
+        logger.info("✅ Conversion completed successfully")
+        logger.info(f"   Duration: {metrics.total_duration_ms:.2f}ms")
+        logger.info(f"   Nodes: {len(diagram.get('nodes', []))}")
+        logger.info(f"   Output: {output_file}")
 
-        except Exception as e:
-            logger.error(f"Conversion failed: {e}", exc_info=True)
-            return False
+        return True
 
     async def watch_sessions(
         self,
         interval: int = 30,
         output_dir: str | None = None,
         format_type: str = "light",
+        follow: bool = False,
     ) -> bool:
         """Watch for new sessions and automatically convert them.
 
@@ -303,21 +523,27 @@ class ClaudeCodeManager:
             interval: Check interval in seconds
             output_dir: Optional output directory
             format_type: Output format type
+            follow: Keep following sessions as they grow and regenerate their
+                    diagrams from the appended events
 
         Returns:
             True if watching started successfully
         """
+        if follow:
+            return await self.follow_sessions(interval, output_dir, format_type)
+
         logger.info(f"Watching {self.session_dir} for new sessions (interval: {interval}s)")
         seen_sessions = set()
 
         try:
             while True:
-                sessions = self.list_sessions(limit=10)
-                for session in sessions:
-                    if session.id not in seen_sessions:
-                        logger.info(f"New session detected: {session.id}")
-                        self.convert_session(session.id, output_dir, format_type)
-                        seen_sessions.add(session.id)
+                # Only file names are needed here; avoid reading session contents
+                for session_file in find_session_files(self.session_dir, limit=10):
+                    session_id = session_file.stem
+                    if session_id not in seen_sessions:
+                        logger.info(f"New session detected: {session_id}")
+                        self.convert_session(session_id, output_dir, format_type)
+                        seen_sessions.add(session_id)
 
                 await asyncio.sleep(interval)
 
@@ -328,6 +554,54 @@ class ClaudeCodeManager:
             logger.error(f"Watch failed: {e}", exc_info=True)
             return False
 
+    async def follow_sessions(
+        self,
+        interval: float = 2.0,
+        output_dir: str | None = None,
+        format_type: str = "light",
+    ) -> bool:
+        """Follow growing sessions and regenerate their diagrams incrementally.
+
+        Each session file is tailed by byte offset, so only appended lines are
+        parsed and converted; the in-memory session is then re-translated.
+
+        Args:
+            interval: Poll interval or notification debounce window in seconds
+            output_dir: Optional output directory
+            format_type: Output format type
+
+        Returns:
+            True when following stops cleanly
+        """
+        follower = SessionFollower(self.session_dir)
+        mode = "file notifications" if HAS_WATCHFILES else f"polling every {interval}s"
+        logger.info(f"Following sessions in {self.session_dir} ({mode})")
+
+        try:
+            async for changed in follower.changes(interval):
+                for followed in changed:
+                    logger.info(
+                        f"Session {followed.session_id}: +{followed.new_event_count} events"
+                    )
+                    try:
+                        self._translate_and_save(
+                            followed.session_id,
+                            followed.file_path,
+                            followed.domain_session(),
+                            output_dir,
+                            format_type,
+                            with_session_id=True,
+                        )
+                    except Exception as e:
+                        logger.error(f"Conversion of {followed.session_id} failed: {e}")
+        except (KeyboardInterrupt, asyncio.CancelledError):
+            logger.info("Following stopped by user")
+            return True
+        except Exception as e:
+            logger.error(f"Follow failed: {e}", exc_info=True)
+            return False
+        return True
+
     async def get_session_stats(self, session_id: str) -> dict:
         """Get detailed statistics about a session.
 
@@ -350,32 +624,24 @@ class ClaudeCodeManager:
             if not session_file.exists():
                 return {"error": f"Session file not found: {session_file}"}
 
-            # Parse session
-            session = parse_session_file(session_file)
+            # Aggregates are served from the index without parsing the session
+            entry = self.session_index.get(session_file)
 
-            # Extract statistics
             stats = {
                 "session_id": session_id,
-                "event_count": len(session.events),
-                "conversation_turn_count": len(session.conversation_turns),
+                "event_count": entry.event_count,
+                "conversation_turn_count": entry.conversation_turn_count,
+                "size_bytes": entry.size,
                 "metadata": {
-                    "start_time": session.metadata.start_time.isoformat()
-                    if session.metadata.start_time
-                    else None,
-                    "end_time": session.metadata.end_time.isoformat()
-                    if session.metadata.end_time
+                    "start_time": entry.first_timestamp.isoformat()
+                    if entry.first_timestamp
                     else None,
-                    "tool_usage": session.metadata.tool_usage_count,
-                    "file_operations": session.metadata.file_operations,
+                    "end_time": entry.last_timestamp.isoformat() if entry.last_timestamp else None,
+                    "tool_usage": entry.tool_usage,
+                    "file_operations": entry.file_operations,
                 },
-                "tool_usage": session.extract_tool_usage()
-                if hasattr(session, "extract_tool_usage")
-                else {},
-                "file_operations": (
-                    session.extract_file_operations()
-                    if hasattr(session, "extract_file_operations")
-                    else {}
-                ),
+                "tool_usage": entry.tool_usage,
+                "file_operations": entry.file_operations,
             }
 
             return stats
@@ -383,3 +649,18 @@ class ClaudeCodeManager:
         except Exception as e:
             logger.error(f"Failed to get session stats: {e}", exc_info=True)
             return {"error": str(e)}
+
+
+# Per-process manager used by batch conversion workers
+_worker_manager: ClaudeCodeManager | None = None
+
+
+def _init_conversion_worker(session_dir: Path) -> None:
+    global _worker_manager
+    _worker_manager = ClaudeCodeManager(session_dir=session_dir)
+
+
+def _convert_in_worker(
+    session_id: str, output_base: str, format_type: str, force: bool
+) -> tuple[str, int]:
+    return _worker_manager._convert_to(session_id, output_base, format_type, force)
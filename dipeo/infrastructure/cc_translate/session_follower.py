@@ -0,0 +1,162 @@
+"""Incremental tail-following of Claude Code session files.
+
+Tracks a byte offset per session file so that only appended JSONL lines are
+parsed, and keeps the parsed session and its domain conversion in memory so a
+growing session can be re-translated without re-reading it from disk.
+"""
+
+import asyncio
+import logging
+import os
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from pathlib import Path
+
+from dipeo.domain.cc_translate.models.session import DomainSession
+from dipeo.infrastructure.cc_translate.adapters import SessionAdapter
+from dipeo.infrastructure.cc_translate.session_parser import ClaudeCodeSession
+
+try:
+    from watchfiles import awatch
+
+    HAS_WATCHFILES = True
+except ImportError:
+    HAS_WATCHFILES = False
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class FollowedSession:
+    """Tail state for a single session file."""
+
+    file_path: Path
+    session: ClaudeCodeSession
+    adapter: SessionAdapter | None = None
+    offset: int = 0
+    size: int = 0
+    mtime_ns: int = 0
+    new_event_count: int = 0
+
+    @property
+    def session_id(self) -> str:
+        return self.file_path.stem
+
+    def domain_session(self) -> DomainSession:
+        if self.adapter is None:
+            self.adapter = SessionAdapter(self.session)
+        return self.adapter.to_domain_session()
+
+
+class SessionFollower:
+    """Follows a directory of session JSONL files and reports sessions that grew.
+
+    Uses filesystem notifications via ``watchfiles`` when it is installed and
+    falls back to polling directory entries by size/mtime otherwise. Neither
+    path reads unchanged files.
+    """
+
+    def __init__(self, session_dir: Path, max_sessions: int = 10):
+        """Initialize the follower.
+
+        Args:
+            session_dir: Directory containing session JSONL files
+            max_sessions: Number of most recently modified sessions to follow
+        """
+        self.session_dir = session_dir
+        self.max_sessions = max_sessions
+        self._followed: dict[Path, FollowedSession] = {}
+
+    def scan(self) -> list[FollowedSession]:
+        """Check followed files for growth and parse appended lines.
+
+        Returns:
+            Sessions that received new events since the previous scan
+        """
+        entries = []
+        try:
+            with os.scandir(self.session_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".jsonl") and entry.is_file():
+                        stat = entry.stat()
+                        entries.append((stat.st_mtime_ns, Path(entry.path), stat))
+        except FileNotFoundError:
+            return []
+
+        entries.sort(key=lambda item: item[0], reverse=True)
+        changed = []
+        for _, path, stat in entries[: self.max_sessions]:
+            followed = self._followed.get(path)
+            if followed and followed.size == stat.st_size and followed.mtime_ns == stat.st_mtime_ns:
+                continue
+            if self._update(path, stat.st_size, stat.st_mtime_ns):
+                changed.append(self._followed[path])
+        return changed
+
+    def update_paths(self, paths: set[Path]) -> list[FollowedSession]:
+        """Parse appended lines for specific files reported by a change notification.
+
+        Args:
+            paths: Paths reported as modified
+
+        Returns:
+            Sessions that received new events
+        """
+        changed = []
+        for path in paths:
+            if path.suffix != ".jsonl" or not path.is_file():
+                continue
+            stat = path.stat()
+            if self._update(path, stat.st_size, stat.st_mtime_ns):
+                changed.append(self._followed[path])
+        return changed
+
+    def _update(self, path: Path, size: int, mtime_ns: int) -> bool:
+        followed = self._followed.get(path)
+        if followed is None or size < followed.offset:
+            # New file, or the file was truncated/rewritten: start from scratch
+            followed = FollowedSession(
+                file_path=path, session=ClaudeCodeSession(path.stem.replace("session-", ""))
+            )
+            self._followed[path] = followed
+
+        try:
+            new_events, followed.offset = followed.session.load_appended(path, followed.offset)
+        except OSError as e:
+            logger.warning(f"Failed to read appended events from {path}: {e}")
+            return False
+
+        followed.size = size
+        followed.mtime_ns = mtime_ns
+        followed.new_event_count = len(new_events)
+        if not new_events:
+            return False
+
+        if followed.adapter is None:
+            followed.adapter = SessionAdapter(followed.session)
+        else:
+            followed.adapter.extend(new_events)
+        return True
+
+    async def changes(self, interval: float) -> AsyncIterator[list[FollowedSession]]:
+        """Yield batches of sessions that grew, until cancelled.
+
+        Args:
+            interval: Poll interval in seconds when notifications are unavailable,
+                      and debounce window when they are
+        """
+        initial = self.scan()
+        if initial:
+            yield initial
+
+        if HAS_WATCHFILES:
+            async for batch in awatch(self.session_dir, debounce=int(interval * 1000)):
+                changed = self.update_paths({Path(path) for _, path in batch})
+                if changed:
+                    yield changed
+        else:
+            while True:
+                await asyncio.sleep(interval)
+                changed = self.scan()
+                if changed:
+                    yield changed
@@ -0,0 +1,273 @@
+"""Persistent metadata index for Claude Code session files.
+
+Session listings and statistics only need a handful of aggregates per file
+(event count, first/last timestamp, tool usage). This index stores them in a
+small SQLite database keyed by path, mtime and size, so unchanged files are
+never re-read and files that only grew are scanned from the last indexed byte.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+from collections.abc import Iterable
+from dataclasses import dataclass, field
+from datetime import datetime
+from pathlib import Path
+
+from dipeo.config.paths import CACHE_DIR
+from dipeo.infrastructure.cc_translate.session_parser import ClaudeCodeSession, SessionEvent
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INDEX_PATH = CACHE_DIR / "cc_session_index.db"
+
+# Number of leading bytes hashed to detect files rewritten in place
+HEAD_DIGEST_BYTES = 4096
+
+FILE_OPERATION_TOOLS = ("Read", "Write", "Edit", "MultiEdit")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_index (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    indexed_bytes INTEGER NOT NULL,
+    head_digest TEXT NOT NULL,
+    event_count INTEGER NOT NULL,
+    conversation_turn_count INTEGER NOT NULL,
+    first_timestamp TEXT,
+    last_timestamp TEXT,
+    tool_usage TEXT NOT NULL,
+    file_operations TEXT NOT NULL
+);
+"""
+
+
+@dataclass
+class SessionIndexEntry:
+    """Aggregated metadata for one session file."""
+
+    path: Path
+    mtime_ns: int = 0
+    size: int = 0
+    indexed_bytes: int = 0
+    head_digest: str = ""
+    event_count: int = 0
+    conversation_turn_count: int = 0
+    first_timestamp: datetime | None = None
+    last_timestamp: datetime | None = None
+    tool_usage: dict[str, int] = field(default_factory=dict)
+    file_operations: dict[str, list[str]] = field(default_factory=dict)
+
+    def _fold_line(self, line: bytes) -> None:
+        if not line.strip():
+            return
+        try:
+            data = json.loads(line)
+            event = SessionEvent.from_json(data)
+        except Exception:
+            return
+
+        self.event_count += 1
+        timestamp = _parse_timestamp(data.get("timestamp"))
+        if timestamp is not None:
+            if self.first_timestamp is None:
+                self.first_timestamp = timestamp
+            self.last_timestamp = timestamp
+
+        if event.tool_name:
+            self.tool_usage[event.tool_name] = self.tool_usage.get(event.tool_name, 0) + 1
+            if event.tool_name in FILE_OPERATION_TOOLS:
+                if event.tool_input and "file_path" in event.tool_input:
+                    self.file_operations.setdefault(event.tool_name, []).append(
+                        event.tool_input["file_path"]
+                    )
+
+        # Mirrors ClaudeCodeSession.get_conversation_flow: every non-meta user
+        # event that is not a command wrapper starts a new turn
+        if (
+            event.type == "user"
+            and not event.is_meta
+            and not ClaudeCodeSession._is_command_wrapper_event(event)
+        ):
+            self.conversation_turn_count += 1
+
+
+class SessionIndex:
+    """SQLite-backed index of session file metadata, updated incrementally."""
+
+    def __init__(self, db_path: Path | None = None):
+        """Initialize the index.
+
+        Args:
+            db_path: Database file path. Defaults to the DiPeO cache directory.
+                     Falls back to an in-memory database if it cannot be opened.
+        """
+        self.db_path = db_path or DEFAULT_INDEX_PATH
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+
+    def _connect(self) -> sqlite3.Connection:
+        try:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.db_path, check_same_thread=False, timeout=30.0)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+        except (OSError, sqlite3.Error) as e:
+            logger.warning(f"Session index unavailable at {self.db_path}, using memory: {e}")
+            conn = sqlite3.connect(":memory:", check_same_thread=False)
+            conn.executescript(_SCHEMA)
+        return conn
+
+    def get(self, file_path: Path) -> SessionIndexEntry:
+        """Get up-to-date metadata for a session file.
+
+        Args:
+            file_path: Path to the session JSONL file
+
+        Returns:
+            Index entry for the file
+        """
+        return self.get_many([file_path])[0]
+
+    def get_many(self, file_paths: Iterable[Path]) -> list[SessionIndexEntry]:
+        """Get up-to-date metadata for several session files.
+
+        Only files whose mtime or size changed since they were last indexed are
+        read, and files that grew are scanned from the previously indexed offset.
+
+        Args:
+            file_paths: Paths to session JSONL files
+
+        Returns:
+            Index entries in the same order as ``file_paths``
+        """
+        entries = []
+        changed = []
+        with self._lock:
+            for file_path in file_paths:
+                stat = file_path.stat()
+                entry = self._load(file_path)
+                if (
+                    entry is None
+                    or entry.mtime_ns != stat.st_mtime_ns
+                    or entry.size != stat.st_size
+                ):
+                    entry = self._refresh(file_path, entry, stat.st_mtime_ns, stat.st_size)
+                    changed.append(entry)
+                entries.append(entry)
+
+            if changed:
+                with self._conn:
+                    self._conn.executemany(
+                        "INSERT OR REPLACE INTO session_index VALUES "
+                        "(?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        [_to_row(entry) for entry in changed],
+                    )
+        return entries
+
+    def prune(self, existing_paths: Iterable[Path]) -> int:
+        """Remove entries for files that no longer exist.
+
+        Args:
+            existing_paths: Paths that should be kept
+
+        Returns:
+            Number of removed entries
+        """
+        keep = {str(path) for path in existing_paths}
+        with self._lock:
+            stale = [
+                (path,)
+                for (path,) in self._conn.execute("SELECT path FROM session_index")
+                if path not in keep and not Path(path).exists()
+            ]
+            if stale:
+                with self._conn:
+                    self._conn.executemany("DELETE FROM session_index WHERE path = ?", stale)
+        return len(stale)
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+    def _load(self, file_path: Path) -> SessionIndexEntry | None:
+        row = self._conn.execute(
+            "SELECT * FROM session_index WHERE path = ?", (str(file_path),)
+        ).fetchone()
+        return _from_row(row) if row else None
+
+    def _refresh(
+        self, file_path: Path, entry: SessionIndexEntry | None, mtime_ns: int, size: int
+    ) -> SessionIndexEntry:
+        with open(file_path, "rb") as f:
+            head = f.read(HEAD_DIGEST_BYTES)
+            if (
+                entry is None
+                or size < entry.indexed_bytes
+                or _digest(head[: min(entry.indexed_bytes, HEAD_DIGEST_BYTES)]) != entry.head_digest
+            ):
+                # New, truncated or rewritten file: index from the start
+                entry = SessionIndexEntry(path=file_path)
+
+            f.seek(entry.indexed_bytes)
+            chunk = f.read()
+
+        # A trailing line without a newline is still being written
+        end = chunk.rfind(b"\n")
+        if end != -1:
+            for line in chunk[: end + 1].splitlines():
+                entry._fold_line(line)
+            entry.indexed_bytes += end + 1
+
+        entry.head_digest = _digest(head[: min(entry.indexed_bytes, HEAD_DIGEST_BYTES)])
+        entry.mtime_ns = mtime_ns
+        entry.size = size
+        return entry
+
+
+def _digest(data: bytes) -> str:
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _parse_timestamp(value: object) -> datetime | None:
+    if not isinstance(value, str):
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+def _to_row(entry: SessionIndexEntry) -> tuple:
+    return (
+        str(entry.path),
+        entry.mtime_ns,
+        entry.size,
+        entry.indexed_bytes,
+        entry.head_digest,
+        entry.event_count,
+        entry.conversation_turn_count,
+        entry.first_timestamp.isoformat() if entry.first_timestamp else None,
+        entry.last_timestamp.isoformat() if entry.last_timestamp else None,
+        json.dumps(entry.tool_usage),
+        json.dumps(entry.file_operations),
+    )
+
+
+def _from_row(row: tuple) -> SessionIndexEntry:
+    return SessionIndexEntry(
+        path=Path(row[0]),
+        mtime_ns=row[1],
+        size=row[2],
+        indexed_bytes=row[3],
+        head_digest=row[4],
+        event_count=row[5],
+        conversation_turn_count=row[6],
+        first_timestamp=datetime.fromisoformat(row[7]) if row[7] else None,
+        last_timestamp=datetime.fromisoformat(row[8]) if row[8] else None,
+        tool_usage=json.loads(row[9]),
+        file_operations=json.loads(row[10]),
+    )
@@ -98,31 +98,83 @@ class ClaudeCodeSession:
         self.session_id = session_id
         self.events: list[SessionEvent] = []
         self.metadata = SessionMetadata(session_id=session_id)
+        self._events_by_uuid: dict[str, SessionEvent] = {}
 
     def load_from_file(self, file_path: Path) -> None:
         if not file_path.exists():
             raise FileNotFoundError(f"Session file not found: {file_path}")
 
         self.events.clear()
+        self._events_by_uuid.clear()
 
         with open(file_path, encoding="utf-8") as f:
             for line_num, line in enumerate(f, 1):
-                if not line.strip():
-                    continue
-
-                try:
-                    data = json.loads(line)
-                    event = SessionEvent.from_json(data)
+                event = self._parse_line(line, line_num)
+                if event is not None:
                     self.events.append(event)
-                except json.JSONDecodeError as e:
-                    print(f"Warning: Failed to parse line {line_num}: {e}")
-                except Exception as e:
-                    print(f"Warning: Error processing line {line_num}: {e}")
 
+        self._index_events(self.events)
         self._associate_tool_results()
         self._update_metadata()
 
-    def _associate_tool_results(self) -> None:
+    def load_appended(self, file_path: Path, offset: int = 0) -> tuple[list[SessionEvent], int]:
+        """Parse only the complete lines appended to a session file since ``offset``.
+
+        A trailing line without a newline is still being written, so it is left for
+        the next call. Tool results and metadata are updated for the new events only.
+
+        Args:
+            file_path: Path to the session JSONL file
+            offset: Byte offset up to which the file has already been parsed
+
+        Returns:
+            Tuple of (new events, new byte offset)
+        """
+        if not file_path.exists():
+            raise FileNotFoundError(f"Session file not found: {file_path}")
+
+        with open(file_path, "rb") as f:
+            f.seek(offset)
+            chunk = f.read()
+
+        end = chunk.rfind(b"\n")
+        if end == -1:
+            return [], offset
+
+        new_events = []
+        first_line = self.metadata.event_count + 1
+        for line_num, raw in enumerate(chunk[: end + 1].splitlines(), first_line):
+            event = self._parse_line(raw.decode("utf-8", errors="replace"), line_num)
+            if event is not None:
+                new_events.append(event)
+
+        if new_events:
+            self.events.extend(new_events)
+            self._index_events(new_events)
+            self._associate_tool_results(new_events)
+            self._update_metadata(new_events)
+
+        return new_events, offset + end + 1
+
+    @staticmethod
+    def _parse_line(line: str, line_num: int) -> SessionEvent | None:
+        if not line.strip():
+            return None
+
+        try:
+            return SessionEvent.from_json(json.loads(line))
+        except json.JSONDecodeError as e:
+            print(f"Warning: Failed to parse line {line_num}: {e}")
+        except Exception as e:
+            print(f"Warning: Error processing line {line_num}: {e}")
+        return None
+
+    def _index_events(self, events: list[SessionEvent]) -> None:
+        for event in events:
+            if event.uuid:
+                self._events_by_uuid[event.uuid] = event
+
+    def _associate_tool_results(self, events: list[SessionEvent] | None = None) -> None:
         """Associate tool result payloads with their originating tool events.
 
         Claude Code sessions emit tool results as separate user events that
@@ -136,14 +188,17 @@ class ClaudeCodeSession:
         2. Structured dict without patch (write/read result)
         3. List of structured payloads (prefer last)
         4. Error strings or primitive values (fallback)
+
+        Args:
+            events: Events to associate; defaults to all events in the session
         """
 
         if not self.events:
             return
 
-        events_by_uuid = {event.uuid: event for event in self.events if event.uuid}
+        events_by_uuid = self._events_by_uuid
 
-        for event in self.events:
+        for event in self.events if events is None else events:
             if not event.tool_use_result or not event.parent_uuid:
                 continue
 
@@ -278,7 +333,8 @@ class ClaudeCodeSession:
 
         return commands
 
-    def _is_command_wrapper_event(self, event: SessionEvent) -> bool:
+    @staticmethod
+    def _is_command_wrapper_event(event: SessionEvent) -> bool:
         if event.type != "user":
             return False
 
@@ -299,15 +355,30 @@ class ClaudeCodeSession:
 
         return False
 
-    def _update_metadata(self) -> None:
+    def _update_metadata(self, new_events: list[SessionEvent] | None = None) -> None:
         if not self.events:
             return
 
         self.metadata.start_time = self.events[0].timestamp
         self.metadata.end_time = self.events[-1].timestamp
         self.metadata.event_count = len(self.events)
-        self.metadata.tool_usage_count = self.extract_tool_usage()
-        self.metadata.file_operations = self.get_file_operations()
+
+        if new_events is None:
+            self.metadata.tool_usage_count = self.extract_tool_usage()
+            self.metadata.file_operations = self.get_file_operations()
+            return
+
+        # Fold only the appended events into the running counters
+        for event in new_events:
+            if event.tool_name:
+                self.metadata.tool_usage_count[event.tool_name] = (
+                    self.metadata.tool_usage_count.get(event.tool_name, 0) + 1
+                )
+            if event.tool_name in ["Read", "Write", "Edit", "MultiEdit"]:
+                if event.tool_input and "file_path" in event.tool_input:
+                    self.metadata.file_operations.setdefault(event.tool_name, []).append(
+                        event.tool_input["file_path"]
+                    )
 
     def get_summary_stats(self) -> dict[str, Any]:
         stats = {
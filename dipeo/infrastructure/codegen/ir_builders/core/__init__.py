@@ -8,6 +8,11 @@ from dipeo.infrastructure.codegen.ir_builders.core.base_steps import (
     BaseValidatorStep,
 )
 from dipeo.infrastructure.codegen.ir_builders.core.context import BuildContext
+from dipeo.infrastructure.codegen.ir_builders.core.shared_cache import (
+    ExtractionCache,
+    get_shared_extraction_cache,
+    source_fingerprint,
+)
 from dipeo.infrastructure.codegen.ir_builders.core.steps import (
     BuildStep,
     CompositeStep,
@@ -27,9 +32,12 @@ __all__ = [
     "BuildContext",
     "BuildStep",
     "CompositeStep",
+    "ExtractionCache",
     "PipelineOrchestrator",
     "StepExecutionMode",
     "StepRegistry",
     "StepResult",
     "StepType",
+    "get_shared_extraction_cache",
+    "source_fingerprint",
 ]
@@ -2,12 +2,17 @@
 
 from __future__ import annotations
 
+import asyncio
 from abc import ABC, abstractmethod
 from pathlib import Path
 from typing import Any, Optional
 
 from dipeo.domain.codegen.ir_builder_port import IRBuilderPort, IRData, IRMetadata
 from dipeo.infrastructure.codegen.ir_builders.core.context import BuildContext
+from dipeo.infrastructure.codegen.ir_builders.core.shared_cache import (
+    get_shared_extraction_cache,
+    source_fingerprint,
+)
 from dipeo.infrastructure.codegen.ir_builders.core.steps import (
     BuildStep,
     PipelineOrchestrator,
@@ -32,8 +37,10 @@ class BaseIRBuilder(IRBuilderPort, ABC):
         # Initialize build context
         self.context = BuildContext(config_path=Path(config_path) if config_path else None)
 
-        # Initialize pipeline orchestrator
-        self.orchestrator = PipelineOrchestrator(self.context)
+        # Initialize pipeline orchestrator; extraction results are shared across builders
+        self.orchestrator = PipelineOrchestrator(
+            self.context, shared_cache=get_shared_extraction_cache()
+        )
 
         # Configure pipeline steps in subclasses
         self._configure_pipeline()
@@ -71,8 +78,9 @@ class BaseIRBuilder(IRBuilderPort, ABC):
         Raises:
             RuntimeError: If required pipeline step fails
         """
-        # Execute the configured pipeline
-        results = self.orchestrator.execute(source_data)
+        # Execute the configured pipeline off the event loop; it is CPU-bound
+        source_key = self.get_cache_key(source_data)
+        results = await asyncio.to_thread(self.orchestrator.execute, source_data, source_key)
 
         # Assemble final IR data from pipeline results
         ir_data = self._assemble_ir_data(results)
@@ -178,9 +186,17 @@ class BaseIRBuilder(IRBuilderPort, ABC):
             source_data: Input data to generate cache key for
 
         Returns:
-            SHA256 hash of the source data
+            SHA256 fingerprint of the source files (see ``source_fingerprint``)
+        """
+        return source_fingerprint(source_data)
+
+    def get_step_timings(self) -> dict[str, float]:
+        """Get per-step durations from the last pipeline run.
+
+        Returns:
+            Dictionary mapping step names to durations in milliseconds
         """
-        return self.context.get_cache_key(source_data)
+        return self.orchestrator.get_timings()
 
     def reset_pipeline(self) -> None:
         """Reset the pipeline for a fresh execution."""
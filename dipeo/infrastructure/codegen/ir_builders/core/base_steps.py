@@ -45,8 +45,13 @@ class BaseExtractionStep(BuildStep):
         - should_process_file(): Filter which files to process
         - pre_extraction_hook(): Setup before extraction begins
         - post_extraction_hook(): Cleanup or additional processing after extraction
+
+    Extraction depends only on the AST and type mappings, so results are shareable
+    across builders processing the same AST.
     """
 
+    shareable = True
+
     def __init__(self, name: str, required: bool = True):
         """Initialize extraction step.
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import hashlib
 import json
 import os
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
@@ -14,6 +15,22 @@ import yaml
 
 from dipeo.infrastructure.codegen.ir_builders.type_system_unified import UnifiedTypeConverter
 
+_default_type_converter: UnifiedTypeConverter | None = None
+_default_type_converter_lock = threading.Lock()
+
+
+def _get_default_type_converter() -> UnifiedTypeConverter:
+    """Get the process-wide converter used when no custom mappings are configured.
+
+    Sharing it lets builders reuse each other's resolved type conversions.
+    """
+    global _default_type_converter
+    if _default_type_converter is None:
+        with _default_type_converter_lock:
+            if _default_type_converter is None:
+                _default_type_converter = UnifiedTypeConverter()
+    return _default_type_converter
+
 
 @dataclass
 class BuildContext:
@@ -100,7 +117,7 @@ class BuildContext:
             self._type_converter = (
                 UnifiedTypeConverter(custom_mappings=custom_mappings)
                 if custom_mappings
-                else UnifiedTypeConverter()
+                else _get_default_type_converter()
             )
         return self._type_converter
 
@@ -0,0 +1,161 @@
+"""Process-wide cache for step results shared between IR builders.
+
+The backend, frontend and strawberry builders all run the same extraction steps
+(node specs, enums, domain models, GraphQL operations) over the same TypeScript
+AST. Shareable step results are stored here keyed by the source fingerprint,
+the build config hash and the step name, so each extraction runs once per AST.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import pickle
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from dipeo.config.paths import BASE_DIR
+
+if TYPE_CHECKING:
+    from dipeo.infrastructure.codegen.ir_builders.core.context import BuildContext
+    from dipeo.infrastructure.codegen.ir_builders.core.steps import StepResult
+
+
+def _content_hash(data: Any) -> str:
+    payload = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+def _file_fingerprint(file_path: Any, file_data: Any) -> str:
+    """Fingerprint one AST entry by its source file's mtime and size when it exists."""
+    if isinstance(file_path, str):
+        path = Path(file_path)
+        if not path.is_absolute():
+            path = BASE_DIR / path
+        try:
+            stat = path.stat()
+        except (OSError, ValueError):
+            pass
+        else:
+            if path.is_file():
+                return f"{stat.st_mtime_ns}:{stat.st_size}"
+    return _content_hash(file_data)
+
+
+def source_fingerprint(source_data: Any) -> str:
+    """Build the cache key of a pipeline input.
+
+    Inputs are dicts of file path -> AST. An entry whose path names an existing
+    file is identified by that file's mtime and size, so the AST itself is not
+    serialized; other entries, and non-dict inputs, are hashed by content.
+
+    Args:
+        source_data: Pipeline input data
+
+    Returns:
+        Hex SHA-256 digest
+    """
+    if not isinstance(source_data, dict):
+        return _content_hash(source_data)
+    digest = hashlib.sha256()
+    for file_path in sorted(source_data, key=str):
+        digest.update(str(file_path).encode())
+        digest.update(b"\0")
+        digest.update(_file_fingerprint(file_path, source_data[file_path]).encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ExtractionCache:
+    """Thread-safe bounded LRU cache of shareable step results.
+
+    Results are stored pickled, so every hit returns an independent copy that
+    callers may mutate.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        """Initialize extraction cache.
+
+        Args:
+            max_entries: Maximum number of step results to retain
+        """
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(source_key: str, step_name: str, context: BuildContext) -> str:
+        """Build the cache key for a step result.
+
+        Args:
+            source_key: Fingerprint of the pipeline input (AST)
+            step_name: Name of the step
+            context: Build context, whose type mappings affect extraction output
+
+        Returns:
+            Cache key string
+        """
+        type_mappings = context.config.get("type_mappings")
+        config_key = context.get_cache_key(type_mappings) if type_mappings else "-"
+        return f"{source_key}:{config_key}:{step_name}"
+
+    def get(self, key: str) -> StepResult | None:
+        """Get a copy of a cached step result.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Independent copy of the cached StepResult, or None on a miss
+        """
+        with self._lock:
+            payload = self._entries.get(key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return pickle.loads(payload)
+
+    def set(self, key: str, result: StepResult) -> None:
+        """Store a copy of a successful step result.
+
+        Args:
+            key: Cache key
+            result: Step result to store
+        """
+        payload = pickle.dumps(result, protocol=pickle.HIGHEST_PROTOCOL)
+        with self._lock:
+            self._entries[key] = payload
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+
+
+_shared_cache: ExtractionCache | None = None
+_shared_cache_lock = threading.Lock()
+
+
+def get_shared_extraction_cache() -> ExtractionCache:
+    """Get the process-wide extraction cache.
+
+    Returns:
+        Shared ExtractionCache instance
+    """
+    global _shared_cache
+    if _shared_cache is None:
+        with _shared_cache_lock:
+            if _shared_cache is None:
+                _shared_cache = ExtractionCache()
+    return _shared_cache
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import time
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
 from enum import Enum
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
+from dipeo.config.base_logger import get_module_logger
 from dipeo.infrastructure.codegen.ir_builders.core.context import BuildContext
 
+if TYPE_CHECKING:
+    from dipeo.infrastructure.codegen.ir_builders.core.shared_cache import ExtractionCache
+
+logger = get_module_logger(__name__)
+
 
 class StepType(Enum):
     """Type of build step in the pipeline."""
@@ -54,8 +61,14 @@ class BuildStep(ABC):
 
     Each step represents a discrete operation in the IR build process.
     Steps can extract data, transform it, assemble it, or validate it.
+
+    A step whose output depends only on the source AST and build config may set
+    ``shareable`` so its result can be reused by other builders processing the
+    same AST.
     """
 
+    shareable: bool = False
+
     def __init__(self, name: str, step_type: StepType, required: bool = True):
         """Initialize build step.
 
@@ -188,16 +201,19 @@ class CompositeStep(BuildStep):
 class PipelineOrchestrator:
     """Orchestrates the execution of build pipeline steps."""
 
-    def __init__(self, context: BuildContext):
+    def __init__(self, context: BuildContext, shared_cache: ExtractionCache | None = None):
         """Initialize pipeline orchestrator.
 
         Args:
             context: Build context for the pipeline
+            shared_cache: Optional cache for reusing shareable step results
         """
         self.context = context
+        self.shared_cache = shared_cache
         self.steps: dict[str, BuildStep] = {}
         self.execution_order: list[str] = []
         self._results: dict[str, StepResult] = {}
+        self._timings: dict[str, float] = {}
 
     def add_step(self, step: BuildStep) -> None:
         """Add a step to the pipeline.
@@ -253,11 +269,72 @@ class PipelineOrchestrator:
 
         return order
 
-    def execute(self, input_data: Any = None) -> dict[str, StepResult]:
+    def _build_step_input(self, step: BuildStep, original_input: Any) -> Any:
+        """Build the input for a step from the original input and prior results.
+
+        Args:
+            step: Step about to run
+            original_input: Input data passed to the pipeline
+
+        Returns:
+            Input data for the step
+        """
+        # EXTRACT steps always get the original input data (AST)
+        if step.step_type == StepType.EXTRACT:
+            return original_input
+
+        dep_data = {}
+        for dep_name in step._dependencies:
+            if dep_name in self._results:
+                dep_data[dep_name] = self._results[dep_name].data
+        if dep_data:
+            return dep_data
+
+        # Fall back to the most recent successful output in execution order
+        for name in reversed(self.execution_order):
+            result = self._results.get(name)
+            if result is not None and result.success and result.data is not None:
+                return result.data
+        return original_input
+
+    def _run_step(self, step: BuildStep, step_input: Any, source_key: str | None) -> StepResult:
+        """Run a single step, consulting the shared cache for shareable steps.
+
+        Args:
+            step: Step to run
+            step_input: Input data for the step
+            source_key: Cache key of the pipeline input, if known
+
+        Returns:
+            StepResult from the step or the shared cache
+        """
+        start = time.perf_counter()
+        cache_key = None
+        result = None
+        if self.shared_cache is not None and source_key and step.shareable:
+            cache_key = self.shared_cache.make_key(source_key, step.name, self.context)
+            result = self.shared_cache.get(cache_key)
+
+        if result is None:
+            result = step.execute(self.context, step_input)
+            if cache_key is not None and result.success:
+                self.shared_cache.set(cache_key, result)
+        else:
+            result.metadata["shared_cache_hit"] = True
+
+        duration_ms = (time.perf_counter() - start) * 1000
+        result.metadata["duration_ms"] = duration_ms
+        self._timings[step.name] = duration_ms
+        return result
+
+    def execute(
+        self, input_data: Any = None, source_key: str | None = None
+    ) -> dict[str, StepResult]:
         """Execute the pipeline with given input data.
 
         Args:
             input_data: Initial input data for the pipeline
+            source_key: Optional cache key of the input, enables the shared cache
 
         Returns:
             Dictionary mapping step names to their results
@@ -267,29 +344,14 @@ class PipelineOrchestrator:
         """
         self.execution_order = self._resolve_execution_order()
         self._results = {}
-
-        current_data = input_data
-        original_input = input_data  # Keep reference to original input
+        self._timings = {}
 
         for step_name in self.execution_order:
             step = self.steps[step_name]
-
-            # EXTRACT steps always get the original input data (AST)
-            # Other steps can use dependency data
-            if step.step_type == StepType.EXTRACT:
-                step_input = original_input
-            elif step._dependencies:
-                # Collect outputs from dependencies
-                dep_data = {}
-                for dep_name in step._dependencies:
-                    if dep_name in self._results:
-                        dep_data[dep_name] = self._results[dep_name].data
-                step_input = dep_data if dep_data else current_data
-            else:
-                step_input = current_data
+            step_input = self._build_step_input(step, input_data)
 
             # Execute step
-            result = step.execute(self.context, step_input)
+            result = self._run_step(step, step_input, source_key)
             self._results[step_name] = result
 
             # Store result in context for inter-step access
@@ -300,10 +362,11 @@ class PipelineOrchestrator:
             if not result.success and step.required:
                 raise RuntimeError(f"Required step '{step_name}' failed: {result.error}")
 
-            # Update current data for next step
-            if result.success and result.data is not None:
-                current_data = result.data
-
+        logger.debug(
+            "Pipeline executed %d steps (%.1f ms)",
+            len(self.execution_order),
+            sum(self._timings.values()),
+        )
         return self._results
 
     def get_result(self, step_name: str) -> StepResult | None:
@@ -329,9 +392,18 @@ class PipelineOrchestrator:
             if result.success and result.data is not None
         }
 
+    def get_timings(self) -> dict[str, float]:
+        """Get per-step wall-clock durations from the last execution.
+
+        Returns:
+            Dictionary mapping step names to durations in milliseconds
+        """
+        return dict(self._timings)
+
     def reset(self) -> None:
         """Reset the pipeline for a fresh execution."""
         self._results = {}
+        self._timings = {}
         self.execution_order = []
 
 
@@ -131,6 +131,7 @@ class GraphQLFilters:
         if operation_name in [
             "ExecuteDiagram",
             "UpdateNodeState",
+            "UpdateNodeStates",
             "ControlExecution",
             "SendInteractiveResponse",
         ]:
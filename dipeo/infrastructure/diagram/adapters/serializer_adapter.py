@@ -6,10 +6,11 @@ to implement the domain DiagramStorageSerializer port.
 
 import contextlib
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from dipeo.config.base_logger import get_module_logger
 from dipeo.domain.diagram.ports import DiagramStorageSerializer, FormatStrategy
+from dipeo.domain.diagram.utils.conversion import parse_diagram_content
 
 if TYPE_CHECKING:
     from dipeo.diagram_generated import DomainDiagram
@@ -64,51 +65,54 @@ class UnifiedSerializerAdapter(DiagramStorageSerializer):
     def deserialize_from_storage(
         self, content: str, format: str | None = None, diagram_path: str | None = None
     ) -> "DomainDiagram":
-        if not format:
-            format = self._detect_format(content)
+        format = format.lower() if format else None
+        if format in (None, "yaml", "yml"):
+            # Parse once and detect the format from the parsed document
+            data = parse_diagram_content(content)
+            return self.deserialize_from_data(data, format, diagram_path)
 
-        format = format.lower() if format else "native"
-        if format in ["yaml", "yml"]:
-            if "version: light" in content or "format: light" in content:
-                format = "light"
-            elif "version: readable" in content:
-                format = "readable"
-            else:
-                format = "light"
         strategy = self._strategies.get(format)
         if not strategy:
             raise ValueError(f"Unknown format: {format}")
 
         return strategy.deserialize_to_domain(content, diagram_path)
 
-    def _detect_format(self, content: str) -> str:
-        import json
+    def deserialize_from_data(
+        self, data: Any, format: str | None = None, diagram_path: str | None = None
+    ) -> "DomainDiagram":
+        """Deserialize an already-parsed diagram document without re-parsing it."""
+        format = format.lower() if format else None
+        if format in (None, "yaml", "yml"):
+            format = self._detect_format_from_data(data, yaml_hint=format is not None)
 
-        import yaml
+        strategy = self._strategies.get(format)
+        if not strategy:
+            raise ValueError(f"Unknown format: {format}")
 
-        try:
-            data = json.loads(content)
-            if isinstance(data, dict):
-                if "nodes" in data and "arrows" in data:
-                    return "native"
-                elif "executable" in data:
-                    return "executable"
-        except json.JSONDecodeError:
-            pass
+        return strategy.deserialize_data_to_domain(data, diagram_path)
 
+    def _detect_format(self, content: str) -> str:
         try:
-            data = yaml.safe_load(content)
-            if isinstance(data, dict):
-                if "version" in data:
-                    if data["version"] == "light":
-                        return "light"
-                    elif data["version"] == "readable":
-                        return "readable"
-                elif "format" in data and data["format"] == "light":
-                    return "light"
-        except yaml.YAMLError:
-            pass
-
+            data = parse_diagram_content(content)
+        except ValueError:
+            return "native"
+        return self._detect_format_from_data(data)
+
+    def _detect_format_from_data(self, data: Any, yaml_hint: bool = False) -> str:
+        if not isinstance(data, dict):
+            return "light" if yaml_hint else "native"
+
+        if yaml_hint:
+            return "readable" if data.get("version") == "readable" else "light"
+
+        if "nodes" in data and "arrows" in data:
+            return "native"
+        if "executable" in data:
+            return "executable"
+        if data.get("version") == "readable":
+            return "readable"
+        if data.get("version") == "light" or data.get("format") == "light":
+            return "light"
         return "native"
 
 
@@ -156,18 +160,11 @@ class FormatStrategyAdapter(DiagramStorageSerializer):
                 raise ValueError(f"No strategy registered for format: {format}")
             return strategy.deserialize_to_domain(content, diagram_path)
 
-        import json
-
-        import yaml
-
         data = None
-        try:
-            data = json.loads(content)
-        except json.JSONDecodeError:
-            with contextlib.suppress(yaml.YAMLError):
-                data = yaml.safe_load(content)
+        with contextlib.suppress(ValueError):
+            data = parse_diagram_content(content)
 
-        if data:
+        if isinstance(data, dict) and data:
             best_strategy = None
             best_confidence = 0.0
 
@@ -182,7 +179,7 @@ class FormatStrategyAdapter(DiagramStorageSerializer):
 
             if best_strategy and best_confidence > 0.5:
                 logger.info(f"Auto-detected format with confidence {best_confidence}")
-                return best_strategy.deserialize_to_domain(content, diagram_path)
+                return best_strategy.deserialize_data_to_domain(data, diagram_path)
 
         for format_id, strategy in self._strategies.items():
             try:
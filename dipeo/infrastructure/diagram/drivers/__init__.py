@@ -1,7 +1,9 @@
-"""Diagram services for format conversion and storage orchestration."""
+"""Diagram services for loading, format conversion and storage orchestration."""
 
+from .diagram_loader import DiagramLoader
 from .diagram_service import DiagramService
 
 __all__ = [
+    "DiagramLoader",
     "DiagramService",
 ]
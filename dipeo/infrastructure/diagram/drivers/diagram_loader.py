@@ -4,10 +4,9 @@ import json
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from dipeo.config import BASE_DIR
 from dipeo.config.base_logger import get_module_logger
+from dipeo.domain.diagram.utils.conversion import load_yaml
 from dipeo.infrastructure.diagram.adapters import UnifiedSerializerAdapter
 
 logger = get_module_logger(__name__)
@@ -39,7 +38,7 @@ class DiagramLoader:
             if diagram_path.endswith(".json"):
                 diagram_data = json.load(f)
             else:
-                diagram_data = yaml.safe_load(f)
+                diagram_data = load_yaml(f.read())
 
         return diagram_data, diagram_path
 
@@ -56,17 +55,11 @@ class DiagramLoader:
 
         diagram_data, diagram_path = await self.load_diagram(diagram, format_type)
 
-        format_hint = format_type or "native"
-        if format_hint in ["light", "readable"]:
-            content = yaml.dump(diagram_data, default_flow_style=False, sort_keys=False)
-            domain_diagram = self.serializer.deserialize_from_storage(
-                content, format_hint, diagram_path
-            )
-        else:
-            json_content = json.dumps(diagram_data)
-            domain_diagram = self.serializer.deserialize_from_storage(
-                json_content, "native", diagram_path
-            )
+        # Hand the parsed document straight to the strategy instead of re-serializing it
+        format_hint = format_type if format_type in ["light", "readable"] else "native"
+        domain_diagram = self.serializer.deserialize_from_data(
+            diagram_data, format_hint, diagram_path
+        )
 
         return domain_diagram, diagram_data, diagram_path
 
@@ -0,0 +1,68 @@
+"""Bounded cache of parsed diagrams keyed by file identity."""
+
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from dipeo.diagram_generated import DomainDiagram
+
+DEFAULT_MAX_ENTRIES = 128
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+class ParsedDiagramCache:
+    """LRU cache of DomainDiagram objects keyed by path, mtime and size.
+
+    A changed file gets a new key, so stale entries are never returned; they simply
+    age out. Memory is bounded by both entry count and total source file size.
+    Callers receive deep copies because loaded diagrams are mutated downstream.
+    """
+
+    def __init__(self, max_entries: int = DEFAULT_MAX_ENTRIES, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[tuple[Any, ...], tuple[DomainDiagram, int]] = OrderedDict()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: tuple[Any, ...]) -> DomainDiagram | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+        return entry[0].model_copy(deep=True)
+
+    def put(self, key: tuple[Any, ...], diagram: DomainDiagram, size: int) -> None:
+        if size > self.max_bytes:
+            return
+
+        stored = diagram.model_copy(deep=True)
+        with self._lock:
+            # Drop older versions of the same file before inserting the new one
+            self._remove_path(key[0])
+            self._entries[key] = (stored, size)
+            self._total_bytes += size
+            while self._entries and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._total_bytes -= evicted_size
+
+    def invalidate(self, path: str) -> None:
+        with self._lock:
+            self._remove_path(path)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._total_bytes = 0
+
+    def _remove_path(self, path: str) -> None:
+        for key in [k for k in self._entries if k[0] == path]:
+            _, size = self._entries.pop(key)
+            self._total_bytes -= size
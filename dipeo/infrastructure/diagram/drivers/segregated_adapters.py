@@ -17,6 +17,8 @@ from dipeo.domain.diagram.segregated_ports import (
     DiagramRepositoryPort,
 )
 from dipeo.domain.diagram.services import DiagramFormatDetector
+from dipeo.domain.diagram.utils.conversion import parse_diagram_content
+from dipeo.infrastructure.diagram.drivers.parsed_diagram_cache import ParsedDiagramCache
 
 if TYPE_CHECKING:
     from dipeo.domain.diagram.ports import DiagramStorageSerializer
@@ -35,39 +37,48 @@ class FileAdapter(LoggingMixin, DiagramFilePort):
         self.base_path = Path(base_path)
         self.format_port = format_port
         self.format_detector = DiagramFormatDetector()
+        self.diagram_cache = ParsedDiagramCache()
 
     async def load_from_file(self, file_path: str) -> DomainDiagram:
         path = Path(file_path)
 
         if self.filesystem.exists(path):
-            with self.filesystem.open(path, "rb") as f:
-                content = f.read().decode("utf-8")
             format_enum = self.format_detector.detect_format_from_filename(str(path))
             format_str = format_enum.value if format_enum else None
-            return self.format_port.deserialize(content, format_str, str(path))
+            return self._load_cached(path, format_str)
 
         if not path.is_absolute():
             relative_path = self.base_path / path
             if self.filesystem.exists(relative_path):
-                with self.filesystem.open(relative_path, "rb") as f:
-                    content = f.read().decode("utf-8")
                 format_enum = self.format_detector.detect_format_from_filename(str(relative_path))
                 format_str = format_enum.value if format_enum else None
-
-                return self.format_port.deserialize(content, format_str, str(relative_path))
+                return self._load_cached(relative_path, format_str)
 
         patterns = self.format_detector.construct_search_patterns(str(path.stem))
         for pattern in patterns:
             test_path = self.base_path / pattern
             if self.filesystem.exists(test_path):
-                with self.filesystem.open(test_path, "rb") as f:
-                    content = f.read().decode("utf-8")
                 format_str = self._detect_format_from_path(test_path)
-
-                return self.format_port.deserialize(content, format_str, str(test_path))
+                return self._load_cached(test_path, format_str)
 
         raise StorageError(f"Diagram not found: {file_path}")
 
+    def _load_cached(self, path: Path, format_str: str | None) -> DomainDiagram:
+        """Load a diagram file, reusing the parsed diagram while the file is unchanged."""
+        stat = self.filesystem.stat(path)
+        cache_key = (str(path), format_str, stat.modified.timestamp(), stat.size)
+
+        diagram = self.diagram_cache.get(cache_key)
+        if diagram is not None:
+            return diagram
+
+        with self.filesystem.open(path, "rb") as f:
+            content = f.read().decode("utf-8")
+        diagram = self.format_port.deserialize(content, format_str, str(path))
+
+        self.diagram_cache.put(cache_key, diagram, stat.size)
+        return diagram
+
     async def save_to_file(
         self, diagram: DomainDiagram, file_path: str, format_type: str = "native"
     ) -> None:
@@ -78,6 +89,7 @@ class FileAdapter(LoggingMixin, DiagramFilePort):
 
         with self.filesystem.open(path, "wb") as f:
             f.write(content.encode("utf-8"))
+        self.diagram_cache.invalidate(str(path))
 
         self.log_debug(f"Saved diagram to {file_path}")
 
@@ -126,24 +138,16 @@ class FormatAdapter(LoggingMixin, DiagramFormatPort):
         self.format_detector = DiagramFormatDetector()
 
     def detect_format(self, content: str) -> DiagramFormat:
-        import json
-
-        import yaml
-
         try:
-            data = json.loads(content)
-            if "nodes" in data and "arrows" in data:
-                return DiagramFormat.NATIVE
-        except json.JSONDecodeError:
-            try:
-                data = yaml.safe_load(content)
-                if data and isinstance(data, dict):
-                    if "format" in data and data["format"] == "light":
-                        return DiagramFormat.LIGHT
-                    elif "version" in data and data["version"] == "readable":
-                        return DiagramFormat.READABLE
-            except yaml.YAMLError:
-                pass
+            data = parse_diagram_content(content)
+        except ValueError:
+            return DiagramFormat.NATIVE
+
+        if isinstance(data, dict):
+            if data.get("format") == "light":
+                return DiagramFormat.LIGHT
+            if data.get("version") == "readable":
+                return DiagramFormat.READABLE
         return DiagramFormat.NATIVE
 
     def serialize(self, diagram: DomainDiagram, format_type: str) -> str:
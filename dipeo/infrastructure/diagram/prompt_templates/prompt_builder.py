@@ -11,7 +11,6 @@ logger = get_module_logger(__name__)
 class PromptBuilder:
     def __init__(self, template_processor: TemplateProcessorPort | None = None):
         self._processor = template_processor
-        self._template_cache: dict[tuple, str] = {}
 
     def build(
         self,
@@ -28,39 +27,19 @@ class PromptBuilder:
             return ""
 
         if self._processor:
-            cache_key = self._make_cache_key(selected_prompt, template_values)
-
-            if cache_key in self._template_cache:
-                return self._template_cache[cache_key]
-
+            # Templates are compiled once by the processor, so rendering is cheap enough
+            # that caching rendered output (and hashing every value to key it) does not pay
             result = self._processor.process(selected_prompt, template_values)
             if result.errors:
                 logger.warning(f"Template processing errors: {result.errors}")
             if result.missing_keys:
                 logger.warning(f"Template missing keys: {result.missing_keys}")
 
-            self._template_cache[cache_key] = result.content
-
-            if len(self._template_cache) > 1000:
-                items_to_remove = len(self._template_cache) // 5
-                for _ in range(items_to_remove):
-                    self._template_cache.pop(next(iter(self._template_cache)))
-
             return result.content
         else:
             logger.warning("No template processor available!")
             return selected_prompt
 
-    def _make_cache_key(self, template: str, values: dict[str, Any]) -> tuple:
-        """Create a hashable cache key from template and values."""
-        import json
-
-        try:
-            values_str = json.dumps(values, sort_keys=True, default=str)
-            return (template, values_str)
-        except (TypeError, ValueError):
-            return (template, str(sorted(values.items())))
-
     def prepare_template_values(self, inputs: dict[str, Any]) -> dict[str, Any]:
         """Prepare template values from inputs."""
         template_values = {}
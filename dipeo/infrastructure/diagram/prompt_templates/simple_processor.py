@@ -2,11 +2,86 @@
 
 import json
 import re
+from dataclasses import dataclass
 from datetime import datetime
+from functools import lru_cache
 from typing import Any
 
 from dipeo.domain.diagram.ports import TemplateProcessorPort, TemplateResult
 
+# Distinct templates (and loop bodies) kept in compiled form
+COMPILED_TEMPLATE_CACHE_SIZE = 512
+
+VARIABLE_PATTERN = re.compile(r"\{\{(\s*[\w\.\[\]]+\s*)\}\}")
+SINGLE_BRACE_PATTERN = re.compile(r"\{([\w\.\[\]]+)\}")
+
+
+@dataclass(frozen=True, slots=True)
+class TemplateSlot:
+    """A variable placeholder in a compiled template."""
+
+    path: str
+    key: str | None  # Top-level key for plain names
+    keys: tuple[str, ...] | None  # Pre-split dotted path; None for indexed paths
+    raw: str  # Original placeholder text, emitted when the value is missing
+
+
+@dataclass(frozen=True, slots=True)
+class CompiledTemplate:
+    """A template split once into literal text and variable slots.
+
+    ``literals`` has one more entry than ``slots``; rendering interleaves them.
+    Each distinct placeholder path is resolved once per render: ``slot_refs``
+    maps every slot to its entry in ``unique_slots``. ``paths`` lists the path of
+    every slot, in order, for reporting used keys.
+    """
+
+    literals: tuple[str, ...]
+    slots: tuple[TemplateSlot, ...]
+    unique_slots: tuple[TemplateSlot, ...]
+    slot_refs: tuple[int, ...]
+    paths: tuple[str, ...]
+
+
+@lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)
+def compile_template(template: str, single_brace: bool = False) -> CompiledTemplate:
+    """Split a template into literal parts and variable slots.
+
+    Args:
+        template: Template text
+        single_brace: Compile ``{var}`` placeholders instead of ``{{var}}``
+
+    Returns:
+        Compiled template, cached by template text
+    """
+    pattern = SINGLE_BRACE_PATTERN if single_brace else VARIABLE_PATTERN
+    literals: list[str] = []
+    slots: list[TemplateSlot] = []
+    unique: dict[str, int] = {}
+    unique_slots: list[TemplateSlot] = []
+    slot_refs: list[int] = []
+    position = 0
+    for match in pattern.finditer(template):
+        literals.append(template[position : match.start()])
+        path = match.group(1).strip()
+        keys = None if "[" in path else tuple(path.split("."))
+        key = keys[0] if keys is not None and len(keys) == 1 else None
+        slot = TemplateSlot(path=path, key=key, keys=keys, raw=match.group(0))
+        slots.append(slot)
+        if path not in unique:
+            unique[path] = len(unique_slots)
+            unique_slots.append(slot)
+        slot_refs.append(unique[path])
+        position = match.end()
+    literals.append(template[position:])
+    return CompiledTemplate(
+        literals=tuple(literals),
+        slots=tuple(slots),
+        unique_slots=tuple(unique_slots),
+        slot_refs=tuple(slot_refs),
+        paths=tuple(slot.path for slot in slots),
+    )
+
 
 class SimpleTemplateProcessor(TemplateProcessorPort):
     """Simple template processor supporting legacy double-brace syntax.
@@ -16,12 +91,12 @@ class SimpleTemplateProcessor(TemplateProcessorPort):
     without requiring a full template engine like Jinja2.
     """
 
-    VARIABLE_PATTERN = re.compile(r"\{\{(\s*[\w\.\[\]]+\s*)\}\}")
+    VARIABLE_PATTERN = VARIABLE_PATTERN
     CONDITIONAL_PATTERN = re.compile(
         r"\{\{#(if|unless)\s+([\w\.\[\]]+)\}\}(.*?)\{\{/\1\}\}", re.DOTALL
     )
     LOOP_PATTERN = re.compile(r"\{\{#each\s+([\w\.\[\]]+)\}\}(.*?)\{\{/each\}\}", re.DOTALL)
-    SINGLE_BRACE_PATTERN = re.compile(r"\{([\w\.\[\]]+)\}")
+    SINGLE_BRACE_PATTERN = SINGLE_BRACE_PATTERN
 
     def process(self, template: str, context: dict[str, Any]) -> TemplateResult:
         missing_keys = []
@@ -29,8 +104,10 @@ class SimpleTemplateProcessor(TemplateProcessorPort):
         errors = []
 
         try:
-            content = self._process_loops(template, context, used_keys, errors)
-            content = self._process_conditionals(content, context, used_keys, errors)
+            content = template
+            if "{{#" in content:
+                content = self._process_loops(content, context, used_keys, errors)
+                content = self._process_conditionals(content, context, used_keys, errors)
             content = self._process_variables(content, context, missing_keys, used_keys)
 
             return TemplateResult(
@@ -52,12 +129,7 @@ class SimpleTemplateProcessor(TemplateProcessorPort):
         return self.process(template, context).content
 
     def process_single_brace(self, template: str, context: dict[str, Any]) -> str:
-        def replace_var(match):
-            var_path = match.group(1)
-            value = self._get_nested_value(context, var_path, context)
-            return self._format_value(value) if value is not None else match.group(0)
-
-        return self.SINGLE_BRACE_PATTERN.sub(replace_var, template)
+        return self._render(compile_template(template, single_brace=True), context, [], [])
 
     def extract_variables(self, template: str) -> list[str]:
         variables = []
@@ -77,19 +149,63 @@ class SimpleTemplateProcessor(TemplateProcessorPort):
     def _process_variables(
         self, template: str, context: dict[str, Any], missing_keys: list[str], used_keys: list[str]
     ) -> str:
-        def replace_var(match):
-            var_path = match.group(1).strip()
-            used_keys.append(var_path)
+        return self._render(compile_template(template), context, missing_keys, used_keys)
+
+    def _render(
+        self,
+        compiled: CompiledTemplate,
+        context: dict[str, Any],
+        missing_keys: list[str],
+        used_keys: list[str],
+    ) -> str:
+        if not compiled.slots:
+            return compiled.literals[0]
+
+        get = context.get
+        values = [
+            get(slot.key) if slot.key is not None else self._resolve_slot(context, slot)
+            for slot in compiled.unique_slots
+        ]
+        texts = [
+            value if value.__class__ is str or value is None else self._format_value(value)
+            for value in values
+        ]
+        missing = None in texts
+
+        # One entry per placeholder occurrence, as the regex-based renderer reported them
+        used_keys.extend(compiled.paths)
+        if missing:
+            missing_keys.extend(
+                slot.path
+                for slot, ref in zip(compiled.slots, compiled.slot_refs, strict=True)
+                if texts[ref] is None
+            )
 
-            value = self._get_nested_value(context, var_path, context)
+        parts: list[str | None] = [None] * (2 * len(compiled.slots) + 1)
+        parts[::2] = compiled.literals
+        parts[1::2] = [texts[ref] for ref in compiled.slot_refs]
+        if missing:
+            # Unresolved placeholders are left in the output verbatim
+            for i, slot in enumerate(compiled.slots):
+                if parts[2 * i + 1] is None:
+                    parts[2 * i + 1] = slot.raw
 
-            if value is None:
-                missing_keys.append(var_path)
-                return match.group(0)
+        return "".join(parts)
 
-            return self._format_value(value)
+    def _resolve_slot(self, context: dict[str, Any], slot: TemplateSlot) -> Any:
+        if slot.keys is None:
+            return self._resolve_path_with_indices(context, slot.path, context)
+        return self._lookup(context, slot.keys)
 
-        return self.VARIABLE_PATTERN.sub(replace_var, template)
+    @staticmethod
+    def _lookup(obj: dict[str, Any], keys: tuple[str, ...]) -> Any:
+        value = obj
+        for key in keys:
+            if isinstance(value, dict) and key in value:
+                value = value[key]
+            else:
+                return None
+        return value
 
     def _format_value(self, value: Any) -> str:
         if isinstance(value, dict | list):
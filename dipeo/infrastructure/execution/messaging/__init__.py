@@ -1,10 +1,11 @@
 """Messaging adapter module."""
 
-from .base_message_router import BaseMessageRouter
+from .base_message_router import BaseMessageRouter, BufferedEvent
 from .message_router import MessageRouter, message_router
 
 __all__ = [
     "BaseMessageRouter",
+    "BufferedEvent",
     "MessageRouter",
     "message_router",
 ]
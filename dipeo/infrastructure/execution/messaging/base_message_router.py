@@ -5,7 +5,9 @@ between the in-memory and Redis-backed routers.
 """
 
 import asyncio
+import json
 import logging
+import threading
 import time
 from abc import abstractmethod
 from collections import deque
@@ -24,6 +26,27 @@ from dipeo.infrastructure.events.serialize import event_to_json_payload
 logger = get_module_logger(__name__)
 
 
+class BufferedEvent:
+    """A routed message kept for replay, with its JSON encoding cached.
+
+    The same envelope is shared by every replay and every publish of the
+    message, so it is encoded at most once.
+    """
+
+    __slots__ = ("_json", "message", "seq")
+
+    def __init__(self, message: dict, seq: int | None = None):
+        self.message = message
+        self.seq = seq
+        self._json: str | None = None
+
+    @property
+    def json(self) -> str:
+        if self._json is None:
+            self._json = json.dumps(self.message, default=str)
+        return self._json
+
+
 @dataclass
 class ConnectionHealth:
     last_successful_send: float
@@ -51,6 +74,7 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
         self.execution_subscriptions: dict[str, set[str]] = {}
         self.connection_health: dict[str, ConnectionHealth] = {}
         self._initialized = False
+        self._queue_lock = threading.Lock()
 
         # Load settings
         settings = get_settings()
@@ -61,8 +85,8 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
         self._batch_max_size = settings.messaging.batch_max
         self._batch_broadcast_warning_threshold = settings.messaging.broadcast_warning_threshold_s
 
-        # Event buffering
-        self._event_buffer: dict[str, list[dict]] = {}
+        # Event buffering: fixed-capacity ring buffer per execution
+        self._event_buffer: dict[str, deque[BufferedEvent]] = {}
 
         # Batch processing
         self._batch_queue: dict[str, list[dict]] = {}
@@ -113,11 +137,6 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
             return False
 
         # Check for backpressure
-        import threading
-
-        if not hasattr(self, "_queue_lock"):
-            self._queue_lock = threading.Lock()
-
         with self._queue_lock:
             queue_size = self._message_queue_size.get(connection_id, 0)
             if queue_size > self.max_queue_size:
@@ -216,25 +235,26 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
         """
         return "_batch_" not in execution_id
 
-    async def _buffer_event(self, execution_id: str, message: dict) -> None:
+    async def _buffer_event(self, execution_id: str, message: dict) -> BufferedEvent:
         """Buffer an event for late connections.
 
         Args:
             execution_id: Execution identifier
             message: Event message to buffer
+
+        Returns:
+            The buffered envelope
         """
-        if execution_id not in self._event_buffer:
-            self._event_buffer[execution_id] = []
+        buffer = self._event_buffer.get(execution_id)
+        if buffer is None:
+            buffer = self._event_buffer[execution_id] = deque(maxlen=self._buffer_max_size)
 
         if "timestamp" not in message:
             message["timestamp"] = datetime.utcnow().isoformat()
 
-        self._event_buffer[execution_id].append(message)
-
-        if len(self._event_buffer[execution_id]) > self._buffer_max_size:
-            self._event_buffer[execution_id] = self._event_buffer[execution_id][
-                -self._buffer_max_size :
-            ]
+        event = BufferedEvent(message, message.get("seq"))
+        buffer.append(event)
+        return event
 
     async def _replay_buffered_events(self, connection_id: str, execution_id: str) -> None:
         """Replay buffered events to a new connection.
@@ -243,19 +263,17 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
             connection_id: Connection to send events to
             execution_id: Execution whose events to replay
         """
-        if execution_id not in self._event_buffer:
-            return
-
-        buffered_events = self._event_buffer.get(execution_id, [])
+        buffered_events = self._event_buffer.get(execution_id)
         if not buffered_events:
             return
 
-        for event in buffered_events:
-            event_type = event.get("type", "")
+        # Snapshot: the buffer may keep growing while we await delivery
+        for event in list(buffered_events):
+            event_type = event.message.get("type", "")
             if event_type in ["HEARTBEAT", "CONNECTION_ESTABLISHED"]:
                 continue
 
-            success = await self.route_to_connection(connection_id, event)
+            success = await self.route_to_connection(connection_id, event.message)
             if not success:
                 logger.warning(f"Failed to replay event to connection {connection_id}")
                 break
@@ -288,16 +306,6 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
             "batch_size": len(messages),
         }
 
-        # Try to publish to streaming manager if available
-        try:
-            from server.api.graphql.subscriptions import publish_execution_update
-
-            await publish_execution_update(execution_id, batch_message)
-        except ImportError:
-            pass
-        except Exception as e:
-            logger.error(f"Failed to publish batch to streaming manager: {e}")
-
         successful_broadcasts = 0
         failed_broadcasts = 0
 
@@ -425,14 +433,17 @@ class BaseMessageRouter(MessageRouterPort, EventHandler[DomainEvent]):
         executions_to_remove = []
 
         # Clean up event buffers
-        for execution_id, events in self._event_buffer.items():
-            events[:] = [
+        for execution_id, events in list(self._event_buffer.items()):
+            fresh = [
                 e
                 for e in events
-                if "timestamp" in e and datetime.fromisoformat(e["timestamp"]) > cutoff_time
+                if "timestamp" in e.message
+                and datetime.fromisoformat(e.message["timestamp"]) > cutoff_time
             ]
+            if len(fresh) != len(events):
+                self._event_buffer[execution_id] = deque(fresh, maxlen=self._buffer_max_size)
 
-            if not events:
+            if not fresh:
                 executions_to_remove.append(execution_id)
 
         # Remove empty executions from buffers
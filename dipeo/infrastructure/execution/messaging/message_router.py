@@ -6,8 +6,7 @@ execution events directly to local GraphQL subscriptions.
 
 import asyncio
 import logging
-import threading
-from collections import deque
+from itertools import islice
 
 from dipeo.config.base_logger import get_module_logger
 from dipeo.infrastructure.execution.messaging.base_message_router import BaseMessageRouter
@@ -26,11 +25,10 @@ class MessageRouter(BaseMessageRouter):
     def __init__(self):
         super().__init__()
         self.worker_id = "single-worker"
-        self._queue_lock = threading.Lock()
 
-        # Sequence tracking for replay
+        # Sequence tracking for replay; the replayable messages themselves live in
+        # the base class ring buffers
         self._sequence_counters: dict[str, int] = {}
-        self._replay_buffers: dict[str, deque] = {}  # Ring buffers for replay
 
     async def initialize(self) -> None:
         """Initialize the router."""
@@ -58,7 +56,6 @@ class MessageRouter(BaseMessageRouter):
         self._batch_queue.clear()
         self._batch_tasks.clear()
         self._sequence_counters.clear()
-        self._replay_buffers.clear()
         self._event_buffer.clear()
         self._initialized = False
         logger.info("MessageRouter cleaned up")
@@ -77,18 +74,11 @@ class MessageRouter(BaseMessageRouter):
         seq = self._get_next_sequence(execution_id)
         message["seq"] = seq
 
-        # Store in replay buffer
-        if self._should_buffer_events(execution_id):
-            self._add_to_replay_buffer(execution_id, message)
-
-        connection_ids = self.execution_subscriptions.get(execution_id, set())
-        if not connection_ids and not self._should_buffer_events(execution_id):
-            return
-
-        # Buffer event for late connections
+        # Buffer event for replay and late connections
         if self._should_buffer_events(execution_id):
             await self._buffer_event(execution_id, message)
 
+        connection_ids = self.execution_subscriptions.get(execution_id)
         if not connection_ids:
             return
 
@@ -156,19 +146,6 @@ class MessageRouter(BaseMessageRouter):
         self._sequence_counters[execution_id] += 1
         return self._sequence_counters[execution_id]
 
-    def _add_to_replay_buffer(self, execution_id: str, message: dict) -> None:
-        """Add a message to the replay buffer with sequence ID.
-
-        Args:
-            execution_id: Execution identifier
-            message: Message to buffer (should already have seq field)
-        """
-        if execution_id not in self._replay_buffers:
-            # Create ring buffer with max size
-            self._replay_buffers[execution_id] = deque(maxlen=self._buffer_max_size)
-
-        self._replay_buffers[execution_id].append(message.copy())
-
     def _get_messages_since(self, execution_id: str, last_seq: int) -> list[dict]:
         """Get all messages since a given sequence number.
 
@@ -179,57 +156,31 @@ class MessageRouter(BaseMessageRouter):
         Returns:
             List of messages with seq > last_seq
         """
-        if execution_id not in self._replay_buffers:
+        buffer = self._event_buffer.get(execution_id)
+        if not buffer:
             return []
 
-        replay_buffer = self._replay_buffers[execution_id]
-        missed_messages = []
-
-        for message in replay_buffer:
-            message_seq = message.get("seq", 0)
-            if message_seq > last_seq:
-                missed_messages.append(message)
-
-        return missed_messages
+        first_seq = buffer[0].seq or 0
+        if (buffer[-1].seq or 0) - first_seq + 1 == len(buffer):
+            # Sequence numbers are contiguous: slice from whichever end is closer
+            start = max(0, last_seq + 1 - first_seq)
+            missed = len(buffer) - start
+            if missed <= 0:
+                return []
+            if start <= missed:
+                return [event.message for event in islice(buffer, start, None)]
+            tail = [event.message for event in islice(reversed(buffer), missed)]
+            tail.reverse()
+            return tail
+
+        return [event.message for event in buffer if (event.seq or 0) > last_seq]
 
     def _cleanup_old_buffers(self) -> None:
-        """Clean up old event buffers and replay buffers based on TTL."""
-        # Call parent cleanup
+        """Clean up old event buffers based on TTL."""
+        buffered_executions = set(self._event_buffer)
         super()._cleanup_old_buffers()
 
-        # Clean up replay buffers
-        from datetime import datetime, timedelta
-
-        cutoff_time = datetime.utcnow() - timedelta(seconds=self._buffer_ttl_seconds)
-        executions_to_remove = []
-
-        for execution_id, replay_buffer in list(self._replay_buffers.items()):
-            # Filter messages in replay buffer by timestamp
-            filtered_messages = []
-            for message in replay_buffer:
-                if "timestamp" in message:
-                    try:
-                        msg_time = datetime.fromisoformat(message["timestamp"])
-                        if msg_time > cutoff_time:
-                            filtered_messages.append(message)
-                    except (ValueError, TypeError):
-                        # Keep message if timestamp is invalid (safer than dropping)
-                        filtered_messages.append(message)
-                else:
-                    # Keep message if no timestamp (safer than dropping)
-                    filtered_messages.append(message)
-
-            # Replace the deque contents
-            if filtered_messages:
-                self._replay_buffers[execution_id] = deque(
-                    filtered_messages, maxlen=self._buffer_max_size
-                )
-            else:
-                executions_to_remove.append(execution_id)
-
-        # Remove empty executions
-        for execution_id in executions_to_remove:
-            self._replay_buffers.pop(execution_id, None)
+        for execution_id in buffered_executions - set(self._event_buffer):
             self._sequence_counters.pop(execution_id, None)
 
     def get_stats(self) -> dict:
@@ -246,7 +197,7 @@ class MessageRouter(BaseMessageRouter):
 
         # Calculate replay buffer statistics
         replay_buffer_sizes = {
-            exec_id: len(buffer) for exec_id, buffer in self._replay_buffers.items()
+            exec_id: len(buffer) for exec_id, buffer in self._event_buffer.items()
         }
         avg_replay_buffer_size = (
             sum(replay_buffer_sizes.values()) / len(replay_buffer_sizes)
@@ -259,7 +210,7 @@ class MessageRouter(BaseMessageRouter):
         total_messages_with_seq = sum(self._sequence_counters.values())
 
         stats["replay_buffers"] = {
-            "total_executions": len(self._replay_buffers),
+            "total_executions": len(self._event_buffer),
             "buffer_sizes": replay_buffer_sizes,
             "avg_buffer_size": round(avg_replay_buffer_size, 2),
             "max_buffer_size": max(replay_buffer_sizes.values()) if replay_buffer_sizes else 0,
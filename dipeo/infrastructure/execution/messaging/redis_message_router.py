@@ -14,7 +14,10 @@ from redis.asyncio.client import PubSub
 
 from dipeo.config import get_settings
 from dipeo.config.base_logger import get_module_logger
-from dipeo.infrastructure.execution.messaging.base_message_router import BaseMessageRouter
+from dipeo.infrastructure.execution.messaging.base_message_router import (
+    BaseMessageRouter,
+    BufferedEvent,
+)
 
 logger = get_module_logger(__name__)
 
@@ -138,15 +141,16 @@ class RedisMessageRouter(BaseMessageRouter):
         if not self._initialized:
             await self.initialize()
 
-        # Buffer event for late connections
+        # Buffer event for late connections; the envelope caches the encoded message
         if self._should_buffer_events(execution_id):
-            await self._buffer_event(execution_id, message)
+            event = await self._buffer_event(execution_id, message)
+        else:
+            event = BufferedEvent(message)
 
         # Publish to Redis
         channel = f"exec:{execution_id}"
         try:
-            message_json = json.dumps(message)
-            await self.redis_client.publish(channel, message_json)
+            await self.redis_client.publish(channel, event.json)
         except Exception as e:
             logger.error(f"Failed to publish to Redis channel {channel}: {e}")
 
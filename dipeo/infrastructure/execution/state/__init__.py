@@ -2,9 +2,11 @@
 
 from .cache_first_state_store import CacheFirstStateStore
 from .execution_state_cache import ExecutionCache, ExecutionStateCache
+from .history_spill import SqliteExecutionHistorySpill
 
 __all__ = [
     "CacheFirstStateStore",
     "ExecutionCache",
     "ExecutionStateCache",
+    "SqliteExecutionHistorySpill",
 ]
@@ -8,7 +8,7 @@ import time
 from datetime import datetime
 from typing import Any
 
-from dipeo.config import STATE_DB_PATH
+from dipeo.config import STATE_DB_PATH, get_settings
 from dipeo.config.base_logger import get_module_logger
 from dipeo.diagram_generated import (
     DiagramID,
@@ -64,7 +64,9 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
             cache_size=cache_size,
             warm_cache_size=warm_cache_size,
         )
-        self._persistence_manager = PersistenceManager(self.db_path)
+        self._persistence_manager = PersistenceManager(
+            self.db_path, convert_existing=get_settings().storage.state_db_convert_vacuum
+        )
 
         # Checkpoint configuration
         self._checkpoint_interval = checkpoint_interval
@@ -76,6 +78,7 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
         self._persistence_task: asyncio.Task | None = None
         self._cache_manager_task: asyncio.Task | None = None
         self._warmup_task: asyncio.Task | None = None
+        self._maintenance_task: asyncio.Task | None = None
 
         # State
         self._initialized = False
@@ -99,6 +102,7 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
         # Start background tasks
         self._running = True
         self._persistence_task = asyncio.create_task(self._persistence_loop())
+        self._maintenance_task = asyncio.create_task(self._persistence_manager.run_maintenance())
 
         cache_tasks = await self._cache_manager.start_background_tasks()
         self._cache_manager_task, self._warmup_task = cache_tasks
@@ -111,6 +115,10 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
         # Persist all dirty cache entries
         await self._persist_all_dirty()
 
+        # Write messages still queued in the message store and stop its flush loop
+        if self.message_store:
+            await self.message_store.close()
+
         # Stop cache manager background tasks
         await self._cache_manager.stop_background_tasks()
 
@@ -120,8 +128,8 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
             with contextlib.suppress(asyncio.CancelledError):
                 await self._persistence_task
 
-        # Stop cache manager tasks
-        for task in [self._cache_manager_task, self._warmup_task]:
+        # Stop cache manager and database maintenance tasks
+        for task in [self._cache_manager_task, self._warmup_task, self._maintenance_task]:
             if task:
                 task.cancel()
                 with contextlib.suppress(asyncio.CancelledError):
@@ -612,6 +620,9 @@ class CacheFirstStateStore(StateStorePort, ExecutionStateService, ExecutionCache
         """Persist final state immediately."""
         state.is_active = False
 
+        if self.message_store:
+            await self.message_store.flush()
+
         entry = await self._cache_manager.get_entry(state.id)
         if entry:
             entry.state = state
@@ -0,0 +1,151 @@
+"""SQLite spill store for execution records evicted from tracker memory."""
+
+import contextlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from dipeo.diagram_generated.enums import CompletionStatus
+from dipeo.domain.execution.messaging.envelope import deserialize_protocol, serialize_protocol
+from dipeo.domain.execution.state.unified_state_tracker import NodeExecutionRecord
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS execution_history (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    node_id TEXT NOT NULL,
+    execution_number INTEGER NOT NULL,
+    payload TEXT NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_history_node ON execution_history(node_id, execution_number);
+"""
+
+
+class SqliteExecutionHistorySpill:
+    """Append-only SQLite table of spilled NodeExecutionRecords.
+
+    Appends only buffer records; ``flush()`` encodes and writes them in batches,
+    so the tracker can append under its lock and flush after releasing it. Reads
+    flush the buffer first so queries always see every spilled record. The
+    database is created on the first write, so executions that never evict a
+    record never touch the disk. Output bodies that are not JSON serializable are
+    stored as strings.
+    """
+
+    def __init__(self, db_path: Path | None = None, batch_size: int = 256):
+        """Initialize the spill store.
+
+        Args:
+            db_path: Database file. When omitted a temporary file is created on the
+                first write and removed again on close().
+            batch_size: Number of buffered records at which append() asks for a flush
+        """
+        self._owns_file = db_path is None
+        self.db_path = db_path
+        self.batch_size = batch_size
+        self._pending: list[NodeExecutionRecord] = []
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def append(self, records: list[NodeExecutionRecord]) -> bool:
+        with self._lock:
+            self._pending.extend(records)
+            return len(self._pending) >= self.batch_size
+
+    def flush(self) -> None:
+        with self._lock:
+            self._flush()
+
+    def load(self, node_id: str) -> list[NodeExecutionRecord]:
+        with self._lock:
+            self._flush()
+            if self._conn is None:
+                return []
+            rows = self._conn.execute(
+                "SELECT payload FROM execution_history WHERE node_id = ? ORDER BY execution_number",
+                (str(node_id),),
+            ).fetchall()
+        return [_decode(payload) for (payload,) in rows]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            if self._conn is not None:
+                with self._conn:
+                    self._conn.execute("DELETE FROM execution_history")
+
+    def close(self) -> None:
+        with self._lock:
+            self._pending.clear()
+            if self._conn is None:
+                return
+            self._conn.close()
+            self._conn = None
+            if self._owns_file:
+                for suffix in ("", "-wal", "-shm"):
+                    with contextlib.suppress(FileNotFoundError):
+                        os.unlink(f"{self.db_path}{suffix}")
+
+    def _connect(self) -> sqlite3.Connection:
+        if self.db_path is None:
+            fd, name = tempfile.mkstemp(prefix="dipeo-history-", suffix=".db")
+            os.close(fd)
+            self.db_path = Path(name)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=OFF")
+        conn.executescript(_SCHEMA)
+        return conn
+
+    def _flush(self) -> None:
+        if not self._pending:
+            return
+        if self._conn is None:
+            self._conn = self._connect()
+        rows = [
+            (str(record.node_id), record.execution_number, _encode(record))
+            for record in self._pending
+        ]
+        with self._conn:
+            self._conn.executemany(
+                "INSERT INTO execution_history (node_id, execution_number, payload) "
+                "VALUES (?, ?, ?)",
+                rows,
+            )
+        self._pending = []
+
+
+def _encode(record: NodeExecutionRecord) -> str:
+    return json.dumps(
+        {
+            "node_id": str(record.node_id),
+            "execution_number": record.execution_number,
+            "started_at": record.started_at.isoformat(),
+            "ended_at": record.ended_at.isoformat() if record.ended_at else None,
+            "status": record.status.value,
+            "output": serialize_protocol(record.output) if record.output else None,
+            "error": record.error,
+            "token_usage": record.token_usage,
+            "duration": record.duration,
+        },
+        default=str,
+    )
+
+
+def _decode(payload: str) -> NodeExecutionRecord:
+    data = json.loads(payload)
+    return NodeExecutionRecord(
+        node_id=data["node_id"],
+        execution_number=data["execution_number"],
+        started_at=datetime.fromisoformat(data["started_at"]),
+        ended_at=datetime.fromisoformat(data["ended_at"]) if data["ended_at"] else None,
+        status=CompletionStatus(data["status"]),
+        output=deserialize_protocol(data["output"]) if data["output"] else None,
+        error=data["error"],
+        token_usage=data["token_usage"],
+        duration=data["duration"],
+    )
@@ -18,16 +18,56 @@ from .models import CacheEntry, CacheMetrics
 
 logger = get_module_logger(__name__)
 
+# PRAGMA auto_vacuum value for INCREMENTAL mode
+_AUTO_VACUUM_INCREMENTAL = 2
+
 
 class PersistenceManager:
-    """Manages database operations and persistence."""
+    """Manages database operations and persistence.
+
+    The database runs with ``auto_vacuum=INCREMENTAL``: retention cleanup deletes
+    in small transactions and leaves freed pages on the freelist, and the
+    maintenance task returns them to the filesystem a few pages at a time while
+    the database is idle. All statements share one worker thread, so keeping
+    each maintenance step short bounds how long it can delay a state write.
 
-    def __init__(self, db_path: str):
+    New databases are created in that mode. A database created without it keeps
+    its pages until it is rebuilt with a full VACUUM, which blocks every state
+    write while it runs; this only happens when ``convert_existing`` is set
+    (``DIPEO_STATE_DB_CONVERT_VACUUM`` for the state store).
+    """
+
+    def __init__(
+        self,
+        db_path: str,
+        cleanup_batch_size: int = 200,
+        vacuum_step_budget: float = 0.05,
+        idle_threshold: float = 2.0,
+        convert_existing: bool = False,
+    ):
+        """Initialize the manager.
+
+        Args:
+            db_path: SQLite database file
+            cleanup_batch_size: Rows deleted per transaction by cleanup_old_states
+            vacuum_step_budget: Target seconds per incremental_vacuum step
+            idle_threshold: Seconds without queries before maintenance runs
+            convert_existing: Rebuild a database created without incremental
+                auto-vacuum with a one-time full VACUUM the first time it is idle
+        """
         self.db_path = db_path
+        self.cleanup_batch_size = cleanup_batch_size
+        self.vacuum_step_budget = vacuum_step_budget
+        # Relocating a page scans the freelist, so the step size adapts to the budget
+        self._vacuum_pages_per_step = 16
+        self.idle_threshold = idle_threshold
+        self.convert_existing = convert_existing
         self._conn: sqlite3.Connection | None = None
         # Use single worker to serialize database access and avoid threading issues
         self._executor = ThreadPoolExecutor(max_workers=1)
         self._metrics = CacheMetrics()
+        self._last_activity = time.monotonic()
+        self._needs_vacuum_conversion = False
 
     @property
     def metrics(self) -> CacheMetrics:
@@ -47,6 +87,11 @@ class PersistenceManager:
                 isolation_level=None,
                 timeout=30.0,
             )
+            # Must precede journal_mode=WAL, which writes the header of a new database.
+            # An existing database keeps its mode unless it is rebuilt with VACUUM
+            conn.execute(f"PRAGMA auto_vacuum={_AUTO_VACUUM_INCREMENTAL}")
+            auto_vacuum = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+
             # Performance optimizations
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("PRAGMA synchronous=NORMAL")
@@ -56,9 +101,17 @@ class PersistenceManager:
             # Disable auto-checkpoint so we control when WAL is checkpointed
             # Default is 1000 pages, we set to 0 to disable and do manual checkpoints
             conn.execute("PRAGMA wal_autocheckpoint=0")
-            return conn
+            return conn, auto_vacuum != _AUTO_VACUUM_INCREMENTAL
 
-        self._conn = await loop.run_in_executor(self._executor, _connect_sync)
+        self._conn, self._needs_vacuum_conversion = await loop.run_in_executor(
+            self._executor, _connect_sync
+        )
+        if self._needs_vacuum_conversion and not self.convert_existing:
+            logger.info(
+                "State database predates incremental auto-vacuum; freed pages are reused "
+                "but not returned to the filesystem (set DIPEO_STATE_DB_CONVERT_VACUUM=true "
+                "to rebuild it once)"
+            )
 
     async def disconnect(self) -> None:
         """Disconnect from database."""
@@ -121,6 +174,7 @@ class PersistenceManager:
     async def execute(self, query: str, params: tuple = ()) -> sqlite3.Cursor:
         """Execute a database query."""
         loop = asyncio.get_event_loop()
+        self._last_activity = time.monotonic()
         cursor = await loop.run_in_executor(self._executor, self._conn.execute, query, params)
 
         # Update metrics
@@ -325,15 +379,172 @@ class PersistenceManager:
 
         return executions
 
-    async def cleanup_old_states(self, days: int = 7) -> None:
-        """Cleanup old execution states."""
+    async def cleanup_old_states(self, days: int = 7) -> int:
+        """Delete executions started more than ``days`` ago, and their transitions.
+
+        Rows are deleted in keyset-paginated batches of ``cleanup_batch_size``, one
+        short transaction each, so state writes interleave with the cleanup. Freed
+        pages are released later by the maintenance task instead of a full VACUUM.
+
+        Args:
+            days: Retention period in days
+
+        Returns:
+            Number of executions deleted
+        """
         from datetime import timedelta
 
-        cutoff_date = datetime.now() - timedelta(days=days)
-        cutoff_iso = cutoff_date.isoformat()
+        cutoff_iso = (datetime.now() - timedelta(days=days)).isoformat()
+        loop = asyncio.get_event_loop()
+
+        deleted = 0
+        last_key: tuple[str, str] = ("", "")
+        while True:
+            batch_size, last_key = await loop.run_in_executor(
+                self._executor, self._delete_execution_batch, cutoff_iso, last_key
+            )
+            deleted += batch_size
+            if batch_size < self.cleanup_batch_size:
+                break
+
+        # Transitions of executions deleted earlier, or never persisted
+        last_rowid = 0
+        while True:
+            batch_size, last_rowid = await loop.run_in_executor(
+                self._executor, self._delete_transition_batch, f"-{days} days", last_rowid
+            )
+            if batch_size < self.cleanup_batch_size:
+                break
+
+        if deleted:
+            logger.info(f"Deleted {deleted} executions older than {days} days")
+        return deleted
+
+    def _delete_execution_batch(
+        self, cutoff_iso: str, after: tuple[str, str]
+    ) -> tuple[int, tuple[str, str]]:
+        rows = self._conn.execute(
+            """
+            SELECT started_at, execution_id FROM executions
+            WHERE started_at < ? AND (started_at, execution_id) > (?, ?)
+            ORDER BY started_at, execution_id
+            LIMIT ?
+            """,
+            (cutoff_iso, *after, self.cleanup_batch_size),
+        ).fetchall()
+        if not rows:
+            return 0, after
+
+        ids = [(execution_id,) for _, execution_id in rows]
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany("DELETE FROM transitions WHERE execution_id = ?", ids)
+            self._conn.executemany("DELETE FROM executions WHERE execution_id = ?", ids)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._checkpoint_passive()
+        self._metrics.db_writes += 1
+        return len(rows), tuple(rows[-1])
+
+    def _delete_transition_batch(self, age: str, after_rowid: int) -> tuple[int, int]:
+        rows = self._conn.execute(
+            """
+            SELECT rowid FROM transitions
+            WHERE rowid > ? AND created_at < datetime('now', ?)
+            ORDER BY rowid
+            LIMIT ?
+            """,
+            (after_rowid, age, self.cleanup_batch_size),
+        ).fetchall()
+        if not rows:
+            return 0, after_rowid
+
+        self._conn.execute("BEGIN IMMEDIATE")
+        try:
+            self._conn.executemany("DELETE FROM transitions WHERE rowid = ?", rows)
+            self._conn.execute("COMMIT")
+        except BaseException:
+            self._conn.execute("ROLLBACK")
+            raise
+        self._checkpoint_passive()
+        self._metrics.db_writes += 1
+        return len(rows), rows[-1][0]
+
+    async def run_maintenance(self, interval: float = 30.0) -> None:
+        """Release free pages while the database is idle; runs until cancelled.
+
+        Args:
+            interval: Seconds between checks for free pages
+        """
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                await self.reclaim_free_pages()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(f"State database maintenance failed: {e}")
+
+    async def reclaim_free_pages(self, max_steps: int | None = None) -> int:
+        """Run incremental_vacuum steps until the freelist is empty or queries arrive.
+
+        Args:
+            max_steps: Upper bound on vacuum steps; None runs until the database is busy
+
+        Returns:
+            Number of pages released
+        """
+        if self._conn is None:
+            return 0
+        loop = asyncio.get_event_loop()
 
-        await self.execute("DELETE FROM executions WHERE started_at < ?", (cutoff_iso,))
-        await self.execute("VACUUM")
+        if self._needs_vacuum_conversion:
+            # incremental_vacuum is a no-op until the database has been rebuilt
+            if not self.convert_existing or not self._is_idle():
+                return 0
+            # Opt-in one-time rebuild so an existing database can use incremental vacuum
+            logger.info("Converting state database to incremental auto-vacuum")
+            await loop.run_in_executor(self._executor, self._conn.execute, "VACUUM")
+            self._needs_vacuum_conversion = False
+            return 0
+
+        released = 0
+        steps = 0
+        while self._is_idle() and (max_steps is None or steps < max_steps):
+            freed = await loop.run_in_executor(self._executor, self._incremental_vacuum_step)
+            if not freed:
+                break
+            released += freed
+            steps += 1
+
+        if released:
+            logger.debug(f"Released {released} free pages from the state database")
+        return released
+
+    def _incremental_vacuum_step(self) -> int:
+        free_pages = self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+        if not free_pages:
+            return 0
+        pages = min(free_pages, self._vacuum_pages_per_step)
+        started = time.perf_counter()
+        self._conn.execute(f"PRAGMA incremental_vacuum({pages})").fetchall()
+        elapsed = time.perf_counter() - started
+        if pages == self._vacuum_pages_per_step:
+            scale = self.vacuum_step_budget / max(elapsed, 1e-4)
+            self._vacuum_pages_per_step = int(min(max(pages * min(scale, 2.0), 8), 4096))
+        # The file only shrinks once the truncation is checkpointed
+        self._checkpoint_passive()
+        return free_pages - self._conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+    def _checkpoint_passive(self) -> None:
+        # Auto-checkpoint is disabled; without this, bulk deletes and vacuum steps
+        # grow the WAL until the next full-sync write
+        self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchall()
+
+    def _is_idle(self) -> bool:
+        return time.monotonic() - self._last_activity >= self.idle_threshold
 
     async def record_transition(
         self,
@@ -2,9 +2,11 @@
 
 import asyncio
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 import aiohttp
+from pydantic import ValidationError
 
 from dipeo.config.base_logger import get_module_logger
 from dipeo.domain.base.exceptions import ServiceError
@@ -125,6 +127,105 @@ class APIService:
         Raises:
             ServiceError: After all retries exhausted
         """
+        response_data, _ = await self._request_with_retry(
+            url=url,
+            method=method,
+            data=data,
+            headers=headers,
+            max_retries=max_retries,
+            retry_delay=retry_delay,
+            timeout=timeout,
+            auth=auth,
+            expected_status_codes=expected_status_codes,
+        )
+        return response_data
+
+    async def iter_pages(
+        self,
+        url: str,
+        pagination: dict[str, Any],
+        method: str = "GET",
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        max_items: int | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 30.0,
+        auth: dict[str, str] | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Stream a paginated collection one page at a time.
+
+        The next page is requested while the caller processes the current one, so
+        large collections can be consumed without buffering them.
+
+        Args:
+            url: URL of the first page
+            pagination: Pagination strategy, in the provider manifest's
+                ``pagination`` format (type, cursor_param, items_path, ...)
+            method: HTTP method
+            params: Query parameters of the first request
+            data: Request body of the first request
+            headers: Request headers
+            max_items: Stop after this many items; defaults to ``pagination["max_items"]``
+            max_retries: Maximum retry attempts per page
+            retry_delay: Base delay between retries
+            timeout: Request timeout per page
+            auth: Authentication credentials
+
+        Yields:
+            Lists of items, one per page
+
+        Raises:
+            ServiceError: If the pagination config is invalid or a page fails
+        """
+        # Imported here: the integrated API package imports this module
+        from dipeo.infrastructure.integrations.drivers.integrated_api.manifest_schema import (
+            PaginationConfig,
+        )
+        from dipeo.infrastructure.integrations.drivers.integrated_api.pagination import (
+            Paginator,
+            with_query,
+        )
+
+        try:
+            config = PaginationConfig(**pagination)
+        except ValidationError as e:
+            raise ServiceError(f"Invalid pagination config: {e}") from e
+
+        async def fetch(page_url, query_params, body):
+            response_data, response_headers = await self._request_with_retry(
+                url=with_query(page_url, query_params),
+                method=method,
+                data=body,
+                headers=headers,
+                max_retries=max_retries,
+                retry_delay=retry_delay,
+                timeout=timeout,
+                auth=auth,
+            )
+            response = {"data": response_data, "headers": response_headers}
+            return response, response_data
+
+        if max_items is None:
+            max_items = config.max_items
+
+        async for page in Paginator(config, fetch).iter_pages(url, params, data, max_items):
+            yield page
+
+    async def _request_with_retry(
+        self,
+        url: str,
+        method: str = "GET",
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 30.0,
+        auth: dict[str, str] | None = None,
+        expected_status_codes: list[int] | None = None,
+    ) -> tuple[Any, dict[str, str]]:
+        """Retry loop behind ``execute_with_retry``; also returns the response headers."""
         for attempt in range(max_retries):
             try:
                 status, response_data, response_headers = await self.execute_request(
@@ -137,7 +238,7 @@ class APIService:
                         response_data=response_data,
                         expected_status_codes=expected_status_codes,
                     )
-                    return response_data
+                    return response_data, response_headers
                 except ServiceError:
                     if not self.business_logic.should_retry(status, attempt, max_retries):
                         raise
@@ -5,6 +5,9 @@ import contextlib
 import importlib.util
 import json
 import logging
+import re
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
@@ -19,19 +22,43 @@ from dipeo.infrastructure.integrations.drivers.integrated_api.auth_strategies im
     AuthStrategyFactory,
 )
 from dipeo.infrastructure.integrations.drivers.integrated_api.manifest_schema import (
+    OperationConfig,
     PaginationType,
     ProviderManifest,
+    RateLimitAlgorithm,
+    RateLimitConfig,
     RetryStrategy,
     validate_manifest,
 )
+from dipeo.infrastructure.integrations.drivers.integrated_api.pagination import (
+    Paginator,
+    resolve_path,
+    with_query,
+)
 from dipeo.infrastructure.integrations.drivers.integrated_api.providers.base_provider import (
     BaseApiProvider,
 )
-from dipeo.infrastructure.integrations.drivers.integrated_api.rate_limiter import RateLimiter
+from dipeo.infrastructure.integrations.drivers.integrated_api.rate_limiter import (
+    PerOperationRateLimiter,
+)
 
 logger = get_module_logger(__name__)
 
 
+@dataclass(slots=True)
+class _PreparedRequest:
+    """Rendered request for one operation call, shared by all of its pages."""
+
+    operation: str
+    op_config: OperationConfig
+    context: dict[str, Any]
+    url: str
+    headers: dict[str, str]
+    body: dict[str, Any] | None
+    query_params: dict[str, str] | None
+    timeout: float
+
+
 class GenericHTTPProvider(BaseApiProvider):
     """A zero-code API provider driven by manifest configuration.
 
@@ -75,9 +102,10 @@ class GenericHTTPProvider(BaseApiProvider):
         self.rate_limiter = None
         self.jinja_env = Environment()
 
-        # Cache for loaded schemas and hooks
+        # Cache for loaded schemas, hooks and compiled templates
         self._schema_cache: dict[str, dict] = {}
         self._hook_cache: dict[str, Any] = {}
+        self._template_cache: dict[str, Template] = {}
 
     @property
     def manifest(self) -> dict:
@@ -92,8 +120,18 @@ class GenericHTTPProvider(BaseApiProvider):
         self.auth_strategy = AuthStrategyFactory.create(self._manifest.auth, self.api_key_port)
 
         # Initialize rate limiter if configured
-        if self._manifest.rate_limit:
-            self.rate_limiter = RateLimiter(self._manifest.rate_limit)
+        overrides = {
+            name: op.rate_limit_override
+            for name, op in self._manifest.operations.items()
+            if op.rate_limit_override
+        }
+        if self._manifest.rate_limit or overrides:
+            self.rate_limiter = PerOperationRateLimiter(
+                self._manifest.rate_limit or RateLimitConfig(algorithm=RateLimitAlgorithm.NONE),
+                key=self._manifest.name,
+            )
+            for operation, config in overrides.items():
+                self.rate_limiter.add_operation_limit(operation, config)
 
         # Load hooks module if specified
         if self._manifest.hooks_module:
@@ -117,15 +155,106 @@ class GenericHTTPProvider(BaseApiProvider):
             timeout: Request timeout
 
         Returns:
-            Operation result
+            Operation result. Its ``data`` is the processed response of a single
+            request. When ``config`` sets ``paginate: true`` or ``max_items`` on a
+            paginated operation, all pages are fetched instead and ``data`` is the
+            flat list of their items, capped at ``max_items`` (or the manifest's
+            ``max_items``).
         """
-        op_config = self._manifest.operations[operation]
+        prepared = await self._prepare_request(operation, config, resource_id, api_key, timeout)
 
-        # Apply rate limiting if configured
-        if self.rate_limiter:
-            rate_limit_config = op_config.rate_limit_override or self._manifest.rate_limit
-            if rate_limit_config:
-                await self.rate_limiter.acquire(operation)
+        if not self._is_paginated(prepared.op_config) or not self._wants_all_pages(config):
+            _, result = await self._fetch_page(
+                prepared, prepared.url, prepared.query_params, prepared.body
+            )
+            return self._build_success_response(result, operation)
+
+        max_items = self._resolve_max_items(prepared.op_config, config)
+        items = [item async for page in self._iter_prepared(prepared, max_items) for item in page]
+        return self._build_success_response(items, operation)
+
+    async def iter_pages(
+        self,
+        operation: str,
+        config: dict[str, Any] | None = None,
+        resource_id: str | None = None,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        max_items: int | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Stream an operation's results one page at a time.
+
+        The next page is requested while the caller processes the current one, so
+        large collections can be consumed without buffering them. Operations without
+        pagination yield their result as a single page.
+
+        Args:
+            operation: Operation name
+            config: Operation configuration from diagram
+            resource_id: Optional resource ID
+            api_key: API key for authentication
+            timeout: Request timeout
+            max_items: Stop after this many items; defaults to ``config["max_items"]``
+                or the manifest's ``max_items``
+
+        Yields:
+            Lists of items, one per page
+        """
+        if operation not in self.supported_operations:
+            raise ValueError(f"Operation '{operation}' not supported by {self.provider_name}")
+        if not api_key:
+            raise ValueError(f"API key required for {self.provider_name} operations")
+
+        config = config or {}
+        prepared = await self._prepare_request(operation, config, resource_id, api_key, timeout)
+        if max_items is None:
+            max_items = self._resolve_max_items(prepared.op_config, config)
+
+        async for page in self._iter_prepared(prepared, max_items):
+            yield page
+
+    async def _iter_prepared(
+        self, prepared: _PreparedRequest, max_items: int | None
+    ) -> AsyncIterator[list[Any]]:
+        if not self._is_paginated(prepared.op_config):
+            _, result = await self._fetch_page(
+                prepared, prepared.url, prepared.query_params, prepared.body
+            )
+            if result is not None:
+                page = result if isinstance(result, list) else [result]
+                yield page[:max_items] if max_items is not None else page
+            return
+
+        async def fetch(url, query_params, body):
+            return await self._fetch_page(prepared, url, query_params, body)
+
+        paginator = Paginator(prepared.op_config.pagination, fetch)
+        async for page in paginator.iter_pages(
+            prepared.url, prepared.query_params, prepared.body, max_items
+        ):
+            yield page
+
+    async def _prepare_request(
+        self,
+        operation: str,
+        config: dict[str, Any],
+        resource_id: str | None,
+        api_key: str,
+        timeout: float,
+    ) -> _PreparedRequest:
+        """Render the URL, headers, body and query parameters of an operation call.
+
+        Args:
+            operation: Operation name
+            config: Operation configuration from diagram
+            resource_id: Optional resource ID
+            api_key: API key for authentication
+            timeout: Request timeout
+
+        Returns:
+            Prepared request
+        """
+        op_config = self._manifest.operations[operation]
 
         # Prepare context for template rendering
         context = {
@@ -139,23 +268,50 @@ class GenericHTTPProvider(BaseApiProvider):
         if op_config.pre_request_hook:
             context = await self._execute_hook(op_config.pre_request_hook, "pre_request", context)
 
-        # Build request
-        url = self._build_url(op_config.path, context)
-        headers = await self._build_headers(op_config, context, api_key)
-        body = self._build_body(op_config, context)
-        query_params = self._build_query_params(op_config, context)
+        return _PreparedRequest(
+            operation=operation,
+            op_config=op_config,
+            context=context,
+            url=self._build_url(op_config.path, context),
+            headers=await self._build_headers(op_config, context, api_key),
+            body=self._build_body(op_config, context),
+            query_params=self._build_query_params(op_config, context),
+            # Use operation-specific timeout if provided
+            timeout=op_config.timeout_override or timeout,
+        )
+
+    async def _fetch_page(
+        self,
+        prepared: _PreparedRequest,
+        url: str,
+        query_params: dict[str, Any] | None,
+        body: dict[str, Any] | None,
+    ) -> tuple[dict[str, Any], Any]:
+        """Request one page and process it.
+
+        Args:
+            prepared: Prepared operation request
+            url: Page URL
+            query_params: Page query parameters
+            body: Page request body
 
-        # Use operation-specific timeout if provided
-        request_timeout = op_config.timeout_override or timeout
+        Returns:
+            Tuple of (raw response, processed result)
+        """
+        op_config = prepared.op_config
+
+        # Apply rate limiting if configured
+        if self.rate_limiter:
+            await self.rate_limiter.acquire(prepared.operation)
 
         # Execute request with retry logic
         response = await self._execute_with_retry(
             method=op_config.method,
             url=url,
-            headers=headers,
+            headers=prepared.headers,
             body=body,
             query_params=query_params,
-            timeout=request_timeout,
+            timeout=prepared.timeout,
             retry_policy=self._manifest.retry_policy,
         )
 
@@ -167,16 +323,18 @@ class GenericHTTPProvider(BaseApiProvider):
             result = await self._execute_hook(
                 op_config.post_response_hook,
                 "post_response",
-                {"result": result, "context": context},
+                {"result": result, "context": prepared.context},
             )
 
-        # Handle pagination if configured
-        if op_config.pagination and op_config.pagination.type != PaginationType.NONE:
-            result = await self._handle_pagination(
-                result, op_config, context, headers, request_timeout
-            )
+        return response, result
 
-        return self._build_success_response(result, operation)
+    def _get_template(self, source: str) -> Template:
+        """Compile a manifest template once and reuse it for every call."""
+        template = self._template_cache.get(source)
+        if template is None:
+            template = self.jinja_env.from_string(source)
+            self._template_cache[source] = template
+        return template
 
     def _build_url(self, path_template: str, context: dict[str, Any]) -> str:
         """Build the full URL from base URL and path template.
@@ -189,8 +347,7 @@ class GenericHTTPProvider(BaseApiProvider):
             Full URL
         """
         # Render path template
-        template = Template(path_template)
-        path = template.render(**context)
+        path = self._get_template(path_template).render(**context)
 
         # Combine with base URL
         base_url = str(self._manifest.base_url).rstrip("/")
@@ -220,8 +377,7 @@ class GenericHTTPProvider(BaseApiProvider):
         # Add operation-specific headers
         if op_config.request and op_config.request.headers_template:
             for key, value_template in op_config.request.headers_template.items():
-                template = Template(value_template)
-                headers[key] = template.render(**context)
+                headers[key] = self._get_template(value_template).render(**context)
 
         # Add authentication headers
         if self.auth_strategy:
@@ -248,8 +404,7 @@ class GenericHTTPProvider(BaseApiProvider):
             return None
 
         # Render body template
-        template = Template(op_config.request.body_template)
-        body_str = template.render(**context)
+        body_str = self._get_template(op_config.request.body_template).render(**context)
 
         # Parse as JSON
         try:
@@ -274,8 +429,7 @@ class GenericHTTPProvider(BaseApiProvider):
 
         params = {}
         for key, value_template in op_config.request.query_params_template.items():
-            template = Template(value_template)
-            value = template.render(**context)
+            value = self._get_template(value_template).render(**context)
             if value:  # Only include non-empty values
                 params[key] = value
 
@@ -330,7 +484,11 @@ class GenericHTTPProvider(BaseApiProvider):
                     response_data,
                     response_headers,
                 ) = await self.api_service.execute_request(
-                    method=method, url=url, data=body, headers=headers, timeout=timeout
+                    method=method,
+                    url=with_query(url, query_params),
+                    data=body,
+                    headers=headers,
+                    timeout=timeout,
                 )
 
                 # Check if we should retry based on status code
@@ -427,15 +585,14 @@ class GenericHTTPProvider(BaseApiProvider):
         # Extract data using JSON pointer if configured
         if op_config.response and op_config.response.json_pointer:
             try:
-                data = jsonpointer.resolve_pointer(data, op_config.response.json_pointer)
+                data = resolve_path(data, op_config.response.json_pointer)
             except Exception as e:
                 logger.error(f"Failed to extract data using JSON pointer: {e}")
                 logger.debug(f"Response data: {data}")
 
         # Apply transformation if configured
         if op_config.response and op_config.response.transform:
-            template = Template(op_config.response.transform)
-            data_str = template.render(response=data)
+            data_str = self._get_template(op_config.response.transform).render(response=data)
             try:
                 data = json.loads(data_str)
             except json.JSONDecodeError:
@@ -444,30 +601,20 @@ class GenericHTTPProvider(BaseApiProvider):
 
         return data
 
-    async def _handle_pagination(
-        self,
-        initial_result: Any,
-        op_config,
-        context: dict[str, Any],
-        headers: dict[str, str],
-        timeout: float,
-    ) -> Any:
-        """Handle pagination if configured.
+    @staticmethod
+    def _is_paginated(op_config: OperationConfig) -> bool:
+        return bool(op_config.pagination and op_config.pagination.type != PaginationType.NONE)
 
-        Args:
-            initial_result: Initial response data
-            op_config: Operation configuration
-            context: Template context
-            headers: Request headers
-            timeout: Request timeout
+    @staticmethod
+    def _wants_all_pages(config: dict[str, Any]) -> bool:
+        return bool(config.get("paginate")) or config.get("max_items") is not None
 
-        Returns:
-            Aggregated results
-        """
-        # This is a simplified implementation
-        # Full implementation would handle different pagination types
-        logger.info(f"Pagination handling not fully implemented for {op_config.pagination.type}")
-        return initial_result
+    @staticmethod
+    def _resolve_max_items(op_config: OperationConfig, config: dict[str, Any]) -> int | None:
+        max_items = config.get("max_items")
+        if max_items is None and op_config.pagination:
+            max_items = op_config.pagination.max_items
+        return int(max_items) if max_items is not None else None
 
     async def _load_hooks_module(self) -> None:
         """Load Python module containing hook implementations."""
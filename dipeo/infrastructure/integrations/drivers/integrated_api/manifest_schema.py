@@ -1,6 +1,6 @@
 """Provider manifest schema definitions."""
 
-from enum import Enum
+from enum import Enum, StrEnum
 from typing import Any, Literal
 
 from pydantic import BaseModel, Field, HttpUrl
@@ -30,6 +30,13 @@ class RateLimitAlgorithm(str, Enum):
     NONE = "none"
 
 
+class RateLimitBackend(StrEnum):
+    """Where rate limiter state is kept."""
+
+    LOCAL = "local"  # Per limiter instance, inside one process
+    SHARED = "shared"  # SQLite store shared by every process on the machine
+
+
 class PaginationType(str, Enum):
     """Pagination types."""
 
@@ -85,6 +92,15 @@ class RateLimitConfig(BaseModel):
     window_size_sec: int = Field(
         60, ge=1, description="Window size in seconds (for window-based algorithms)"
     )
+    backend: RateLimitBackend = Field(
+        RateLimitBackend.LOCAL, description="Keep limiter state per process or shared"
+    )
+    shared_key: str | None = Field(
+        None,
+        description="Quota key for the shared backend; limiters with the same key share a "
+        "budget (defaults to the provider name, or provider:operation for an operation's "
+        "rate_limit_override)",
+    )
 
 
 class RequestSchema(BaseModel):
@@ -126,14 +142,30 @@ class PaginationConfig(BaseModel):
 
     type: PaginationType = Field(PaginationType.NONE, description="Pagination type")
     limit_param: str | None = Field(None, description="Parameter name for page size limit")
+    per_page_param: str | None = Field(
+        None, description="Alternative name for limit_param used by page_number APIs"
+    )
     offset_param: str | None = Field(None, description="Parameter name for offset")
     page_param: str | None = Field(None, description="Parameter name for page number")
     cursor_param: str | None = Field(None, description="Parameter name for cursor")
     cursor_response_path: str | None = Field(
         None, description="JSON path to extract next cursor from response"
     )
+    cursor_path: str | None = Field(None, description="Alias for cursor_response_path")
     has_more_path: str | None = Field(None, description="JSON path to check if more pages exist")
+    items_path: str | None = Field(
+        None, description="JSON path to the page's item list within the processed response"
+    )
     default_limit: int = Field(100, ge=1, le=1000, description="Default page size")
+    max_limit: int | None = Field(None, ge=1, description="Largest page size the API accepts")
+    max_items: int | None = Field(
+        None, ge=1, description="Default cap on items collected across pages (None for all)"
+    )
+    params_in: Literal["query", "body"] | None = Field(
+        None,
+        description="Where paging parameters are sent (default: the JSON body when the "
+        "operation has one, otherwise the query string)",
+    )
 
 
 class OperationConfig(BaseModel):
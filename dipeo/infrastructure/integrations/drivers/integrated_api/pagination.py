@@ -0,0 +1,280 @@
+"""Manifest-driven pagination for HTTP collections."""
+
+import asyncio
+import contextlib
+import re
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any
+from urllib.parse import urlencode, urljoin, urlsplit
+
+from dipeo.config.base_logger import get_module_logger
+from dipeo.infrastructure.integrations.drivers.integrated_api.manifest_schema import (
+    PaginationConfig,
+    PaginationType,
+)
+
+logger = get_module_logger(__name__)
+
+_PATH_TOKEN = re.compile(r"\[(-?\d+)\]|([^.\[\]]+)")
+_LINK_ENTRY = re.compile(r"<([^>]*)>([^<]*)")
+_LINK_REL = re.compile(r'rel\s*=\s*"?([^";,]*)"?', re.IGNORECASE)
+
+# URL, query parameters and JSON body of one page request
+PageRequest = tuple[str, dict[str, Any] | None, dict[str, Any] | None]
+
+# Fetches one page request; returns the raw response (with "data" and "headers") and
+# the processed result that holds the page's items
+PageFetcher = Callable[
+    [str, dict[str, Any] | None, dict[str, Any] | None], Awaitable[tuple[dict[str, Any], Any]]
+]
+
+
+def resolve_path(data: Any, path: str | None) -> Any:
+    """Resolve a manifest data path against a response.
+
+    Accepts JSON pointers ("/results/0"), dotted paths ("$.data.items") and
+    bracketed indexes ("[-1]/user/id"). Empty paths, "/" and "$" select the whole
+    document.
+
+    Raises:
+        LookupError: If the path does not exist in ``data``
+    """
+    if not path or path in ("/", "$"):
+        return data
+    if path.startswith("/"):
+        tokens = [segment.replace("~1", "/").replace("~0", "~") for segment in path[1:].split("/")]
+    else:
+        tokens = []
+        for part in path.removeprefix("$").split("/"):
+            for index, key in _PATH_TOKEN.findall(part):
+                tokens.append(int(index) if index else key)
+
+    for token in tokens:
+        if token == "":
+            continue
+        if isinstance(data, list):
+            try:
+                data = data[int(token)]
+            except ValueError as e:
+                raise LookupError(f"Cannot index a list with {token!r}") from e
+        elif isinstance(data, dict):
+            data = data[token]
+        else:
+            raise LookupError(f"Cannot resolve {token!r} in {type(data).__name__}")
+    return data
+
+
+def _find(data: Any, path: str | None) -> Any:
+    try:
+        return resolve_path(data, path)
+    except LookupError:
+        return None
+
+
+def _next_link(headers: dict[str, str]) -> str | None:
+    """Extract the rel="next" target from an RFC 8288 Link header."""
+    link = next((value for key, value in headers.items() if key.lower() == "link"), None)
+    if not link:
+        return None
+    for target, params in _LINK_ENTRY.findall(link):
+        rel = _LINK_REL.search(params)
+        if rel and "next" in rel.group(1).lower().split():
+            return target
+    return None
+
+
+def with_query(url: str, query_params: dict[str, Any] | None) -> str:
+    """Append ``query_params`` to ``url``, keeping any query string it already has."""
+    if not query_params:
+        return url
+    separator = "&" if urlsplit(url).query else "?"
+    return f"{url}{separator}{urlencode(query_params)}"
+
+
+class Paginator:
+    """Walks a paginated collection, prefetching the next page.
+
+    Supports offset/limit, page number, cursor/next-token and RFC 8288 link-header
+    strategies as described by a ``PaginationConfig``.
+    """
+
+    def __init__(self, pagination: PaginationConfig, fetch: PageFetcher):
+        """Initialize the paginator.
+
+        Args:
+            pagination: Pagination strategy
+            fetch: Coroutine that requests one page
+        """
+        self.pagination = pagination
+        self._fetch = fetch
+
+    async def iter_pages(
+        self,
+        url: str,
+        query_params: dict[str, Any] | None = None,
+        body: dict[str, Any] | None = None,
+        max_items: int | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Yield item pages, fetching the next page while the caller holds this one.
+
+        Only the page being consumed and the one in flight are held in memory, so a
+        caller that processes pages as they arrive never buffers the collection.
+
+        Args:
+            url: URL of the first page
+            query_params: Query parameters of the first request
+            body: JSON body of the first request
+            max_items: Stop after this many items (None for all pages)
+
+        Yields:
+            Lists of items, one per page
+        """
+        page_request = self._first_request(url, query_params, body)
+
+        fetch: asyncio.Task | None = asyncio.create_task(self._fetch(*page_request))
+        collected = 0
+        try:
+            while fetch is not None:
+                response, result = await fetch
+                fetch = None
+
+                items = self.page_items(result)
+                page_length = len(items)
+                if max_items is not None:
+                    items = items[: max_items - collected]
+                collected += len(items)
+
+                if max_items is None or collected < max_items:
+                    next_request = self._next_request(page_request, response, page_length)
+                    if next_request is not None:
+                        page_request = next_request
+                        fetch = asyncio.create_task(self._fetch(*next_request))
+
+                if items:
+                    yield items
+        finally:
+            if fetch is not None:
+                # The consumer stopped early; drop the prefetched page
+                fetch.cancel()
+                with contextlib.suppress(asyncio.CancelledError, Exception):
+                    await fetch
+
+    def page_items(self, result: Any) -> list[Any]:
+        """Extract the item list of one processed page."""
+        if self.pagination.items_path:
+            result = _find(result, self.pagination.items_path)
+        if result is None:
+            return []
+        return result if isinstance(result, list) else [result]
+
+    def _limit_param(self) -> str | None:
+        return self.pagination.limit_param or self.pagination.per_page_param
+
+    def _params_in_body(self, body: dict[str, Any] | None) -> bool:
+        if self.pagination.params_in is not None:
+            return self.pagination.params_in == "body"
+        # Operations that send a JSON body (e.g. POST search endpoints) page through it
+        return isinstance(body, dict)
+
+    def _page_size(self, params: dict[str, Any]) -> int:
+        size = self.pagination.default_limit
+        limit_param = self._limit_param()
+        if limit_param and params.get(limit_param):
+            with contextlib.suppress(TypeError, ValueError):
+                size = int(params[limit_param])
+        if self.pagination.max_limit:
+            size = min(size, self.pagination.max_limit)
+        return size
+
+    def _first_request(
+        self, url: str, query_params: dict[str, Any] | None, body: dict[str, Any] | None
+    ) -> PageRequest:
+        pagination = self.pagination
+        in_body = self._params_in_body(body)
+        params = dict((body if in_body else query_params) or {})
+        # Paging numbers stay numbers in a JSON body and become strings in a query
+        encode = int if in_body else str
+
+        limit_param = self._limit_param()
+        if limit_param:
+            params[limit_param] = encode(self._page_size(params))
+
+        if pagination.type == PaginationType.OFFSET_LIMIT and pagination.offset_param:
+            params.setdefault(pagination.offset_param, encode(0))
+        elif pagination.type == PaginationType.PAGE_NUMBER and pagination.page_param:
+            params.setdefault(pagination.page_param, encode(1))
+
+        if in_body:
+            return url, query_params, params
+        return url, params or None, body
+
+    def _next_request(
+        self, page_request: PageRequest, response: dict[str, Any], page_length: int
+    ) -> PageRequest | None:
+        """Work out the request for the page after ``page_request``.
+
+        Args:
+            page_request: URL, query parameters and body of the page just fetched
+            response: Raw response of that page
+            page_length: Number of items the page contained
+
+        Returns:
+            Next page request, or None when the collection is exhausted
+        """
+        if page_length == 0:
+            return None
+
+        pagination = self.pagination
+        data = response["data"]
+        if pagination.has_more_path and not _find(data, pagination.has_more_path):
+            return None
+
+        url, query_params, body = page_request
+        in_body = self._params_in_body(body)
+        params = dict((body if in_body else query_params) or {})
+        # Paging numbers stay numbers in a JSON body and become strings in a query
+        encode = int if in_body else str
+        short_page = (
+            pagination.has_more_path is None
+            and self._limit_param() is not None
+            and page_length < self._page_size(params)
+        )
+
+        if pagination.type == PaginationType.OFFSET_LIMIT:
+            if not pagination.offset_param or short_page:
+                return None
+            offset = int(params.get(pagination.offset_param) or 0)
+            params[pagination.offset_param] = encode(offset + page_length)
+
+        elif pagination.type == PaginationType.PAGE_NUMBER:
+            if not pagination.page_param or short_page:
+                return None
+            page = int(params.get(pagination.page_param) or 1)
+            params[pagination.page_param] = encode(page + 1)
+
+        elif pagination.type in (PaginationType.CURSOR, PaginationType.NEXT_TOKEN):
+            cursor_path = pagination.cursor_response_path or pagination.cursor_path
+            cursor = _find(data, cursor_path)
+            if not pagination.cursor_param or cursor in (None, ""):
+                return None
+            params[pagination.cursor_param] = str(cursor)
+
+        elif pagination.type == PaginationType.LINK_HEADER:
+            next_url = _next_link(response.get("headers") or {})
+            if not next_url:
+                return None
+            # The link carries its own query string
+            url, query_params, params = urljoin(url, next_url), None, {}
+            in_body = False
+
+        else:
+            return None
+
+        if in_body:
+            next_request = (url, query_params, params)
+        else:
+            next_request = (url, params or None, body)
+        if next_request == page_request:
+            logger.warning(f"Pagination made no progress for {url}; stopping")
+            return None
+        return next_request
@@ -2,12 +2,18 @@
 
 import asyncio
 import logging
+import math
+import sqlite3
+import threading
 import time
 from collections import deque
+from pathlib import Path
 
 from dipeo.config.base_logger import get_module_logger
+from dipeo.config.paths import RATE_LIMIT_DB_PATH
 from dipeo.infrastructure.integrations.drivers.integrated_api.manifest_schema import (
     RateLimitAlgorithm,
+    RateLimitBackend,
     RateLimitConfig,
 )
 
@@ -17,17 +23,24 @@ logger = get_module_logger(__name__)
 class RateLimiter:
     """Rate limiter implementation supporting multiple algorithms."""
 
-    def __init__(self, config: RateLimitConfig):
+    def __init__(self, config: RateLimitConfig, key: str | None = None):
         """Initialize rate limiter.
 
         Args:
             config: Rate limit configuration
+            key: Quota key used by the shared backend when the config has no
+                ``shared_key``, usually the provider name
         """
         self.config = config
         self.algorithm = config.algorithm
+        self._shared: SharedRateLimiter | None = None
 
         # Initialize algorithm-specific state
-        if self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+        if self.algorithm == RateLimitAlgorithm.NONE:
+            self._no_limit = True
+        elif config.backend == RateLimitBackend.SHARED:
+            self._shared = SharedRateLimiter(config, config.shared_key or key or "default")
+        elif self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
             self._token_bucket = TokenBucket(
                 capacity=config.capacity, refill_rate=config.refill_per_sec
             )
@@ -59,7 +72,9 @@ class RateLimiter:
         if hasattr(self, "_no_limit"):
             return
 
-        if self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+        if self._shared is not None:
+            await self._shared.acquire()
+        elif self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
             await self._token_bucket.acquire()
         elif self.algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
             await self._sliding_window.acquire()
@@ -68,8 +83,8 @@ class RateLimiter:
         elif self.algorithm == RateLimitAlgorithm.LEAKY_BUCKET:
             await self._leaky_bucket.acquire()
 
-    def can_proceed(self, operation: str | None = None) -> bool:
-        """Check if a request can proceed without blocking.
+    async def can_proceed(self, operation: str | None = None) -> bool:
+        """Check if a request can proceed without waiting for a slot.
 
         Args:
             operation: Optional operation name
@@ -80,7 +95,9 @@ class RateLimiter:
         if hasattr(self, "_no_limit"):
             return True
 
-        if self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+        if self._shared is not None:
+            return await self._shared.can_proceed()
+        elif self.algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
             return self._token_bucket.can_proceed()
         elif self.algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
             return self._sliding_window.can_proceed()
@@ -93,7 +110,9 @@ class RateLimiter:
 
     def reset(self) -> None:
         """Reset rate limiter state."""
-        if hasattr(self, "_token_bucket"):
+        if self._shared is not None:
+            self._shared.reset()
+        elif hasattr(self, "_token_bucket"):
             self._token_bucket.reset()
         elif hasattr(self, "_sliding_window"):
             self._sliding_window.reset()
@@ -316,17 +335,247 @@ class LeakyBucket:
         self.last_leak = time.monotonic()
 
 
+_SHARED_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rate_limit_state (
+    key TEXT PRIMARY KEY,
+    value REAL NOT NULL,
+    stamp REAL NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS rate_limit_events (
+    key TEXT NOT NULL,
+    ts REAL NOT NULL
+);
+
+CREATE INDEX IF NOT EXISTS idx_rate_limit_events ON rate_limit_events(key, ts);
+"""
+
+
+class SharedRateLimitStore:
+    """Rate limiter state in a SQLite file shared by every process on the machine.
+
+    Each decision reads, updates and writes a key's state inside one
+    ``BEGIN IMMEDIATE`` transaction. SQLite allows a single writer at a time, so
+    the whole step is an atomic compare-and-set across processes. State is keyed
+    by wall-clock time because monotonic clocks are not comparable between
+    processes.
+    """
+
+    def __init__(self, db_path: Path, busy_timeout: float = 30.0):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite database file
+            busy_timeout: Seconds to wait for another process's transaction
+        """
+        self.db_path = db_path
+        self.busy_timeout = busy_timeout
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def try_acquire(
+        self,
+        key: str,
+        algorithm: RateLimitAlgorithm,
+        capacity: int,
+        rate: float,
+        window: float,
+        consume: bool = True,
+    ) -> float:
+        """Take one request slot for ``key`` if the limit allows it.
+
+        Args:
+            key: Quota key
+            algorithm: Rate limiting algorithm
+            capacity: Bucket capacity or requests per window
+            rate: Refill or leak rate per second (bucket algorithms)
+            window: Window size in seconds (window algorithms)
+            consume: Record the request; False only checks
+
+        Returns:
+            0.0 if the request may proceed, otherwise seconds to wait before retrying
+        """
+        state_key = f"{key}:{algorithm.value}"
+        with self._lock:
+            conn = self._connection()
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                now = time.time()
+                if algorithm == RateLimitAlgorithm.SLIDING_WINDOW:
+                    wait = self._sliding_window(conn, state_key, now, capacity, window, consume)
+                else:
+                    row = conn.execute(
+                        "SELECT value, stamp FROM rate_limit_state WHERE key = ?", (state_key,)
+                    ).fetchone()
+                    value, stamp, wait = _step(algorithm, row, now, capacity, rate, window)
+                    if consume:
+                        conn.execute(
+                            "INSERT OR REPLACE INTO rate_limit_state VALUES (?, ?, ?)",
+                            (state_key, value, stamp),
+                        )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return wait
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            conn = self._connection()
+            state_keys = [(f"{key}:{algorithm.value}",) for algorithm in RateLimitAlgorithm]
+            with conn:
+                conn.executemany("DELETE FROM rate_limit_state WHERE key = ?", state_keys)
+                conn.executemany("DELETE FROM rate_limit_events WHERE key = ?", state_keys)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            # Autocommit mode, so try_acquire controls its own transactions
+            self._conn = sqlite3.connect(
+                str(self.db_path),
+                timeout=self.busy_timeout,
+                isolation_level=None,
+                check_same_thread=False,
+            )
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(_SHARED_SCHEMA)
+        return self._conn
+
+    @staticmethod
+    def _sliding_window(
+        conn: sqlite3.Connection,
+        key: str,
+        now: float,
+        max_requests: int,
+        window: float,
+        consume: bool,
+    ) -> float:
+        conn.execute("DELETE FROM rate_limit_events WHERE key = ? AND ts <= ?", (key, now - window))
+        count, oldest = conn.execute(
+            "SELECT COUNT(*), MIN(ts) FROM rate_limit_events WHERE key = ?", (key,)
+        ).fetchone()
+        if count < max_requests:
+            if consume:
+                conn.execute("INSERT INTO rate_limit_events VALUES (?, ?)", (key, now))
+            return 0.0
+        return max(oldest + window - now, 0.001)
+
+
+def _step(
+    algorithm: RateLimitAlgorithm,
+    row: tuple[float, float] | None,
+    now: float,
+    capacity: int,
+    rate: float,
+    window: float,
+) -> tuple[float, float, float]:
+    """Advance one key's stored (value, stamp) state by a single request.
+
+    Returns:
+        Tuple of (new value, new stamp, seconds to wait); the wait is 0.0 when the
+        request was admitted
+    """
+    if algorithm == RateLimitAlgorithm.TOKEN_BUCKET:
+        tokens = capacity if row is None else min(capacity, row[0] + (now - row[1]) * rate)
+        if tokens >= 1:
+            return tokens - 1, now, 0.0
+        return tokens, now, (1 - tokens) / rate
+
+    if algorithm == RateLimitAlgorithm.LEAKY_BUCKET:
+        level = 0.0 if row is None else max(0.0, row[0] - (now - row[1]) * rate)
+        if level < capacity:
+            return level + 1, now, 0.0
+        return level, now, (level - capacity + 1) / rate
+
+    # Fixed window: windows are aligned to the epoch so all processes agree on them
+    window_start = math.floor(now / window) * window
+    count = row[0] if row is not None and row[1] == window_start else 0
+    if count < capacity:
+        return count + 1, window_start, 0.0
+    return count, window_start, max(window_start + window - now, 0.001)
+
+
+_shared_stores: dict[Path, SharedRateLimitStore] = {}
+_shared_stores_lock = threading.Lock()
+
+
+def get_shared_rate_limit_store(db_path: Path | None = None) -> SharedRateLimitStore:
+    """Return the process-wide store for ``db_path`` (default: RATE_LIMIT_DB_PATH)."""
+    db_path = db_path or RATE_LIMIT_DB_PATH
+    with _shared_stores_lock:
+        store = _shared_stores.get(db_path)
+        if store is None:
+            store = SharedRateLimitStore(db_path)
+            _shared_stores[db_path] = store
+        return store
+
+
+class SharedRateLimiter:
+    """Rate limiter whose budget is shared by every process using the same key."""
+
+    def __init__(
+        self, config: RateLimitConfig, key: str, store: SharedRateLimitStore | None = None
+    ):
+        """Initialize shared rate limiter.
+
+        Args:
+            config: Rate limit configuration
+            key: Quota key; limiters with the same key and algorithm share a budget
+            store: State store (default: the store at RATE_LIMIT_DB_PATH)
+        """
+        self.config = config
+        self.key = key
+        self.store = store or get_shared_rate_limit_store()
+
+    async def acquire(self) -> None:
+        """Acquire permission to make a request, waiting for other processes if needed."""
+        while True:
+            wait_time = await asyncio.to_thread(self._try_acquire, True)
+            if wait_time <= 0:
+                return
+            await asyncio.sleep(wait_time)
+
+    async def can_proceed(self) -> bool:
+        """Check if a request can proceed."""
+        # The check takes the store's write lock, which can wait on other processes
+        return await asyncio.to_thread(self._try_acquire, False) <= 0
+
+    def reset(self) -> None:
+        """Clear the shared state for this key."""
+        self.store.reset(self.key)
+
+    def _try_acquire(self, consume: bool) -> float:
+        return self.store.try_acquire(
+            self.key,
+            self.config.algorithm,
+            capacity=self.config.capacity,
+            rate=self.config.refill_per_sec,
+            window=self.config.window_size_sec,
+            consume=consume,
+        )
+
+
 class PerOperationRateLimiter:
     """Rate limiter that supports per-operation limits."""
 
-    def __init__(self, default_config: RateLimitConfig):
+    def __init__(self, default_config: RateLimitConfig, key: str | None = None):
         """Initialize per-operation rate limiter.
 
         Args:
             default_config: Default rate limit configuration
+            key: Quota key of the default limiter for the shared backend, usually
+                the provider name; operation limits use ``{key}:{operation}``
         """
         self.default_config = default_config
-        self.default_limiter = RateLimiter(default_config)
+        self.key = key
+        self.default_limiter = RateLimiter(default_config, key=key)
         self.operation_limiters: dict[str, RateLimiter] = {}
 
     def add_operation_limit(self, operation: str, config: RateLimitConfig) -> None:
@@ -336,7 +585,8 @@ class PerOperationRateLimiter:
             operation: Operation name
             config: Rate limit configuration
         """
-        self.operation_limiters[operation] = RateLimiter(config)
+        key = f"{self.key}:{operation}" if self.key else operation
+        self.operation_limiters[operation] = RateLimiter(config, key=key)
 
     async def acquire(self, operation: str | None = None) -> None:
         """Acquire permission for an operation.
@@ -349,7 +599,7 @@ class PerOperationRateLimiter:
         else:
             await self.default_limiter.acquire()
 
-    def can_proceed(self, operation: str | None = None) -> bool:
+    async def can_proceed(self, operation: str | None = None) -> bool:
         """Check if an operation can proceed.
 
         Args:
@@ -359,9 +609,9 @@ class PerOperationRateLimiter:
             True if can proceed
         """
         if operation and operation in self.operation_limiters:
-            return self.operation_limiters[operation].can_proceed()
+            return await self.operation_limiters[operation].can_proceed()
         else:
-            return self.default_limiter.can_proceed()
+            return await self.default_limiter.can_proceed()
 
     def reset(self, operation: str | None = None) -> None:
         """Reset rate limiter.
@@ -1,6 +1,7 @@
 """Integrated API service implementation."""
 
 import logging
+from collections.abc import AsyncIterator
 from typing import Any
 
 from dipeo.config.base_logger import get_module_logger
@@ -130,32 +131,7 @@ class IntegratedApiService(
         max_retries: int = 3,
     ) -> dict[str, Any]:
         """Execute an operation on a specific provider."""
-        if not self._initialized:
-            await self.initialize()
-
-        # Get the provider from registry
-        provider_instance = self.provider_registry.get_provider(provider)
-        if not provider_instance:
-            available_providers = ", ".join(self.provider_registry.list_providers())
-            raise ValueError(
-                f"Provider '{provider}' not registered. "
-                f"Available providers: {available_providers}"
-            )
-
-        # Validate the operation
-        if operation not in provider_instance.supported_operations:
-            supported_ops = ", ".join(provider_instance.supported_operations)
-            raise ValueError(
-                f"Operation '{operation}' not supported by provider '{provider}'. "
-                f"Supported operations: {supported_ops}"
-            )
-
-        # For GenericHTTPProvider, ensure it has access to APIService and APIKeyPort
-        if isinstance(provider_instance, GenericHTTPProvider):
-            if not provider_instance.api_service:
-                provider_instance.api_service = self._api_service
-            if not provider_instance.api_key_port:
-                provider_instance.api_key_port = self._api_key_port
+        provider_instance = await self._get_operation_provider(provider, operation)
 
         # Execute the operation with retry logic
         last_error = None
@@ -184,6 +160,78 @@ class IntegratedApiService(
             f"{max_retries} attempts: {last_error}"
         )
 
+    async def stream_operation(
+        self,
+        provider: str,
+        operation: str,
+        config: dict[str, Any] | None = None,
+        resource_id: str | None = None,
+        api_key: str | None = None,
+        timeout: float = 30.0,
+        max_items: int | None = None,
+    ) -> AsyncIterator[list[Any]]:
+        """Stream an operation's results page by page without buffering the collection.
+
+        Manifest providers follow the operation's pagination and fetch the next page
+        while the caller processes the current one. Other providers yield their
+        whole result as a single page.
+        """
+        provider_instance = await self._get_operation_provider(provider, operation)
+
+        if isinstance(provider_instance, GenericHTTPProvider):
+            async for page in provider_instance.iter_pages(
+                operation=operation,
+                config=config,
+                resource_id=resource_id,
+                api_key=api_key,
+                timeout=timeout,
+                max_items=max_items,
+            ):
+                yield page
+            return
+
+        result = await provider_instance.execute(
+            operation=operation,
+            config=config,
+            resource_id=resource_id,
+            api_key=api_key,
+            timeout=timeout,
+        )
+        data = result.get("data") if isinstance(result, dict) else result
+        if data is not None:
+            page = data if isinstance(data, list) else [data]
+            yield page[:max_items] if max_items is not None else page
+
+    async def _get_operation_provider(self, provider: str, operation: str) -> ApiProviderPort:
+        """Look up a provider and check that it supports ``operation``."""
+        if not self._initialized:
+            await self.initialize()
+
+        # Get the provider from registry
+        provider_instance = self.provider_registry.get_provider(provider)
+        if not provider_instance:
+            available_providers = ", ".join(self.provider_registry.list_providers())
+            raise ValueError(
+                f"Provider '{provider}' not registered. Available providers: {available_providers}"
+            )
+
+        # Validate the operation
+        if operation not in provider_instance.supported_operations:
+            supported_ops = ", ".join(provider_instance.supported_operations)
+            raise ValueError(
+                f"Operation '{operation}' not supported by provider '{provider}'. "
+                f"Supported operations: {supported_ops}"
+            )
+
+        # For GenericHTTPProvider, ensure it has access to APIService and APIKeyPort
+        if isinstance(provider_instance, GenericHTTPProvider):
+            if not provider_instance.api_service:
+                provider_instance.api_service = self._api_service
+            if not provider_instance.api_key_port:
+                provider_instance.api_key_port = self._api_key_port
+
+        return provider_instance
+
     def get_supported_providers(self) -> list[str]:
         """Get list of currently registered providers."""
         return self.provider_registry.list_providers()
@@ -0,0 +1,197 @@
+"""Concurrency-bounded batch execution shared by all LLM provider clients."""
+
+import asyncio
+import random
+import weakref
+from collections.abc import Awaitable, Callable, Sequence
+from typing import Any, TypeVar
+
+from dipeo.config.base_logger import get_module_logger
+from dipeo.config.llm import (
+    BATCH_DEFAULT_MAX_CONCURRENCY,
+    BATCH_MAX_CONCURRENCY,
+    BATCH_OVERLOAD_RETRIES,
+)
+
+logger = get_module_logger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+# 429 Too Many Requests, 503 Service Unavailable, 529 Anthropic "overloaded"
+OVERLOAD_STATUS_CODES = frozenset({429, 503, 529})
+_OVERLOAD_MARKERS = ("rate limit", "rate_limit", "ratelimit", "overloaded", "resource_exhausted")
+
+
+def _status_code(error: BaseException) -> int | None:
+    for source in (error, getattr(error, "response", None)):
+        for attr in ("status_code", "status", "code"):
+            value = getattr(source, attr, None)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def is_overload_error(error: BaseException) -> bool:
+    """Check whether an SDK error means the provider is rate limiting or overloaded.
+
+    Args:
+        error: Exception raised by a provider call
+
+    Returns:
+        True for 429/503/529 responses and errors named or worded as such
+    """
+    if _status_code(error) in OVERLOAD_STATUS_CODES:
+        return True
+    text = f"{type(error).__name__} {error}".lower()
+    return any(marker in text for marker in _OVERLOAD_MARKERS)
+
+
+def _retry_after(error: BaseException) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    if not headers:
+        return None
+    try:
+        return float(headers.get("retry-after"))
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveConcurrencyLimiter:
+    """Concurrency limit that halves on overload and grows back on success (AIMD)."""
+
+    def __init__(self, max_concurrency: int, min_concurrency: int = 1):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Upper bound on requests in flight
+            min_concurrency: Lower bound the limit never backs off below
+        """
+        self.max_concurrency = max_concurrency
+        self.min_concurrency = min(min_concurrency, max_concurrency)
+        self.limit = max_concurrency
+        self.in_flight = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def acquire(self) -> None:
+        async with self._condition:
+            await self._condition.wait_for(lambda: self.in_flight < self.limit)
+            self.in_flight += 1
+
+    async def release(self, succeeded: bool = False, overloaded: bool = False) -> None:
+        async with self._condition:
+            self.in_flight -= 1
+            if overloaded:
+                self._successes = 0
+                if self.limit > self.min_concurrency:
+                    self.limit = max(self.min_concurrency, self.limit // 2)
+                    logger.debug(f"Batch concurrency backed off to {self.limit}")
+            elif succeeded:
+                # Additive increase: one more slot per `limit` consecutive successes
+                self._successes += 1
+                if self.limit < self.max_concurrency and self._successes >= self.limit:
+                    self._successes = 0
+                    self.limit += 1
+            self._condition.notify_all()
+
+
+class BatchExecutor:
+    """Runs batches of provider calls under one per-provider concurrency limit.
+
+    Results keep the order of the inputs. A failing item yields its exception
+    in place of a result instead of failing the batch, and rate-limit or overload
+    errors back off the shared concurrency limit and retry the item.
+    """
+
+    def __init__(
+        self,
+        provider: str,
+        max_concurrency: int,
+        max_overload_retries: int = BATCH_OVERLOAD_RETRIES,
+        backoff_base: float = 1.0,
+        backoff_max: float = 30.0,
+    ):
+        """Initialize the executor.
+
+        Args:
+            provider: Provider name, for logging
+            max_concurrency: Maximum requests in flight for this provider
+            max_overload_retries: Retries per item after overload errors
+            backoff_base: First retry delay in seconds; doubles per attempt
+            backoff_max: Longest retry delay in seconds
+        """
+        self.provider = provider
+        self.max_overload_retries = max_overload_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.limiter = AdaptiveConcurrencyLimiter(max_concurrency)
+
+    async def run(
+        self, items: Sequence[T], call: Callable[[T], Awaitable[R]]
+    ) -> list[R | Exception]:
+        """Call ``call`` for every item.
+
+        Args:
+            items: Batch inputs
+            call: Coroutine function performing one provider request
+
+        Returns:
+            One entry per input, in input order: the call's result or the
+            exception it finally raised
+        """
+        return list(await asyncio.gather(*(self._run_item(item, call) for item in items)))
+
+    async def _run_item(self, item: T, call: Callable[[T], Awaitable[R]]) -> R | Exception:
+        attempt = 0
+        while True:
+            await self.limiter.acquire()
+            try:
+                result = await call(item)
+            except Exception as e:
+                error = e
+            except BaseException:
+                await self.limiter.release()
+                raise
+            else:
+                await self.limiter.release(succeeded=True)
+                return result
+
+            overloaded = is_overload_error(error)
+            await self.limiter.release(overloaded=overloaded)
+            if not overloaded or attempt >= self.max_overload_retries:
+                logger.warning(f"{self.provider} batch item failed: {error}")
+                return error
+
+            delay = _retry_after(error) or min(self.backoff_max, self.backoff_base * 2**attempt)
+            attempt += 1
+            # Jitter keeps retried items from hitting the provider in lockstep
+            await asyncio.sleep(delay * random.uniform(0.5, 1.0))
+
+
+# asyncio primitives belong to one event loop, so executors are kept per loop
+_executors: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict[str, BatchExecutor]] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_batch_executor(provider: Any) -> BatchExecutor:
+    """Return the executor shared by every client of ``provider`` on the running loop.
+
+    Must be called from a coroutine.
+
+    Args:
+        provider: Provider name or ProviderType
+
+    Returns:
+        BatchExecutor with the provider's configured concurrency limit
+    """
+    name = str(getattr(provider, "value", provider))
+    loop_executors = _executors.setdefault(asyncio.get_running_loop(), {})
+    executor = loop_executors.get(name)
+    if executor is None:
+        executor = BatchExecutor(
+            name, BATCH_MAX_CONCURRENCY.get(name, BATCH_DEFAULT_MAX_CONCURRENCY)
+        )
+        loop_executors[name] = executor
+    return executor
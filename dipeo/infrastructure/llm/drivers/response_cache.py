@@ -0,0 +1,236 @@
+"""Content-addressed cache of LLM responses with record/replay support."""
+
+import asyncio
+import enum
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from dipeo.config.base_logger import get_module_logger
+from dipeo.diagram_generated import ChatResult
+
+logger = get_module_logger(__name__)
+
+# Request kwargs that identify a call site or trace rather than the request itself
+VOLATILE_PARAMS = frozenset({"trace_id", "execution_id", "execution_phase", "node_id"})
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS llm_responses (
+    key TEXT PRIMARY KEY,
+    service TEXT,
+    model TEXT,
+    response TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    expires_at REAL
+);
+"""
+
+
+class CacheMode(enum.StrEnum):
+    """How LLMInfraService uses the response cache."""
+
+    OFF = "off"  # Always call the provider
+    READ_WRITE = "read_write"  # Serve hits, call and store on misses
+    RECORD = "record"  # Always call the provider and store the response
+    REPLAY = "replay"  # Serve recorded responses only; misses are errors
+
+    @property
+    def reads(self) -> bool:
+        return self in (CacheMode.READ_WRITE, CacheMode.REPLAY)
+
+    @property
+    def writes(self) -> bool:
+        return self in (CacheMode.READ_WRITE, CacheMode.RECORD)
+
+
+def _canonical(value: Any) -> Any:
+    if isinstance(value, enum.Enum):
+        return value.value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    if isinstance(value, type) and hasattr(value, "model_json_schema"):
+        # Structured output models are identified by their schema, not their identity
+        return {"__model__": value.__name__, "schema": value.model_json_schema()}
+    if hasattr(value, "model_dump"):
+        return _canonical(value.model_dump(exclude_none=True))
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    return repr(value)
+
+
+def _structured_output(raw_response: Any) -> dict[str, Any] | None:
+    """Extract the parsed structured output a provider attached to its raw response."""
+    for attr in ("parsed", "output_parsed"):
+        value = getattr(raw_response, attr, None)
+        if hasattr(value, "model_dump"):
+            return value.model_dump(mode="json")
+        if isinstance(value, dict) and value:
+            return value
+    return None
+
+
+def make_cache_key(
+    service: str | None, model: str, messages: list[dict[str, Any]], params: dict[str, Any]
+) -> str:
+    """Build the content hash identifying an LLM request.
+
+    Args:
+        service: Normalized provider name
+        model: Model name
+        messages: Chat messages sent to the provider
+        params: Provider call parameters; volatile tracing parameters are ignored
+
+    Returns:
+        Hex SHA-256 digest of the canonical request
+    """
+    request = {
+        "service": service,
+        "model": model,
+        "messages": _canonical(messages),
+        "params": _canonical({k: v for k, v in params.items() if k not in VOLATILE_PARAMS}),
+    }
+    payload = json.dumps(request, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """Two-tier response cache: an in-memory LRU in front of a SQLite table.
+
+    Raw provider responses are not stored; replayed results carry the text,
+    usage and tool outputs of the recorded call. Parsed structured output is
+    kept as a plain dict in ``raw_response``, where structured-output readers
+    look for it when the text is not JSON.
+    """
+
+    def __init__(self, db_path: Path, max_memory_entries: int = 512):
+        """Initialize the cache.
+
+        Args:
+            db_path: SQLite database file
+            max_memory_entries: Entries kept in the in-memory LRU tier
+        """
+        self.db_path = db_path
+        self.max_memory_entries = max_memory_entries
+        self._memory: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._memory_lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    async def get(self, key: str) -> ChatResult | None:
+        """Look up a cached response.
+
+        Args:
+            key: Request hash from make_cache_key
+
+        Returns:
+            Cached ChatResult, or None on a miss or expired entry
+        """
+        now = time.time()
+        with self._memory_lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                self._memory.move_to_end(key)
+
+        if entry is None:
+            entry = await asyncio.to_thread(self._load, key)
+            if entry is not None:
+                self._remember(key, *entry)
+
+        if entry is None or (entry[1] is not None and entry[1] <= now):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        return ChatResult.model_validate(json.loads(entry[0]))
+
+    async def set(
+        self,
+        key: str,
+        result: ChatResult,
+        ttl_s: float | None,
+        service: str | None = None,
+        model: str | None = None,
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Request hash from make_cache_key
+            result: Response to store
+            ttl_s: Time to live in seconds; None or 0 never expires
+            service: Provider name, stored for inspection
+            model: Model name, stored for inspection
+        """
+        data = result.model_dump(
+            exclude={"raw_response": True, "tool_outputs": {"__all__": {"raw_response"}}}
+        )
+        structured = _structured_output(result.raw_response)
+        if structured is not None:
+            data["raw_response"] = structured
+        payload = json.dumps(data, default=str)
+        expires_at = time.time() + ttl_s if ttl_s else None
+        self._remember(key, payload, expires_at)
+        await asyncio.to_thread(self._store, key, payload, expires_at, service, model)
+
+    def get_stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "memory_entries": len(self._memory),
+        }
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, payload: str, expires_at: float | None) -> None:
+        with self._memory_lock:
+            self._memory[key] = (payload, expires_at)
+            self._memory.move_to_end(key)
+            while len(self._memory) > self.max_memory_entries:
+                self._memory.popitem(last=False)
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        return self._conn
+
+    def _load(self, key: str) -> tuple[str, float | None] | None:
+        with self._db_lock:
+            row = (
+                self._connection()
+                .execute("SELECT response, expires_at FROM llm_responses WHERE key = ?", (key,))
+                .fetchone()
+            )
+        return (row[0], row[1]) if row else None
+
+    def _store(
+        self,
+        key: str,
+        payload: str,
+        expires_at: float | None,
+        service: str | None,
+        model: str | None,
+    ) -> None:
+        with self._db_lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_responses VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, service, model, payload, time.time(), expires_at),
+                )
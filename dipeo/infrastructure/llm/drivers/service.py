@@ -2,7 +2,8 @@
 
 from typing import Any
 
-from dipeo.config import normalize_service_name
+from dipeo.config import get_settings, normalize_service_name
+from dipeo.config.paths import LLM_CACHE_DB_PATH
 from dipeo.config.services import LLMServiceName
 from dipeo.diagram_generated import ChatResult
 from dipeo.domain.base import LLMServiceError
@@ -12,6 +13,11 @@ from dipeo.domain.integrations.ports import LLMService as LLMServicePort
 from dipeo.infrastructure.llm.drivers.client_manager import ClientManager
 from dipeo.infrastructure.llm.drivers.completion_handlers import CompletionHandlers
 from dipeo.infrastructure.llm.drivers.decision_parser import DecisionParser
+from dipeo.infrastructure.llm.drivers.response_cache import (
+    CacheMode,
+    LLMResponseCache,
+    make_cache_key,
+)
 from dipeo.infrastructure.llm.drivers.response_converter import ResponseConverter
 from dipeo.infrastructure.llm.drivers.types import (
     DecisionOutput,
@@ -35,6 +41,7 @@ class LLMInfraService(LoggingMixin, InitializationMixin, LLMServicePort):
             complete_fn=self.complete,
             decision_parser=self._decision_parser,
         )
+        self._response_cache: LLMResponseCache | None = None
 
     async def initialize(self) -> None:
         pass
@@ -92,12 +99,29 @@ class LLMInfraService(LoggingMixin, InitializationMixin, LLMServicePort):
                 messages = []
 
             execution_phase = kwargs.pop("execution_phase", None)
+            cache_mode, cache_ttl_s = self._resolve_cache_options(kwargs.pop("llm_cache", None))
 
             if service_name:
                 if hasattr(service_name, "value"):
                     service_name = service_name.value
                 service_name = normalize_service_name(str(service_name))
 
+            # Looked up before a client is created so replay needs no API key
+            cache_key = None
+            if cache_mode is not CacheMode.OFF:
+                cache_key = make_cache_key(service_name, model, messages, kwargs)
+                if cache_mode.reads:
+                    cached = await self._get_response_cache().get(cache_key)
+                    if cached is not None:
+                        self.log_debug(f"LLM response cache hit: {cache_key[:12]}")
+                        return cached
+                    if cache_mode is CacheMode.REPLAY:
+                        raise LLMServiceError(
+                            service=service_name,
+                            message=f"No recorded response for request {cache_key[:12]} "
+                            f"(model {model}) in replay mode",
+                        )
+
             trace_id = kwargs.get("trace_id", "")
 
             # Determine execution phase for metrics
@@ -168,9 +192,9 @@ class LLMInfraService(LoggingMixin, InitializationMixin, LLMServicePort):
                 self.log_debug(f"LLM response: {response_text}")
 
             if isinstance(response, LLMResponse):
-                return self._response_converter.convert_to_chat_result(response)
+                result = self._response_converter.convert_to_chat_result(response)
             elif isinstance(response, ChatResult):
-                return response
+                result = response
             else:
                 if hasattr(response, "content"):
                     content = response.content
@@ -188,13 +212,45 @@ class LLMInfraService(LoggingMixin, InitializationMixin, LLMServicePort):
                 if hasattr(response, "total_tokens"):
                     result.total_tokens = response.total_tokens
 
-                return result
+            if cache_key and cache_mode.writes:
+                try:
+                    await self._get_response_cache().set(
+                        cache_key, result, cache_ttl_s, service=service_name, model=model
+                    )
+                except Exception as e:
+                    self.log_warning(f"Failed to store LLM response in cache: {e}")
 
+            return result
+
+        except LLMServiceError:
+            raise
         except Exception as e:
             if hasattr(self, "logger"):
                 self.log_error(f"Error in LLM completion: {e}")
             raise LLMServiceError(service=service_name, message=str(e)) from e
 
+    def _resolve_cache_options(self, options: dict[str, Any] | None) -> tuple[CacheMode, int]:
+        """Merge per-call cache options over the LLM settings.
+
+        Args:
+            options: Optional ``{"mode": ..., "ttl_s": ...}`` passed as ``llm_cache``
+
+        Returns:
+            Cache mode and TTL in seconds (0 = no expiry)
+        """
+        settings = get_settings().llm
+        options = options or {}
+        mode = CacheMode(options.get("mode") or settings.cache_mode)
+        ttl_s = options.get("ttl_s")
+        return mode, int(settings.cache_ttl_s if ttl_s is None else ttl_s)
+
+    def _get_response_cache(self) -> LLMResponseCache:
+        if self._response_cache is None:
+            self._response_cache = LLMResponseCache(
+                LLM_CACHE_DB_PATH, max_memory_entries=get_settings().llm.cache_memory_entries
+            )
+        return self._response_cache
+
     async def validate_api_key(self, api_key_id: str, service: str | None = None) -> bool:
         try:
             api_key = await self.api_key_service.get_api_key(api_key_id)
@@ -0,0 +1,337 @@
+"""Pool of pre-connected Claude SDK sessions.
+
+Connecting a ClaudeSDKClient starts a CLI subprocess, which dominates the
+latency of short prompts. The pool keeps sessions connected ahead of time per
+(phase, options fingerprint), so a call leases a running session and the pool
+reconnects a replacement in the background.
+
+A session keeps the conversation of every query it served, so by default a
+session serves a single query (``max_uses=1``) and pooling only moves the
+connect off the request path. Raise ``max_uses`` only for callers that tolerate
+shared context.
+
+Callers whose options are tied to a single execution (for example a cwd created
+for that execution) lease with ``prewarm=False``: their key is never seen
+again once the execution ends, so spares connected for it would only idle
+until the timeout.
+"""
+
+import asyncio
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict, deque
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from typing import Any
+
+from claude_agent_sdk import ClaudeSDKClient
+
+from dipeo.config.base_logger import get_module_logger
+from dipeo.config.llm import (
+    CLAUDE_SESSION_POOL_IDLE_TIMEOUT,
+    CLAUDE_SESSION_POOL_MAX_SESSIONS,
+    CLAUDE_SESSION_POOL_MAX_USES,
+    CLAUDE_SESSION_POOL_SIZE,
+)
+
+logger = get_module_logger(__name__)
+
+SESSION_POOL_SIZE = int(os.getenv("DIPEO_CLAUDE_SESSION_POOL_SIZE", str(CLAUDE_SESSION_POOL_SIZE)))
+SESSION_POOL_MAX_USES = int(
+    os.getenv("DIPEO_CLAUDE_SESSION_MAX_USES", str(CLAUDE_SESSION_POOL_MAX_USES))
+)
+
+PoolKey = tuple[str, str]
+
+
+def _canonical(value: Any) -> Any:
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, dict):
+        return {str(k): _canonical(v) for k, v in value.items()}
+    if isinstance(value, list | tuple):
+        return [_canonical(v) for v in value]
+    if isinstance(value, set | frozenset):
+        return sorted(repr(_canonical(v)) for v in value)
+    if isinstance(value, os.PathLike):
+        return os.fspath(value)
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return {
+            "__type__": type(value).__qualname__,
+            **{f.name: _canonical(getattr(value, f.name)) for f in dataclasses.fields(value)},
+        }
+    if callable(value):
+        return f"{getattr(value, '__module__', '')}.{getattr(value, '__qualname__', repr(value))}"
+    # Per-call objects such as SDK MCP server instances are identified by type only
+    return type(value).__qualname__
+
+
+def options_fingerprint(options: Any) -> str:
+    """Hash the settings a session is started with.
+
+    Args:
+        options: ClaudeAgentOptions (or any dataclass/object with attributes)
+
+    Returns:
+        Hex SHA-256 digest; equal for options that start equivalent sessions
+    """
+    payload = json.dumps(_canonical(options), sort_keys=True, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _is_alive(client: Any) -> bool:
+    """Best-effort check that a session's CLI subprocess is still usable."""
+    if not hasattr(client, "_transport"):
+        return True
+    transport = client._transport
+    if transport is None:
+        return False
+    is_ready = getattr(transport, "is_ready", None)
+    if callable(is_ready) and not is_ready():
+        return False
+    process = getattr(transport, "_process", None)
+    return process is None or getattr(process, "returncode", None) is None
+
+
+@dataclasses.dataclass(slots=True)
+class PooledSession:
+    """A connected session and its usage."""
+
+    client: Any
+    key: PoolKey | None
+    created_at: float
+    idle_since: float = 0.0
+    uses: int = 0
+
+
+class ClaudeSessionPool:
+    """Bounded pool of pre-connected sessions keyed by (phase, options fingerprint)."""
+
+    def __init__(
+        self,
+        name: str = "ClaudeCode",
+        client_factory: Callable[..., Any] = ClaudeSDKClient,
+        warm_size: int = SESSION_POOL_SIZE,
+        max_sessions: int = CLAUDE_SESSION_POOL_MAX_SESSIONS,
+        max_uses: int = SESSION_POOL_MAX_USES,
+        idle_timeout: float = CLAUDE_SESSION_POOL_IDLE_TIMEOUT,
+    ):
+        """Initialize the pool.
+
+        Args:
+            name: Provider name used in log messages
+            client_factory: Session class, called as ``client_factory(options=...)``
+            warm_size: Idle sessions kept ready per key; 0 disables pooling
+            max_sessions: Idle plus connecting sessions kept across all keys
+            max_uses: Queries a session serves before it is closed
+            idle_timeout: Seconds an idle session is kept before it is closed
+        """
+        self.name = name
+        self.client_factory = client_factory
+        self.warm_size = warm_size
+        self.max_sessions = max(max_sessions, warm_size)
+        self.max_uses = max(max_uses, 1)
+        self.idle_timeout = idle_timeout
+        # Keys in least-recently-leased order
+        self._idle: OrderedDict[PoolKey, deque[PooledSession]] = OrderedDict()
+        self._options: dict[PoolKey, Any] = {}
+        self._connecting: dict[PoolKey, int] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._reaper: asyncio.Task | None = None
+        self._closed = False
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.warm_size > 0 and not self._closed
+
+    @asynccontextmanager
+    async def lease(self, phase: str, options: Any, prewarm: bool = True) -> AsyncIterator[Any]:
+        """Lease a connected session for one request.
+
+        The session goes back to the pool only if the block completes normally;
+        sessions that raised or were abandoned mid-response are closed.
+
+        Args:
+            phase: Execution phase key
+            options: Options the session must be started with
+            prewarm: False if no later request will reuse these options
+
+        Yields:
+            Connected client
+        """
+        session = await self.acquire(phase, options, prewarm)
+        reusable = False
+        try:
+            yield session.client
+            reusable = True
+        finally:
+            self.release(session, reusable)
+
+    async def acquire(self, phase: str, options: Any, prewarm: bool = True) -> PooledSession:
+        """Take a warm session, or connect one if none is ready.
+
+        Args:
+            phase: Execution phase key
+            options: Options the session must be started with
+            prewarm: Connect spare sessions for the key in the background
+
+        Returns:
+            Leased session; hand it back with ``release``
+        """
+        if not self.enabled:
+            return await self._connect(options, None)
+
+        key = (phase, options_fingerprint(options))
+        self._options[key] = options
+        session = self._take_idle(key)
+        if session is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+        if prewarm:
+            self._refill(key)
+        if session is None:
+            session = await self._connect(options, key)
+        return session
+
+    def release(self, session: PooledSession, reusable: bool = True) -> None:
+        """Return a leased session to the pool, or close it.
+
+        Args:
+            session: Session from ``acquire``
+            reusable: False if the request failed and the session state is unknown
+        """
+        session.uses += 1
+        key = session.key
+        if (
+            reusable
+            and key is not None
+            and self.enabled
+            and session.uses < self.max_uses
+            and _is_alive(session.client)
+            and len(self._idle.get(key, ())) < self.warm_size
+        ):
+            self._add_idle(session)
+        else:
+            self._spawn(self._disconnect(session))
+
+    async def close(self) -> None:
+        """Close all idle sessions and stop background work."""
+        self._closed = True
+        if self._reaper is not None:
+            self._reaper.cancel()
+            self._reaper = None
+        tasks = list(self._tasks)
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+        idle = [session for sessions in self._idle.values() for session in sessions]
+        self._idle.clear()
+        self._options.clear()
+        await asyncio.gather(*(self._disconnect(s) for s in idle), return_exceptions=True)
+        logger.debug(f"[{self.name}] Session pool closed ({len(idle)} idle sessions)")
+
+    def get_stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hits / total if total else 0.0,
+            "idle_sessions": self._idle_count(),
+            "connecting": sum(self._connecting.values()),
+        }
+
+    def _take_idle(self, key: PoolKey) -> PooledSession | None:
+        sessions = self._idle.get(key)
+        if sessions is None:
+            return None
+        self._idle.move_to_end(key)
+        now = time.monotonic()
+        while sessions:
+            session = sessions.pop()
+            if now - session.idle_since < self.idle_timeout and _is_alive(session.client):
+                return session
+            self._spawn(self._disconnect(session))
+        return None
+
+    def _add_idle(self, session: PooledSession) -> None:
+        session.idle_since = time.monotonic()
+        self._idle.setdefault(session.key, deque()).append(session)
+        if self._reaper is None or self._reaper.done():
+            self._reaper = asyncio.create_task(self._reap_idle())
+
+    def _refill(self, key: PoolKey) -> None:
+        """Start connecting sessions until ``key`` has ``warm_size`` ready."""
+        missing = self.warm_size - len(self._idle.get(key, ())) - self._connecting.get(key, 0)
+        for _ in range(missing):
+            if not self._make_room(key):
+                return
+            self._connecting[key] = self._connecting.get(key, 0) + 1
+            self._spawn(self._prewarm(key))
+
+    def _make_room(self, key: PoolKey) -> bool:
+        """Evict idle sessions of the least recently leased other keys if at capacity."""
+        while self._idle_count() + sum(self._connecting.values()) >= self.max_sessions:
+            victim = next((k for k, sessions in self._idle.items() if k != key and sessions), None)
+            if victim is None:
+                return False
+            self._spawn(self._disconnect(self._idle[victim].popleft()))
+        return True
+
+    async def _prewarm(self, key: PoolKey) -> None:
+        try:
+            session = await self._connect(self._options[key], key)
+        except Exception as e:
+            logger.warning(f"[{self.name}] Failed to pre-connect session: {e}")
+            return
+        finally:
+            self._connecting[key] -= 1
+            if not self._connecting[key]:
+                del self._connecting[key]
+
+        if self._closed or len(self._idle.get(key, ())) >= self.warm_size:
+            await self._disconnect(session)
+        else:
+            self._add_idle(session)
+
+    async def _connect(self, options: Any, key: PoolKey | None) -> PooledSession:
+        client = self.client_factory(options=options)
+        await client.connect(None)
+        return PooledSession(client=client, key=key, created_at=time.monotonic())
+
+    async def _disconnect(self, session: PooledSession) -> None:
+        try:
+            await session.client.disconnect()
+        except Exception as e:
+            logger.warning(f"[{self.name}] Error disconnecting pooled session: {e}")
+
+    async def _reap_idle(self) -> None:
+        while self._idle_count():
+            await asyncio.sleep(max(self.idle_timeout / 2, 0.01))
+            now = time.monotonic()
+            for key in list(self._idle):
+                sessions = self._idle[key]
+                for session in list(sessions):
+                    if now - session.idle_since >= self.idle_timeout or not _is_alive(
+                        session.client
+                    ):
+                        sessions.remove(session)
+                        self._spawn(self._disconnect(session))
+                if not sessions:
+                    del self._idle[key]
+                    if not self._connecting.get(key):
+                        self._options.pop(key, None)
+
+    def _idle_count(self) -> int:
+        return sum(len(sessions) for sessions in self._idle.values())
+
+    def _spawn(self, coro) -> None:
+        task = asyncio.create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
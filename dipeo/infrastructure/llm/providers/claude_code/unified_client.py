@@ -19,6 +19,7 @@ from dipeo.config.llm import (
 from dipeo.config.paths import BASE_DIR
 from dipeo.config.provider_capabilities import get_provider_capabilities_object
 from dipeo.diagram_generated import Message, ToolConfig
+from dipeo.infrastructure.llm.drivers.batch_executor import get_batch_executor
 from dipeo.infrastructure.llm.drivers.types import (
     AdapterConfig,
     ExecutionPhase,
@@ -29,6 +30,7 @@ from dipeo.infrastructure.timing.context import atime_phase, time_phase
 
 from .message_processor import ClaudeCodeMessageProcessor
 from .response_parser import ClaudeCodeResponseParser
+from .session_pool import ClaudeSessionPool
 
 logger = get_module_logger(__name__)
 
@@ -39,7 +41,7 @@ FORK_SESSION_ENABLED = (
 
 
 class UnifiedClaudeCodeClient:
-    """Client with template session forking and context manager lifecycle."""
+    """Client with template session forking and a pool of pre-connected sessions."""
 
     def __init__(self, config: AdapterConfig):
         self.config = config
@@ -63,6 +65,7 @@ class UnifiedClaudeCodeClient:
             "default": None,
         }
         self._template_lock = asyncio.Lock()
+        self._session_pool = ClaudeSessionPool(name="ClaudeCode")
 
     def _get_capabilities(self) -> ProviderCapabilities:
         """Get provider capabilities."""
@@ -74,8 +77,12 @@ class UnifiedClaudeCodeClient:
             max_output_tokens=CLAUDE_MAX_OUTPUT_TOKENS,
         )
 
-    def _setup_workspace(self, kwargs: dict) -> None:
-        """Configure workspace directory (modifies kwargs in-place)."""
+    def _setup_workspace(self, kwargs: dict) -> bool:
+        """Configure workspace directory (modifies kwargs in-place).
+
+        Returns:
+            True if the cwd is a workspace created for this execution only
+        """
         if "cwd" not in kwargs:
             from pathlib import Path
 
@@ -84,8 +91,9 @@ class UnifiedClaudeCodeClient:
             workspace_dir = Path(root) / f"exec_{trace_id}"
             workspace_dir.mkdir(parents=True, exist_ok=True)
             kwargs["cwd"] = str(workspace_dir)
-        else:
-            kwargs.pop("trace_id", None)
+            return True
+        kwargs.pop("trace_id", None)
+        return False
 
     async def _get_or_create_template(
         self, options: ClaudeAgentOptions, execution_phase: str, trace_id: str = ""
@@ -172,7 +180,9 @@ class UnifiedClaudeCodeClient:
                 **kwargs,
             )
 
-        self._setup_workspace(kwargs)
+        # Sessions started in a per-execution workspace never serve another
+        # execution, so pre-connecting spares for them only wastes subprocesses
+        prewarm = not self._setup_workspace(kwargs)
 
         async with atime_phase(trace_id, "claude_code", f"{phase_key}__build_options"):
             options_dict = self._processor.build_claude_options(
@@ -209,11 +219,10 @@ class UnifiedClaudeCodeClient:
 
                 query_input = default_generator()
 
-            # Context manager handles connection/disconnection automatically
-            session_id = f"{phase_key}_{uuid4()}"
+            # Leased sessions are already connected; the pool closes or recycles them
             async with (
                 atime_phase(trace_id, "claude_code", f"{phase_key}__api_call"),
-                ClaudeSDKClient(options=forked_options) as client,
+                self._session_pool.lease(phase_key, forked_options, prewarm=prewarm) as client,
             ):
                 async with atime_phase(trace_id, "claude_code", f"{phase_key}__send"):
                     await client.query(query_input)
@@ -271,7 +280,9 @@ class UnifiedClaudeCodeClient:
             **kwargs,
         )
 
-        self._setup_workspace(kwargs)
+        # Sessions started in a per-execution workspace never serve another
+        # execution, so pre-connecting spares for them only wastes subprocesses
+        prewarm = not self._setup_workspace(kwargs)
 
         options_dict = self._processor.build_claude_options(
             system_prompt, tool_options, hooks_config, stream=True, **kwargs
@@ -298,10 +309,9 @@ class UnifiedClaudeCodeClient:
 
             query_input = default_generator()
 
-        # Context manager handles cleanup automatically
         session_id = f"{phase_key}_{uuid4()}"
 
-        async with ClaudeSDKClient(options=forked_options) as client:
+        async with self._session_pool.lease(phase_key, forked_options, prewarm=prewarm) as client:
             await client.query(query_input, session_id=session_id)
 
             has_yielded_content = False
@@ -330,10 +340,15 @@ class UnifiedClaudeCodeClient:
         response_format: type[BaseModel] | dict[str, Any] | None = None,
         execution_phase: ExecutionPhase | None = None,
         **kwargs,
-    ) -> list[LLMResponse]:
-        """Execute batch requests (no native batch API, uses asyncio.gather)."""
-        tasks = [
-            self.async_chat(
+    ) -> list[LLMResponse | Exception]:
+        """Execute batch chat completion requests.
+
+        Requests run through the provider's shared batch executor, so concurrency is
+        bounded and a failed item yields its exception instead of failing the batch.
+        """
+        return await get_batch_executor(self.provider_type).run(
+            messages_list,
+            lambda messages: self.async_chat(
                 messages=messages,
                 model=model,
                 temperature=temperature,
@@ -342,14 +357,13 @@ class UnifiedClaudeCodeClient:
                 response_format=response_format,
                 execution_phase=execution_phase,
                 **kwargs,
-            )
-            for messages in messages_list
-        ]
-
-        return await asyncio.gather(*tasks)
+            ),
+        )
 
     async def cleanup(self) -> None:
-        """Cleanup template sessions (forked sessions auto-cleanup via context manager)."""
+        """Cleanup template sessions and pooled sessions."""
+        await self._session_pool.close()
+
         async with self._template_lock:
             for phase, template in self._template_sessions.items():
                 if template:
@@ -364,4 +378,4 @@ class UnifiedClaudeCodeClient:
         # Allow subprocess graceful termination to avoid EPIPE errors
         await asyncio.sleep(0.5)
 
-        logger.info("[ClaudeCode] Cleanup complete (template sessions)")
+        logger.info("[ClaudeCode] Cleanup complete (template and pooled sessions)")
@@ -6,19 +6,20 @@ from claude_agent_sdk import ClaudeAgentOptions, ClaudeSDKClient
 
 from dipeo.config.base_logger import get_module_logger
 
+from ..claude_code.session_pool import ClaudeSessionPool, PooledSession
 from .config import FORK_SESSION_ENABLED
 
 logger = get_module_logger(__name__)
 
 
 class SessionManager:
-    """Manage template sessions and forking for efficient execution."""
+    """Manage template sessions, forking and pre-connected request sessions."""
 
     def __init__(self):
         self._template_sessions: dict[str, ClaudeSDKClient | None] = {}
         self._template_lock = asyncio.Lock()
-        self._active_sessions: list[ClaudeSDKClient] = []
-        self._session_lock = asyncio.Lock()
+        self._pool = ClaudeSessionPool(name="ClaudeCodeCustom")
+        self._active_sessions: dict[int, PooledSession] = {}
 
     async def get_or_create_template(
         self, options: ClaudeAgentOptions, execution_phase: str
@@ -56,18 +57,21 @@ class SessionManager:
     async def create_forked_session(
         self, options: ClaudeAgentOptions, execution_phase: str
     ) -> ClaudeSDKClient:
-        """Create a session by forking from template or creating fresh.
+        """Lease a session forked from the template, or a fresh one.
 
         This method attempts to fork from an existing template session for efficiency.
-        If forking is not supported or fails, it falls back to creating a fresh session.
+        If forking is not supported or fails, it falls back to fresh session options.
+        Sessions come pre-connected from the session pool when one is warm.
 
         Args:
             options: Claude Code options with system prompt
             execution_phase: Execution phase identifier
 
         Returns:
-            New or forked ClaudeSDKClient session for this request
+            Connected ClaudeSDKClient session for this request; pass it to
+            ``cleanup_session`` when done
         """
+        session_options = options
         if FORK_SESSION_ENABLED:
             try:
                 template = await self.get_or_create_template(options, execution_phase)
@@ -76,7 +80,7 @@ class SessionManager:
                     f"[ClaudeCodeCustom] Forking session from template for phase '{execution_phase}'"
                 )
 
-                fork_options = ClaudeAgentOptions(
+                session_options = ClaudeAgentOptions(
                     **{
                         **options.__dict__,
                         "resume": template.session_id if hasattr(template, "session_id") else None,
@@ -84,49 +88,50 @@ class SessionManager:
                     }
                 )
 
-                forked_session = ClaudeSDKClient(options=fork_options)
-                await forked_session.connect(None)
-
-                async with self._session_lock:
-                    self._active_sessions.append(forked_session)
-
-                return forked_session
-
             except Exception as e:
                 logger.warning(
                     f"[ClaudeCodeCustom] Failed to fork from template: {e}, creating fresh session"
                 )
 
-        logger.debug(f"[ClaudeCodeCustom] Creating fresh session for phase '{execution_phase}'")
-
-        session = ClaudeSDKClient(options=options)
-        await session.connect(None)
+        try:
+            leased = await self._pool.acquire(execution_phase, session_options)
+        except Exception as e:
+            if session_options is options:
+                raise
+            logger.warning(
+                f"[ClaudeCodeCustom] Failed to connect forked session: {e}, creating fresh session"
+            )
+            leased = await self._pool.acquire(execution_phase, options)
 
-        async with self._session_lock:
-            self._active_sessions.append(session)
+        self._active_sessions[id(leased.client)] = leased
+        return leased.client
 
-        return session
+    async def cleanup_session(self, session: ClaudeSDKClient, reusable: bool = False) -> None:
+        """Hand a session back after use.
 
-    async def cleanup_session(self, session: ClaudeSDKClient) -> None:
-        """Clean up a session after use."""
+        Args:
+            session: Session from ``create_forked_session``
+            reusable: True if the request completed, so the pool may recycle the session
+        """
+        leased = self._active_sessions.pop(id(session), None)
+        if leased is not None:
+            self._pool.release(leased, reusable)
+            return
         try:
             await session.disconnect()
-            async with self._session_lock:
-                if session in self._active_sessions:
-                    self._active_sessions.remove(session)
         except Exception as e:
             logger.warning(f"[ClaudeCodeCustom] Error disconnecting session: {e}")
 
     async def cleanup_all(self) -> None:
         """Cleanup all sessions on shutdown."""
-        async with self._session_lock:
-            for session in self._active_sessions[:]:
-                try:
-                    await session.disconnect()
-                    logger.debug("[ClaudeCodeCustom] Disconnected active forked session")
-                except Exception as e:
-                    logger.warning(f"[ClaudeCodeCustom] Error disconnecting forked session: {e}")
-            self._active_sessions.clear()
+        for leased in list(self._active_sessions.values()):
+            try:
+                await leased.client.disconnect()
+                logger.debug("[ClaudeCodeCustom] Disconnected active forked session")
+            except Exception as e:
+                logger.warning(f"[ClaudeCodeCustom] Error disconnecting forked session: {e}")
+        self._active_sessions.clear()
+        await self._pool.close()
 
         async with self._template_lock:
             for phase, template in self._template_sessions.items():
@@ -142,4 +147,4 @@ class SessionManager:
                         )
             self._template_sessions.clear()
 
-        logger.info("[ClaudeCodeCustom] Cleanup complete (templates and forked sessions)")
+        logger.info("[ClaudeCodeCustom] Cleanup complete (templates, forked and pooled sessions)")
@@ -1,6 +1,5 @@
 """Unified Claude Code Custom client with full system prompt override."""
 
-import asyncio
 from collections.abc import AsyncIterator
 from typing import Any
 from uuid import uuid4
@@ -11,6 +10,7 @@ from tenacity import AsyncRetrying, retry_if_exception_type, stop_after_attempt,
 
 from dipeo.config.base_logger import get_module_logger
 from dipeo.diagram_generated import Message, ToolConfig
+from dipeo.infrastructure.llm.drivers.batch_executor import get_batch_executor
 from dipeo.infrastructure.llm.drivers.types import (
     AdapterConfig,
     ExecutionPhase,
@@ -32,7 +32,8 @@ class UnifiedClaudeCodeCustomClient:
     This variant allows complete system prompt override, similar to how other
     adapters (like OpenAI/ChatGPT) handle system prompts. When a system_prompt
     is provided from the diagram, it completely replaces any default prompts.
-    Uses template-based session management with forking for efficiency.
+    Uses template-based session management with forking and pre-connected
+    sessions for efficiency.
     """
 
     def __init__(self, config: AdapterConfig):
@@ -60,6 +61,7 @@ class UnifiedClaudeCodeCustomClient:
         session_id: str,
     ) -> LLMResponse:
         """Execute a query on a session."""
+        completed = False
         try:
             await session.query(query_input, session_id=session_id)
 
@@ -95,14 +97,14 @@ class UnifiedClaudeCodeCustomClient:
                 )
                 parsed.provider = self.provider_type
                 parsed.raw_response = str(tool_invocation_data)
-                return parsed
-
-            parsed = ResponseParser.parse_response(result_text, execution_phase)
-            parsed.provider = self.provider_type
-            parsed.raw_response = result_text
+            else:
+                parsed = ResponseParser.parse_response(result_text, execution_phase)
+                parsed.provider = self.provider_type
+                parsed.raw_response = result_text
+            completed = True
             return parsed
         finally:
-            await self.session_manager.cleanup_session(session)
+            await self.session_manager.cleanup_session(session, reusable=completed)
 
     async def async_chat(
         self,
@@ -195,6 +197,7 @@ class UnifiedClaudeCodeCustomClient:
         phase_key = str(execution_phase) if execution_phase else "default"
         session = await self.session_manager.create_forked_session(options, phase_key)
 
+        completed = False
         try:
             session_id = f"{phase_key}_{uuid4()}"
             await session.query(formatted_messages, session_id=session_id)
@@ -209,8 +212,9 @@ class UnifiedClaudeCodeCustomClient:
                 elif hasattr(message, "result"):
                     if not has_yielded_content:
                         yield str(message.result)
+            completed = True
         finally:
-            await self.session_manager.cleanup_session(session)
+            await self.session_manager.cleanup_session(session, reusable=completed)
 
     async def batch_chat(
         self,
@@ -222,10 +226,15 @@ class UnifiedClaudeCodeCustomClient:
         response_format: type[BaseModel] | dict[str, Any] | None = None,
         execution_phase: ExecutionPhase | None = None,
         **kwargs,
-    ) -> list[LLMResponse]:
-        """Execute batch chat completion requests."""
-        tasks = [
-            self.async_chat(
+    ) -> list[LLMResponse | Exception]:
+        """Execute batch chat completion requests.
+
+        Requests run through the provider's shared batch executor, so concurrency is
+        bounded and a failed item yields its exception instead of failing the batch.
+        """
+        return await get_batch_executor(self.provider_type).run(
+            messages_list,
+            lambda messages: self.async_chat(
                 messages=messages,
                 model=model,
                 temperature=temperature,
@@ -234,11 +243,8 @@ class UnifiedClaudeCodeCustomClient:
                 response_format=response_format,
                 execution_phase=execution_phase,
                 **kwargs,
-            )
-            for messages in messages_list
-        ]
-
-        return await asyncio.gather(*tasks)
+            ),
+        )
 
     async def cleanup(self) -> None:
         """Cleanup all sessions on shutdown."""
@@ -19,6 +19,7 @@ from dipeo.config.llm import (
 from dipeo.config.provider_capabilities import get_provider_capabilities_object
 from dipeo.diagram_generated import Message, ToolConfig
 from dipeo.diagram_generated.domain_models import LLMUsage
+from dipeo.infrastructure.llm.drivers.batch_executor import get_batch_executor
 from dipeo.infrastructure.llm.drivers.types import (
     AdapterConfig,
     ExecutionPhase,
@@ -266,8 +267,22 @@ class UnifiedGoogleClient:
         response_format: type[BaseModel] | dict[str, Any] | None = None,
         execution_phase: ExecutionPhase | None = None,
         **kwargs,
-    ) -> list[LLMResponse]:
-        """Execute batch chat completion requests."""
-        # Google doesn't have native batch API, so we process sequentially
-        # This can be optimized with asyncio.gather in the future
-        raise NotImplementedError("Batch chat not yet implemented for Google provider")
+    ) -> list[LLMResponse | Exception]:
+        """Execute batch chat completion requests.
+
+        Requests run through the provider's shared batch executor, so concurrency is
+        bounded and a failed item yields its exception instead of failing the batch.
+        """
+        return await get_batch_executor(self.provider_type).run(
+            messages_list,
+            lambda messages: self.async_chat(
+                messages=messages,
+                model=model,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                response_format=response_format,
+                execution_phase=execution_phase,
+                **kwargs,
+            ),
+        )
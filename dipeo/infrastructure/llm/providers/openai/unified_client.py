@@ -20,6 +20,7 @@ from dipeo.config.llm import (
 from dipeo.config.provider_capabilities import get_provider_capabilities_object
 from dipeo.diagram_generated import Message, ToolConfig
 from dipeo.diagram_generated.domain_models import LLMUsage
+from dipeo.infrastructure.llm.drivers.batch_executor import get_batch_executor
 from dipeo.infrastructure.llm.drivers.types import (
     AdapterConfig,
     ExecutionPhase,
@@ -252,7 +253,7 @@ class UnifiedOpenAIClient:
                 params["tools"] = self._prepare_tools(tools)
 
             # Check for text_format in kwargs (for structured output)
-            text_format = kwargs.pop("text_format", None)
+            text_format = kwargs.pop("text_format", text_format)
 
             # Set structured output for specific execution phases if not already set
             if not text_format:
@@ -377,9 +378,12 @@ class UnifiedOpenAIClient:
         response_format: Any | None = None,
         execution_phase: ExecutionPhase | None = None,
         **kwargs,
-    ) -> list[LLMResponse]:
+    ) -> list[LLMResponse | Exception]:
         """Execute batch chat completion.
 
+        Requests run through the provider's shared batch executor, which bounds
+        concurrency and backs off on rate-limit and overload errors.
+
         Args:
             messages_list: List of message lists for batch processing
             temperature: Temperature for generation
@@ -390,9 +394,18 @@ class UnifiedOpenAIClient:
             **kwargs: Additional parameters
 
         Returns:
-            List of LLM responses
-
-        Raises:
-            NotImplementedError: Batch chat is not yet implemented
+            One entry per message list, in order: its LLM response, or the
+            exception that request raised
         """
-        raise NotImplementedError("Batch chat is not yet implemented for OpenAI")
+        return await get_batch_executor(self.provider_type).run(
+            messages_list,
+            lambda messages: self.async_chat(
+                messages=messages,
+                temperature=temperature,
+                max_tokens=max_tokens,
+                tools=tools,
+                text_format=response_format,
+                execution_phase=execution_phase,
+                **kwargs,
+            ),
+        )
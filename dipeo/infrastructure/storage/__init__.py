@@ -6,6 +6,7 @@ This module provides concrete implementations for storage-related domain ports:
 - ArtifactStorePort: High-level artifact management
 - DBOperationsDomainService: JSON-based database-like storage operations
 - MessageStore: SQLite-based message persistence for executions
+- WebhookInbox: SQLite-backed durable queue for incoming webhooks
 """
 
 from .artifacts.artifact_adapter import ArtifactStoreAdapter
@@ -13,6 +14,7 @@ from .cloud.s3_adapter import S3Adapter
 from .json_db import DBOperationsDomainService
 from .local.local_adapter import LocalBlobAdapter, LocalFileSystemAdapter
 from .message_store import MessageStore
+from .webhook_inbox import WebhookDelivery, WebhookInbox
 
 __all__ = [
     "ArtifactStoreAdapter",
@@ -21,4 +23,6 @@ __all__ = [
     "LocalFileSystemAdapter",
     "MessageStore",
     "S3Adapter",
+    "WebhookDelivery",
+    "WebhookInbox",
 ]
@@ -1,33 +1,94 @@
 """Message store for handling message persistence."""
 
+import asyncio
+import contextlib
 import json
+import sqlite3
 from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import aiosqlite
 
+from dipeo.config.base_logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+# Statements are issued with identical SQL text on one long-lived connection, so
+# sqlite3's per-connection statement cache keeps them prepared
+_INSERT_MESSAGE = """INSERT INTO messages
+   (id, execution_id, node_id, person_id, content, token_count)
+   VALUES (?, ?, ?, ?, ?, ?)"""
+
 
 class MessageStore:
-    def __init__(self, db_path: Path):
+    """SQLite message persistence with write-behind batching.
+
+    Inserts are queued and written by a background task in a single transaction
+    once ``batch_size`` rows are pending or ``flush_interval`` seconds have passed.
+    Reads flush the queue first, so they always see every stored message. Call
+    ``flush()`` when an execution ends and ``close()`` on shutdown.
+    """
+
+    def __init__(self, db_path: Path, flush_interval: float = 0.005, batch_size: int = 500):
+        """Initialize the store.
+
+        Args:
+            db_path: SQLite database file
+            flush_interval: Maximum seconds a queued message waits before being written
+            batch_size: Number of queued messages that triggers an immediate write
+        """
         self.db_path = db_path
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self._db: aiosqlite.Connection | None = None
+        self._pending: list[tuple] = []
+        self._write_lock = asyncio.Lock()
+        self._init_lock = asyncio.Lock()
+        self._wakeup = asyncio.Event()
+        self._flush_task: asyncio.Task | None = None
+        self._closing = asyncio.Event()
 
     async def initialize(self):
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.executescript("""
-                CREATE TABLE IF NOT EXISTS messages (
-                    id TEXT PRIMARY KEY,
-                    execution_id TEXT NOT NULL,
-                    node_id TEXT NOT NULL,
-                    person_id TEXT,
-                    content TEXT NOT NULL,
-                    token_count INTEGER,
-                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-                );
-                CREATE INDEX IF NOT EXISTS idx_execution ON messages(execution_id);
-                CREATE INDEX IF NOT EXISTS idx_node ON messages(node_id);
-            """)
-            await db.commit()
+        # Concurrent first writers must not each open a connection
+        async with self._init_lock:
+            if self._db is None:
+                self._db = await self._open()
+
+    async def _open(self) -> aiosqlite.Connection:
+        db = await aiosqlite.connect(self.db_path)
+        await db.execute("PRAGMA journal_mode=WAL")
+        await db.execute("PRAGMA synchronous=NORMAL")
+        await db.executescript("""
+            CREATE TABLE IF NOT EXISTS messages (
+                id TEXT PRIMARY KEY,
+                execution_id TEXT NOT NULL,
+                node_id TEXT NOT NULL,
+                person_id TEXT,
+                content TEXT NOT NULL,
+                token_count INTEGER,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            );
+            CREATE INDEX IF NOT EXISTS idx_execution ON messages(execution_id);
+            CREATE INDEX IF NOT EXISTS idx_node ON messages(node_id);
+        """)
+        await db.commit()
+        return db
+
+    async def close(self) -> None:
+        """Write all queued messages and close the connection."""
+        if self._flush_task is not None:
+            # Let the loop finish any batch it is writing instead of cancelling it mid-flush
+            self._closing.set()
+            self._wakeup.set()
+            await self._flush_task
+            self._flush_task = None
+            self._closing.clear()
+
+        if self._db is not None:
+            await self.flush()
+            await self._db.close()
+            self._db = None
 
     async def store_message(
         self,
@@ -39,45 +100,75 @@ class MessageStore:
     ) -> str:
         message_id = f"{execution_id}:{node_id}:{datetime.utcnow().timestamp()}"
 
-        async with aiosqlite.connect(self.db_path) as db:
-            await db.execute(
-                """INSERT INTO messages
-                   (id, execution_id, node_id, person_id, content, token_count)
-                   VALUES (?, ?, ?, ?, ?, ?)""",
-                (
-                    message_id,
-                    execution_id,
-                    node_id,
-                    person_id,
-                    json.dumps(content),
-                    token_count,
-                ),
+        await self._connection()
+        self._pending.append(
+            (
+                message_id,
+                execution_id,
+                node_id,
+                person_id,
+                json.dumps(content),
+                token_count,
             )
-            await db.commit()
+        )
+        if self._flush_task is None or self._flush_task.done():
+            self._flush_task = asyncio.create_task(self._flush_loop())
+        self._wakeup.set()
 
         return message_id
 
+    async def flush(self) -> int:
+        """Write all queued messages in one transaction.
+
+        Returns:
+            Number of messages written
+        """
+        async with self._write_lock:
+            if not self._pending:
+                return 0
+            rows, self._pending = self._pending, []
+            db = await self._connection()
+
+            try:
+                await db.executemany(_INSERT_MESSAGE, rows)
+                await db.commit()
+                return len(rows)
+            except sqlite3.IntegrityError:
+                await db.rollback()
+            except BaseException:
+                await db.rollback()
+                # Keep the batch queued so a later flush can retry it, also when cancelled
+                self._pending[:0] = rows
+                raise
+
+            # A duplicate id fails the whole batch; write the rows individually
+            written = 0
+            for row in rows:
+                try:
+                    await db.execute(_INSERT_MESSAGE, row)
+                    written += 1
+                except sqlite3.IntegrityError as e:
+                    logger.warning(f"Dropping message {row[0]}: {e}")
+            await db.commit()
+            return written
+
     async def get_message(self, message_id: str) -> dict[str, Any] | None:
-        async with (
-            aiosqlite.connect(self.db_path) as db,
-            db.execute("SELECT content FROM messages WHERE id = ?", (message_id,)) as cursor,
-        ):
+        db = await self._readable_connection()
+        async with db.execute("SELECT content FROM messages WHERE id = ?", (message_id,)) as cursor:
             row = await cursor.fetchone()
             return json.loads(row[0]) if row else None
 
     async def get_conversation_messages(
         self, execution_id: str, person_id: str
     ) -> list[dict[str, Any]]:
-        async with (
-            aiosqlite.connect(self.db_path) as db,
-            db.execute(
-                """SELECT id, content, token_count, created_at
-                   FROM messages
-                   WHERE execution_id = ? AND person_id = ?
-                   ORDER BY created_at""",
-                (execution_id, person_id),
-            ) as cursor,
-        ):
+        db = await self._readable_connection()
+        async with db.execute(
+            """SELECT id, content, token_count, created_at
+               FROM messages
+               WHERE execution_id = ? AND person_id = ?
+               ORDER BY created_at""",
+            (execution_id, person_id),
+        ) as cursor:
             messages = []
             async for row in cursor:
                 messages.append(
@@ -92,16 +183,14 @@ class MessageStore:
 
     async def get_execution_messages(self, execution_id: str) -> list[dict[str, Any]]:
         """Get all messages for an execution, ordered by creation time."""
-        async with (
-            aiosqlite.connect(self.db_path) as db,
-            db.execute(
-                """SELECT id, node_id, person_id, content, token_count, created_at
-                   FROM messages
-                   WHERE execution_id = ?
-                   ORDER BY created_at""",
-                (execution_id,),
-            ) as cursor,
-        ):
+        db = await self._readable_connection()
+        async with db.execute(
+            """SELECT id, node_id, person_id, content, token_count, created_at
+               FROM messages
+               WHERE execution_id = ?
+               ORDER BY created_at""",
+            (execution_id,),
+        ) as cursor:
             messages = []
             async for row in cursor:
                 messages.append(
@@ -115,3 +204,27 @@ class MessageStore:
                     }
                 )
             return messages
+
+    async def _connection(self) -> aiosqlite.Connection:
+        if self._db is None:
+            await self.initialize()
+        return self._db
+
+    async def _readable_connection(self) -> aiosqlite.Connection:
+        await self.flush()
+        return await self._connection()
+
+    async def _flush_loop(self) -> None:
+        while not self._closing.is_set():
+            await self._wakeup.wait()
+            self._wakeup.clear()
+            if self._closing.is_set():
+                break
+            if len(self._pending) < self.batch_size:
+                # Give concurrent writers a moment to join the batch; close() cuts the wait short
+                with contextlib.suppress(TimeoutError):
+                    await asyncio.wait_for(self._closing.wait(), self.flush_interval)
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to write queued messages: {e}")
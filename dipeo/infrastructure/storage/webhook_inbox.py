@@ -0,0 +1,467 @@
+"""Durable inbox for incoming webhooks.
+
+Webhooks are acknowledged once their raw payload is committed to SQLite, and a
+worker pool processes them afterwards. A delivery is marked done only after its
+handler succeeded, so deliveries that were accepted but not processed when the
+server stopped are processed after it restarts (at-least-once). Deliveries are
+deduplicated by (provider, delivery id) for as long as they are retained, except
+that a redelivery of a dead-lettered webhook is accepted and retried afresh.
+
+A single writer task owns every write. It commits newly accepted deliveries and
+the outcomes of processed ones together, in one transaction per batch, so one
+fsync covers all requests that arrived while the previous batch was committing.
+Each transaction runs as one call on a dedicated database thread.
+Committed deliveries are handed to the workers from memory; the database is only
+read back for deliveries left over from a restart, due retries, or deliveries
+accepted while too many were in flight.
+"""
+
+import asyncio
+import contextlib
+import json
+import math
+import sqlite3
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from dipeo.config.base_logger import get_module_logger
+
+logger = get_module_logger(__name__)
+
+PENDING = "pending"
+DONE = "done"
+DEAD = "dead"
+
+# Outcomes wait this long for a batch to share; a crash replays at most this window
+OUTCOME_FLUSH_DELAY = 0.05
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS webhook_inbox (
+    id INTEGER PRIMARY KEY,
+    provider TEXT NOT NULL,
+    delivery_id TEXT NOT NULL,
+    execution_id TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    body BLOB NOT NULL,
+    received_at REAL NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL DEFAULT 0,
+    processed_at REAL,
+    error TEXT
+);
+CREATE UNIQUE INDEX IF NOT EXISTS idx_webhook_inbox_delivery
+    ON webhook_inbox(provider, delivery_id);
+CREATE INDEX IF NOT EXISTS idx_webhook_inbox_pending
+    ON webhook_inbox(next_attempt_at, id) WHERE status = 'pending';
+DROP INDEX IF EXISTS idx_webhook_inbox_processed;
+CREATE INDEX IF NOT EXISTS idx_webhook_inbox_finished
+    ON webhook_inbox(processed_at) WHERE status IN ('done', 'dead');
+"""
+
+# A redelivery of a dead-lettered webhook revives it; any other repeat is a duplicate
+_INSERT = """INSERT INTO webhook_inbox
+    (provider, delivery_id, execution_id, headers, body, received_at)
+    VALUES (?, ?, ?, ?, ?, ?)
+    ON CONFLICT (provider, delivery_id) DO UPDATE SET
+        execution_id = excluded.execution_id, headers = excluded.headers,
+        body = excluded.body, received_at = excluded.received_at, status = 'pending',
+        attempts = 0, next_attempt_at = 0, processed_at = NULL, error = NULL
+    WHERE status = 'dead'
+    RETURNING id"""
+
+_UPDATE = """UPDATE webhook_inbox
+    SET status = ?, attempts = ?, next_attempt_at = ?, processed_at = ?, error = ?
+    WHERE id = ?"""
+
+
+@dataclass(slots=True)
+class WebhookDelivery:
+    """A webhook accepted into the inbox."""
+
+    id: int
+    provider: str
+    delivery_id: str
+    execution_id: str
+    headers: dict[str, str]
+    body: bytes
+    received_at: float
+    attempts: int = 0
+
+
+@dataclass(slots=True)
+class _Append:
+    delivery: WebhookDelivery
+    future: asyncio.Future
+
+    @property
+    def row(self) -> tuple:
+        d = self.delivery
+        headers = json.dumps(d.headers)
+        return d.provider, d.delivery_id, d.execution_id, headers, d.body, d.received_at
+
+
+WebhookHandler = Callable[[WebhookDelivery], Awaitable[None]]
+
+
+class WebhookInbox:
+    """SQLite-backed webhook queue with a worker pool, retries and deduplication."""
+
+    def __init__(
+        self,
+        db_path: Path,
+        handler: WebhookHandler,
+        workers: int = 4,
+        batch_size: int = 256,
+        max_attempts: int = 5,
+        retry_base_delay: float = 1.0,
+        retry_max_delay: float = 300.0,
+        retention: float = 86400.0,
+    ):
+        """Initialize the inbox; call ``start()`` before use.
+
+        Args:
+            db_path: SQLite database file
+            handler: Coroutine that processes one delivery; raising schedules a retry
+            workers: Deliveries processed concurrently
+            batch_size: Deliveries in flight at once, and loaded per query
+            max_attempts: Attempts before a delivery is dead-lettered
+            retry_base_delay: Seconds before the first retry; doubles per attempt
+            retry_max_delay: Upper bound on the retry delay
+            retention: Seconds processed and dead-lettered deliveries are kept for
+                deduplication
+        """
+        self.db_path = db_path
+        self.handler = handler
+        self.workers = max(workers, 1)
+        self.batch_size = max(batch_size, 1)
+        self.max_attempts = max_attempts
+        self.retry_base_delay = retry_base_delay
+        self.retry_max_delay = retry_max_delay
+        self.retention = retention
+        self._conn: sqlite3.Connection | None = None
+        # One thread runs every statement, so transactions never interleave
+        self._executor: ThreadPoolExecutor | None = None
+        self._appends: list[_Append] = []
+        # Processed deliveries and their error, if any, awaiting commit
+        self._outcomes: list[tuple[WebhookDelivery, str | None]] = []
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # Deliveries handed to the dispatcher and not yet committed as processed
+        self._inflight: set[int] = set()
+        self._ready: deque[WebhookDelivery] = deque()
+        # When pending rows must next be read from the database; inf if none are due
+        self._poll_at = 0.0
+        self._work: asyncio.Queue[WebhookDelivery] = asyncio.Queue(maxsize=self.workers * 2)
+        self._write_wakeup = asyncio.Event()
+        self._dispatch_wakeup = asyncio.Event()
+        self._tasks: list[asyncio.Task] = []
+        self._start_lock = asyncio.Lock()
+        # Makes a transaction and the in-flight bookkeeping after it atomic
+        self._db_lock = asyncio.Lock()
+        self._last_cleanup = 0.0
+        self.accepted = 0
+        self.duplicates = 0
+        self.processed = 0
+        self.failed = 0
+
+    async def start(self) -> None:
+        """Open the database and start the writer, dispatcher and workers."""
+        async with self._start_lock:
+            if self._conn is not None:
+                return
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="webhook-inbox")
+            await self._run(self._open)
+
+            self._poll_at = 0.0
+            self._tasks = [
+                asyncio.create_task(self._write_loop()),
+                asyncio.create_task(self._dispatch_loop()),
+                *(asyncio.create_task(self._worker()) for _ in range(self.workers)),
+            ]
+
+    async def close(self) -> None:
+        """Commit outstanding work and stop; unprocessed deliveries stay pending."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+        if self._conn is not None:
+            with contextlib.suppress(Exception):
+                await self._write_batch()
+            await self._run(self._conn.close)
+            self._conn = None
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        for append in self._appends:
+            if not append.future.done():
+                append.future.set_exception(RuntimeError("Webhook inbox closed"))
+        self._appends.clear()
+        self._ready.clear()
+        self._inflight.clear()
+
+    async def append(
+        self,
+        provider: str,
+        delivery_id: str,
+        headers: dict[str, str],
+        body: bytes,
+        execution_id: str,
+    ) -> bool:
+        """Durably store a webhook for processing.
+
+        Args:
+            provider: Provider name
+            delivery_id: Provider's unique id for this delivery
+            headers: Request headers
+            body: Raw request body
+            execution_id: Execution id the webhook event is published under
+
+        Returns:
+            True if the webhook was stored, False if it was a duplicate delivery
+        """
+        await self.start()
+        delivery = WebhookDelivery(
+            id=0,
+            provider=provider,
+            delivery_id=delivery_id,
+            execution_id=execution_id,
+            headers=headers,
+            body=body,
+            received_at=time.time(),
+        )
+        future = asyncio.get_running_loop().create_future()
+        self._appends.append(_Append(delivery, future))
+        self._write_wakeup.set()
+        return await future
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "accepted": self.accepted,
+            "duplicates": self.duplicates,
+            "processed": self.processed,
+            "failed_attempts": self.failed,
+            "in_flight": len(self._inflight),
+        }
+
+    async def _write_loop(self) -> None:
+        while True:
+            await self._write_wakeup.wait()
+            self._write_wakeup.clear()
+            try:
+                await self._write_batch()
+            except Exception as e:
+                logger.error(f"Failed to write webhook inbox batch: {e}", exc_info=True)
+                await asyncio.sleep(0.1)
+                if self._outcomes:
+                    self._write_wakeup.set()
+
+    async def _write_batch(self) -> None:
+        """Commit queued appends and outcomes in one transaction."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        appends, self._appends = self._appends, []
+        outcomes, self._outcomes = self._outcomes, []
+        if not appends and not outcomes:
+            return
+
+        now = time.time()
+        updates = [self._outcome_row(delivery, error, now) for delivery, error in outcomes]
+        expire_before = None
+        if now - self._last_cleanup >= 60:
+            expire_before = now - self.retention
+            self._last_cleanup = now
+
+        async with self._db_lock:
+            try:
+                row_ids = await self._run(
+                    self._commit, [append.row for append in appends], updates, expire_before
+                )
+            except BaseException as e:
+                # Outcomes are retried with the next batch; appends fail so the sender retries
+                self._outcomes[:0] = outcomes
+                for append in appends:
+                    if not append.future.done():
+                        append.future.set_exception(e)
+                raise
+
+            for (delivery, _), update in zip(outcomes, updates, strict=True):
+                self._inflight.discard(delivery.id)
+                if update[0] == PENDING:
+                    self._poll_at = min(self._poll_at, update[2])
+            for append, row_id in zip(appends, row_ids, strict=True):
+                if row_id is None:
+                    continue
+                append.delivery.id = row_id
+                if len(self._inflight) < self.batch_size:
+                    self._inflight.add(append.delivery.id)
+                    self._ready.append(append.delivery)
+                else:
+                    self._poll_at = 0.0
+
+        for append, row_id in zip(appends, row_ids, strict=True):
+            is_new = row_id is not None
+            if is_new:
+                self.accepted += 1
+            else:
+                self.duplicates += 1
+            if not append.future.done():
+                append.future.set_result(is_new)
+        self._dispatch_wakeup.set()
+
+    async def _run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+
+    def _open(self) -> None:
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        conn.execute("PRAGMA journal_mode=WAL")
+        # An acknowledged webhook must survive a crash, so commits are fsynced
+        conn.execute("PRAGMA synchronous=FULL")
+        conn.executescript(_SCHEMA)
+        self._conn = conn
+
+    def _commit(
+        self, rows: list[tuple], updates: list[tuple], expire_before: float | None
+    ) -> list[int | None]:
+        """Apply outcomes and insert deliveries in one transaction.
+
+        Outcomes go first, so a redelivery in the same batch as its delivery's
+        final failure revives it.
+
+        Returns:
+            Row id of each inserted or revived delivery, or None where it was a
+            duplicate
+        """
+        conn = self._conn
+        with conn:
+            if updates:
+                conn.executemany(_UPDATE, updates)
+            # RETURNING rules out executemany; the statements still share one commit
+            row_ids = [conn.execute(_INSERT, row).fetchone() for row in rows]
+            if expire_before is not None:
+                conn.execute(
+                    "DELETE FROM webhook_inbox WHERE id IN (SELECT id FROM webhook_inbox"
+                    " WHERE status IN ('done', 'dead') AND processed_at < ? LIMIT 1000)",
+                    (expire_before,),
+                )
+        return [row_id[0] if row_id else None for row_id in row_ids]
+
+    def _select_due(self, now: float, limit: int) -> tuple[list[tuple], float | None]:
+        """Read due pending rows and the time the next retry becomes due."""
+        rows = self._conn.execute(
+            "SELECT id, provider, delivery_id, execution_id, headers, body, received_at,"
+            " attempts FROM webhook_inbox WHERE status = 'pending' AND next_attempt_at <= ?"
+            " ORDER BY id LIMIT ?",
+            (now, limit),
+        ).fetchall()
+        (next_due,) = self._conn.execute(
+            "SELECT MIN(next_attempt_at) FROM webhook_inbox"
+            " WHERE status = 'pending' AND next_attempt_at > ?",
+            (now,),
+        ).fetchone()
+        return rows, next_due
+
+    def _outcome_row(self, delivery: WebhookDelivery, error: str | None, now: float) -> tuple:
+        attempts = delivery.attempts + 1
+        if error is None:
+            return DONE, attempts, 0, now, None, delivery.id
+        if attempts >= self.max_attempts:
+            logger.error(
+                f"Webhook {delivery.provider}/{delivery.delivery_id} failed {attempts} times,"
+                f" giving up: {error}"
+            )
+            return DEAD, attempts, 0, now, error, delivery.id
+        delay = min(self.retry_base_delay * 2 ** (attempts - 1), self.retry_max_delay)
+        return PENDING, attempts, now + delay, None, error, delivery.id
+
+    async def _dispatch_loop(self) -> None:
+        """Feed committed deliveries to the workers, reading the database when needed."""
+        while True:
+            self._dispatch_wakeup.clear()
+            while self._ready:
+                await self._work.put(self._ready.popleft())
+
+            timeout = None
+            # At capacity, outcomes being committed wake the dispatcher
+            if len(self._inflight) < self.batch_size:
+                if self._poll_at <= time.time():
+                    try:
+                        if await self._load_due():
+                            continue
+                    except Exception as e:
+                        logger.error(f"Failed to load pending webhooks: {e}", exc_info=True)
+                        self._poll_at = time.time() + 1.0
+                if self._poll_at != math.inf:
+                    timeout = max(self._poll_at - time.time(), 0.01)
+
+            with contextlib.suppress(TimeoutError):
+                await asyncio.wait_for(self._dispatch_wakeup.wait(), timeout=timeout)
+
+    async def _load_due(self) -> bool:
+        """Queue due pending deliveries that are not in flight.
+
+        Returns:
+            True if any delivery was queued
+        """
+        async with self._db_lock:
+            now = time.time()
+            limit = self.batch_size + len(self._inflight)
+            rows, next_due = await self._run(self._select_due, now, limit)
+
+            due = [row for row in rows if row[0] not in self._inflight]
+            room = self.batch_size - len(self._inflight)
+            for row in due[:room]:
+                self._inflight.add(row[0])
+                self._ready.append(
+                    WebhookDelivery(
+                        id=row[0],
+                        provider=row[1],
+                        delivery_id=row[2],
+                        execution_id=row[3],
+                        headers=json.loads(row[4]),
+                        body=row[5],
+                        received_at=row[6],
+                        attempts=row[7],
+                    )
+                )
+
+            if len(rows) == limit or len(due) > room:
+                # More due deliveries than fit; read again once some finish
+                self._poll_at = 0.0
+            else:
+                self._poll_at = math.inf if next_due is None else next_due
+            return bool(due[:room])
+
+    async def _worker(self) -> None:
+        while True:
+            delivery = await self._work.get()
+            error = None
+            try:
+                await self.handler(delivery)
+                self.processed += 1
+            except Exception as e:
+                error = f"{type(e).__name__}: {e}"
+                self.failed += 1
+                logger.warning(
+                    f"Webhook {delivery.provider}/{delivery.delivery_id} attempt"
+                    f" {delivery.attempts + 1} failed: {error}"
+                )
+            finally:
+                self._work.task_done()
+            self._add_outcome(delivery, error)
+
+    def _add_outcome(self, delivery: WebhookDelivery, error: str | None) -> None:
+        self._outcomes.append((delivery, error))
+        if len(self._outcomes) >= self.batch_size // 2:
+            self._write_wakeup.set()
+        elif self._flush_handle is None:
+            self._flush_handle = asyncio.get_running_loop().call_later(
+                OUTCOME_FLUSH_DELAY, self._write_wakeup.set
+            )
@@ -1,12 +1,14 @@
 """Timing infrastructure for DiPeO.
 
-Provides zero-overhead timing collection with decorators and context managers.
+Provides low-overhead timing collection with decorators and context managers, and
+latency histograms exportable in the Prometheus text format.
 """
 
-from dipeo.infrastructure.timing.collector import TimingCollector, timing_collector
+from dipeo.infrastructure.timing.collector import PhaseHistogram, TimingCollector, timing_collector
 from dipeo.infrastructure.timing.context import atime_phase, atimed, time_phase, timed
 
 __all__ = [
+    "PhaseHistogram",
     "TimingCollector",
     "atime_phase",
     "atimed",
@@ -1,24 +1,201 @@
-from collections import defaultdict
-from threading import Lock
+"""In-process timing collector with log-linear latency histograms.
+
+Durations are bucketed HDR-style: values below 64µs get one bucket per
+microsecond, and above that every power-of-two range is split into 32 equal
+sub-buckets, so any recorded value is within ~3% of its bucket. Bucket
+boundaries are fixed, so histograms from different threads merge by adding
+counts.
+
+Each thread records into its own shard without taking a lock; reads merge the
+shards. In an event loop all tasks share the loop thread's shard, and
+``asyncio.to_thread`` workers get shards of their own. When a new shard is
+registered, the shards of threads that have exited are folded into a single
+ownerless shard, so short-lived threads do not accumulate shards. Process-wide per-phase
+histograms are assembled on read from live executions plus the executions
+already popped, so recording updates a single histogram.
+"""
+
+import math
+import os
+import sys
+import tempfile
+import threading
+import weakref
+from pathlib import Path
 from typing import Any
 
+_SUB_BUCKET_BITS = 5
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_LINEAR_LIMIT_US = _SUB_BUCKETS << 1
+# Durations are clamped to 2^40µs (~12.7 days)
+_MAX_SHIFT = 40 - _SUB_BUCKET_BITS - 1
+_MAX_BUCKET = (_MAX_SHIFT << _SUB_BUCKET_BITS) + _LINEAR_LIMIT_US - 1
+
+# Prometheus bucket bounds: powers of two from ~1ms to ~18min, each an exact
+# boundary of the fine buckets
+_EXPORT_BOUNDS_US = tuple(1 << n for n in range(10, 31))
+
+DEFAULT_QUANTILES = (0.5, 0.95, 0.99)
+
+
+def bucket_index(micros: int) -> int:
+    """Fine bucket holding a duration in microseconds."""
+    if micros < _LINEAR_LIMIT_US:
+        return max(micros, 0)
+    shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+    if shift > _MAX_SHIFT:
+        return _MAX_BUCKET
+    return (shift << _SUB_BUCKET_BITS) + (micros >> shift)
+
+
+def bucket_bounds(index: int) -> tuple[int, int]:
+    """Lower (inclusive) and upper (exclusive) microsecond bounds of a fine bucket."""
+    if index < _LINEAR_LIMIT_US:
+        return index, index + 1
+    shift = (index >> _SUB_BUCKET_BITS) - 1
+    mantissa = index - (shift << _SUB_BUCKET_BITS)
+    return mantissa << shift, (mantissa + 1) << shift
+
+
+class PhaseHistogram:
+    """Duration statistics of one timed phase.
+
+    ``total_ms`` and ``max_ms`` accumulate whole milliseconds, as the collector
+    always has; ``total_seconds`` keeps the unrounded sum and the histogram keeps
+    microsecond resolution.
+    """
+
+    __slots__ = ("buckets", "count", "max_ms", "metadata", "total_ms", "total_seconds")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total_ms = 0
+        self.total_seconds = 0.0
+        self.max_ms = 0
+        self.buckets: dict[int, int] = {}
+        self.metadata: dict[str, Any] | None = None
+
+    def add(self, dur_ms: float) -> None:
+        rounded = round(dur_ms)
+        self.count += 1
+        self.total_ms += rounded
+        self.total_seconds += dur_ms / 1000
+        if rounded > self.max_ms:
+            self.max_ms = rounded
+
+        # Inlined bucket_index: this is the recording hot path
+        micros = int(dur_ms * 1000)
+        if micros < _LINEAR_LIMIT_US:
+            index = max(micros, 0)
+        else:
+            shift = micros.bit_length() - _SUB_BUCKET_BITS - 1
+            index = (
+                _MAX_BUCKET
+                if shift > _MAX_SHIFT
+                else (shift << _SUB_BUCKET_BITS) + (micros >> shift)
+            )
+        buckets = self.buckets
+        buckets[index] = buckets.get(index, 0) + 1
+
+    def merge(self, other: "PhaseHistogram") -> None:
+        self.count += other.count
+        self.total_ms += other.total_ms
+        self.total_seconds += other.total_seconds
+        self.max_ms = max(self.max_ms, other.max_ms)
+        for index, count in list(other.buckets.items()):
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        if other.metadata:
+            self.metadata = other.metadata
+
+    def quantile(self, q: float) -> float:
+        """Estimate a quantile in milliseconds.
+
+        Args:
+            q: Quantile between 0.0 and 1.0
+
+        Returns:
+            Midpoint of the bucket holding the quantile, or 0.0 when empty
+        """
+        total = sum(self.buckets.values())
+        if total == 0:
+            return 0.0
+        rank = max(1, math.ceil(q * total))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                lower, upper = bucket_bounds(index)
+                return (lower + upper - 1) / 2000
+        return self.max_ms
+
+    def cumulative_counts(self, bounds_us: tuple[int, ...]) -> list[int]:
+        """Number of samples at or below each bound; bounds must be fine bucket edges."""
+        counts = [0] * len(bounds_us)
+        for index, count in self.buckets.items():
+            upper = bucket_bounds(index)[1]
+            for position, bound in enumerate(bounds_us):
+                if upper <= bound:
+                    counts[position] += count
+        return counts
+
+
+class _Shard:
+    """Timing data recorded by one thread, or by threads that have exited."""
+
+    __slots__ = ("executions", "owner")
+
+    def __init__(self, owner: threading.Thread | None = None) -> None:
+        self.executions: dict[str, dict[tuple[str, str], PhaseHistogram]] = {}
+        self.owner = weakref.ref(owner) if owner is not None else None
+
+    def is_orphaned(self) -> bool:
+        if self.owner is None:
+            return False
+        thread = self.owner()
+        return thread is None or not thread.is_alive()
+
+    def absorb(self, other: "_Shard") -> None:
+        for exec_id, histograms in other.executions.items():
+            nodes = self.executions.setdefault(exec_id, {})
+            for key, histogram in histograms.items():
+                target = nodes.get(key)
+                if target is None:
+                    nodes[key] = histogram
+                else:
+                    target.merge(histogram)
+
+
+def _merge_shards(parts: list[dict[Any, PhaseHistogram]]) -> dict[Any, PhaseHistogram]:
+    merged: dict[Any, PhaseHistogram] = {}
+    for part in parts:
+        for key, histogram in list(part.items()):
+            target = merged.get(key)
+            if target is None:
+                target = merged[key] = PhaseHistogram()
+            target.merge(histogram)
+    return merged
+
 
 class TimingCollector:
     """In-process singleton for collecting timing metrics.
 
-    Thread-safe collector keyed by exec_id. No file I/O, no parsing.
+    Keeps per-execution histograms keyed by exec_id, node and phase, and
+    process-wide histograms per phase for export. No file I/O on record.
     """
 
     _instance = None
-    _lock = Lock()
+    _lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
             with cls._lock:
                 if cls._instance is None:
                     cls._instance = super().__new__(cls)
-                    cls._instance._data = defaultdict(lambda: defaultdict(dict))
-                    cls._instance._data_lock = Lock()
+                    cls._instance._local = threading.local()
+                    # The first shard collects the data of exited threads
+                    cls._instance._shards = [_Shard()]
+                    cls._instance._shards_lock = threading.Lock()
+                    cls._instance._retired_phases = {}
         return cls._instance
 
     def record(
@@ -30,57 +207,192 @@ class TimingCollector:
             exec_id: Execution ID
             node_id: Node ID (use "system" for non-node phases)
             phase: Phase name (e.g., "input_extraction", "llm_completion")
-            dur_ms: Duration in milliseconds (will be rounded to integer)
+            dur_ms: Duration in milliseconds (totals are kept in whole milliseconds)
             **metadata: Additional context (model, token_count, etc.)
         """
-        # Round to integer milliseconds (show 0 for sub-millisecond operations)
-        dur_ms_int = round(dur_ms)
-
-        with self._data_lock:
-            if phase in self._data[exec_id][node_id]:
-                # Accumulate if phase runs multiple times
-                self._data[exec_id][node_id][phase] += dur_ms_int
-                # Track count of occurrences
-                count_key = f"{phase}__count"
-                self._data[exec_id][node_id][count_key] = (
-                    self._data[exec_id][node_id].get(count_key, 1) + 1
-                )
-                # Track maximum individual duration
-                max_key = f"{phase}__max"
-                self._data[exec_id][node_id][max_key] = max(
-                    self._data[exec_id][node_id].get(max_key, 0), dur_ms_int
-                )
-            else:
-                self._data[exec_id][node_id][phase] = dur_ms_int
-                # Initialize count
-                count_key = f"{phase}__count"
-                self._data[exec_id][node_id][count_key] = 1
-                # Initialize max with first value
-                max_key = f"{phase}__max"
-                self._data[exec_id][node_id][max_key] = dur_ms_int
-
-            # Store metadata separately if provided
-            if metadata:
-                meta_key = f"{phase}_metadata"
-                self._data[exec_id][node_id][meta_key] = metadata
+        try:
+            shard = self._local.shard
+        except AttributeError:
+            shard = self._register_shard()
+
+        nodes = shard.executions.get(exec_id)
+        if nodes is None:
+            nodes = shard.executions[sys.intern(exec_id)] = {}
+        key = (node_id, phase)
+        histogram = nodes.get(key)
+        if histogram is None:
+            key = (sys.intern(node_id), sys.intern(phase))
+            histogram = nodes[key] = PhaseHistogram()
+        histogram.add(dur_ms)
+        if metadata:
+            histogram.metadata = metadata
 
     def get(self, exec_id: str) -> dict[str, dict[str, float]]:
         """Get all timing data for an execution (non-destructive)."""
-        with self._data_lock:
-            return dict(self._data.get(exec_id, {}))
+        with self._shards_lock:
+            parts = [shard.executions.get(exec_id) or {} for shard in self._shards]
+        return self._format(_merge_shards(parts))
 
     def pop(self, exec_id: str) -> dict[str, dict[str, float]]:
         """Get and remove timing data for an execution."""
-        with self._data_lock:
-            return dict(self._data.pop(exec_id, {}))
+        with self._shards_lock:
+            parts = [shard.executions.pop(exec_id, None) or {} for shard in self._shards]
+            histograms = _merge_shards(parts)
+            self._retire(histograms)
+        return self._format(histograms)
 
     def clear(self, exec_id: str | None = None) -> None:
-        """Clear data for specific exec_id or all data."""
-        with self._data_lock:
-            if exec_id:
-                self._data.pop(exec_id, None)
-            else:
-                self._data.clear()
+        """Clear data for specific exec_id, or all data including phase histograms."""
+        with self._shards_lock:
+            for shard in self._shards:
+                if exec_id:
+                    self._retire(shard.executions.pop(exec_id, None) or {})
+                else:
+                    shard.executions.clear()
+            if not exec_id:
+                self._retired_phases.clear()
+
+    def histograms(self, exec_id: str) -> dict[tuple[str, str], PhaseHistogram]:
+        """Merged histograms of an execution keyed by (node_id, phase)."""
+        with self._shards_lock:
+            parts = [shard.executions.get(exec_id) or {} for shard in self._shards]
+        return _merge_shards(parts)
+
+    def phase_histograms(self) -> dict[str, PhaseHistogram]:
+        """Merged process-wide histograms keyed by phase."""
+        with self._shards_lock:
+            parts = [self._retired_phases]
+            for shard in self._shards:
+                for histograms in list(shard.executions.values()):
+                    parts.append(
+                        {(phase,): histogram for (_, phase), histogram in list(histograms.items())}
+                    )
+            merged = _merge_shards(parts)
+        return {key[0]: histogram for key, histogram in merged.items()}
+
+    def percentiles(
+        self,
+        exec_id: str,
+        node_id: str,
+        phase: str,
+        quantiles: tuple[float, ...] = DEFAULT_QUANTILES,
+    ) -> dict[float, float]:
+        """Latency percentiles of a phase within one execution.
+
+        Args:
+            exec_id: Execution ID
+            node_id: Node ID
+            phase: Phase name
+            quantiles: Quantiles to estimate
+
+        Returns:
+            Quantile to duration in milliseconds; empty if the phase was not recorded
+        """
+        histogram = self.histograms(exec_id).get((node_id, phase))
+        if histogram is None:
+            return {}
+        return {q: histogram.quantile(q) for q in quantiles}
+
+    def render_prometheus(self, quantiles: tuple[float, ...] = DEFAULT_QUANTILES) -> str:
+        """Render process-wide phase histograms in the Prometheus text format."""
+        histograms = self.phase_histograms()
+        if not histograms:
+            return ""
+
+        lines = [
+            "# HELP dipeo_phase_duration_seconds Duration of timed DiPeO phases.",
+            "# TYPE dipeo_phase_duration_seconds histogram",
+        ]
+        for phase in sorted(histograms):
+            histogram = histograms[phase]
+            label = _escape_label(phase)
+            counts = histogram.cumulative_counts(_EXPORT_BOUNDS_US)
+            for bound, count in zip(_EXPORT_BOUNDS_US, counts, strict=True):
+                lines.append(
+                    f'dipeo_phase_duration_seconds_bucket{{phase="{label}",le="{bound / 1e6}"}} '
+                    f"{count}"
+                )
+            lines.append(
+                f'dipeo_phase_duration_seconds_bucket{{phase="{label}",le="+Inf"}} '
+                f"{histogram.count}"
+            )
+            lines.append(
+                f'dipeo_phase_duration_seconds_sum{{phase="{label}"}} {histogram.total_seconds}'
+            )
+            lines.append(f'dipeo_phase_duration_seconds_count{{phase="{label}"}} {histogram.count}')
+
+        lines.append(
+            "# HELP dipeo_phase_duration_quantile_seconds Estimated phase duration quantiles."
+        )
+        lines.append("# TYPE dipeo_phase_duration_quantile_seconds gauge")
+        for phase in sorted(histograms):
+            label = _escape_label(phase)
+            for q in quantiles:
+                value = histograms[phase].quantile(q) / 1000
+                lines.append(
+                    f'dipeo_phase_duration_quantile_seconds{{phase="{label}",quantile="{q}"}} '
+                    f"{value}"
+                )
+        return "\n".join(lines) + "\n"
+
+    def write_prometheus_textfile(self, path: str | Path) -> None:
+        """Atomically write the Prometheus export, e.g. for node_exporter's textfile collector.
+
+        Args:
+            path: Destination file
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(self.render_prometheus())
+            Path(tmp_path).replace(path)
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+
+    def _retire(self, histograms: dict[tuple[str, str], PhaseHistogram]) -> None:
+        """Fold a finished execution into the process-wide phase histograms."""
+        for (_, phase), histogram in histograms.items():
+            target = self._retired_phases.get((phase,))
+            if target is None:
+                target = self._retired_phases[(phase,)] = PhaseHistogram()
+            target.merge(histogram)
+
+    def _register_shard(self) -> _Shard:
+        shard = _Shard(threading.current_thread())
+        with self._shards_lock:
+            # An exited thread no longer writes to its shard, so it can be merged
+            orphans = self._shards[0]
+            live = [orphans]
+            for other in self._shards[1:]:
+                if other.is_orphaned():
+                    orphans.absorb(other)
+                else:
+                    live.append(other)
+            live.append(shard)
+            self._shards = live
+        self._local.shard = shard
+        return shard
+
+    @staticmethod
+    def _format(
+        histograms: dict[tuple[str, str], PhaseHistogram],
+    ) -> dict[str, dict[str, float]]:
+        data: dict[str, dict[str, Any]] = {}
+        for (node_id, phase), histogram in histograms.items():
+            phases = data.setdefault(node_id, {})
+            phases[phase] = histogram.total_ms
+            phases[f"{phase}__count"] = histogram.count
+            phases[f"{phase}__max"] = histogram.max_ms
+            if histogram.metadata:
+                phases[f"{phase}_metadata"] = histogram.metadata
+        return data
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
 
 
 # Global singleton instance
@@ -39,8 +39,7 @@ def time_phase(exec_id: str, node_id: str, phase: str, **metadata: Any):
         raise
     finally:
         dur_ms = (time.perf_counter_ns() - start) / 1_000_000
-        dur_ms_int = round(dur_ms)
-        timing_collector.record(exec_id, node_id, phase, dur_ms_int, **metadata)
+        timing_collector.record(exec_id, node_id, phase, dur_ms, **metadata)
 
 
 @asynccontextmanager
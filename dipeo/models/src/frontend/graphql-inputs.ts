@@ -157,6 +157,20 @@ export type UpdateNodeStateInput = {
   status: Status;
 };
 
+// One entry of a bulk node state update
+export type NodeStateUpdateInput = {
+  error?: InputMaybe<Scalars['String']['input']>;
+  node_id: Scalars['ID']['input'];
+  output?: InputMaybe<Scalars['JSON']['input']>;
+  status: Status;
+};
+
+// Node state updates applied in order
+export type UpdateNodeStatesInput = {
+  execution_id: Scalars['ID']['input'];
+  updates: Array<NodeStateUpdateInput>;
+};
+
 // Interactive response input
 export type InteractiveResponseInput = {
   execution_id: Scalars['ID']['input'];
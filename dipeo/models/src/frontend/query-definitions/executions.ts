@@ -169,6 +169,22 @@ export const executionQueries: EntityQueryDefinitions = {
           ]
         }
       ]
+    },
+    {
+      name: 'UpdateNodeStates',
+      type: QueryOperationType.MUTATION,
+      variables: [
+        { name: 'input', type: 'UpdateNodeStatesInput', required: true }
+      ],
+      fields: [
+        {
+          name: 'updateNodeStates',
+          args: [
+            { name: 'input', value: 'input', isVariable: true }
+          ],
+          fields: RESULT_FIELDS
+        }
+      ]
     }
   ]
 };
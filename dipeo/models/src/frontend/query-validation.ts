@@ -106,12 +106,14 @@ const GRAPHQL_INPUT_TYPES = new Set([
   'ExecutionControlInput',
   'ExecutionFilterInput',
   'InteractiveResponseInput',
+  'NodeStateUpdateInput',
   'PersonLLMConfigInput',
   'RegisterCliSessionInput',
   'TestIntegrationInput',
   'UnregisterCliSessionInput',
   'UpdateNodeInput',
   'UpdateNodeStateInput',
+  'UpdateNodeStatesInput',
   'UpdatePersonInput',
   'Vec2Input'
 ]);
@@ -233,6 +235,7 @@ const MUTATION_OPERATIONS: Record<string, string> = {
   controlExecution: 'ExecutionResult',
   sendInteractiveResponse: 'ExecutionResult',
   updateNodeState: 'ExecutionResult',
+  updateNodeStates: 'ExecutionResult',
   uploadFile: 'JSON',
   uploadDiagram: 'JSON',
   validateDiagram: 'JSON',
@@ -14,7 +14,7 @@ from .config import DEFAULT_MCP_TIMEOUT, PROJECT_ROOT, mcp_server
 from .discovery import register_diagram_tools
 from .resources import list_diagrams
 from .routers import create_info_router, create_messages_router
-from .tools import dipeo_run, fetch, run_backend, search, see_result
+from .tools import cancel_backend, dipeo_run, fetch, run_backend, search, see_result
 
 logger = get_module_logger(__name__)
 
@@ -27,6 +27,7 @@ except Exception as e:
 __all__ = [
     "DEFAULT_MCP_TIMEOUT",
     "PROJECT_ROOT",
+    "cancel_backend",
     "create_info_router",
     "create_messages_router",
     "dipeo_run",
@@ -0,0 +1,338 @@
+"""In-process execution of run_backend diagrams.
+
+run_backend used to spawn a CLI subprocess per call, which re-imported DiPeO and
+built a fresh container before the first node could start. The manager instead
+queues the execution on the server's own container: a fixed number of workers run
+queued diagrams as asyncio tasks, admission is refused once the queue is full, and
+a queued or running execution can be cancelled by its session id. Executions write
+to the server's state store, so see_result reads their live state.
+"""
+
+import asyncio
+import time
+import uuid
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass, field
+from typing import Any
+
+from dipeo.config.base_logger import get_module_logger
+
+from .config import BACKGROUND_MAX_QUEUED, BACKGROUND_MAX_WORKERS
+
+logger = get_module_logger(__name__)
+
+# Finished jobs remembered for see_result; older ones are only in the state store
+FINISHED_JOBS_RETAINED = 1000
+
+QUEUED = "queued"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+CANCELLED = "cancelled"
+TIMED_OUT = "timeout"
+
+
+class BackgroundQueueFullError(Exception):
+    """Raised when an execution is submitted while the queue is at capacity."""
+
+
+@dataclass(slots=True)
+class BackgroundJob:
+    """A diagram execution submitted through run_backend."""
+
+    session_id: str
+    diagram: str
+    format_type: str | None
+    input_data: dict[str, Any]
+    timeout: int
+    status: str = QUEUED
+    error: str | None = None
+    submitted_at: float = field(default_factory=time.monotonic)
+    started_at: float | None = None
+    finished_at: float | None = None
+    task: asyncio.Task | None = field(default=None, repr=False)
+
+    @property
+    def is_finished(self) -> bool:
+        return self.status not in (QUEUED, RUNNING)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the job for MCP responses."""
+        data: dict[str, Any] = {
+            "session_id": self.session_id,
+            "diagram": self.diagram,
+            "status": self.status,
+        }
+        if self.started_at is not None:
+            data["queue_wait_ms"] = round((self.started_at - self.submitted_at) * 1000, 3)
+        if self.finished_at is not None and self.started_at is not None:
+            data["duration_ms"] = round((self.finished_at - self.started_at) * 1000, 3)
+        if self.error:
+            data["error"] = self.error
+        return data
+
+
+JobRunner = Callable[[BackgroundJob], Awaitable[bool]]
+
+
+class BackgroundExecutionManager:
+    """Bounded worker pool that runs submitted diagrams on the server container."""
+
+    def __init__(
+        self,
+        runner: JobRunner | None = None,
+        max_workers: int = BACKGROUND_MAX_WORKERS,
+        max_queued: int = BACKGROUND_MAX_QUEUED,
+    ):
+        """Initialize the manager.
+
+        Args:
+            runner: Coroutine that executes a job and returns whether it succeeded;
+                defaults to running the diagram on the server container
+            max_workers: Executions run concurrently
+            max_queued: Submitted executions allowed to wait for a worker
+        """
+        self.max_workers = max(max_workers, 1)
+        self.max_queued = max(max_queued, 0)
+        self._runner = runner or self._run_diagram
+        # Only executions on the server container have state to update when stopped
+        self._records_state = runner is None
+        self._queue: asyncio.Queue[BackgroundJob] | None = None
+        self._workers: list[asyncio.Task] = []
+        self._jobs: dict[str, BackgroundJob] = {}
+        self._finished: OrderedDict[str, BackgroundJob] = OrderedDict()
+        self._queued = 0
+        self._loader = None
+        self._closed = False
+
+    def submit(
+        self,
+        diagram: str,
+        input_data: dict[str, Any] | None = None,
+        format_type: str | None = None,
+        timeout: int = 300,
+    ) -> BackgroundJob:
+        """Queue a diagram execution.
+
+        Args:
+            diagram: Diagram name or path
+            input_data: Input variables for the diagram
+            format_type: Diagram format ("light", "native" or "readable")
+            timeout: Execution timeout in seconds, counted from when a worker starts it
+
+        Returns:
+            The queued job; its session_id is the execution id
+
+        Raises:
+            BackgroundQueueFullError: If every worker is busy and the queue is full
+        """
+        if self._closed:
+            raise RuntimeError("Background execution manager is shut down")
+        if len(self._jobs) >= self.max_workers + self.max_queued:
+            raise BackgroundQueueFullError(
+                f"Too many background executions queued ({self._queued}); try again later"
+            )
+
+        self._ensure_workers()
+        job = BackgroundJob(
+            session_id=f"exec_{uuid.uuid4().hex}",
+            diagram=diagram,
+            format_type=format_type,
+            input_data=input_data or {},
+            timeout=timeout,
+        )
+        self._jobs[job.session_id] = job
+        self._queued += 1
+        self._queue.put_nowait(job)
+        return job
+
+    def get(self, session_id: str) -> BackgroundJob | None:
+        """Look up a job that is queued, running or recently finished."""
+        return self._jobs.get(session_id) or self._finished.get(session_id)
+
+    async def cancel(self, session_id: str) -> BackgroundJob | None:
+        """Cancel a queued or running execution.
+
+        Args:
+            session_id: Session id returned by ``submit``
+
+        Returns:
+            The job, or None if the session is unknown
+        """
+        job = self.get(session_id)
+        if job is None or job.is_finished:
+            return job
+
+        if job.status == QUEUED:
+            # The worker that dequeues it skips it
+            self._queued -= 1
+            self._finish(job, CANCELLED, "Cancelled before it started")
+        elif job.task is not None:
+            task = job.task
+            task.cancel()
+            await asyncio.wait({task})
+            if not job.is_finished:
+                # Cancelled before its first step, so _execute never ran
+                self._finish(job, CANCELLED, "Cancelled")
+        return job
+
+    async def shutdown(self) -> None:
+        """Cancel queued and running executions and stop the workers."""
+        self._closed = True
+        for session_id in list(self._jobs):
+            await self.cancel(session_id)
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers.clear()
+
+    def get_stats(self) -> dict[str, Any]:
+        return {
+            "workers": self.max_workers,
+            "running": self._busy(),
+            "queued": self._queued,
+            "max_queued": self.max_queued,
+            "finished_retained": len(self._finished),
+        }
+
+    def _busy(self) -> int:
+        return len(self._jobs) - self._queued
+
+    def _ensure_workers(self) -> None:
+        if self._queue is None:
+            self._queue = asyncio.Queue()
+        self._workers = [worker for worker in self._workers if not worker.done()]
+        while len(self._workers) < self.max_workers:
+            self._workers.append(asyncio.create_task(self._worker()))
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                if job.status != QUEUED:
+                    continue
+                self._queued -= 1
+                job.status = RUNNING
+                job.started_at = time.monotonic()
+                job.task = asyncio.create_task(self._execute(job))
+                # wait() instead of await so cancelling the job leaves the worker running
+                await asyncio.wait({job.task})
+            finally:
+                self._queue.task_done()
+
+    async def _execute(self, job: BackgroundJob) -> None:
+        try:
+            success = await asyncio.wait_for(self._runner(job), timeout=job.timeout)
+            self._finish(job, COMPLETED if success else FAILED, job.error)
+        except TimeoutError:
+            message = f"Execution timed out after {job.timeout} seconds"
+            self._finish(job, TIMED_OUT, message)
+            await self._mark_aborted(job, message, timed_out=True)
+        except asyncio.CancelledError:
+            self._finish(job, CANCELLED, "Cancelled")
+            await self._mark_aborted(job, "Execution cancelled")
+        except Exception as e:
+            logger.error(f"Background execution {job.session_id} failed: {e}", exc_info=True)
+            self._finish(job, FAILED, str(e))
+
+    def _finish(self, job: BackgroundJob, status: str, error: str | None = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.monotonic()
+        job.task = None
+        self._jobs.pop(job.session_id, None)
+        self._finished[job.session_id] = job
+        while len(self._finished) > FINISHED_JOBS_RETAINED:
+            self._finished.popitem(last=False)
+
+    async def _run_diagram(self, job: BackgroundJob) -> bool:
+        """Execute the job's diagram on the server container."""
+        from dipeo.application.execution import ExecuteDiagramUseCase
+        from dipeo.application.registry.keys import DIAGRAM_PORT, MESSAGE_ROUTER, STATE_STORE
+        from dipeo.infrastructure.diagram.drivers import DiagramLoader
+        from server.app_context import get_container
+
+        registry = get_container().registry
+        state_store = registry.resolve(STATE_STORE)
+        integrated_service = registry.resolve(DIAGRAM_PORT)
+        if integrated_service and hasattr(integrated_service, "initialize"):
+            await integrated_service.initialize()
+
+        if self._loader is None:
+            self._loader = DiagramLoader()
+        domain_diagram, diagram_data, _ = await self._loader.load_and_deserialize(
+            job.diagram, job.format_type
+        )
+        if not domain_diagram:
+            raise ValueError("Failed to load diagram")
+
+        options = {
+            "variables": job.input_data,
+            "debug_mode": False,
+            "max_iterations": 100,
+            "timeout_seconds": job.timeout,
+            "diagram_source_path": job.diagram,
+        }
+        if isinstance(diagram_data, dict) and diagram_data.get("llm_cache"):
+            options["llm_cache"] = diagram_data["llm_cache"]
+
+        use_case = ExecuteDiagramUseCase(
+            service_registry=registry,
+            state_store=state_store,
+            message_router=registry.resolve(MESSAGE_ROUTER),
+        )
+        last_update = None
+        async for update in use_case.execute_diagram(
+            diagram=domain_diagram,
+            options=options,
+            execution_id=job.session_id,
+        ):
+            last_update = update
+
+        if last_update and last_update.get("type") == "execution_error":
+            job.error = last_update.get("error")
+            return False
+        return True
+
+    async def _mark_aborted(self, job: BackgroundJob, message: str, timed_out: bool = False):
+        """Record a stopped execution in the state store and notify subscribers."""
+        if not self._records_state:
+            return
+        try:
+            from dipeo.application.registry.keys import EVENT_BUS, STATE_STORE
+            from dipeo.diagram_generated.enums import Status
+            from dipeo.domain.events import execution_error
+            from server.app_context import get_container
+
+            registry = get_container().registry
+            state_store = registry.resolve(STATE_STORE)
+            state = await state_store.get_state(job.session_id)
+            if state is None or state.status not in (Status.PENDING, Status.RUNNING):
+                return
+            status = Status.FAILED if timed_out else Status.ABORTED
+            await state_store.update_status(job.session_id, status, error=message)
+            await registry.resolve(EVENT_BUS).publish(
+                execution_error(execution_id=job.session_id, error_message=message)
+            )
+        except Exception as e:
+            logger.warning(f"Could not record stop of execution {job.session_id}: {e}")
+
+
+_manager: BackgroundExecutionManager | None = None
+
+
+def get_background_manager() -> BackgroundExecutionManager:
+    """Return the server's background execution manager, creating it on first use."""
+    global _manager
+    if _manager is None:
+        _manager = BackgroundExecutionManager()
+    return _manager
+
+
+async def shutdown_background_manager() -> None:
+    """Cancel outstanding background executions; called on server shutdown."""
+    global _manager
+    if _manager is not None:
+        await _manager.shutdown()
+        _manager = None
@@ -0,0 +1,570 @@
+"""In-memory catalog of the diagrams exposed through MCP.
+
+The catalog indexes the diagram directories once: name, path, format, node
+types, person names and a token index over names, node labels, node types and
+persons. It stays fresh with mtime checks. A directory whose mtime changed (a
+file was added, removed or renamed) is rescanned on the next call, and all
+directories are re-stat'ed at most every ``refresh_interval`` seconds to pick
+up in-place edits. Only files whose mtime or size changed are parsed again.
+File contents are cached by mtime for fetch.
+"""
+
+import bisect
+import heapq
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Iterator, Sequence
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from dipeo.config.base_logger import get_module_logger
+from dipeo.domain.diagram.utils.conversion.format_converters import YamlSafeLoader
+
+from .config import PROJECT_ROOT
+
+logger = get_module_logger(__name__)
+
+DIAGRAM_SUFFIXES = {".yaml": "light", ".json": "native"}
+
+# Searched in this order; earlier roots win ties and name lookups
+DEFAULT_ROOTS = (
+    (PROJECT_ROOT / "projects" / "mcp-diagrams", "mcp-diagrams"),
+    (PROJECT_ROOT / "examples" / "simple_diagrams", "examples"),
+)
+
+_CAMEL_BOUNDARY = re.compile(r"([a-z0-9])([A-Z])")
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+# Ranking for a query matching the diagram name or path; token matches add to these
+SCORE_EXACT_NAME = 100
+SCORE_NAME_PREFIX = 80
+SCORE_NAME_SUBSTRING = 60
+SCORE_PATH_SUBSTRING = 30
+SCORE_TOKEN = 10
+SCORE_TOKEN_PREFIX = 5
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into lowercase alphanumeric tokens, breaking camelCase words."""
+    return _TOKEN.findall(_CAMEL_BOUNDARY.sub(r"\1 \2", text).lower())
+
+
+@dataclass(slots=True)
+class CatalogEntry:
+    """Index record for one diagram file."""
+
+    name: str
+    path: str
+    format: str
+    location: str
+    mtime_ns: int
+    size: int
+    node_types: tuple[str, ...] = ()
+    persons: tuple[str, ...] = ()
+    tokens: frozenset[str] = frozenset()
+    # Position of the entry's root in the catalog, for ordering equal scores
+    rank: int = 0
+    name_lower: str = field(init=False)
+    # Lowercase path relative to the project root, for substring matches
+    search_path: str = field(init=False)
+    summary: dict[str, Any] = field(init=False)
+
+    def __post_init__(self) -> None:
+        self.name_lower = self.name.lower()
+        self.search_path = _relative(self.path).lower()
+        self.summary = {
+            "name": self.name,
+            "path": self.path,
+            "format": self.format,
+            "location": self.location,
+            "node_types": list(self.node_types),
+            "persons": list(self.persons),
+        }
+
+    @property
+    def sort_key(self) -> tuple[int, str, str]:
+        return self.rank, self.name, self.path
+
+
+def _relative(path: str) -> str:
+    try:
+        return os.path.relpath(path, PROJECT_ROOT)
+    except ValueError:
+        return path
+
+
+def _describe(data: Any) -> tuple[tuple[str, ...], tuple[str, ...], list[str]]:
+    """Extract node types, person names and node labels from a parsed diagram."""
+    if not isinstance(data, dict):
+        return (), (), []
+
+    nodes = data.get("nodes") or []
+    if isinstance(nodes, dict):
+        nodes = list(nodes.values())
+    node_types: dict[str, None] = {}
+    labels: list[str] = []
+    for node in nodes if isinstance(nodes, list) else ():
+        if not isinstance(node, dict):
+            continue
+        node_type = node.get("type")
+        if node_type:
+            node_types[str(node_type).lower()] = None
+        node_data = node.get("data") if isinstance(node.get("data"), dict) else {}
+        label = node.get("label") or node_data.get("label")
+        if label:
+            labels.append(str(label))
+
+    persons: dict[str, None] = {}
+    raw_persons = data.get("persons") or {}
+    if isinstance(raw_persons, dict):
+        for key, person in raw_persons.items():
+            label = person.get("label") if isinstance(person, dict) else None
+            persons[str(label or key)] = None
+    elif isinstance(raw_persons, list):
+        for person in raw_persons:
+            if isinstance(person, dict):
+                label = person.get("label") or person.get("name") or person.get("id")
+                if label:
+                    persons[str(label)] = None
+
+    return tuple(node_types), tuple(persons), labels
+
+
+def _skip(events: Iterator[yaml.Event], start: yaml.Event) -> None:
+    """Consume the rest of a YAML node whose first event is ``start``."""
+    if not isinstance(start, yaml.CollectionStartEvent):
+        return
+    depth = 1
+    for event in events:
+        if isinstance(event, yaml.CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, yaml.CollectionEndEvent):
+            depth -= 1
+            if not depth:
+                return
+
+
+def _mapping_items(events: Iterator[yaml.Event]) -> Iterator[tuple[str | None, yaml.Event]]:
+    """Yield (key, first value event) pairs of a mapping whose start was consumed.
+
+    The caller consumes each value, with ``_skip`` if it is not needed.
+    """
+    for key in events:
+        if isinstance(key, yaml.MappingEndEvent):
+            return
+        if isinstance(key, yaml.ScalarEvent):
+            yield key.value, next(events)
+        else:
+            _skip(events, key)
+            yield None, next(events)
+
+
+def _sequence_items(events: Iterator[yaml.Event]) -> Iterator[yaml.Event]:
+    """Yield the first event of each item of a sequence whose start was consumed."""
+    for event in events:
+        if isinstance(event, yaml.SequenceEndEvent):
+            return
+        yield event
+
+
+def _scalar_fields(
+    events: Iterator[yaml.Event], keys: tuple[str, ...], nested: str | None = None
+) -> dict[str, str]:
+    """Read scalar values of ``keys`` from a mapping, and from its ``nested`` mapping."""
+    fields: dict[str, str] = {}
+    for key, value in _mapping_items(events):
+        if key in keys and isinstance(value, yaml.ScalarEvent):
+            fields[key] = value.value
+        elif key is not None and key == nested and isinstance(value, yaml.MappingStartEvent):
+            for inner_key, inner_value in _scalar_fields(events, keys).items():
+                fields.setdefault(inner_key, inner_value)
+        else:
+            _skip(events, value)
+    return fields
+
+
+def _describe_yaml(content: str) -> tuple[tuple[str, ...], tuple[str, ...], list[str]]:
+    """Like ``_describe`` for YAML text, reading the parser events without building objects.
+
+    Constructing Python objects is most of the cost of loading a diagram, and the
+    catalog only needs a few scalars from it.
+    """
+    events = iter(yaml.parse(content, Loader=YamlSafeLoader))
+    for event in events:
+        if isinstance(event, yaml.MappingStartEvent):
+            break
+        if isinstance(event, yaml.NodeEvent | yaml.StreamEndEvent):
+            return (), (), []
+    else:
+        return (), (), []
+
+    node_types: dict[str, None] = {}
+    labels: list[str] = []
+    persons: dict[str, None] = {}
+    for key, value in _mapping_items(events):
+        if key == "nodes" and isinstance(value, yaml.CollectionStartEvent):
+            if isinstance(value, yaml.SequenceStartEvent):
+                items = _sequence_items(events)
+            else:
+                items = (item for _, item in _mapping_items(events))
+            for item in items:
+                if not isinstance(item, yaml.MappingStartEvent):
+                    _skip(events, item)
+                    continue
+                fields = _scalar_fields(events, ("type", "label"), nested="data")
+                if fields.get("type"):
+                    node_types[fields["type"].lower()] = None
+                if fields.get("label"):
+                    labels.append(fields["label"])
+        elif key == "persons" and isinstance(value, yaml.MappingStartEvent):
+            for person_key, person in _mapping_items(events):
+                label = None
+                if isinstance(person, yaml.MappingStartEvent):
+                    label = _scalar_fields(events, ("label",)).get("label")
+                else:
+                    _skip(events, person)
+                if label or person_key:
+                    persons[label or person_key] = None
+        elif key == "persons" and isinstance(value, yaml.SequenceStartEvent):
+            for person in _sequence_items(events):
+                if not isinstance(person, yaml.MappingStartEvent):
+                    _skip(events, person)
+                    continue
+                fields = _scalar_fields(events, ("label", "name", "id"))
+                label = fields.get("label") or fields.get("name") or fields.get("id")
+                if label:
+                    persons[label] = None
+        else:
+            _skip(events, value)
+
+    return tuple(node_types), tuple(persons), labels
+
+
+class _Haystack:
+    """Strings joined into one text so substring search runs in C."""
+
+    __slots__ = ("items", "starts", "text")
+
+    def __init__(self, items: list[str]):
+        self.items = items
+        self.text = "\n".join(items)
+        self.starts = []
+        position = 0
+        for item in items:
+            self.starts.append(position)
+            position += len(item) + 1
+
+    def find(self, query: str) -> dict[int, int]:
+        """Map the index of each item containing ``query`` to its first offset."""
+        if not query or "\n" in query:
+            return {}
+        found: dict[int, int] = {}
+        position = self.text.find(query)
+        while position != -1:
+            i = bisect.bisect_right(self.starts, position) - 1
+            found[i] = position - self.starts[i]
+            if i + 1 == len(self.starts):
+                break
+            position = self.text.find(query, self.starts[i + 1])
+        return found
+
+
+@dataclass(slots=True)
+class _SearchView:
+    """Catalog-ordered structures for search, rebuilt after the index changes."""
+
+    order: dict[str, int]
+    paths: list[str]
+    names: _Haystack
+    search_paths: _Haystack
+
+
+class DiagramCatalog:
+    """Indexed, mtime-checked view of the diagram directories."""
+
+    def __init__(
+        self,
+        roots: Sequence[tuple[Path, str]] = DEFAULT_ROOTS,
+        refresh_interval: float = 30.0,
+        content_cache_size: int = 256,
+    ):
+        """Initialize the catalog; the index is built on first use.
+
+        Args:
+            roots: (directory, location label) pairs to index, in priority order
+            refresh_interval: Seconds between re-stat'ing every indexed file
+            content_cache_size: Number of file contents kept for fetch
+        """
+        self.roots = [(Path(directory), location) for directory, location in roots]
+        self.refresh_interval = refresh_interval
+        self.content_cache_size = content_cache_size
+        self._lock = threading.RLock()
+        self._entries: dict[str, CatalogEntry] = {}
+        self._root_mtimes: dict[Path, int | None] = {}
+        self._token_index: dict[str, set[str]] = {}
+        self._vocabulary: list[str] | None = None
+        self._view: _SearchView | None = None
+        self._last_sweep = float("-inf")
+        self._contents: OrderedDict[str, tuple[int, int, str]] = OrderedDict()
+
+    def refresh(self, force: bool = False) -> None:
+        """Bring the index up to date with the directories.
+
+        Args:
+            force: Re-stat every file even if the refresh interval has not passed
+        """
+        with self._lock:
+            now = time.monotonic()
+            sweep = force or now - self._last_sweep >= self.refresh_interval
+            for rank, (directory, location) in enumerate(self.roots):
+                try:
+                    mtime = directory.stat().st_mtime_ns
+                except OSError:
+                    mtime = None
+                if sweep or mtime != self._root_mtimes.get(directory, -1):
+                    self._scan_root(directory, location, rank)
+                    self._root_mtimes[directory] = mtime
+            if sweep:
+                self._last_sweep = now
+
+    def invalidate(self, path: str | Path | None = None) -> None:
+        """Force the next call to re-stat every file, e.g. after writing a diagram.
+
+        Args:
+            path: File whose cached content should be dropped as well
+        """
+        with self._lock:
+            self._last_sweep = float("-inf")
+            if path is not None:
+                self._contents.pop(str(path), None)
+
+    def entries(self) -> list[CatalogEntry]:
+        """All indexed diagrams in root order, then by name."""
+        self.refresh()
+        with self._lock:
+            return [self._entries[path] for path in self._search_view().paths]
+
+    def search(self, query: str, limit: int | None = None) -> tuple[list[dict[str, Any]], int]:
+        """Rank diagrams matching a query.
+
+        A diagram matches if the query is a substring of its name or path, or if
+        every query token equals or prefixes one of its tokens. Name matches rank
+        first, and each matching token adds to the score.
+
+        Args:
+            query: Search text; empty matches every diagram
+            limit: Maximum number of results
+
+        Returns:
+            Matching diagrams best first, each with a ``score``, and the number of
+            matches before the limit was applied
+        """
+        self.refresh()
+        with self._lock:
+            view = self._search_view()
+            scores = self._substring_scores(view, query.lower().strip())
+
+            query_tokens = tokenize(query)
+            if query_tokens:
+                bonus: dict[str, int] = {}
+                matched_all: set[str] | None = None
+                for token in query_tokens:
+                    exact = self._token_index.get(token, set())
+                    hits = set(exact)
+                    for path in exact:
+                        bonus[path] = bonus.get(path, 0) + SCORE_TOKEN
+                    for word in self._prefixed(token):
+                        for path in self._token_index[word]:
+                            if path not in hits:
+                                hits.add(path)
+                                bonus[path] = bonus.get(path, 0) + SCORE_TOKEN_PREFIX
+                    matched_all = hits if matched_all is None else matched_all & hits
+
+                for path, points in bonus.items():
+                    if path in scores:
+                        scores[path] += points
+                    elif path in matched_all:
+                        scores[path] = points
+
+            # Higher score first, then catalog order; one int per key keeps ranking cheap
+            order, stride = view.order, len(view.order)
+            ranked = scores.items()
+            if limit is None or limit >= len(scores):
+                ranked = sorted(ranked, key=lambda item: order[item[0]] - item[1] * stride)
+            else:
+                ranked = heapq.nsmallest(
+                    limit, ranked, key=lambda item: order[item[0]] - item[1] * stride
+                )
+            entries = self._entries
+            results = [{**entries[path].summary, "score": score} for path, score in ranked]
+            return results, len(scores)
+
+    def lookup(self, name: str) -> CatalogEntry | None:
+        """Find a diagram by file name without suffix, preferring YAML and earlier roots."""
+        self.refresh()
+        with self._lock:
+            for directory, _ in self.roots:
+                for suffix in DIAGRAM_SUFFIXES:
+                    entry = self._entries.get(os.path.join(directory, name + suffix))
+                    if entry is not None:
+                        return entry
+        return None
+
+    def read(self, path: str | Path) -> str:
+        """Read a file, serving the cached content while its mtime and size are unchanged.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        key = str(path)
+        stat = os.stat(key)
+        with self._lock:
+            cached = self._contents.get(key)
+            if cached is not None and cached[:2] == (stat.st_mtime_ns, stat.st_size):
+                self._contents.move_to_end(key)
+                return cached[2]
+
+        content = Path(key).read_text()
+        with self._lock:
+            self._contents[key] = (stat.st_mtime_ns, stat.st_size, content)
+            self._contents.move_to_end(key)
+            while len(self._contents) > self.content_cache_size:
+                self._contents.popitem(last=False)
+        return content
+
+    def _search_view(self) -> "_SearchView":
+        if self._view is None:
+            entries = sorted(self._entries.values(), key=lambda entry: entry.sort_key)
+            paths = [entry.path for entry in entries]
+            self._view = _SearchView(
+                order={path: i for i, path in enumerate(paths)},
+                paths=paths,
+                names=_Haystack([entry.name_lower for entry in entries]),
+                search_paths=_Haystack([entry.search_path for entry in entries]),
+            )
+        return self._view
+
+    def _substring_scores(self, view: "_SearchView", query: str) -> dict[str, int]:
+        if not query:
+            return dict.fromkeys(view.paths, 0)
+
+        paths = view.paths
+        scores = {paths[i]: SCORE_PATH_SUBSTRING for i in view.search_paths.find(query)}
+        for i, offset in view.names.find(query).items():
+            if offset:
+                score = SCORE_NAME_SUBSTRING
+            elif len(view.names.items[i]) == len(query):
+                score = SCORE_EXACT_NAME
+            else:
+                score = SCORE_NAME_PREFIX
+            scores[paths[i]] = score
+        return scores
+
+    def _prefixed(self, token: str) -> list[str]:
+        """Indexed tokens that start with ``token``."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._token_index)
+        start = bisect.bisect_left(self._vocabulary, token)
+        end = bisect.bisect_left(self._vocabulary, token + "\uffff", start)
+        return self._vocabulary[start:end]
+
+    def _scan_root(self, directory: Path, location: str, rank: int) -> None:
+        seen: set[str] = set()
+        try:
+            with os.scandir(directory) as it:
+                for item in it:
+                    suffix = Path(item.name).suffix
+                    if suffix not in DIAGRAM_SUFFIXES or not item.is_file():
+                        continue
+                    path = str(directory / item.name)
+                    seen.add(path)
+                    stat = item.stat()
+                    entry = self._entries.get(path)
+                    if entry is None or (entry.mtime_ns, entry.size) != (
+                        stat.st_mtime_ns,
+                        stat.st_size,
+                    ):
+                        self._index(path, location, rank, stat)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.warning(f"Could not scan diagram directory {directory}: {e}")
+            return
+
+        prefix = str(directory) + os.sep
+        for path in [p for p in self._entries if p.startswith(prefix) and p not in seen]:
+            self._remove(path)
+
+    def _index(self, path: str, location: str, rank: int, stat: os.stat_result) -> None:
+        file_path = Path(path)
+        name, suffix = file_path.stem, file_path.suffix
+        node_types: tuple[str, ...] = ()
+        persons: tuple[str, ...] = ()
+        labels: list[str] = []
+        try:
+            with open(path, encoding="utf-8") as f:
+                content = f.read()
+            if suffix == ".json":
+                node_types, persons, labels = _describe(json.loads(content))
+            else:
+                node_types, persons, labels = _describe_yaml(content)
+        except Exception as e:
+            # Unparseable diagrams stay searchable by name and path
+            logger.debug(f"Could not parse diagram {path} for the catalog: {e}")
+
+        tokens = set(tokenize(name))
+        tokens.update(node_types)
+        for text in (*node_types, *persons, *labels):
+            tokens.update(tokenize(text))
+
+        self._remove(path)
+        self._view = None
+        self._entries[path] = CatalogEntry(
+            name=name,
+            path=path,
+            format=DIAGRAM_SUFFIXES[suffix],
+            location=location,
+            mtime_ns=stat.st_mtime_ns,
+            size=stat.st_size,
+            node_types=node_types,
+            persons=persons,
+            tokens=frozenset(tokens),
+            rank=rank,
+        )
+        for token in tokens:
+            if token not in self._token_index:
+                self._token_index[token] = set()
+                self._vocabulary = None
+            self._token_index[token].add(path)
+
+    def _remove(self, path: str) -> None:
+        entry = self._entries.pop(path, None)
+        if entry is None:
+            return
+        self._view = None
+        for token in entry.tokens:
+            paths = self._token_index.get(token)
+            if paths is None:
+                continue
+            paths.discard(path)
+            if not paths:
+                del self._token_index[token]
+                self._vocabulary = None
+
+
+_catalog: DiagramCatalog | None = None
+
+
+def get_diagram_catalog() -> DiagramCatalog:
+    """Return the shared catalog of MCP diagrams."""
+    global _catalog
+    if _catalog is None:
+        _catalog = DiagramCatalog()
+    return _catalog
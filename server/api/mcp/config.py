@@ -14,3 +14,7 @@ mcp_server = FastMCP(
     streamable_http_path="/mcp/messages",
     stateless_http=True,
 )
+
+# In-process run_backend executions: concurrent runs and queued runs admitted beyond them
+BACKGROUND_MAX_WORKERS = int(os.environ.get("MCP_BACKGROUND_WORKERS", "4"))
+BACKGROUND_MAX_QUEUED = int(os.environ.get("MCP_BACKGROUND_QUEUE_SIZE", "64"))
@@ -3,7 +3,8 @@
 import asyncio
 import json
 
-from .config import PROJECT_ROOT, mcp_server
+from .catalog import get_diagram_catalog
+from .config import mcp_server
 
 
 @mcp_server.resource("dipeo://diagrams")
@@ -11,21 +12,10 @@ async def list_diagrams() -> str:
     """List available DiPeO diagrams."""
 
     def scan_diagrams():
-        result = []
-
-        mcp_dir = PROJECT_ROOT / "projects" / "mcp-diagrams"
-        if mcp_dir.exists():
-            for file in mcp_dir.glob("*.yaml"):
-                result.append({"name": file.stem, "path": str(file), "format": "light"})
-            for file in mcp_dir.glob("*.json"):
-                result.append({"name": file.stem, "path": str(file), "format": "native"})
-
-        examples_dir = PROJECT_ROOT / "examples" / "simple_diagrams"
-        if examples_dir.exists():
-            for file in examples_dir.glob("*.yaml"):
-                result.append({"name": file.stem, "path": str(file), "format": "light"})
-
-        return result
+        return [
+            {"name": entry.name, "path": entry.path, "format": entry.format}
+            for entry in get_diagram_catalog().entries()
+        ]
 
     diagrams = await asyncio.to_thread(scan_diagrams)
 
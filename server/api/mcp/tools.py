@@ -10,6 +10,8 @@ from mcp.types import TextContent
 
 from dipeo.config.base_logger import get_module_logger
 
+from .background import BackgroundQueueFullError, get_background_manager
+from .catalog import get_diagram_catalog
 from .config import DEFAULT_MCP_TIMEOUT, PROJECT_ROOT, mcp_server
 
 logger = get_module_logger(__name__)
@@ -18,8 +20,9 @@ logger = get_module_logger(__name__)
 @mcp_server.tool(
     description="""Start a DiPeO diagram execution in the background (asynchronous).
 
-This tool starts execution in a background process and returns immediately with a session ID.
-Use the see_result tool to check status and retrieve results later.
+This tool queues the execution on the server and returns immediately with a session ID.
+Use the see_result tool to check status and retrieve results later, and cancel_backend to stop it.
+If too many executions are already queued, the call fails and can be retried later.
 
 Use Cases:
   - Long-running diagrams that exceed typical request timeouts
@@ -71,71 +74,16 @@ async def run_backend(
     if "/" not in diagram and "\\" not in diagram:
         diagram = f"projects/mcp-diagrams/{diagram}"
 
-    cmd_args = [
-        sys.executable,
-        "-m",
-        "cli.entry_point",
-        "run",
-        diagram,
-        "--background",
-    ]
-
-    if timeout != DEFAULT_MCP_TIMEOUT:
-        cmd_args.extend(["--timeout", str(timeout)])
-
-    if format_type == "light":
-        cmd_args.append("--light")
-    elif format_type == "native":
-        cmd_args.append("--native")
-    elif format_type == "readable":
-        cmd_args.append("--readable")
-
-    if input_data:
-        cmd_args.extend(["--input-data", json.dumps(input_data)])
-
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *cmd_args,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
+        job = get_background_manager().submit(
+            diagram=diagram,
+            input_data=input_data,
+            format_type=format_type,
+            timeout=timeout,
         )
-
-        # Add timeout to prevent hanging
-        try:
-            stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=60.0)
-        except TimeoutError:
-            proc.kill()
-            await proc.wait()
-            result = {
-                "success": False,
-                "error": "Background execution start timed out after 60 seconds",
-                "diagram": diagram,
-            }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        if proc.returncode != 0:
-            error_msg = stderr.decode() if stderr else "Unknown error"
-            result = {
-                "success": False,
-                "error": f"Failed to start background execution: {error_msg}",
-                "diagram": diagram,
-            }
-            return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
-        output = stdout.decode().strip()
-        cli_result = json.loads(output)
-        session_id = cli_result.get("session_id")
-
-        result = {
-            "success": True,
-            "session_id": session_id,
-            "diagram": diagram,
-            "status": "started",
-            "message": f"Diagram execution started. Use see_result('{session_id}') to check status.",
-        }
-
+    except BackgroundQueueFullError as e:
+        result = {"success": False, "error": str(e), "diagram": diagram}
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
-
     except Exception as e:
         logger.error(f"Error starting background execution: {e}", exc_info=True)
         result = {
@@ -145,6 +93,16 @@ async def run_backend(
         }
         return [TextContent(type="text", text=json.dumps(result, indent=2))]
 
+    session_id = job.session_id
+    result = {
+        "success": True,
+        "session_id": session_id,
+        "diagram": diagram,
+        "status": "started",
+        "message": f"Diagram execution started. Use see_result('{session_id}') to check status.",
+    }
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
 
 @mcp_server.tool(
     description="""Check status and retrieve results of a background diagram execution.
@@ -156,9 +114,12 @@ Parameters:
   - session_id: The session ID returned by run_backend
 
 Possible Statuses:
+  - queued: Waiting for a free worker
   - running: Execution in progress
   - completed: Execution finished successfully
   - failed: Execution encountered an error
+  - cancelled: Stopped with cancel_backend
+  - timeout: Stopped after exceeding its timeout
 
 Examples:
   Check status of background execution:
@@ -179,7 +140,7 @@ Examples:
 Returns:
   JSON object with:
     - session_id: The execution session identifier
-    - status: Current execution status (running|completed|failed)
+    - status: Current execution status (queued|running|completed|failed|cancelled|timeout)
     - executed_nodes: List of nodes that have been executed
     - node_outputs: Final outputs from each node (if completed)
     - llm_usage: Token usage statistics (if completed)
@@ -192,10 +153,22 @@ async def see_result(session_id: str) -> list[TextContent]:
     from server.app_context import get_container
 
     try:
+        job = get_background_manager().get(session_id)
+        if job is not None and job.status == "queued":
+            return [TextContent(type="text", text=json.dumps(job.to_dict(), indent=2))]
+
+        # Background executions run on this container, so its state store has their live state
         container = get_container()
         cli = CLIRunner(container)
 
         result_data = await cli.query.get_results_data(session_id, verbose=True)
+        if job is not None:
+            if "status" not in result_data:
+                # Stopped before the execution state was created
+                result_data = job.to_dict()
+            elif job.is_finished and job.status in ("cancelled", "timeout"):
+                result_data["status"] = job.status
+                result_data["error"] = job.error
 
         return [TextContent(type="text", text=json.dumps(result_data, indent=2))]
 
@@ -208,6 +181,38 @@ async def see_result(session_id: str) -> list[TextContent]:
         return [TextContent(type="text", text=json.dumps(error_result, indent=2))]
 
 
+@mcp_server.tool(
+    description="""Cancel a background diagram execution started with run_backend.
+
+A queued execution is removed before it starts; a running execution is stopped and
+marked as aborted.
+
+Parameters:
+  - session_id: The session ID returned by run_backend
+
+Examples:
+  Cancel a running execution:
+    {
+      "session_id": "exec_9ebb3df7180a4a7383079680c28c6028"
+    }
+
+Returns:
+  JSON object with success, session_id, and the execution's status after cancellation.
+"""
+)
+async def cancel_backend(session_id: str) -> list[TextContent]:
+    job = await get_background_manager().cancel(session_id)
+    if job is None:
+        result = {
+            "success": False,
+            "error": f"No background execution found: {session_id}",
+            "session_id": session_id,
+        }
+    else:
+        result = {"success": job.status == "cancelled", **job.to_dict()}
+    return [TextContent(type="text", text=json.dumps(result, indent=2))]
+
+
 @mcp_server.tool(
     description="""Execute a DiPeO diagram synchronously with optional input variables.
 
@@ -304,10 +309,17 @@ Searches in:
   - projects/mcp-diagrams/ (uploaded diagrams)
   - examples/simple_diagrams/ (example diagrams)
 
-The search is case-insensitive and matches against diagram names and paths.
+The search is case-insensitive. It matches substrings of diagram names and paths, and
+words in diagram names, node labels, node types and person names (a word may be a prefix).
+Results are ranked with name matches first.
+
+Note: results are capped at `limit` (50 by default), where earlier versions returned every
+match. `count` is the total number of matches, so a client can tell when results were cut
+off and repeat the search with a higher limit.
 
 Parameters:
   - query: Search term to match against diagram names
+  - limit: Maximum number of results to return (default: 50)
 
 Examples:
   Search for iteration diagrams:
@@ -326,71 +338,30 @@ Examples:
     {
       "query": "data_analysis"
     }
-    Returns: ["data_analysis"] (exact match)
+    Returns: ["data_analysis", ...] (exact match ranked first)
 
   Broad search:
     {
       "query": "simple"
     }
-    Returns: All diagrams containing "simple" in their name
+    Returns: Diagrams containing "simple" in their name, then other matches
 
 Returns:
   JSON object with:
     - success: true
     - query: The search term used
-    - count: Number of matching diagrams
-    - results: Array of matching diagrams with name, path, format, and location
+    - count: Total number of matching diagrams; exceeds len(results) when capped by limit
+    - results: Best matches first, each with name, path, format, location, node_types,
+      persons, and score
 """
 )
-async def search(query: str) -> list[TextContent]:
-    def search_diagrams(search_query: str):
-        results = []
-        search_lower = search_query.lower()
-
-        mcp_dir = PROJECT_ROOT / "projects" / "mcp-diagrams"
-        if mcp_dir.exists():
-            for file in mcp_dir.glob("*.yaml"):
-                if search_lower in file.stem.lower():
-                    results.append(
-                        {
-                            "name": file.stem,
-                            "path": str(file),
-                            "format": "light",
-                            "location": "mcp-diagrams",
-                        }
-                    )
-            for file in mcp_dir.glob("*.json"):
-                if search_lower in file.stem.lower():
-                    results.append(
-                        {
-                            "name": file.stem,
-                            "path": str(file),
-                            "format": "native",
-                            "location": "mcp-diagrams",
-                        }
-                    )
-
-        examples_dir = PROJECT_ROOT / "examples" / "simple_diagrams"
-        if examples_dir.exists():
-            for file in examples_dir.glob("*.yaml"):
-                if search_lower in file.stem.lower() or search_lower in str(file).lower():
-                    results.append(
-                        {
-                            "name": file.stem,
-                            "path": str(file),
-                            "format": "light",
-                            "location": "examples",
-                        }
-                    )
-
-        return results
-
-    matching_diagrams = await asyncio.to_thread(search_diagrams, query)
+async def search(query: str, limit: int = 50) -> list[TextContent]:
+    matching_diagrams, count = await asyncio.to_thread(get_diagram_catalog().search, query, limit)
 
     response = {
         "success": True,
         "query": query,
-        "count": len(matching_diagrams),
+        "count": count,
         "results": matching_diagrams,
     }
 
@@ -451,28 +422,16 @@ async def fetch(uri: str) -> list[TextContent]:
         else:
             diagram_name = diagram_uri
 
-        mcp_dir = PROJECT_ROOT / "projects" / "mcp-diagrams"
+        catalog = get_diagram_catalog()
         diagram_path = None
 
         test_path = Path(diagram_name)
         if test_path.exists() and test_path.is_file():
             diagram_path = test_path
         else:
-            if mcp_dir.exists():
-                for ext in ["*.yaml", "*.json"]:
-                    matches = list(mcp_dir.glob(f"{diagram_name}.{ext[2:]}"))
-                    if matches:
-                        diagram_path = matches[0]
-                        break
-
-            if not diagram_path:
-                examples_dir = PROJECT_ROOT / "examples" / "simple_diagrams"
-                if examples_dir.exists():
-                    for ext in ["*.yaml", "*.json"]:
-                        matches = list(examples_dir.glob(f"{diagram_name}.{ext[2:]}"))
-                        if matches:
-                            diagram_path = matches[0]
-                            break
+            entry = catalog.lookup(diagram_name)
+            if entry is not None:
+                diagram_path = Path(entry.path)
 
         if not diagram_path:
             return {
@@ -482,7 +441,7 @@ async def fetch(uri: str) -> list[TextContent]:
             }
 
         try:
-            content = diagram_path.read_text()
+            content = catalog.read(diagram_path)
             return {
                 "success": True,
                 "uri": diagram_uri,
@@ -651,6 +610,7 @@ async def compile_diagram(
         }
 
         if compile_result.get("valid"):
+            get_diagram_catalog().invalidate()
             result["pushed_as"] = push_as
             result["message"] = f"Diagram validated and pushed to MCP directory as {push_as}"
         else:
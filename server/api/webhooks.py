@@ -1,8 +1,14 @@
-"""Webhook gateway for receiving and processing provider webhooks."""
+"""Webhook gateway for receiving and processing provider webhooks.
+
+A webhook is acknowledged as soon as its signature is verified and its raw body is
+committed to the webhook inbox; inbox workers normalize and publish it afterwards,
+retrying failures and skipping redelivered webhooks by delivery id.
+"""
 
 import hashlib
 import hmac
 import json
+import os
 import time
 from typing import Any
 
@@ -10,6 +16,7 @@ from fastapi import APIRouter, HTTPException, Request, Response, status
 from fastapi.responses import JSONResponse
 
 from dipeo.config.base_logger import get_module_logger
+from dipeo.config.paths import WEBHOOK_INBOX_DB_PATH
 from dipeo.domain.events import (
     DomainEvent,
     EventScope,
@@ -20,9 +27,15 @@ from dipeo.infrastructure.events.adapters import InMemoryEventBus
 from dipeo.infrastructure.integrations.drivers.integrated_api.registry import (
     ProviderRegistry,
 )
+from dipeo.infrastructure.storage.webhook_inbox import WebhookDelivery, WebhookInbox
 
 logger = get_module_logger(__name__)
 
+WEBHOOK_WORKERS = int(os.getenv("DIPEO_WEBHOOK_WORKERS", "4"))
+WEBHOOK_MAX_ATTEMPTS = int(os.getenv("DIPEO_WEBHOOK_MAX_ATTEMPTS", "5"))
+# Processed deliveries are remembered this long to drop redeliveries
+WEBHOOK_DEDUP_RETENTION = float(os.getenv("DIPEO_WEBHOOK_DEDUP_RETENTION", "86400"))
+
 router = APIRouter(prefix="/webhooks", tags=["webhooks"])
 
 
@@ -32,6 +45,7 @@ def create_webhook_event(
     payload: dict[str, Any],
     headers: dict[str, str],
     execution_id: str | None = None,
+    webhook_id: str | None = None,
 ) -> DomainEvent:
     exec_id = execution_id or f"webhook-{provider}-{int(time.time())}"
 
@@ -43,7 +57,7 @@ def create_webhook_event(
             message=f"Webhook received from {provider}: {event_name}",
             logger_name="webhook_processor",
             extra_fields={
-                "webhook_id": f"{provider}-{event_name}-{int(time.time())}",
+                "webhook_id": webhook_id or f"{provider}-{event_name}-{int(time.time())}",
                 "source": provider,
                 "event_name": event_name,
                 "payload": payload,
@@ -149,23 +163,26 @@ class WebhookProcessor:
 
         return normalized
 
-    async def process_webhook(
-        self, provider_name: str, headers: dict[str, str], body: bytes
-    ) -> dict[str, Any]:
-        if not await self.validate_webhook_signature(provider_name, headers, body):
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid webhook signature",
-            )
-
-        try:
-            raw_payload = json.loads(body)
-        except json.JSONDecodeError as e:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Invalid JSON payload: {e}",
-            )
-
+    async def publish_webhook(
+        self,
+        provider_name: str,
+        headers: dict[str, str],
+        raw_payload: dict[str, Any],
+        execution_id: str | None = None,
+        webhook_id: str | None = None,
+    ) -> DomainEvent:
+        """Normalize a verified webhook and publish it on the event bus.
+
+        Args:
+            provider_name: Provider the webhook came from
+            headers: Request headers (lower-cased names)
+            raw_payload: Parsed request body
+            execution_id: Execution id to publish under; generated if omitted
+            webhook_id: Delivery id recorded on the event
+
+        Returns:
+            The published event
+        """
         normalized_payload = await self.normalize_webhook_payload(provider_name, raw_payload)
         event_name = self._extract_event_name(provider_name, headers, raw_payload)
 
@@ -174,16 +191,12 @@ class WebhookProcessor:
             event_name=event_name,
             payload=normalized_payload,
             headers=dict(headers),
+            execution_id=execution_id,
+            webhook_id=webhook_id,
         )
 
         await self.event_bus.publish(webhook_event)
-
-        return {
-            "status": "processed",
-            "provider": provider_name,
-            "event": event_name,
-            "execution_id": webhook_event.scope.execution_id,
-        }
+        return webhook_event
 
     def _extract_event_name(
         self, provider_name: str, headers: dict[str, str], payload: dict[str, Any]
@@ -204,28 +217,118 @@ class WebhookProcessor:
         )
 
 
-@router.post("/{provider}")
-async def receive_webhook(provider: str, request: Request, response: Response) -> JSONResponse:
-    """Receive and process provider webhooks with signature validation and event emission."""
+def parse_webhook_body(body: bytes) -> dict[str, Any]:
     try:
-        from dipeo.application.registry.keys import EVENT_BUS, PROVIDER_REGISTRY
-        from server.app_context import get_container
+        return json.loads(body)
+    except json.JSONDecodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Invalid JSON payload: {e}",
+        )
 
-        container = get_container()
-        registry = container.registry.resolve(PROVIDER_REGISTRY)
-        event_bus = container.registry.resolve(EVENT_BUS)
 
-        if not registry:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Provider registry not available",
-            )
+def extract_delivery_id(
+    provider_name: str, headers: dict[str, str], payload: dict[str, Any], body: bytes
+) -> str:
+    """Return the provider's id for this delivery, used to drop redeliveries.
+
+    Falls back to a hash of the body for providers that send no delivery id, so
+    only byte-identical redeliveries are treated as duplicates.
+    """
+    delivery_id = None
+    if provider_name == "github":
+        delivery_id = headers.get("x-github-delivery")
+    elif provider_name == "slack":
+        delivery_id = payload.get("event_id")
+    elif provider_name == "stripe":
+        delivery_id = payload.get("id")
+
+    delivery_id = (
+        delivery_id
+        or headers.get("x-webhook-id")
+        or headers.get("x-delivery-id")
+        or headers.get("idempotency-key")
+    )
+    if delivery_id:
+        return str(delivery_id)
+    return "sha256:" + hashlib.sha256(body).hexdigest()
 
-        if not event_bus:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Event bus not available",
-            )
+
+def _resolve_services() -> tuple[ProviderRegistry, InMemoryEventBus]:
+    from dipeo.application.registry.keys import EVENT_BUS, PROVIDER_REGISTRY
+    from server.app_context import get_container
+
+    container = get_container()
+    registry = container.registry.resolve(PROVIDER_REGISTRY)
+    event_bus = container.registry.resolve(EVENT_BUS)
+
+    if not registry:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Provider registry not available",
+        )
+
+    if not event_bus:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail="Event bus not available",
+        )
+
+    return registry, event_bus
+
+
+async def _publish_delivery(delivery: WebhookDelivery) -> None:
+    """Inbox handler: normalize a stored webhook and publish it."""
+    registry, event_bus = _resolve_services()
+    processor = WebhookProcessor(registry, event_bus)
+    await processor.publish_webhook(
+        delivery.provider,
+        delivery.headers,
+        json.loads(delivery.body),
+        execution_id=delivery.execution_id,
+        webhook_id=delivery.delivery_id,
+    )
+
+
+_inbox: WebhookInbox | None = None
+
+
+def get_webhook_inbox() -> WebhookInbox:
+    """Return the server's webhook inbox, creating it on first use."""
+    global _inbox
+    if _inbox is None:
+        _inbox = WebhookInbox(
+            WEBHOOK_INBOX_DB_PATH,
+            _publish_delivery,
+            workers=WEBHOOK_WORKERS,
+            max_attempts=WEBHOOK_MAX_ATTEMPTS,
+            retention=WEBHOOK_DEDUP_RETENTION,
+        )
+    return _inbox
+
+
+async def start_webhook_inbox() -> None:
+    """Start the inbox workers, resuming webhooks accepted before a restart."""
+    await get_webhook_inbox().start()
+
+
+async def shutdown_webhook_inbox() -> None:
+    """Stop the inbox workers; unprocessed webhooks stay queued on disk."""
+    global _inbox
+    if _inbox is not None:
+        await _inbox.close()
+        _inbox = None
+
+
+@router.post("/{provider}")
+async def receive_webhook(provider: str, request: Request, response: Response) -> JSONResponse:
+    """Verify a provider webhook and queue it for processing.
+
+    Returns once the webhook is durably stored; publishing happens in the
+    inbox workers.
+    """
+    try:
+        registry, event_bus = _resolve_services()
 
         if not registry.get_provider(provider):
             raise HTTPException(
@@ -237,12 +340,31 @@ async def receive_webhook(provider: str, request: Request, response: Response) -
         headers = dict(request.headers)
 
         processor = WebhookProcessor(registry, event_bus)
-        result = await processor.process_webhook(provider, headers, body)
+        if not await processor.validate_webhook_signature(provider, headers, body):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook signature",
+            )
+
+        raw_payload = parse_webhook_body(body)
+        if provider == "slack" and raw_payload.get("type") == "url_verification":
+            return JSONResponse(content={"challenge": raw_payload.get("challenge")})
 
-        if provider == "slack":
-            if json.loads(body).get("type") == "url_verification":
-                challenge = json.loads(body).get("challenge")
-                return JSONResponse(content={"challenge": challenge})
+        delivery_id = extract_delivery_id(provider, headers, raw_payload, body)
+        execution_id = f"webhook-{provider}-{int(time.time())}"
+        stored = await get_webhook_inbox().append(
+            provider, delivery_id, headers, body, execution_id
+        )
+
+        result = {
+            "status": "accepted" if stored else "duplicate",
+            "provider": provider,
+            "event": processor._extract_event_name(provider, headers, raw_payload),
+            "delivery_id": delivery_id,
+        }
+        if stored:
+            # A duplicate was published under the execution id of its first delivery
+            result["execution_id"] = execution_id
 
         response.status_code = status.HTTP_200_OK
         return JSONResponse(content=result)
@@ -17,6 +17,7 @@ from dipeo.application.registry.keys import (
     AST_PARSER,
     BLOB_STORE,
     EVENT_BUS,
+    EXECUTION_HISTORY_SPILL_FACTORY,
     FILESYSTEM_ADAPTER,
     IR_BUILDER_REGISTRY,
     IR_CACHE,
@@ -35,7 +36,10 @@ logger = get_module_logger(__name__)
 
 def wire_state_services(registry: ServiceRegistry, redis_client: Any = None) -> None:
     """Wire state management services."""
-    from dipeo.infrastructure.execution.state import CacheFirstStateStore
+    from dipeo.infrastructure.execution.state import (
+        CacheFirstStateStore,
+        SqliteExecutionHistorySpill,
+    )
 
     cache_size = int(os.getenv("DIPEO_STATE_CACHE_SIZE", "1000"))
     checkpoint_interval = int(os.getenv("DIPEO_STATE_CHECKPOINT_INTERVAL", "10"))
@@ -53,6 +57,7 @@ def wire_state_services(registry: ServiceRegistry, redis_client: Any = None) ->
     registry.register(STATE_REPOSITORY, store)
     registry.register(STATE_SERVICE, store)
     registry.register(STATE_CACHE, store)
+    registry.register(EXECUTION_HISTORY_SPILL_FACTORY, SqliteExecutionHistorySpill)
 
 
 def wire_messaging_services(registry: ServiceRegistry) -> None:
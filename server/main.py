@@ -1,3 +1,4 @@
+import asyncio
 import os
 import sys
 import warnings
@@ -10,8 +11,11 @@ from fastapi.responses import Response
 
 from dipeo.application.bootstrap import init_resources, shutdown_resources
 from dipeo.infrastructure.logging_config import setup_logging
+from server.api.mcp.background import shutdown_background_manager
+from server.api.mcp.catalog import get_diagram_catalog
 from server.api.middleware import setup_middleware
 from server.api.router import setup_routes
+from server.api.webhooks import shutdown_webhook_inbox, start_webhook_inbox
 from server.app_context import initialize_container_async
 
 
@@ -77,8 +81,15 @@ async def lifespan(app: FastAPI):
     container = await initialize_container_async()
     await init_resources(container)
     setup_routes(app)
+    # Resume webhooks that were accepted but not yet published before a restart
+    await start_webhook_inbox()
+    # Index MCP diagrams off the event loop so the first search does not pay for it
+    catalog_warmup = asyncio.create_task(asyncio.to_thread(get_diagram_catalog().refresh))
 
     yield
+    catalog_warmup.cancel()
+    await shutdown_background_manager()
+    await shutdown_webhook_inbox()
     await shutdown_resources(container)
 
 
@@ -98,25 +109,29 @@ async def health():
 
 @app.get("/metrics")
 async def metrics(request: Request):
+    from dipeo.infrastructure.timing import timing_collector
+
     accept_header = request.headers.get("accept", "")
+    timing_metrics = timing_collector.render_prometheus()
 
     try:
         from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
-        if "application/json" in accept_header:
-            metrics_data = generate_latest().decode("utf-8")
-            return {
-                "metrics": metrics_data,
-                "format": "prometheus",
-                "message": "Metrics in Prometheus format",
-            }
-
-        return Response(content=generate_latest(), media_type=CONTENT_TYPE_LATEST)
+        metrics_data = generate_latest().decode("utf-8") + timing_metrics
+        media_type = CONTENT_TYPE_LATEST
     except ImportError:
+        metrics_data = timing_metrics
+        media_type = "text/plain; version=0.0.4; charset=utf-8"
+
+    if "application/json" in accept_header:
         return {
-            "message": "Prometheus client not installed. Install with: pip install prometheus-client"
+            "metrics": metrics_data,
+            "format": "prometheus",
+            "message": "Metrics in Prometheus format",
         }
 
+    return Response(content=metrics_data, media_type=media_type)
+
 
 def start():
     import asyncio
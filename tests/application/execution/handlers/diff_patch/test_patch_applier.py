@@ -0,0 +1,149 @@
+"""Single-pass apply_diff against the original rebuild-per-hunk implementation."""
+
+import random
+from typing import Any
+
+import pytest
+
+from dipeo.application.execution.handlers.diff_patch.diff_processor import parse_hunks
+from dipeo.application.execution.handlers.diff_patch.patch_applier import apply_diff
+
+
+def _reference_apply_diff(
+    original_lines: list[str],
+    diff_content: str,
+    format_type: str,
+    strip_level: int,
+    fuzz_factor: int,
+    ignore_whitespace: bool,
+) -> tuple[list[str], list[dict[str, Any]]]:
+    """apply_diff as it was before the single-pass rewrite."""
+    hunks = parse_hunks(diff_content)
+    patched_lines = original_lines.copy()
+    rejected_hunks = []
+    offset = 0
+
+    for hunk in hunks:
+        old_start = hunk["old_start"] - 1 + offset
+        new_lines = []
+        old_content = []
+
+        for line in hunk["lines"]:
+            if line.startswith("-"):
+                old_content.append(line[1:])
+            elif line.startswith("+"):
+                new_lines.append(line[1:])
+            elif line.startswith(" "):
+                old_content.append(line[1:])
+                new_lines.append(line[1:])
+
+        applied = False
+        for fuzz in range(fuzz_factor + 1):
+            for direction in [0, -1, 1]:
+                test_start = old_start + direction * fuzz
+                if test_start < 0 or test_start >= len(patched_lines):
+                    continue
+
+                if _reference_match_content(
+                    patched_lines[test_start : test_start + len(old_content)],
+                    old_content,
+                    ignore_whitespace,
+                ):
+                    patched_lines = (
+                        patched_lines[:test_start]
+                        + new_lines
+                        + patched_lines[test_start + len(old_content) :]
+                    )
+                    offset += len(new_lines) - len(old_content)
+                    applied = True
+                    break
+
+            if applied:
+                break
+
+        if not applied:
+            rejected_hunks.append(hunk)
+
+    return patched_lines, rejected_hunks
+
+
+def _reference_match_content(
+    actual_lines: list[str], expected_lines: list[str], ignore_whitespace: bool
+) -> bool:
+    if len(actual_lines) != len(expected_lines):
+        return False
+
+    for actual, expected in zip(actual_lines, expected_lines, strict=True):
+        if ignore_whitespace:
+            if actual.strip() != expected.strip():
+                return False
+        elif actual != expected:
+            return False
+
+    return True
+
+
+# A small vocabulary repeats lines, so fuzzy matching can find more than one position
+WORDS = ("a", "b", "c", "return x", "pass", "x = 1", "}", "")
+
+
+def _random_case(rng: random.Random) -> tuple[list[str], str]:
+    lines = [rng.choice(WORDS) for _ in range(rng.randint(0, 60))]
+    if rng.random() < 0.3:
+        lines = [f"  {line} " if rng.random() < 0.3 else line for line in lines]
+
+    diff = ["--- a/file.py", "+++ b/file.py"]
+    for _ in range(rng.randint(1, 6)):
+        # Hunks may be out of order, overlap, or point past the end of the file
+        start = rng.randint(0, len(lines) + 2)
+        body = []
+        for line in lines[start : start + rng.randint(0, 6)]:
+            kind = rng.random()
+            if kind < 0.1:
+                line = rng.choice(WORDS) + " changed"  # Context that will not match
+            elif kind < 0.2:
+                line = line.strip()  # Matches only when ignoring whitespace
+            body.append(("-" if rng.random() < 0.4 else " ") + line)
+            if rng.random() < 0.3:
+                body.append("+" + rng.choice(WORDS))
+        if not body or rng.random() < 0.2:
+            body.append("+" + rng.choice(WORDS) + " new")
+        old_lines = sum(not line.startswith("+") for line in body)
+        new_lines = sum(not line.startswith("-") for line in body)
+        # A shifted header exercises the fuzz search around the stated position
+        header_start = max(1, start + 1 + rng.randint(-3, 3))
+        diff.append(f"@@ -{header_start},{old_lines} +{header_start},{new_lines} @@")
+        diff.extend(body)
+    return lines, "\n".join(diff)
+
+
+@pytest.mark.parametrize("seed", range(40))
+def test_matches_reference_on_random_diffs(seed):
+    rng = random.Random(seed)
+    for _ in range(100):
+        lines, diff = _random_case(rng)
+        args = (diff, "unified", 1, rng.randint(0, 4), rng.random() < 0.5)
+
+        original = list(lines)
+        expected = _reference_apply_diff(original, *args)
+        assert apply_diff(lines, *args) == expected
+        assert lines == original
+        # Any sequence of lines is accepted
+        assert apply_diff(tuple(lines), *args) == expected
+
+
+def test_large_file_with_many_hunks():
+    lines = [f"line {i}" for i in range(20000)]
+    diff = ["--- a/big.txt", "+++ b/big.txt"]
+    for i in range(0, 20000, 100):
+        # Every tenth hunk is displaced by two lines and found by fuzz
+        start = i + 1 + (2 if i % 1000 == 0 else 0)
+        diff.append(f"@@ -{start},3 +{start},3 @@")
+        diff.extend([f" line {i}", f"-line {i + 1}", f"+LINE {i + 1}", f" line {i + 2}"])
+    args = ("\n".join(diff), "unified", 1, 2, False)
+
+    patched, rejected = apply_diff(lines, *args)
+
+    assert (patched, rejected) == _reference_apply_diff(lines, *args)
+    assert rejected == []
+    assert sum(line.startswith("LINE") for line in patched) == 200
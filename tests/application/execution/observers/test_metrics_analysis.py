@@ -0,0 +1,178 @@
+"""Critical path, slack and parallel groups of the execution DAG."""
+
+import itertools
+import random
+
+import pytest
+
+from dipeo.application.execution.observers.metrics_analysis import ExecutionDag, MetricsAnalyzer
+from dipeo.application.execution.observers.metrics_types import ExecutionMetrics, NodeMetrics
+
+
+def _dag(durations: dict[str, float], edges: list[tuple[str, str]]) -> ExecutionDag:
+    predecessors = {key: set() for key in durations}
+    for source, target in edges:
+        predecessors[target].add(source)
+    dag = ExecutionDag(durations=durations, predecessors=predecessors)
+    dag.successors = {key: set() for key in durations}
+    for source, target in edges:
+        dag.successors[source].add(target)
+    dag.order = dag._topological_order(list(durations))
+    return dag
+
+
+def _random_dag(seed: int, size: int = 12) -> ExecutionDag:
+    rng = random.Random(seed)
+    keys = [f"n{i}" for i in range(size)]
+    durations = {key: float(rng.randint(1, 50)) for key in keys}
+    # Edges only go from lower to higher index, so the graph is acyclic
+    edges = [(a, b) for a, b in itertools.combinations(keys, 2) if rng.random() < 0.25]
+    rng.shuffle(keys)
+    return _dag({key: durations[key] for key in keys}, edges)
+
+
+def _paths(dag: ExecutionDag) -> list[list[str]]:
+    """Every source-to-sink path, by exhaustive search."""
+    paths = []
+
+    def walk(path: list[str]) -> None:
+        successors = dag.successors[path[-1]]
+        if not successors:
+            paths.append(path)
+        for successor in successors:
+            walk([*path, successor])
+
+    for key in dag.durations:
+        if not dag.predecessors[key]:
+            walk([key])
+    return paths
+
+
+def _reachable(dag: ExecutionDag, key: str) -> set[str]:
+    seen: set[str] = set()
+    stack = [key]
+    while stack:
+        for successor in dag.successors[stack.pop()]:
+            if successor not in seen:
+                seen.add(successor)
+                stack.append(successor)
+    return seen
+
+
+def test_diamond_schedule_and_critical_path():
+    #   a(10) -> b(30) -> d(5)
+    #   a(10) -> c(10) -> d(5)
+    dag = _dag(
+        {"a": 10.0, "b": 30.0, "c": 10.0, "d": 5.0},
+        [("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")],
+    )
+
+    earliest, latest = dag.schedule()
+
+    assert earliest == {"a": 0.0, "b": 10.0, "c": 10.0, "d": 40.0}
+    assert latest == {"a": 0.0, "b": 10.0, "c": 30.0, "d": 40.0}
+    assert dag.critical_path(earliest) == ["a", "b", "d"]
+    assert dag.antichain_levels() == [["a"], ["b", "c"], ["d"]]
+
+
+def test_empty_dag():
+    dag = _dag({}, [])
+
+    assert dag.schedule() == ({}, {})
+    assert dag.critical_path({}) == []
+    assert dag.antichain_levels() == []
+
+
+def test_independent_chains_are_one_level_each():
+    dag = _dag({"a1": 1.0, "a2": 2.0, "b1": 5.0, "b2": 1.0}, [("a1", "a2"), ("b1", "b2")])
+
+    earliest, latest = dag.schedule()
+
+    assert dag.critical_path(earliest) == ["b1", "b2"]
+    # The short chain can start 3ms late without lengthening the run
+    assert latest["a1"] - earliest["a1"] == 3.0
+    assert dag.antichain_levels() == [["a1", "b1"], ["a2", "b2"]]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_random_dags_match_exhaustive_search(seed):
+    dag = _random_dag(seed)
+    earliest, latest = dag.schedule()
+    weight = {tuple(path): sum(dag.durations[k] for k in path) for path in _paths(dag)}
+    makespan = max(weight.values())
+
+    path = dag.critical_path(earliest)
+    assert tuple(path) in weight
+    assert weight[tuple(path)] == makespan
+
+    for key in dag.durations:
+        through = [w for p, w in weight.items() if key in p]
+        # Slack is how much shorter the longest path through a node is than the makespan
+        assert latest[key] - earliest[key] == pytest.approx(makespan - max(through))
+        assert latest[key] >= earliest[key]
+    assert all(latest[key] == earliest[key] for key in path)
+
+    levels = dag.antichain_levels()
+    assert sorted(key for level in levels for key in level) == sorted(dag.durations)
+    for level in levels:
+        members = set(level)
+        assert not any(_reachable(dag, key) & members for key in level)
+
+
+def _node(node_id: str, start: float, end: float) -> NodeMetrics:
+    return NodeMetrics(
+        node_id=node_id,
+        node_type="code_job",
+        start_time=start,
+        end_time=end,
+        duration_ms=(end - start) * 1000,
+    )
+
+
+def _metrics(nodes: dict[str, NodeMetrics]) -> ExecutionMetrics:
+    return ExecutionMetrics(execution_id="exec_test", start_time=0.0, node_metrics=nodes)
+
+
+def test_loop_iterations_depend_on_the_latest_finished_instance():
+    metrics = _metrics(
+        {
+            "start": _node("start", 0.0, 0.1),
+            "body_iter_1": _node("body", 0.1, 0.3),
+            "check_iter_1": _node("check", 0.3, 0.35),
+            "body_iter_2": _node("body", 0.35, 0.55),
+            "check_iter_2": _node("check", 0.55, 0.6),
+        }
+    )
+    dependencies = {"body": {"start", "check"}, "check": {"body"}}
+
+    dag = ExecutionDag.from_metrics(metrics, dependencies)
+
+    assert dag.predecessors["body_iter_1"] == {"start"}
+    assert dag.predecessors["check_iter_1"] == {"body_iter_1"}
+    assert dag.predecessors["body_iter_2"] == {"start", "check_iter_1"}
+    assert dag.predecessors["check_iter_2"] == {"body_iter_2"}
+    assert dag.order == list(metrics.node_metrics)
+
+
+async def test_analyzer_reports_sequential_independent_nodes():
+    # b and c only depend on a but ran one after the other
+    metrics = _metrics(
+        {
+            "a": _node("a", 0.0, 0.1),
+            "b": _node("b", 0.1, 0.4),
+            "c": _node("c", 0.4, 0.6),
+            "d": _node("d", 0.6, 0.65),
+        }
+    )
+    analyzer = MetricsAnalyzer()
+    analyzer.set_node_dependencies("exec_test", {"b": {"a"}, "c": {"a"}, "d": {"b", "c"}})
+
+    await analyzer.analyze_execution(metrics, scope=None)
+
+    assert metrics.critical_path == ["a", "b", "d"]
+    assert metrics.critical_path_ms == pytest.approx(450.0)
+    assert metrics.node_slack_ms["c"] == pytest.approx(100.0)
+    assert metrics.node_slack_ms["b"] == pytest.approx(0.0, abs=1e-9)
+    assert metrics.parallelizable_groups == [["b", "c"]]
+    # Running b and c together would finish at the end of the critical path
+    assert analyzer._estimate_parallel_savings(metrics) == pytest.approx(200.0)
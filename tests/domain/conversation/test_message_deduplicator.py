@@ -0,0 +1,132 @@
+"""MessageDeduplicator against the original pairwise deduplication."""
+
+import random
+from collections.abc import Sequence
+
+import pytest
+
+from dipeo.config.memory import MEMORY_CONTENT_KEY_LENGTH
+from dipeo.diagram_generated.domain_models import Message, PersonID
+from dipeo.domain.conversation.memory_strategies import IntelligentMemoryStrategy, MemoryConfig
+from dipeo.domain.conversation.message_deduplicator import MessageDeduplicator
+
+
+def _reference_deduplicate(
+    messages: Sequence[Message], threshold: float
+) -> tuple[list[Message], dict[str, int]]:
+    """IntelligentMemoryStrategy._deduplicate_messages before the prefix-filter index."""
+    unique_messages = []
+    frequencies = {}
+    seen_contents = []
+
+    for message in messages:
+        if not getattr(message, "id", None):
+            continue
+
+        content_key = (message.content or "")[:MEMORY_CONTENT_KEY_LENGTH].strip()
+
+        is_duplicate = False
+        for seen_content, seen_msg in seen_contents:
+            if _reference_word_overlap(content_key, seen_content, threshold):
+                frequencies[seen_msg.id] = frequencies.get(seen_msg.id, 1) + 1
+                is_duplicate = True
+                break
+
+        if not is_duplicate:
+            unique_messages.append(message)
+            frequencies[message.id] = 1
+            seen_contents.append((content_key, message))
+
+    return unique_messages, frequencies
+
+
+def _reference_word_overlap(text1: str, text2: str, threshold: float) -> bool:
+    words1 = set(text1.lower().split())
+    words2 = set(text2.lower().split())
+
+    if not words1 or not words2:
+        return text1 == text2
+
+    intersection = len(words1 & words2)
+    smaller_set = min(len(words1), len(words2))
+
+    return (intersection / smaller_set) >= threshold
+
+
+VOCABULARY = [f"w{i}" for i in range(12)] + ["Alpha", "alpha", "beta", "a", "longerword"]
+
+
+def _messages(rng: random.Random, count: int) -> list[Message]:
+    messages = []
+    for i in range(count):
+        kind = rng.random()
+        if kind < 0.05:
+            content = rng.choice(["", "   ", "\n"])
+        elif kind < 0.3 and messages:
+            # A near copy of an earlier message: drop, add or repeat a few words
+            words = rng.choice(messages).content.split()
+            for _ in range(rng.randint(0, 2)):
+                if words and rng.random() < 0.5:
+                    words.pop(rng.randrange(len(words)))
+                else:
+                    words.insert(rng.randint(0, len(words)), rng.choice(VOCABULARY))
+            content = " ".join(words)
+        else:
+            content = " ".join(rng.choices(VOCABULARY, k=rng.randint(1, 12)))
+        if rng.random() < 0.05:
+            # Words past the content key length are ignored
+            content = content + " " * (MEMORY_CONTENT_KEY_LENGTH - len(content)) + " tail"
+        messages.append(
+            Message(
+                id=None if rng.random() < 0.05 else f"msg_{i}",
+                from_person_id=PersonID("alice"),
+                to_person_id=PersonID("bob"),
+                content=content,
+                message_type="person_to_person",
+            )
+        )
+    return messages
+
+
+def _summary(result: tuple[list[Message], dict[str, int]]) -> tuple[list[str], dict[str, int]]:
+    unique, frequencies = result
+    return [message.id for message in unique], frequencies
+
+
+@pytest.mark.parametrize("threshold", [0.0, 0.3, 0.5, 0.75, 0.9, 1.0])
+@pytest.mark.parametrize("seed", range(10))
+def test_matches_pairwise_reference(seed, threshold):
+    rng = random.Random(seed)
+    messages = _messages(rng, 300)
+    expected = _summary(_reference_deduplicate(messages, threshold))
+
+    deduplicator = MessageDeduplicator(threshold)
+    deduplicator.extend(messages)
+    assert _summary((deduplicator.unique_messages, deduplicator.frequencies)) == expected
+
+    # Indexing the conversation in chunks gives the same result
+    chunked = MessageDeduplicator(threshold)
+    position = 0
+    while position < len(messages):
+        end = position + rng.randint(1, 40)
+        assert chunked.extends(messages[:end])
+        chunked.extend(messages[position:end])
+        position = end
+    assert _summary((chunked.unique_messages, chunked.frequencies)) == expected
+
+
+def test_strategy_reuses_the_index_as_the_conversation_grows():
+    rng = random.Random(7)
+    messages = _messages(rng, 200)
+    strategy = IntelligentMemoryStrategy(config=MemoryConfig(word_overlap_threshold=0.75))
+
+    for end in (50, 120, 200):
+        result = strategy._deduplicate_messages(messages[:end])
+        assert _summary(result) == _summary(_reference_deduplicate(messages[:end], 0.75))
+    assert strategy._deduplicators[None].seen_count == 200
+
+    # A different history (e.g. after the conversation was cleared) rebuilds the index
+    other = _messages(random.Random(8), 30)
+    result = strategy._deduplicate_messages(other)
+    assert _summary(result) == _summary(_reference_deduplicate(other, 0.75))
+    assert strategy._deduplicators[None].seen_count == 30
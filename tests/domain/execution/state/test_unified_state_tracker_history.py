@@ -0,0 +1,76 @@
+"""Bounded execution history with records spilled to SQLite."""
+
+from dipeo.domain.execution.messaging.envelope import EnvelopeFactory
+from dipeo.domain.execution.state.unified_state_tracker import UnifiedStateTracker
+from dipeo.infrastructure.execution.state.history_spill import SqliteExecutionHistorySpill
+
+
+class RecordingSpill(SqliteExecutionHistorySpill):
+    """Spill that records whether the tracker lock was held while flushing."""
+
+    def __init__(self, tracker: UnifiedStateTracker, **kwargs):
+        super().__init__(**kwargs)
+        self.tracker = tracker
+        self.flushed_under_lock: list[bool] = []
+
+    def flush(self) -> None:
+        self.flushed_under_lock.append(self.tracker._lock.locked())
+        super().flush()
+
+
+def _run(tracker: UnifiedStateTracker, node_id: str, times: int) -> None:
+    tracker.initialize_node(node_id)
+    for i in range(times):
+        tracker.transition_to_running(node_id, epoch=0)
+        output = EnvelopeFactory.create(body={"run": i}, produced_by=node_id)
+        tracker.transition_to_completed(node_id, output=output, token_usage={"input": 1})
+        tracker.reset_node(node_id)
+
+
+def test_history_beyond_the_limit_is_spilled_and_read_back():
+    tracker = UnifiedStateTracker()
+    spill = RecordingSpill(tracker, batch_size=4)
+    tracker.configure_history(3, spill)
+
+    _run(tracker, "loop", 20)
+
+    assert len(tracker._execution_records["loop"]) == 3
+    history = tracker.get_node_execution_history("loop")
+    assert [record.execution_number for record in history] == list(range(1, 21))
+    assert [record.output.body for record in history] == [{"run": i} for i in range(20)]
+    summary = tracker.get_execution_summary()
+    assert summary["total_executions"] == 20
+    assert summary["total_tokens"]["input"] == 20
+
+    # Records are encoded and written only after the tracker lock is released
+    assert spill.flushed_under_lock
+    assert not any(spill.flushed_under_lock)
+    spill.close()
+    assert not spill.db_path.exists()
+
+
+def test_spill_database_is_created_on_first_write_only():
+    tracker = UnifiedStateTracker()
+    spill = SqliteExecutionHistorySpill(batch_size=4)
+    tracker.configure_history(50, spill)
+
+    _run(tracker, "node", 10)
+
+    assert spill.db_path is None
+    assert len(tracker.get_node_execution_history("node")) == 10
+    assert spill.db_path is None
+    spill.close()
+
+
+def test_unflushed_records_are_visible_to_reads():
+    tracker = UnifiedStateTracker()
+    spill = SqliteExecutionHistorySpill(batch_size=1000)
+    tracker.configure_history(2, spill)
+
+    _run(tracker, "node", 5)
+
+    # Three evicted records are still buffered; reading flushes them first
+    assert len(spill._pending) == 3
+    assert len(tracker.get_node_execution_history("node")) == 5
+    assert spill._pending == []
+    spill.close()
@@ -0,0 +1,90 @@
+"""IR build pipeline orchestration and the shared extraction cache."""
+
+import os
+
+import pytest
+
+from dipeo.infrastructure.codegen.ir_builders.core import (
+    BuildContext,
+    BuildStep,
+    ExtractionCache,
+    PipelineOrchestrator,
+    StepResult,
+    StepType,
+    source_fingerprint,
+)
+
+
+class CountingExtract(BuildStep):
+    """Shareable extraction that lists the AST's file paths."""
+
+    shareable = True
+
+    def __init__(self, name: str = "extract"):
+        super().__init__(name=name, step_type=StepType.EXTRACT)
+        self.runs = 0
+
+    def execute(self, context, input_data):
+        self.runs += 1
+        return StepResult(success=True, data={"files": sorted(input_data)})
+
+
+class Failing(BuildStep):
+    def __init__(self):
+        super().__init__(name="failing", step_type=StepType.TRANSFORM)
+
+    def execute(self, context, input_data):
+        raise KeyError("missing field")
+
+
+def _pipeline(*steps: BuildStep, cache: ExtractionCache | None = None) -> PipelineOrchestrator:
+    orchestrator = PipelineOrchestrator(BuildContext(), shared_cache=cache)
+    orchestrator.add_steps(list(steps))
+    return orchestrator
+
+
+def test_step_exceptions_propagate():
+    orchestrator = _pipeline(CountingExtract(), Failing())
+
+    with pytest.raises(KeyError, match="missing field"):
+        orchestrator.execute({"a.ts": {}})
+
+
+def test_shared_cache_runs_extraction_once_and_returns_copies(tmp_path):
+    source = tmp_path / "nodes.ts"
+    source.write_text("export interface A {}")
+    ast = {str(source): {"interfaces": ["A"]}}
+    cache = ExtractionCache()
+    first, second = CountingExtract(), CountingExtract()
+
+    results = _pipeline(first, cache=cache).execute(ast, source_fingerprint(ast))
+    results["extract"].data["files"].append("mutated")
+    shared = _pipeline(second, cache=cache).execute(ast, source_fingerprint(ast))
+
+    assert (first.runs, second.runs) == (1, 0)
+    assert shared["extract"].data == {"files": [str(source)]}
+    assert shared["extract"].metadata["shared_cache_hit"] is True
+
+
+def test_fingerprint_follows_file_mtime_not_ast_identity(tmp_path):
+    source = tmp_path / "nodes.ts"
+    source.write_text("export interface A {}")
+    ast = {str(source): {"interfaces": ["A"]}}
+    before = source_fingerprint(ast)
+
+    # The same dict mutated in place still maps to the file's key ...
+    ast[str(source)]["interfaces"].append("B")
+    assert source_fingerprint(ast) == before
+    # ... and a rewritten file gets a new one
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert source_fingerprint(ast) != before
+
+
+def test_fingerprint_hashes_entries_without_a_file():
+    ast = {"virtual.ts": {"interfaces": ["A"]}}
+    before = source_fingerprint(ast)
+
+    ast["virtual.ts"]["interfaces"].append("B")
+
+    assert source_fingerprint(ast) != before
@@ -0,0 +1,80 @@
+"""Diagram parsing with the fast YAML loader, format detection and the parsed-diagram cache."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from dipeo.config import BASE_DIR
+from dipeo.diagram_generated import DiagramFormat
+from dipeo.domain.diagram.services import DiagramFormatDetector
+from dipeo.domain.diagram.utils.conversion import load_yaml
+from dipeo.infrastructure.diagram.adapters import UnifiedSerializerAdapter
+from dipeo.infrastructure.diagram.drivers.segregated_adapters import FileAdapter, FormatAdapter
+from dipeo.infrastructure.storage.local.local_adapter import LocalFileSystemAdapter
+
+EXAMPLES = sorted((BASE_DIR / "examples").rglob("*.light.yaml"))
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        ('{"nodes": {}, "arrows": {}}', DiagramFormat.NATIVE),
+        ("version: light\nnodes: []\n", DiagramFormat.LIGHT),
+        ("format: readable\nflow: []\n", DiagramFormat.READABLE),
+        # Both were detected as LIGHT before libyaml parsing was introduced
+        ("nodes:\n  a: {}\n", DiagramFormat.LIGHT),
+        ("nodes: []\narrows: []\n", DiagramFormat.LIGHT),
+        ("version: readable\n", DiagramFormat.LIGHT),
+    ],
+)
+def test_detect_format_keeps_the_yaml_rules(content, expected):
+    assert DiagramFormatDetector().detect_format(content) == expected
+
+
+@pytest.mark.skipif(not EXAMPLES, reason="no example diagrams")
+def test_fast_loader_matches_safe_load():
+    contents = [path.read_text(encoding="utf-8") for path in EXAMPLES]
+
+    started = time.perf_counter()
+    fast = [load_yaml(content) for content in contents]
+    fast_seconds = time.perf_counter() - started
+    started = time.perf_counter()
+    safe = [yaml.safe_load(content) for content in contents]
+    safe_seconds = time.perf_counter() - started
+    print(
+        f"\nParsed {len(contents)} diagrams: load_yaml {fast_seconds * 1000:.1f} ms, "
+        f"safe_load {safe_seconds * 1000:.1f} ms"
+    )
+
+    assert fast == safe
+
+
+async def test_file_adapter_reuses_parsed_diagrams_until_the_file_changes(tmp_path):
+    source = tmp_path / "flow.light.yaml"
+    source.write_text(
+        "version: light\nnodes:\n  - label: start\n    type: start\n    position: {x: 0, y: 0}\n"
+    )
+    adapter = FileAdapter(
+        LocalFileSystemAdapter(tmp_path), tmp_path, FormatAdapter(UnifiedSerializerAdapter())
+    )
+
+    first = await adapter.load_from_file(str(source))
+    started = time.perf_counter()
+    for _ in range(200):
+        cached = await adapter.load_from_file(str(source))
+    print(f"\n200 cached loads in {(time.perf_counter() - started) * 1000:.1f} ms")
+
+    assert adapter.diagram_cache.misses == 1
+    assert adapter.diagram_cache.hits == 200
+    assert cached == first
+    # Callers get copies, so mutating one does not leak into the cache
+    cached.nodes.clear()
+    assert (await adapter.load_from_file(str(source))).nodes
+
+    source.write_text(source.read_text() + "  - label: end\n    type: endpoint\n")
+    stat = source.stat()
+    os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    changed = await adapter.load_from_file(str(source))
+    assert len(changed.nodes) == len(first.nodes) + 1
@@ -0,0 +1,61 @@
+"""SimpleTemplateProcessor rendering from compiled templates."""
+
+from datetime import datetime
+
+from dipeo.infrastructure.diagram.prompt_templates.simple_processor import (
+    SimpleTemplateProcessor,
+)
+
+CONTEXT = {
+    "name": "Ada",
+    "user": {"profile": {"age": 36}},
+    "sections": [{"title": "intro"}, {"title": "body"}],
+    "current": 1,
+    "items": ["a", "b"],
+    "flag": True,
+    "when": datetime(2024, 1, 2),
+    "tags": ["x"],
+}
+
+
+def test_variables_render_like_the_regex_renderer():
+    result = SimpleTemplateProcessor().process(
+        "{{ name }}/{{name}} {{user.profile.age}} {{sections[current].title}} "
+        "{{when}} {{tags}} {{missing}} {{user.nope}}",
+        CONTEXT,
+    )
+
+    assert result.content == (
+        'Ada/Ada 36 body 2024-01-02T00:00:00 [\n  "x"\n] {{missing}} {{user.nope}}'
+    )
+    assert sorted(result.missing_keys) == ["missing", "user.nope"]
+    assert "sections[current].title" in result.used_keys
+    assert result.errors == []
+
+
+def test_key_lists_have_one_entry_per_placeholder():
+    processor = SimpleTemplateProcessor()
+    missing: list[str] = []
+    used: list[str] = []
+
+    processor._process_variables("{{name}} {{gone}} {{name}} {{gone}}", CONTEXT, missing, used)
+
+    assert used == ["name", "gone", "name", "gone"]
+    assert missing == ["gone", "gone"]
+
+
+def test_loops_and_conditionals():
+    result = SimpleTemplateProcessor().process(
+        "{{#each items}}[{{this}}]{{/each}}{{#if flag}} on{{/if}}{{#unless flag}} off{{/unless}}",
+        CONTEXT,
+    )
+
+    assert result.content == "[a][b] on"
+
+
+def test_single_brace_placeholders():
+    processor = SimpleTemplateProcessor()
+
+    assert processor.process_single_brace("{name} {user.profile.age} {x}", CONTEXT) == (
+        "Ada 36 {x}"
+    )
@@ -0,0 +1,112 @@
+"""State database maintenance: writer stalls and the opt-in VACUUM conversion."""
+
+import asyncio
+import sqlite3
+import time
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from dipeo.config.settings import StorageSettings
+from dipeo.infrastructure.execution.state import cache_first_state_store
+from dipeo.infrastructure.execution.state.persistence_manager import PersistenceManager
+
+ROWS = 3000
+
+
+def _fill(conn: sqlite3.Connection) -> None:
+    """Insert ROWS executions started 30 days ago, each with a 2 KB payload."""
+    started_at = (datetime.now() - timedelta(days=30)).isoformat()
+    payload = "x" * 2048
+    conn.execute("BEGIN")
+    conn.executemany(
+        "INSERT INTO executions (execution_id, status, started_at, node_states,"
+        " node_outputs, llm_usage, variables) VALUES (?, 'completed', ?, ?, '{}', '{}', '{}')",
+        ((f"exec_{i}", started_at, payload) for i in range(ROWS)),
+    )
+    conn.execute("COMMIT")
+
+
+async def _open(db_path, **kwargs) -> PersistenceManager:
+    manager = PersistenceManager(str(db_path), **kwargs)
+    await manager.connect()
+    await manager.init_schema()
+    return manager
+
+
+async def _in_executor(manager: PersistenceManager, fn, *args):
+    return await asyncio.get_running_loop().run_in_executor(manager._executor, fn, *args)
+
+
+def _freelist(manager: PersistenceManager) -> int:
+    return manager._conn.execute("PRAGMA freelist_count").fetchone()[0]
+
+
+async def test_reclaiming_free_pages_keeps_writer_stalls_short(tmp_path):
+    manager = await _open(tmp_path / "state.db", idle_threshold=0.0, vacuum_step_budget=0.01)
+    await _in_executor(manager, _fill, manager._conn)
+    assert await manager.cleanup_old_states(days=7) == ROWS
+    assert await _in_executor(manager, _freelist, manager) > 500
+
+    latencies: list[float] = []
+
+    async def writer() -> None:
+        for seq in range(200):
+            started = time.perf_counter()
+            # Bypasses execute() so the writes do not pause maintenance
+            await _in_executor(
+                manager,
+                manager._conn.execute,
+                "INSERT INTO transitions (id, execution_id, phase, seq, payload)"
+                " VALUES (?, 'live', 'node', ?, '{}')",
+                (f"live:{seq}", seq),
+            )
+            latencies.append(time.perf_counter() - started)
+            await asyncio.sleep(0.001)
+
+    released, _ = await asyncio.gather(manager.reclaim_free_pages(), writer())
+
+    assert released > 500
+    assert await _in_executor(manager, _freelist, manager) == 0
+    # Every write waited for at most about one incremental_vacuum step
+    assert max(latencies) < 0.25
+    await manager.disconnect()
+    manager.shutdown()
+
+
+def _legacy_db(db_path) -> None:
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE legacy (x)")
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute("PRAGMA auto_vacuum").fetchone()[0] == 0
+
+
+async def _auto_vacuum(manager: PersistenceManager) -> int:
+    cursor = await manager.execute("PRAGMA auto_vacuum")
+    return cursor.fetchone()[0]
+
+
+@pytest.mark.parametrize("convert_existing", [False, True])
+async def test_full_vacuum_conversion_is_opt_in(tmp_path, convert_existing):
+    db_path = tmp_path / "legacy.db"
+    _legacy_db(db_path)
+    manager = await _open(db_path, idle_threshold=0.0, convert_existing=convert_existing)
+
+    await manager.reclaim_free_pages()
+
+    assert await _auto_vacuum(manager) == (2 if convert_existing else 0)
+    await manager.disconnect()
+    manager.shutdown()
+
+
+def test_state_store_reads_the_conversion_setting(monkeypatch, tmp_path):
+    monkeypatch.setenv("DIPEO_STATE_DB_CONVERT_VACUUM", "true")
+    storage = StorageSettings()
+    assert storage.state_db_convert_vacuum is True
+
+    monkeypatch.setattr(
+        cache_first_state_store, "get_settings", lambda: SimpleNamespace(storage=storage)
+    )
+    store = cache_first_state_store.CacheFirstStateStore(str(tmp_path / "state.db"))
+    assert store._persistence_manager.convert_existing is True
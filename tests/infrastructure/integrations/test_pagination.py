@@ -0,0 +1,227 @@
+"""Streaming pagination against a local aiohttp stub server."""
+
+import asyncio
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from dipeo.domain.integrations.api_services import APIBusinessLogic
+from dipeo.infrastructure.integrations.adapters.api_service import APIService
+from dipeo.infrastructure.integrations.drivers.integrated_api.generic_provider import (
+    GenericHTTPProvider,
+)
+
+TOTAL = 95
+
+
+class StubApi:
+    """Serves items 0..TOTAL-1 with cursor, offset and link-header pagination."""
+
+    def __init__(self):
+        self.requests: list[dict[str, str]] = []
+
+    def app(self) -> web.Application:
+        app = web.Application()
+        app.router.add_get("/cursor", self.cursor)
+        app.router.add_get("/offset", self.offset)
+        app.router.add_get("/linked", self.linked)
+        return app
+
+    def _record(self, request: web.Request) -> dict[str, str]:
+        query = dict(request.query)
+        self.requests.append(query)
+        return query
+
+    async def cursor(self, request: web.Request) -> web.Response:
+        query = self._record(request)
+        start = int(query.get("after") or 0)
+        size = int(query.get("per_page", 10))
+        end = min(start + size, TOTAL)
+        next_cursor = str(end) if end < TOTAL else None
+        return web.json_response(
+            {"data": list(range(start, end)), "meta": {"next_cursor": next_cursor}}
+        )
+
+    async def offset(self, request: web.Request) -> web.Response:
+        query = self._record(request)
+        offset = int(query["offset"])
+        limit = int(query["limit"])
+        return web.json_response(
+            {"results": list(range(offset, min(offset + limit, TOTAL))), "q": query.get("q")}
+        )
+
+    async def linked(self, request: web.Request) -> web.Response:
+        query = self._record(request)
+        page = int(query.get("page", 1))
+        start = (page - 1) * 40
+        headers = {}
+        if start + 40 < TOTAL:
+            headers["Link"] = f'</linked?page={page + 1}>; rel="next"'
+        return web.json_response(list(range(start, min(start + 40, TOTAL))), headers=headers)
+
+
+@pytest.fixture
+async def stub():
+    api = StubApi()
+    server = TestServer(api.app())
+    await server.start_server()
+    api.base_url = str(server.make_url(""))
+    yield api
+    await server.close()
+
+
+@pytest.fixture
+async def api_service():
+    service = APIService(APIBusinessLogic())
+    yield service
+    await service.close()
+
+
+async def test_cursor_pages_stream_every_item_and_send_query_params(stub, api_service):
+    pages = [
+        page
+        async for page in api_service.iter_pages(
+            url=f"{stub.base_url}/cursor",
+            pagination={
+                "type": "cursor",
+                "cursor_param": "after",
+                "cursor_path": "meta.next_cursor",
+                "items_path": "data",
+                "limit_param": "per_page",
+                "default_limit": 20,
+            },
+            params={"state": "open"},
+        )
+    ]
+
+    assert [len(page) for page in pages] == [20, 20, 20, 20, 15]
+    assert [item for page in pages for item in page] == list(range(TOTAL))
+    assert all(query["state"] == "open" for query in stub.requests)
+    assert [query.get("after") for query in stub.requests] == [None, "20", "40", "60", "80"]
+
+
+async def test_link_header_pages(stub, api_service):
+    items = [
+        item
+        async for page in api_service.iter_pages(
+            url=f"{stub.base_url}/linked", pagination={"type": "link_header"}
+        )
+        for item in page
+    ]
+
+    assert items == list(range(TOTAL))
+    assert len(stub.requests) == 3
+
+
+async def test_max_items_stops_fetching(stub, api_service):
+    pages = [
+        page
+        async for page in api_service.iter_pages(
+            url=f"{stub.base_url}/cursor",
+            pagination={
+                "type": "cursor",
+                "cursor_param": "after",
+                "cursor_path": "meta.next_cursor",
+                "items_path": "data",
+            },
+            max_items=25,
+        )
+    ]
+
+    assert [item for page in pages for item in page] == list(range(25))
+    assert len(stub.requests) == 3
+
+
+async def test_next_page_is_prefetched_while_the_caller_holds_one(stub, api_service):
+    pages = api_service.iter_pages(
+        url=f"{stub.base_url}/linked", pagination={"type": "link_header"}
+    )
+
+    first = await anext(pages)
+    # Give the prefetch task a chance to complete while the first page is "processed"
+    for _ in range(20):
+        if len(stub.requests) == 2:
+            break
+        await asyncio.sleep(0.01)
+
+    assert first == list(range(40))
+    assert len(stub.requests) == 2
+    await pages.aclose()
+    assert len(stub.requests) == 2
+
+
+async def test_manifest_provider_iter_pages(stub, api_service):
+    provider = GenericHTTPProvider(
+        {
+            "name": "stub",
+            "version": "1.0.0",
+            "base_url": stub.base_url,
+            "auth": {"strategy": "none"},
+            "operations": {
+                "search": {
+                    "method": "GET",
+                    "path": "/offset",
+                    "request": {"query_params_template": {"q": "{{ config.query }}"}},
+                    "pagination": {
+                        "type": "offset_limit",
+                        "offset_param": "offset",
+                        "limit_param": "limit",
+                        "items_path": "results",
+                        "default_limit": 30,
+                    },
+                }
+            },
+        },
+        api_service=api_service,
+    )
+    await provider.initialize()
+
+    pages = [
+        page async for page in provider.iter_pages("search", {"query": "dipeo"}, api_key="unused")
+    ]
+
+    assert [len(page) for page in pages] == [30, 30, 30, 5]
+    assert [item for page in pages for item in page] == list(range(TOTAL))
+    # The manifest's query parameters are sent with every page
+    assert [query["q"] for query in stub.requests] == ["dipeo"] * 4
+    assert [query["offset"] for query in stub.requests] == ["0", "30", "60", "90"]
+
+
+class _Request:
+    """Just enough of an ExecutionRequest for ApiJobNodeHandler._stream_pages."""
+
+    def __init__(self, metadata: dict, filesystem):
+        self.node = type("Node", (), {"metadata": metadata})()
+        self._filesystem = filesystem
+
+    def get_optional_service(self, key, default=None):
+        return self._filesystem
+
+
+async def test_api_job_streams_pages_to_jsonl(stub, api_service, tmp_path):
+    from dipeo.application.execution.handlers.api_job.handler import ApiJobNodeHandler
+    from dipeo.infrastructure.storage.local.local_adapter import LocalFileSystemAdapter
+
+    handler = ApiJobNodeHandler()
+    handler._api_service = api_service
+    request = _Request(
+        {"max_items": 90, "output_file": "out/items.jsonl"}, LocalFileSystemAdapter(tmp_path)
+    )
+
+    result = await handler._stream_pages(
+        request,
+        {
+            "type": "cursor",
+            "cursor_param": "after",
+            "cursor_path": "meta.next_cursor",
+            "items_path": "data",
+        },
+        url=f"{stub.base_url}/cursor",
+        method="GET",
+        params={"state": "open"},
+    )
+
+    assert result == {"output_file": "out/items.jsonl", "count": 90, "pages": 9}
+    lines = (tmp_path / "out" / "items.jsonl").read_text().splitlines()
+    assert [int(line) for line in lines] == list(range(90))
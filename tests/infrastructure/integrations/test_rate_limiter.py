@@ -0,0 +1,99 @@
+"""Shared rate limiter budgets across processes."""
+
+import asyncio
+import multiprocessing
+import sqlite3
+
+from dipeo.infrastructure.integrations.drivers.integrated_api.manifest_schema import (
+    RateLimitAlgorithm,
+    RateLimitBackend,
+    RateLimitConfig,
+)
+from dipeo.infrastructure.integrations.drivers.integrated_api.rate_limiter import (
+    PerOperationRateLimiter,
+    SharedRateLimiter,
+    SharedRateLimitStore,
+)
+
+PROCESSES = 4
+ATTEMPTS = 25
+CAPACITY = 30
+
+
+def _config(**kwargs) -> RateLimitConfig:
+    return RateLimitConfig(backend=RateLimitBackend.SHARED, **kwargs)
+
+
+ALGORITHMS = ("token_bucket", "fixed_window", "sliding_window")
+
+
+def _admitted(db_path, start, results) -> None:
+    store = SharedRateLimitStore(db_path)
+    start.wait()
+    admitted = {
+        algorithm: sum(
+            store.try_acquire("github", RateLimitAlgorithm(algorithm), CAPACITY, 1e-6, 3600) == 0
+            for _ in range(ATTEMPTS)
+        )
+        for algorithm in ALGORITHMS
+    }
+    store.close()
+    results.put(admitted)
+
+
+def test_processes_share_one_budget(tmp_path):
+    ctx = multiprocessing.get_context("spawn")
+    start, results = ctx.Event(), ctx.Queue()
+    processes = [
+        ctx.Process(target=_admitted, args=(tmp_path / "limits.db", start, results))
+        for _ in range(PROCESSES)
+    ]
+    for process in processes:
+        process.start()
+    start.set()
+    admitted = [results.get(timeout=60) for _ in processes]
+    for process in processes:
+        process.join(timeout=60)
+
+    # 100 attempts race for 30 slots of each algorithm; no process sees a stale count
+    for algorithm in ALGORITHMS:
+        assert sum(counts[algorithm] for counts in admitted) == CAPACITY, algorithm
+
+
+def test_operation_limits_use_provider_operation_keys(tmp_path):
+    limiter = PerOperationRateLimiter(_config(), key="github")
+    limiter.add_operation_limit("search", _config(capacity=5))
+
+    assert limiter.default_limiter._shared.key == "github"
+    assert limiter.operation_limiters["search"]._shared.key == "github:search"
+
+
+async def test_can_proceed_does_not_block_the_event_loop(tmp_path):
+    store = SharedRateLimitStore(tmp_path / "limits.db")
+    limiter = SharedRateLimiter(_config(), "github", store=store)
+    assert await limiter.can_proceed()
+
+    # Another process holds the write lock for a moment
+    other = sqlite3.connect(tmp_path / "limits.db", isolation_level=None)
+    other.execute("BEGIN IMMEDIATE")
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0.01)
+
+    async def release_later():
+        await asyncio.sleep(0.3)
+        other.execute("COMMIT")
+
+    beat = asyncio.create_task(heartbeat())
+    release = asyncio.create_task(release_later())
+    assert await limiter.can_proceed()
+    beat.cancel()
+    await release
+
+    assert ticks >= 10
+    other.close()
+    store.close()
@@ -0,0 +1,78 @@
+"""ClaudeSessionPool with a fake SDK client in place of the CLI subprocess."""
+
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+pytest.importorskip("claude_agent_sdk")
+
+from dipeo.infrastructure.llm.providers.claude_code.session_pool import (  # noqa: E402
+    ClaudeSessionPool,
+    options_fingerprint,
+)
+
+
+@dataclass
+class Options:
+    system_prompt: str
+    cwd: str
+
+
+class FakeClient:
+    """Counts connects and disconnects instead of starting a CLI process."""
+
+    connected = 0
+    disconnected = 0
+
+    def __init__(self, options: Options):
+        self.options = options
+
+    async def connect(self, prompt=None) -> None:
+        await asyncio.sleep(0)
+        FakeClient.connected += 1
+
+    async def disconnect(self) -> None:
+        FakeClient.disconnected += 1
+
+
+@pytest.fixture
+def pool():
+    FakeClient.connected = FakeClient.disconnected = 0
+    return ClaudeSessionPool(client_factory=FakeClient, warm_size=2, max_sessions=8)
+
+
+async def _settle(pool: ClaudeSessionPool) -> None:
+    while pool._tasks:
+        await asyncio.gather(*pool._tasks)
+
+
+async def test_shared_options_are_served_from_warm_sessions(pool):
+    options = Options("prompt", "/work/shared")
+
+    for _ in range(5):
+        async with pool.lease("memory_selection", options):
+            pass
+        await _settle(pool)
+
+    assert pool.get_stats()["hits"] == 4
+    assert pool.get_stats()["idle_sessions"] == 2
+    await pool.close()
+    assert FakeClient.connected == FakeClient.disconnected
+
+
+async def test_per_execution_options_are_not_prewarmed(pool):
+    # Each execution runs in its own workspace, so each has its own key
+    keys = {options_fingerprint(Options("prompt", f"/work/exec_{i}")) for i in range(5)}
+    assert len(keys) == 5
+
+    for i in range(5):
+        async with pool.lease("direct_execution", Options("prompt", f"/work/exec_{i}"), False):
+            pass
+        await _settle(pool)
+
+    # One connect per request and nothing left connected for finished executions
+    assert FakeClient.connected == 5
+    assert FakeClient.disconnected == 5
+    assert pool.get_stats()["idle_sessions"] == 0
+    await pool.close()
@@ -0,0 +1,132 @@
+"""BatchExecutor against a mocked httpx transport with latency and rate limiting."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from dipeo.infrastructure.llm.drivers.batch_executor import (
+    AdaptiveConcurrencyLimiter,
+    BatchExecutor,
+    get_batch_executor,
+    is_overload_error,
+)
+
+
+class FakeProvider:
+    """Mock transport handler: answers after a delay, 429s above a concurrency cap."""
+
+    def __init__(self, latency: float = 0.01, capacity: int = 3, fail_every: int = 0):
+        self.latency = latency
+        self.capacity = capacity
+        self.fail_every = fail_every
+        self.in_flight = 0
+        self.peak = 0
+        self.rate_limited = 0
+
+    async def __call__(self, request: httpx.Request) -> httpx.Response:
+        item = int(request.url.params["item"])
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            if self.in_flight > self.capacity:
+                self.rate_limited += 1
+                return httpx.Response(429, headers={"retry-after": "0.01"})
+            await asyncio.sleep(self.latency)
+            if self.fail_every and item % self.fail_every == 0:
+                return httpx.Response(400, json={"error": "bad request"})
+            return httpx.Response(200, json={"item": item})
+        finally:
+            self.in_flight -= 1
+
+
+async def _run_batch(executor: BatchExecutor, provider: FakeProvider, count: int) -> list:
+    async with httpx.AsyncClient(
+        transport=httpx.MockTransport(provider), base_url="https://llm.test"
+    ) as client:
+
+        async def call(item: int) -> int:
+            response = await client.get("/chat", params={"item": item})
+            response.raise_for_status()
+            return response.json()["item"]
+
+        return await executor.run(range(count), call)
+
+
+async def test_results_keep_input_order_and_capture_item_errors():
+    provider = FakeProvider(capacity=100, fail_every=7)
+    executor = BatchExecutor("fake", max_concurrency=8)
+
+    results = await _run_batch(executor, provider, 50)
+
+    assert len(results) == 50
+    for item, result in enumerate(results):
+        if item % 7 == 0:
+            assert isinstance(result, httpx.HTTPStatusError)
+            assert result.response.status_code == 400
+        else:
+            assert result == item
+    assert provider.peak <= 8
+
+
+async def test_rate_limited_items_back_off_and_are_retried():
+    provider = FakeProvider(capacity=3)
+    executor = BatchExecutor("fake", max_concurrency=8, backoff_base=0.01, max_overload_retries=10)
+
+    results = await _run_batch(executor, provider, 40)
+
+    assert results == list(range(40))
+    assert provider.rate_limited > 0
+    # The limit halves on every 429 until the fake provider stops rejecting requests
+    assert executor.limiter.limit < 8
+
+
+async def test_retries_give_up_after_max_overload_retries():
+    provider = FakeProvider(capacity=0)
+    executor = BatchExecutor("fake", max_concurrency=2, backoff_base=0.001, max_overload_retries=2)
+
+    results = await _run_batch(executor, provider, 3)
+
+    assert all(isinstance(r, httpx.HTTPStatusError) for r in results)
+    assert provider.rate_limited == 3 * 3
+
+
+async def test_limiter_grows_back_after_successes():
+    limiter = AdaptiveConcurrencyLimiter(max_concurrency=4)
+    await limiter.acquire()
+    await limiter.release(overloaded=True)
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        await limiter.acquire()
+        await limiter.release(succeeded=True)
+    assert limiter.limit == 3
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (type("RateLimitError", (Exception,), {})("slow down"), True),
+        (Exception("Overloaded"), True),
+        (type("E", (Exception,), {"status_code": 529})(), True),
+        (ValueError("invalid prompt"), False),
+    ],
+)
+def test_is_overload_error(error, expected):
+    assert is_overload_error(error) is expected
+
+
+async def test_executor_is_shared_per_provider_on_a_loop():
+    assert get_batch_executor("openai") is get_batch_executor("openai")
+    assert get_batch_executor("openai") is not get_batch_executor("anthropic")
+
+
+def test_each_event_loop_gets_its_own_executor():
+    async def lookup() -> BatchExecutor:
+        executor = get_batch_executor("openai")
+        # Exercise the limiter's condition on this loop
+        await executor.limiter.acquire()
+        await executor.limiter.release(succeeded=True)
+        return executor
+
+    assert asyncio.run(lookup()) is not asyncio.run(lookup())
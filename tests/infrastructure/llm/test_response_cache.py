@@ -0,0 +1,149 @@
+"""LLM response cache record/replay through LLMInfraService with a stub provider."""
+
+from types import SimpleNamespace
+
+import pytest
+from pydantic import BaseModel
+
+from dipeo.diagram_generated import ChatResult
+from dipeo.diagram_generated.domain_models import LLMUsage
+from dipeo.domain.base import LLMServiceError
+from dipeo.infrastructure.llm.drivers import response_cache
+from dipeo.infrastructure.llm.drivers.response_cache import LLMResponseCache, make_cache_key
+from dipeo.infrastructure.llm.drivers.service import LLMInfraService
+
+
+class Verdict(BaseModel):
+    approved: bool
+    reason: str
+
+
+class StubClient:
+    """Provider client that answers with a numbered response and counts calls."""
+
+    def __init__(self):
+        self.calls: list[dict] = []
+
+    async def async_chat(self, messages, **kwargs) -> ChatResult:
+        self.calls.append({"messages": messages, **kwargs})
+        parsed = Verdict(approved=True, reason=f"call {len(self.calls)}")
+        return ChatResult(
+            text=f"answer {len(self.calls)} to {messages[-1]['content']}",
+            llm_usage=LLMUsage(input=10, output=len(self.calls), total=10 + len(self.calls)),
+            # Providers attach structured output to their raw response
+            raw_response=SimpleNamespace(parsed=parsed, internals=object()),
+        )
+
+
+def _service(db_path, client: StubClient) -> LLMInfraService:
+    service = LLMInfraService(api_key_service=None)
+
+    async def get_client(service_name, model, api_key_id):
+        return client
+
+    service._client_manager = SimpleNamespace(get_client=get_client)
+    service._response_cache = LLMResponseCache(db_path)
+    return service
+
+
+def _messages(text: str) -> list[dict[str, str]]:
+    return [{"role": "system", "content": "Be brief."}, {"role": "user", "content": text}]
+
+
+async def _complete(service: LLMInfraService, text: str, mode: str, **kwargs) -> ChatResult:
+    return await service.complete(
+        _messages(text),
+        model="gpt-5-nano-2025-08-07",
+        api_key_id="APIKEY_TEST",
+        service_name="openai",
+        llm_cache={"mode": mode},
+        **kwargs,
+    )
+
+
+async def test_record_then_replay_without_the_provider(tmp_path):
+    db_path = tmp_path / "llm_responses.db"
+    recording = StubClient()
+    recorder = _service(db_path, recording)
+
+    first = await _complete(recorder, "hello", "record", trace_id="run-1", temperature=0.2)
+    # Record mode always calls the provider and overwrites the stored response
+    second = await _complete(recorder, "hello", "record", trace_id="run-1", temperature=0.2)
+    await _complete(recorder, "bye", "record", trace_id="run-1", temperature=0.2)
+    assert len(recording.calls) == 3
+    assert first.text == "answer 1 to hello"
+    recorder._response_cache.close()
+
+    # A fresh service reads the recording from disk; tracing parameters do not change the key
+    replaying = StubClient()
+    replayer = _service(db_path, replaying)
+    replayed = await _complete(replayer, "hello", "replay", trace_id="run-2", temperature=0.2)
+
+    assert replaying.calls == []
+    assert replayed.text == second.text
+    assert replayed.llm_usage == second.llm_usage
+    assert replayed.raw_response == {"approved": True, "reason": "call 2"}
+    assert Verdict.model_validate(replayed.raw_response).reason == "call 2"
+    assert replayer._response_cache.get_stats()["hits"] == 1
+    replayer._response_cache.close()
+
+
+async def test_replay_miss_raises_without_calling_the_provider(tmp_path):
+    client = StubClient()
+    service = _service(tmp_path / "llm_responses.db", client)
+    await _complete(service, "hello", "record", temperature=0.2)
+
+    with pytest.raises(LLMServiceError, match="No recorded response .* in replay mode"):
+        await _complete(service, "hello", "replay", temperature=0.7)
+    with pytest.raises(LLMServiceError):
+        await _complete(service, "something else", "replay", temperature=0.2)
+
+    assert len(client.calls) == 1
+    assert service._response_cache.get_stats()["misses"] == 2
+    service._response_cache.close()
+
+
+async def test_read_write_serves_hits_and_expires_entries(tmp_path, monkeypatch):
+    client = StubClient()
+    service = _service(tmp_path / "llm_responses.db", client)
+    now = [1_000_000.0]
+    monkeypatch.setattr(response_cache, "time", SimpleNamespace(time=lambda: now[0]))
+
+    async def complete() -> ChatResult:
+        return await service.complete(
+            _messages("hello"),
+            model="gpt-5-nano-2025-08-07",
+            api_key_id="APIKEY_TEST",
+            service_name="openai",
+            llm_cache={"mode": "read_write", "ttl_s": 60},
+        )
+
+    assert (await complete()).text == "answer 1 to hello"
+    assert (await complete()).text == "answer 1 to hello"
+    assert len(client.calls) == 1
+
+    now[0] += 61
+    assert (await complete()).text == "answer 2 to hello"
+    assert len(client.calls) == 2
+
+    # Off bypasses the cache entirely
+    await _complete(service, "hello", "off")
+    assert len(client.calls) == 3
+    service._response_cache.close()
+
+
+def test_cache_key_ignores_tracing_and_key_order():
+    messages = _messages("hello")
+    key = make_cache_key("openai", "m", messages, {"temperature": 0.2, "trace_id": "a"})
+
+    assert key == make_cache_key("openai", "m", messages, {"execution_id": "b", "temperature": 0.2})
+    assert key != make_cache_key("openai", "m", messages, {"temperature": 0.3})
+    assert key != make_cache_key("anthropic", "m", messages, {"temperature": 0.2})
+
+    # Structured output models are keyed by their schema
+    class Renamed(BaseModel):
+        approved: bool
+
+    verdict = make_cache_key("openai", "m", messages, {"text_format": Verdict})
+    assert verdict == make_cache_key("openai", "m", messages, {"text_format": Verdict})
+    assert verdict != make_cache_key("openai", "m", messages, {"text_format": Renamed})
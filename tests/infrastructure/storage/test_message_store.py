@@ -0,0 +1,69 @@
+"""MessageStore write-behind batching and shutdown."""
+
+import asyncio
+import sqlite3
+
+from dipeo.infrastructure.execution.state.cache_first_state_store import CacheFirstStateStore
+from dipeo.infrastructure.storage.message_store import MessageStore
+
+MESSAGES = 2000
+
+
+class CountingStore(MessageStore):
+    """Counts the transactions that wrote at least one message."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.transactions = 0
+
+    async def flush(self) -> int:
+        written = await super().flush()
+        self.transactions += written > 0
+        return written
+
+
+def _count(db_path) -> int:
+    with sqlite3.connect(db_path) as conn:
+        return conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
+
+
+async def _store_all(store: MessageStore) -> list[str]:
+    return await asyncio.gather(
+        *(store.store_message("exec", f"node_{i}", {"i": i}, "person") for i in range(MESSAGES))
+    )
+
+
+async def test_concurrent_writes_share_transactions(tmp_path):
+    store = CountingStore(tmp_path / "messages.db", batch_size=500)
+
+    ids = await _store_all(store)
+    messages = await store.get_conversation_messages("exec", "person")
+
+    assert {message["id"] for message in messages} == set(ids)
+    # Writes are batched instead of committed one by one
+    assert store.transactions <= MESSAGES // 100
+    await store.close()
+    assert store._flush_task is None
+    assert _count(tmp_path / "messages.db") == MESSAGES
+
+
+async def test_close_writes_queued_messages(tmp_path):
+    store = MessageStore(tmp_path / "messages.db", flush_interval=60.0, batch_size=MESSAGES * 2)
+
+    await _store_all(store)
+    await store.close()
+
+    assert _count(tmp_path / "messages.db") == MESSAGES
+
+
+async def test_state_store_cleanup_closes_the_message_store(tmp_path):
+    message_store = MessageStore(tmp_path / "messages.db", flush_interval=60.0)
+    state_store = CacheFirstStateStore(str(tmp_path / "state.db"), message_store=message_store)
+    await state_store.initialize()
+
+    await message_store.store_message("exec", "node", {"text": "hi"}, "person")
+    await state_store.cleanup()
+
+    assert message_store._db is None
+    assert message_store._flush_task is None
+    assert _count(tmp_path / "messages.db") == 1
@@ -0,0 +1,114 @@
+"""WebhookInbox durability, deduplication and dead-letter redelivery."""
+
+import asyncio
+import sqlite3
+from collections import Counter
+
+from dipeo.infrastructure.storage.webhook_inbox import WebhookDelivery, WebhookInbox
+
+
+class Recorder:
+    """Handler that records completed deliveries, optionally failing some."""
+
+    def __init__(self, delay: float = 0.0, fail: set[str] | None = None):
+        self.delay = delay
+        self.fail = fail or set()
+        self.completed: Counter[str] = Counter()
+
+    async def __call__(self, delivery: WebhookDelivery) -> None:
+        await asyncio.sleep(self.delay)
+        if delivery.delivery_id in self.fail:
+            raise RuntimeError("handler failed")
+        self.completed[delivery.delivery_id] += 1
+
+
+async def _wait_for(predicate, timeout: float = 10.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not predicate():
+        assert asyncio.get_running_loop().time() < deadline, "timed out"
+        await asyncio.sleep(0.01)
+
+
+def _statuses(db_path) -> Counter[str]:
+    with sqlite3.connect(db_path) as conn:
+        return Counter(status for (status,) in conn.execute("SELECT status FROM webhook_inbox"))
+
+
+async def _append_all(inbox: WebhookInbox, ids: list[str]) -> list[bool]:
+    return await asyncio.gather(
+        *(inbox.append("github", i, {"x-id": i}, i.encode(), f"exec_{i}") for i in ids)
+    )
+
+
+async def test_reopen_mid_stream_loses_and_duplicates_nothing(tmp_path):
+    db_path = tmp_path / "inbox.db"
+    ids = [f"d{i}" for i in range(300)]
+
+    first = Recorder(delay=0.002)
+    inbox = WebhookInbox(db_path, first, workers=4, batch_size=32)
+    assert all(await _append_all(inbox, ids))
+    await _wait_for(lambda: sum(first.completed.values()) >= 50)
+    # Stop while deliveries are still being processed
+    await inbox.close()
+    assert 0 < sum(first.completed.values()) < len(ids)
+
+    second = Recorder()
+    reopened = WebhookInbox(db_path, second, workers=4, batch_size=32)
+    await reopened.start()
+    # Redeliveries of accepted webhooks are duplicates across the restart
+    assert not any(await _append_all(reopened, ids[:10]))
+    await _wait_for(lambda: _statuses(db_path) == Counter({"done": len(ids)}))
+    await reopened.close()
+
+    completed = first.completed + second.completed
+    assert set(completed) == set(ids)
+    assert max(completed.values()) == 1
+
+
+async def test_crash_redelivers_uncommitted_outcomes(tmp_path):
+    db_path = tmp_path / "inbox.db"
+    ids = [f"d{i}" for i in range(100)]
+
+    first = Recorder(delay=0.002)
+    inbox = WebhookInbox(db_path, first, workers=4, batch_size=16)
+    assert all(await _append_all(inbox, ids))
+    await _wait_for(lambda: sum(first.completed.values()) >= 20)
+    # Simulate a crash: stop the tasks without committing pending outcomes
+    for task in inbox._tasks:
+        task.cancel()
+    await asyncio.gather(*inbox._tasks, return_exceptions=True)
+    await inbox._run(inbox._conn.close)
+    inbox._executor.shutdown(wait=True)
+
+    second = Recorder()
+    reopened = WebhookInbox(db_path, second, workers=4, batch_size=16)
+    await reopened.start()
+    await _wait_for(lambda: _statuses(db_path) == Counter({"done": len(ids)}))
+    await reopened.close()
+
+    # At-least-once: every delivery completed, repeats only for uncommitted outcomes
+    completed = first.completed + second.completed
+    assert set(completed) == set(ids)
+    assert sum(completed.values()) - len(ids) <= sum(first.completed.values())
+
+
+async def test_redelivery_revives_a_dead_letter(tmp_path):
+    db_path = tmp_path / "inbox.db"
+    handler = Recorder(fail={"bad"})
+    inbox = WebhookInbox(db_path, handler, workers=2, max_attempts=2, retry_base_delay=0.01)
+
+    assert await _append_all(inbox, ["ok", "bad"]) == [True, True]
+    await _wait_for(lambda: _statuses(db_path) == Counter({"done": 1, "dead": 1}))
+
+    # A processed delivery stays deduplicated; a dead one is accepted again
+    handler.fail.clear()
+    assert await _append_all(inbox, ["ok", "bad", "bad"]) == [False, True, False]
+    await _wait_for(lambda: _statuses(db_path) == Counter({"done": 2}))
+    await inbox.close()
+
+    assert handler.completed == Counter({"ok": 1, "bad": 1})
+    assert inbox.get_stats()["accepted"] == 3
+    with sqlite3.connect(db_path) as conn:
+        assert conn.execute(
+            "SELECT attempts, error FROM webhook_inbox WHERE delivery_id = 'bad'"
+        ).fetchone() == (1, None)
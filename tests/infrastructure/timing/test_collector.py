@@ -0,0 +1,95 @@
+"""TimingCollector histograms: accuracy, exported sums and shard lifecycle."""
+
+import math
+import random
+import threading
+import time
+
+import pytest
+
+from dipeo.infrastructure.timing.collector import TimingCollector, bucket_bounds, bucket_index
+
+SAMPLES = 1_000_000
+THREADS = 4
+
+
+@pytest.fixture
+def collector():
+    collector = TimingCollector()
+    collector.clear()
+    yield collector
+    collector.clear()
+
+
+def _exact_quantile(values: list[float], q: float) -> float:
+    ordered = sorted(values)
+    return ordered[max(1, math.ceil(q * len(ordered))) - 1]
+
+
+def test_bucket_bounds_contain_their_values():
+    for micros in [0, 1, 63, 64, 65, 1000, 123_456, 10**9]:
+        lower, upper = bucket_bounds(bucket_index(micros))
+        assert lower <= micros < upper
+        assert upper - lower <= max(1, lower / 32)
+
+
+def test_one_million_samples_from_several_threads(collector):
+    rng = random.Random(7)
+    # Log-normal latencies around 20ms, recorded as float milliseconds
+    samples = [rng.lognormvariate(3.0, 1.0) for _ in range(SAMPLES)]
+    chunk = SAMPLES // THREADS
+
+    def record(part: list[float]) -> None:
+        for dur_ms in part:
+            collector.record("bench", "node", "llm_call", dur_ms)
+
+    threads = [
+        threading.Thread(target=record, args=(samples[i * chunk : (i + 1) * chunk],))
+        for i in range(THREADS)
+    ]
+    started = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - started
+    print(f"\n{SAMPLES} samples recorded in {elapsed:.2f}s ({SAMPLES / elapsed:,.0f}/s)")
+
+    histogram = collector.histograms("bench")[("node", "llm_call")]
+    assert histogram.count == SAMPLES
+    for q in (0.5, 0.95, 0.99):
+        exact = _exact_quantile(samples, q)
+        assert histogram.quantile(q) == pytest.approx(exact, rel=0.04)
+
+    collector.pop("bench")
+    export = collector.render_prometheus()
+    exported_sum = next(
+        float(line.rsplit(" ", 1)[1])
+        for line in export.splitlines()
+        if line.startswith('dipeo_phase_duration_seconds_sum{phase="llm_call"}')
+    )
+    # The exported sum is not skewed by per-sample rounding to whole milliseconds
+    assert exported_sum == pytest.approx(math.fsum(samples) / 1000, rel=1e-9)
+
+
+def test_sub_millisecond_samples_keep_their_sum(collector):
+    for _ in range(1000):
+        collector.record("fast", "node", "cache_lookup", 0.4)
+
+    assert collector.phase_histograms()["cache_lookup"].total_seconds == pytest.approx(0.4)
+    assert collector.phase_histograms()["cache_lookup"].total_ms == 0
+
+
+def test_shards_of_exited_threads_are_merged(collector):
+    def record(i: int) -> None:
+        collector.record("threads", "node", "work", float(i))
+
+    for i in range(50):
+        thread = threading.Thread(target=record, args=(i,))
+        thread.start()
+        thread.join()
+    # Registering one more shard folds the exited threads' shards together
+    record(0)
+
+    assert len(collector._shards) <= 3
+    assert collector.get("threads")["node"]["work__count"] == 51
@@ -0,0 +1,124 @@
+"""run_backend concurrency: BackgroundExecutionManager with a stub runner."""
+
+import asyncio
+import statistics
+import time
+
+import pytest
+
+from server.api.mcp.background import (
+    CANCELLED,
+    COMPLETED,
+    FAILED,
+    RUNNING,
+    TIMED_OUT,
+    BackgroundExecutionManager,
+    BackgroundJob,
+    BackgroundQueueFullError,
+)
+
+
+class StubRunner:
+    """Runs a job by sleeping, tracking how many run at once and when each started."""
+
+    def __init__(self, duration: float = 0.01):
+        self.duration = duration
+        self.running = 0
+        self.peak = 0
+        self.started: dict[str, float] = {}
+
+    async def __call__(self, job: BackgroundJob) -> bool:
+        self.started[job.session_id] = time.perf_counter()
+        self.running += 1
+        self.peak = max(self.peak, self.running)
+        try:
+            await asyncio.sleep(job.input_data.get("duration", self.duration))
+        finally:
+            self.running -= 1
+        if job.input_data.get("fail"):
+            job.error = "node failed"
+            return False
+        return True
+
+
+async def _wait_finished(manager: BackgroundExecutionManager, jobs: list[BackgroundJob]) -> None:
+    deadline = time.monotonic() + 10
+    while not all(manager.get(job.session_id).is_finished for job in jobs):
+        assert time.monotonic() < deadline, "timed out"
+        await asyncio.sleep(0.005)
+
+
+async def test_burst_of_submissions_is_admitted_quickly_and_bounded():
+    runner = StubRunner(duration=0.01)
+    manager = BackgroundExecutionManager(runner, max_workers=4, max_queued=200)
+
+    submitted: dict[str, float] = {}
+    started = time.perf_counter()
+    jobs = []
+    for i in range(100):
+        submitted_at = time.perf_counter()
+        job = manager.submit(f"diagram_{i}", {"i": i})
+        submitted[job.session_id] = submitted_at
+        jobs.append(job)
+    submit_elapsed = time.perf_counter() - started
+
+    await _wait_finished(manager, jobs)
+    await manager.shutdown()
+
+    # Submitting never waits for an execution; the old path spawned a process per call
+    assert submit_elapsed < 0.5
+    assert runner.peak == 4
+    assert all(manager.get(job.session_id).status == COMPLETED for job in jobs)
+
+    # With 4 workers and 10ms runs, the i-th job waits about i / 4 * 10ms for a worker
+    waits = [runner.started[job.session_id] - submitted[job.session_id] for job in jobs]
+    first_wave = statistics.median(waits[:4])
+    assert first_wave < 0.1
+    assert waits[-1] >= 0.2
+
+
+async def test_full_queue_refuses_new_executions():
+    manager = BackgroundExecutionManager(StubRunner(duration=0.05), max_workers=2, max_queued=3)
+
+    jobs = [manager.submit("diagram") for _ in range(5)]
+    with pytest.raises(BackgroundQueueFullError):
+        manager.submit("diagram")
+    assert manager.get_stats()["queued"] == 5
+
+    await asyncio.sleep(0.01)
+    assert manager.get_stats() == {
+        "workers": 2,
+        "running": 2,
+        "queued": 3,
+        "max_queued": 3,
+        "finished_retained": 0,
+    }
+    await _wait_finished(manager, jobs)
+    # Capacity is released as executions finish
+    manager.submit("diagram")
+    await manager.shutdown()
+
+
+async def test_cancel_timeout_and_failure():
+    manager = BackgroundExecutionManager(StubRunner(), max_workers=1, max_queued=10)
+
+    running = manager.submit("slow", {"duration": 10})
+    queued = manager.submit("waiting")
+    timing_out = manager.submit("hangs", {"duration": 10}, timeout=0.05)
+    failing = manager.submit("broken", {"fail": True})
+    await asyncio.sleep(0.01)
+    assert running.status == RUNNING
+
+    assert (await manager.cancel(queued.session_id)).status == CANCELLED
+    assert (await manager.cancel(running.session_id)).status == CANCELLED
+    await _wait_finished(manager, [timing_out, failing])
+
+    assert timing_out.status == TIMED_OUT
+    assert timing_out.error == "Execution timed out after 0.05 seconds"
+    assert failing.status == FAILED
+    assert failing.to_dict()["error"] == "node failed"
+    # The cancelled queued job never reached the runner
+    assert queued.started_at is None
+    await manager.shutdown()
+    with pytest.raises(RuntimeError):
+        manager.submit("diagram")
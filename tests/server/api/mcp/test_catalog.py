@@ -0,0 +1,152 @@
+"""MCP diagram catalog search over a 10k-file tree."""
+
+import json
+import os
+import time
+
+import pytest
+
+from server.api.mcp.catalog import DiagramCatalog
+
+YAML_FILES = 9000
+JSON_FILES = 1000
+NODE_TYPES = ("start", "person_job", "code_job", "condition", "endpoint")
+PERSONS = ("Analyst", "Reviewer", "Summarizer", "Translator")
+TOPICS = ("greeting", "data_analysis", "simple_iter", "report", "webhook", "batch")
+
+
+def _light(i: int) -> str:
+    topic = TOPICS[i % len(TOPICS)]
+    person = PERSONS[i % len(PERSONS)]
+    return (
+        "version: light\n"
+        "nodes:\n"
+        f"- label: Start {topic}\n  type: {NODE_TYPES[0]}\n  position: {{x: 0, y: 0}}\n"
+        f"- label: Step{i}\n  type: {NODE_TYPES[1 + i % 4]}\n  position: {{x: 100, y: 0}}\n"
+        f"  props:\n    person: {person}\n"
+        "connections:\n- {from: Start, to: Step}\n"
+        f"persons:\n  {person}:\n    service: openai\n    model: gpt-5-nano-2025-08-07\n"
+    )
+
+
+def _native(i: int) -> str:
+    return json.dumps(
+        {
+            "nodes": {
+                "n0": {"type": "start", "data": {"label": f"Begin {TOPICS[i % len(TOPICS)]}"}},
+                "n1": {"type": "db", "data": {"label": f"Load{i}"}},
+            },
+            "persons": {"p0": {"label": PERSONS[i % len(PERSONS)]}},
+        }
+    )
+
+
+@pytest.fixture(scope="module")
+def tree(tmp_path_factory):
+    root = tmp_path_factory.mktemp("catalog")
+    uploads, examples = root / "mcp-diagrams", root / "simple_diagrams"
+    uploads.mkdir()
+    examples.mkdir()
+    for i in range(YAML_FILES):
+        directory = uploads if i % 2 else examples
+        name = f"{TOPICS[i % len(TOPICS)]}_{i:05d}"
+        (directory / f"{name}.yaml").write_text(_light(i))
+    for i in range(JSON_FILES):
+        (uploads / f"native_{TOPICS[i % len(TOPICS)]}_{i:04d}.json").write_text(_native(i))
+    return [(uploads, "mcp-diagrams"), (examples, "examples")]
+
+
+@pytest.fixture(scope="module")
+def catalog(tree):
+    catalog = DiagramCatalog(tree)
+    catalog.refresh()
+    return catalog
+
+
+def _old_search(roots, query: str) -> list[str]:
+    """The pre-catalog search tool: substring match on file stems, YAML before JSON."""
+    query = query.lower()
+    return [
+        str(file)
+        for directory, _ in roots
+        for pattern in ("*.yaml", "*.json")
+        for file in directory.glob(pattern)
+        if query in file.stem.lower()
+    ]
+
+
+def test_index_covers_every_file(catalog):
+    entries = catalog.entries()
+
+    assert len(entries) == YAML_FILES + JSON_FILES
+    assert sum(entry.format == "native" for entry in entries) == JSON_FILES
+    entry = catalog.lookup("report_00003")
+    assert entry.location == "mcp-diagrams"
+    assert entry.node_types == ("start", "endpoint")
+    assert entry.persons == ("Translator",)
+
+
+@pytest.mark.parametrize("query", ["greeting", "data_analysis", "iter", "_0001", "native"])
+def test_old_matches_are_kept_and_count_is_the_total(catalog, tree, query):
+    expected = _old_search(tree, query)
+    results, count = catalog.search(query, 50)
+    everything, total = catalog.search(query)
+
+    assert len(results) == min(50, count)
+    assert total == count == len(everything)
+    # Every diagram the old search returned still matches
+    assert set(expected) <= {result["path"] for result in everything}
+    # The capped results are the best-ranked prefix of the full ranking
+    assert results == everything[:50]
+    assert [r["score"] for r in everything] == sorted(
+        (r["score"] for r in everything), reverse=True
+    )
+
+
+def test_name_matches_rank_before_content_matches(catalog):
+    results, _ = catalog.search("greeting")
+
+    # Name prefixes rank before name substrings (native_greeting_*)
+    names = [result["name"] for result in results]
+    first_native = names.index("native_greeting_0000")
+    assert all(name.startswith("greeting_") for name in names[:first_native])
+    assert all("greeting" in name for name in names)
+
+    # Person names and node types are searchable as words, not only file names
+    _, reviewers = catalog.search("reviewer")
+    _, conditions = catalog.search("condition")
+    assert reviewers == YAML_FILES // len(PERSONS) + JSON_FILES // len(PERSONS)
+    assert conditions == YAML_FILES // 4
+
+
+def test_search_is_served_from_memory(catalog, tree):
+    started = time.perf_counter()
+    for query in ("greeting", "data analysis", "summ", "webhook_08"):
+        catalog.search(query, 50)
+    elapsed = (time.perf_counter() - started) / 4
+
+    started = time.perf_counter()
+    _old_search(tree, "greeting")
+    globbed = time.perf_counter() - started
+
+    assert elapsed < globbed
+    assert elapsed < 0.25
+
+
+def test_added_and_edited_files_are_picked_up(tree):
+    catalog = DiagramCatalog(tree)
+    catalog.refresh()
+    uploads = tree[0][0]
+
+    (uploads / "fresh_upload.yaml").write_text(_light(1))
+    # The directory mtime changed, so the next search rescans it
+    assert [r["name"] for r in catalog.search("fresh_upload")[0]] == ["fresh_upload"]
+
+    path = uploads / "fresh_upload.yaml"
+    path.write_text(_light(1).replace("Analyst", "Auditor").replace("Reviewer", "Auditor"))
+    os.utime(path, ns=(time.time_ns(), time.time_ns() + 10**9))
+    catalog.invalidate(path)
+    assert catalog.search("auditor")[1] == 1
+
+    path.unlink()
+    assert catalog.search("fresh_upload")[1] == 0